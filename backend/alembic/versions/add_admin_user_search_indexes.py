@@ -0,0 +1,67 @@
+"""Add admin user search indexes
+
+Revision ID: admin_search_001
+Revises: committee_queue_001
+Create Date: 2026-10-18
+
+Serves the admin user search (substring match on email or full name)
+from an index. On PostgreSQL, adds a pg_trgm GIN index on lower(email);
+lower(full_name) is already covered by idx_users_full_name_trgm. On
+SQLite, adds an FTS5 trigram table over users (email, full_name), kept
+in sync by triggers, and builds it from existing rows.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'admin_search_001'
+down_revision: Union[str, None] = 'committee_queue_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    if bind.dialect.name == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS idx_users_email_trgm "
+            "ON users USING gin (lower(email) gin_trgm_ops)"
+        )
+    elif bind.dialect.name == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5("
+            "email, full_name, content='users', content_rowid='id', tokenize='trigram')"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS users_fts_ai AFTER INSERT ON users BEGIN "
+            "INSERT INTO users_fts(rowid, email, full_name) VALUES (new.id, new.email, new.full_name); END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS users_fts_ad AFTER DELETE ON users BEGIN "
+            "INSERT INTO users_fts(users_fts, rowid, email, full_name) "
+            "VALUES ('delete', old.id, old.email, old.full_name); END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS users_fts_au AFTER UPDATE OF email, full_name ON users BEGIN "
+            "INSERT INTO users_fts(users_fts, rowid, email, full_name) "
+            "VALUES ('delete', old.id, old.email, old.full_name); "
+            "INSERT INTO users_fts(rowid, email, full_name) VALUES (new.id, new.email, new.full_name); END"
+        )
+        # Index existing users
+        op.execute("INSERT INTO users_fts(users_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+
+    if bind.dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS idx_users_email_trgm")
+    elif bind.dialect.name == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS users_fts_au")
+        op.execute("DROP TRIGGER IF EXISTS users_fts_ad")
+        op.execute("DROP TRIGGER IF EXISTS users_fts_ai")
+        op.execute("DROP TABLE IF EXISTS users_fts")
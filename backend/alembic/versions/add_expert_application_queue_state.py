@@ -0,0 +1,66 @@
+"""Add denormalized review queue state to expert applications
+
+Revision ID: committee_queue_001
+Revises: challenge_stats_001
+Create Date: 2026-10-18
+
+Adds claim_count and has_active_claim to expert_applications so the
+committee queue reads one table instead of aggregating every
+application_reviews row, backfilled from existing reviews. Also indexes
+(status, has_active_claim, submitted_at) for the queue and
+(status, decided_at) for the dashboard's monthly decision counts.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'committee_queue_001'
+down_revision: Union[str, None] = 'challenge_stats_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('expert_applications') as batch_op:
+        batch_op.add_column(sa.Column('claim_count', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('has_active_claim', sa.Boolean(), nullable=False, server_default='0'))
+
+    op.create_index(
+        'idx_expert_app_queue',
+        'expert_applications',
+        ['status', 'has_active_claim', 'submitted_at'],
+        unique=False
+    )
+    op.create_index(
+        'idx_expert_app_status_decided',
+        'expert_applications',
+        ['status', 'decided_at'],
+        unique=False
+    )
+
+    # Backfill
+    op.execute("""
+        UPDATE expert_applications SET claim_count = (
+            SELECT COUNT(*) FROM application_reviews
+            WHERE application_reviews.application_id = expert_applications.id
+        )
+    """)
+    op.execute("""
+        UPDATE expert_applications SET has_active_claim = TRUE
+        WHERE id IN (
+            SELECT application_id FROM application_reviews
+            WHERE application_reviews.status = 'claimed'
+        )
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_expert_app_status_decided', table_name='expert_applications')
+    op.drop_index('idx_expert_app_queue', table_name='expert_applications')
+
+    with op.batch_alter_table('expert_applications') as batch_op:
+        batch_op.drop_column('has_active_claim')
+        batch_op.drop_column('claim_count')
@@ -0,0 +1,57 @@
+"""Add running rating sums to reviewer_stats and requester_stats
+
+Revision ID: rating_sums_001
+Revises: admin_search_001
+Create Date: 2026-10-18
+
+Stores the sum of each rating dimension so a new rating can be added to
+the averages in one UPDATE instead of re-aggregating every rating the
+user has received. Backfilled (with total_ratings) from the rating tables.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'rating_sums_001'
+down_revision: Union[str, None] = 'admin_search_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# stats table -> (ratings table, rated user column, dimensions)
+TABLES = {
+    'reviewer_stats': ('reviewer_ratings', 'reviewer_id', ['quality', 'professionalism', 'helpfulness', 'overall']),
+    'requester_stats': ('requester_ratings', 'requester_id', ['clarity', 'responsiveness', 'fairness', 'overall']),
+}
+
+
+def upgrade() -> None:
+    for stats_table, (ratings_table, user_column, dimensions) in TABLES.items():
+        with op.batch_alter_table(stats_table) as batch_op:
+            for dimension in dimensions:
+                batch_op.add_column(
+                    sa.Column(f'{dimension}_sum', sa.Integer(), nullable=False, server_default='0')
+                )
+
+        # Backfill
+        sums = ", ".join(
+            f"{dimension}_sum = COALESCE((SELECT SUM(r.{dimension}_rating) FROM {ratings_table} r "
+            f"WHERE r.{user_column} = {stats_table}.user_id), 0)"
+            for dimension in dimensions
+        )
+        op.execute(f"""
+            UPDATE {stats_table} SET {sums},
+                total_ratings = (
+                    SELECT COUNT(*) FROM {ratings_table} r WHERE r.{user_column} = {stats_table}.user_id
+                )
+        """)
+
+
+def downgrade() -> None:
+    for stats_table, (_, _, dimensions) in TABLES.items():
+        with op.batch_alter_table(stats_table) as batch_op:
+            for dimension in reversed(dimensions):
+                batch_op.drop_column(f'{dimension}_sum')
@@ -0,0 +1,73 @@
+"""Allow one active claim per reviewer per review request
+
+Revision ID: slot_active_claim_001
+Revises: rating_sums_001
+Create Date: 2026-10-18
+
+Adds a partial unique index on review_slots(review_request_id, reviewer_id)
+for claimed and submitted slots. The claim statement's NOT EXISTS check
+reads a snapshot, so two concurrent claims by one reviewer could each take
+a different slot; the index makes the second one fail instead.
+
+Duplicate claims left by that race are released first: a claimed slot is
+put back to available when the same reviewer has a submitted slot or an
+older claimed slot on the request.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'slot_active_claim_001'
+down_revision: Union[str, None] = 'rating_sums_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ACTIVE = "status IN ('claimed', 'submitted')"
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    duplicates = conn.execute(sa.text("""
+        SELECT s.id, s.review_request_id FROM review_slots s
+        WHERE s.status = 'claimed' AND EXISTS (
+            SELECT 1 FROM review_slots o
+            WHERE o.review_request_id = s.review_request_id
+              AND o.reviewer_id = s.reviewer_id
+              AND (o.status = 'submitted' OR (o.status = 'claimed' AND o.id < s.id))
+        )
+    """)).fetchall()
+
+    for slot_id, review_request_id in duplicates:
+        conn.execute(
+            sa.text("""
+                UPDATE review_slots
+                SET status = 'available', reviewer_id = NULL, claimed_at = NULL, claim_deadline = NULL
+                WHERE id = :slot_id
+            """),
+            {"slot_id": slot_id},
+        )
+        conn.execute(
+            sa.text("""
+                UPDATE review_requests SET reviews_claimed = reviews_claimed - 1
+                WHERE id = :review_request_id AND reviews_claimed > 0
+            """),
+            {"review_request_id": review_request_id},
+        )
+
+    op.create_index(
+        'uq_slot_active_claim',
+        'review_slots',
+        ['review_request_id', 'reviewer_id'],
+        unique=True,
+        postgresql_where=sa.text(ACTIVE),
+        sqlite_where=sa.text(ACTIVE),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_slot_active_claim', table_name='review_slots')
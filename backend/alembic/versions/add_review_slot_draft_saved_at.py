@@ -0,0 +1,31 @@
+"""Add draft_saved_at to review_slots
+
+Revision ID: draft_saved_at_001
+Revises: slot_active_claim_001
+Create Date: 2026-10-18
+
+Records when the stored draft was saved. Draft writes only replace an older
+draft, so a worker flushing a stale buffered autosave can't overwrite a
+newer one written by another worker.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'draft_saved_at_001'
+down_revision: Union[str, None] = 'slot_active_claim_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('review_slots') as batch_op:
+        batch_op.add_column(sa.Column('draft_saved_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('review_slots') as batch_op:
+        batch_op.drop_column('draft_saved_at')
@@ -0,0 +1,57 @@
+"""Add running statistics columns to reviewer_dna
+
+Revision ID: reviewer_dna_stats_001
+Revises: 42a4d1d50dd9
+Create Date: 2026-10-18
+
+Stores count / sum / sum-of-squares for response time, word count,
+action items and helpful ratings so Reviewer DNA can be refreshed
+without rescanning every completed review slot.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'reviewer_dna_stats_001'
+down_revision: Union[str, None] = '42a4d1d50dd9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INTEGER_COLUMNS = [
+    'response_time_count',
+    'feedback_count',
+    'rating_count',
+    'accepted_count',
+    'rejected_count',
+]
+
+FLOAT_COLUMNS = [
+    'response_time_sum',
+    'response_time_sum_sq',
+    'word_count_sum',
+    'word_count_sum_sq',
+    'action_items_sum',
+    'action_items_sum_sq',
+    'rating_sum',
+    'rating_sum_sq',
+]
+
+
+def upgrade() -> None:
+    """Add running statistics columns (existing rows are backfilled by recalculate_all_dna)."""
+    for name in INTEGER_COLUMNS:
+        op.add_column('reviewer_dna', sa.Column(name, sa.Integer(), nullable=False, server_default='0'))
+    for name in FLOAT_COLUMNS:
+        op.add_column('reviewer_dna', sa.Column(name, sa.Float(), nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    """Drop running statistics columns."""
+    for name in reversed(FLOAT_COLUMNS):
+        op.drop_column('reviewer_dna', name)
+    for name in reversed(INTEGER_COLUMNS):
+        op.drop_column('reviewer_dna', name)
@@ -0,0 +1,40 @@
+"""Add specificity and encouragement sums to reviewer_dna
+
+Revision ID: dna_tone_signals_001
+Revises: draft_saved_at_001
+Create Date: 2026-10-18
+
+Stores the running totals of specificity markers and encouraging phrases
+found in feedback text, which now feed the specificity and encouragement
+dimensions. Existing rows start at zero until recalculate_all_dna rebuilds
+them from review history.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'dna_tone_signals_001'
+down_revision: Union[str, None] = 'draft_saved_at_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMNS = [
+    'specificity_hits_sum',
+    'encouragement_hits_sum',
+]
+
+
+def upgrade() -> None:
+    """Add signal sum columns (existing rows are backfilled by recalculate_all_dna)."""
+    for name in COLUMNS:
+        op.add_column('reviewer_dna', sa.Column(name, sa.Float(), nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    """Drop signal sum columns."""
+    for name in reversed(COLUMNS):
+        op.drop_column('reviewer_dna', name)
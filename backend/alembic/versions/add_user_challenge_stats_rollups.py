@@ -0,0 +1,67 @@
+"""Add challenge stats rollups and leaderboard index to users
+
+Revision ID: challenge_stats_001
+Revises: user_specialties_001
+Create Date: 2026-10-18
+
+Adds per-user rollups for the challenge stats endpoint (votes received in
+completed challenges, votes cast, category challenges joined) so a stats
+read is one row lookup, backfilled from existing entries, votes and
+participants. Also indexes (challenges_won, best_challenge_streak) for the
+challenge leaderboard.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'challenge_stats_001'
+down_revision: Union[str, None] = 'user_specialties_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.add_column(sa.Column('challenge_votes_received', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('challenge_votes_cast', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('category_challenges_joined', sa.Integer(), nullable=False, server_default='0'))
+
+    op.create_index(
+        'idx_users_challenge_leaderboard',
+        'users',
+        ['challenges_won', 'best_challenge_streak'],
+        unique=False
+    )
+
+    # Backfill
+    op.execute("""
+        UPDATE users SET challenge_votes_received = COALESCE((
+            SELECT SUM(challenge_entries.vote_count)
+            FROM challenge_entries
+            JOIN challenges ON challenges.id = challenge_entries.challenge_id
+            WHERE challenge_entries.user_id = users.id
+              AND challenges.completed_at IS NOT NULL
+        ), 0)
+    """)
+    op.execute("""
+        UPDATE users SET challenge_votes_cast = (
+            SELECT COUNT(*) FROM challenge_votes WHERE challenge_votes.voter_id = users.id
+        )
+    """)
+    op.execute("""
+        UPDATE users SET category_challenges_joined = (
+            SELECT COUNT(*) FROM challenge_participants WHERE challenge_participants.user_id = users.id
+        )
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_users_challenge_leaderboard', table_name='users')
+
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('category_challenges_joined')
+        batch_op.drop_column('challenge_votes_cast')
+        batch_op.drop_column('challenge_votes_received')
@@ -0,0 +1,93 @@
+"""Add user_specialties table and reviewer name search indexes
+
+Revision ID: user_specialties_001
+Revises: webhook_inbox_001
+Create Date: 2026-10-18
+
+Normalizes users.specialty_tags (JSON text) into user_specialties so the
+reviewer directory can filter and count tags with index lookups, and
+backfills it from existing profiles. On PostgreSQL, also adds pg_trgm
+GIN indexes on lower(full_name) and lower(username) for the directory's
+substring search.
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'user_specialties_001'
+down_revision: Union[str, None] = 'webhook_inbox_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _normalized_rows(user_id: int, tags_json: str) -> list:
+    try:
+        tags = json.loads(tags_json)
+    except (json.JSONDecodeError, TypeError):
+        return []
+    if not isinstance(tags, list):
+        return []
+
+    rows = []
+    seen = set()
+    for raw in tags:
+        if not isinstance(raw, str):
+            continue
+        label = raw.strip()[:50]
+        tag = label.lower()
+        if not tag or tag in seen:
+            continue
+        seen.add(tag)
+        rows.append({'user_id': user_id, 'tag': tag, 'label': label, 'position': len(rows)})
+    return rows
+
+
+def upgrade() -> None:
+    user_specialties = op.create_table(
+        'user_specialties',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('tag', sa.String(length=50), nullable=False),
+        sa.Column('label', sa.String(length=50), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'tag'),
+    )
+    op.create_index('idx_user_specialties_tag_user', 'user_specialties', ['tag', 'user_id'], unique=False)
+
+    # Backfill from the JSON column
+    bind = op.get_bind()
+    users = bind.execute(
+        sa.text("SELECT id, specialty_tags FROM users WHERE specialty_tags IS NOT NULL")
+    ).fetchall()
+    rows = []
+    for user_id, tags_json in users:
+        rows.extend(_normalized_rows(user_id, tags_json))
+    if rows:
+        op.bulk_insert(user_specialties, rows)
+
+    # Trigram indexes are PostgreSQL-specific, skip for SQLite
+    if bind.dialect.name == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS idx_users_full_name_trgm "
+            "ON users USING gin (lower(full_name) gin_trgm_ops)"
+        )
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS idx_users_username_trgm "
+            "ON users USING gin (lower(username) gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+
+    if bind.dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS idx_users_username_trgm")
+        op.execute("DROP INDEX IF EXISTS idx_users_full_name_trgm")
+
+    op.drop_index('idx_user_specialties_tag_user', table_name='user_specialties')
+    op.drop_table('user_specialties')
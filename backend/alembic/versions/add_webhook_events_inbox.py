@@ -0,0 +1,56 @@
+"""Add webhook_events inbox table
+
+Revision ID: webhook_inbox_001
+Revises: reviewer_dna_stats_001
+Create Date: 2026-10-18
+
+Stripe webhooks are persisted here and acknowledged immediately, then
+processed by a worker pool. (provider, event_id) is unique so duplicate
+deliveries are dropped.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'webhook_inbox_001'
+down_revision: Union[str, None] = 'reviewer_dna_stats_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'webhook_events',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('provider', sa.String(length=20), nullable=False, server_default='stripe'),
+        sa.Column('event_id', sa.String(length=255), nullable=False),
+        sa.Column('event_type', sa.String(length=100), nullable=False),
+        sa.Column('object_id', sa.String(length=255), nullable=True),
+        sa.Column('account_id', sa.String(length=255), nullable=True),
+        sa.Column('payload', sa.Text(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False, server_default='pending'),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('event_created_at', sa.DateTime(), nullable=True),
+        sa.Column('received_at', sa.DateTime(), nullable=False),
+        sa.Column('next_attempt_at', sa.DateTime(), nullable=False),
+        sa.Column('locked_at', sa.DateTime(), nullable=True),
+        sa.Column('processed_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('provider', 'event_id', name='uq_webhook_events_provider_event_id'),
+    )
+    op.create_index(op.f('ix_webhook_events_id'), 'webhook_events', ['id'], unique=False)
+    op.create_index(op.f('ix_webhook_events_event_type'), 'webhook_events', ['event_type'], unique=False)
+    op.create_index('idx_webhook_events_status_next_attempt', 'webhook_events', ['status', 'next_attempt_at'], unique=False)
+    op.create_index('idx_webhook_events_object', 'webhook_events', ['object_id', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_webhook_events_object', table_name='webhook_events')
+    op.drop_index('idx_webhook_events_status_next_attempt', table_name='webhook_events')
+    op.drop_index(op.f('ix_webhook_events_event_type'), table_name='webhook_events')
+    op.drop_index(op.f('ix_webhook_events_id'), table_name='webhook_events')
+    op.drop_table('webhook_events')
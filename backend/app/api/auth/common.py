@@ -24,6 +24,10 @@ from app.schemas.user import UserCreate, UserLogin, UserResponse
 from app.core.security import (
     verify_password,
     get_password_hash,
+    verify_password_async,
+    get_password_hash_async,
+    verify_and_update_password,
+    verify_dummy_password,
     create_access_token,
     create_refresh_token,
     decode_refresh_token,
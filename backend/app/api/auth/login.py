@@ -22,8 +22,10 @@ from app.api.auth.common import (
     User,
     UserLogin,
     UserResponse,
-    verify_password,
-    get_password_hash,
+    verify_password_async,
+    get_password_hash_async,
+    verify_and_update_password,
+    verify_dummy_password,
     create_access_token,
     create_refresh_token,
     decode_refresh_token,
@@ -75,12 +77,15 @@ async def login(
     user = result.scalar_one_or_none()
 
     # Always verify password to prevent timing attacks
+    # (bcrypt runs on the hashing pool, off the event loop)
+    new_password_hash = None
     if user:
-        password_valid = verify_password(credentials.password, user.hashed_password)
+        password_valid, new_password_hash = await verify_and_update_password(
+            credentials.password, user.hashed_password
+        )
     else:
-        # Run password hash to maintain consistent timing
-        get_password_hash(credentials.password)
-        password_valid = False
+        # Verify against a dummy hash to maintain consistent timing
+        password_valid = await verify_dummy_password(credentials.password)
 
     # Generic error message to prevent email enumeration
     if not user or not password_valid:
@@ -102,8 +107,10 @@ async def login(
         )
         raise InactiveUserError()
 
-    # Update last login
+    # Update last login, upgrading the password hash if its cost is outdated
     user.last_login = datetime.utcnow()
+    if new_password_hash:
+        user.hashed_password = new_password_hash
     await db.commit()
 
     # Create access and refresh tokens
@@ -270,7 +277,7 @@ async def change_password(
         )
 
     # Verify current password
-    if not verify_password(password_data.current_password, current_user.hashed_password):
+    if not await verify_password_async(password_data.current_password, current_user.hashed_password):
         security_logger.log_auth_failure(
             current_user.email,
             request,
@@ -280,13 +287,13 @@ async def change_password(
         raise InvalidInputError(message="Current password is incorrect")
 
     # Ensure new password is different
-    if verify_password(password_data.new_password, current_user.hashed_password):
+    if await verify_password_async(password_data.new_password, current_user.hashed_password):
         raise InvalidInputError(
             message="New password must be different from current password"
         )
 
     # Update password
-    current_user.hashed_password = get_password_hash(password_data.new_password)
+    current_user.hashed_password = await get_password_hash_async(password_data.new_password)
     await db.commit()
 
     security_logger.log_auth_success(current_user.email, request, event_type="change_password")
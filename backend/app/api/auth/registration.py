@@ -16,7 +16,7 @@ from app.api.auth.common import (
     User,
     UserCreate,
     UserResponse,
-    get_password_hash,
+    get_password_hash_async,
     generate_unique_username,
     security_logger,
     settings,
@@ -69,7 +69,7 @@ async def register(
         )
 
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash_async(user_data.password)
 
     # Auto-generate full_name from email prefix if not provided
     full_name = user_data.full_name
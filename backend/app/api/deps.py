@@ -1,5 +1,7 @@
 """Dependencies for API endpoints"""
 
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Optional
 from fastapi import Cookie, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -16,35 +18,74 @@ from app.core.exceptions import (
     BannedUserError,
     SuspendedUserError,
 )
-from app.models.user import User
+from app.models.user import User, UserRole, UserTier, SubscriptionTier
 from app.schemas.user import TokenData
 from app.services.infrastructure.redis_service import redis_service
 
 security = HTTPBearer()
 
+# Errors meaning "no usable session"; optional dependencies turn these into None
+_AUTH_ERRORS = (
+    NotAuthenticatedError,
+    TokenRevokedError,
+    TokenInvalidError,
+    InactiveUserError,
+    BannedUserError,
+    SuspendedUserError,
+)
 
-async def get_current_user(
-    access_token: Optional[str] = Cookie(None),
-    db: AsyncSession = Depends(get_db)
-) -> User:
+
+@dataclass
+class AuthPrincipal:
     """
-    Dependency to get the current authenticated user from JWT token in cookie
+    The authenticated caller, loaded with a column-limited query.
 
-    Args:
-        access_token: JWT access token from httpOnly cookie
-        db: Database session
+    Carries what most routes need (id, role, tier, account status) without
+    hydrating the full User row. Handlers that need the ORM object call
+    get_user(), which loads it once per request.
+    """
 
-    Returns:
-        Current authenticated user
+    id: int
+    email: str
+    role: UserRole
+    user_tier: UserTier
+    subscription_tier: SubscriptionTier
+    is_active: bool
+    is_banned: bool
+    is_suspended: bool
+    suspended_until: Optional[datetime]
+    _db: AsyncSession = field(repr=False, compare=False)
+    _user: Optional[User] = field(default=None, repr=False, compare=False)
+
+    @property
+    def is_admin(self) -> bool:
+        return self.role == UserRole.ADMIN
+
+    async def get_user(self) -> User:
+        """Load (once) and return the full User for this principal"""
+        if self._user is None:
+            self._user = await self._db.get(User, self.id)
+            if self._user is None:
+                raise TokenInvalidError(message="User not found")
+        return self._user
+
+
+# Columns loaded for an AuthPrincipal, in dataclass field order
+_PRINCIPAL_COLUMNS = (
+    User.id,
+    User.email,
+    User.role,
+    User.user_tier,
+    User.subscription_tier,
+    User.is_active,
+    User.is_banned,
+    User.is_suspended,
+    User.suspended_until,
+)
 
-    Raises:
-        NotAuthenticatedError: If no token is provided
-        TokenRevokedError: If token has been revoked
-        TokenInvalidError: If token is invalid or user not found
-        InactiveUserError: If user account is inactive
-        BannedUserError: If user account is banned
-        SuspendedUserError: If user account is suspended
-    """
+
+def _user_id_from_token(access_token: Optional[str]) -> int:
+    """Validate the access token cookie and return its user ID"""
     # Check if token exists in cookie
     if not access_token:
         raise NotAuthenticatedError()
@@ -62,78 +103,134 @@ async def get_current_user(
     if user_id is None:
         raise TokenInvalidError()
 
-    # Fetch user from database
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    return user_id
 
-    if user is None:
-        raise TokenInvalidError(message="User not found")
 
-    if not user.is_active:
+def _check_account_status(account) -> None:
+    """Reject inactive, banned and actively suspended accounts (User or AuthPrincipal)"""
+    if not account.is_active:
         raise InactiveUserError()
 
     # Check if user is banned
-    if user.is_banned:
+    if account.is_banned:
         raise BannedUserError()
 
     # Check if user is suspended (and suspension hasn't expired)
-    if user.is_suspended:
-        from datetime import datetime
-        if user.suspended_until and user.suspended_until > datetime.utcnow():
-            raise SuspendedUserError(suspended_until=user.suspended_until.isoformat())
+    if account.is_suspended:
+        if account.suspended_until and account.suspended_until > datetime.utcnow():
+            raise SuspendedUserError(suspended_until=account.suspended_until.isoformat())
+
+
+async def _load_principal(access_token: Optional[str], db: AsyncSession) -> AuthPrincipal:
+    user_id = _user_id_from_token(access_token)
+
+    result = await db.execute(select(*_PRINCIPAL_COLUMNS).where(User.id == user_id))
+    row = result.one_or_none()
+
+    if row is None:
+        raise TokenInvalidError(message="User not found")
+
+    principal = AuthPrincipal(*row, _db=db)
+    _check_account_status(principal)
+    return principal
+
+
+async def _load_user(access_token: Optional[str], db: AsyncSession) -> User:
+    user_id = _user_id_from_token(access_token)
+
+    # Fetch user from database
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalar_one_or_none()
+
+    if user is None:
+        raise TokenInvalidError(message="User not found")
 
+    _check_account_status(user)
     return user
 
 
-async def get_current_user_optional(
+async def get_current_principal(
     access_token: Optional[str] = Cookie(None),
     db: AsyncSession = Depends(get_db)
-) -> Optional[User]:
+) -> AuthPrincipal:
     """
-    Dependency to optionally get the current authenticated user.
+    Dependency to get the authenticated caller without loading the full User.
+
+    Use this instead of get_current_user on routes that only need the
+    user's id, role, tier or status (e.g. notification counts). Same
+    authentication and account-status rules as get_current_user.
+
+    Raises:
+        NotAuthenticatedError: If no token is provided
+        TokenRevokedError: If token has been revoked
+        TokenInvalidError: If token is invalid or user not found
+        InactiveUserError: If user account is inactive
+        BannedUserError: If user account is banned
+        SuspendedUserError: If user account is suspended
+    """
+    return await _load_principal(access_token, db)
+
+
+async def get_current_principal_optional(
+    access_token: Optional[str] = Cookie(None),
+    db: AsyncSession = Depends(get_db)
+) -> Optional[AuthPrincipal]:
+    """
+    Dependency to optionally get the authenticated caller as an AuthPrincipal.
     Returns None if not authenticated instead of raising an exception.
+    """
+    try:
+        return await _load_principal(access_token, db)
+    except _AUTH_ERRORS:
+        return None
+
+
+async def get_current_user(
+    access_token: Optional[str] = Cookie(None),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """
+    Dependency to get the current authenticated user from JWT token in cookie
 
     Args:
         access_token: JWT access token from httpOnly cookie
         db: Database session
 
     Returns:
-        Current authenticated user or None if not authenticated
-    """
-    if not access_token:
-        return None
-
-    # Check if token is blacklisted
-    if redis_service.is_token_blacklisted(access_token):
-        return None
+        Current authenticated user
 
-    payload = decode_access_token(access_token)
-    if payload is None:
-        return None
+    Raises:
+        NotAuthenticatedError: If no token is provided
+        TokenRevokedError: If token has been revoked
+        TokenInvalidError: If token is invalid or user not found
+        InactiveUserError: If user account is inactive
+        BannedUserError: If user account is banned
+        SuspendedUserError: If user account is suspended
+    """
+    return await _load_user(access_token, db)
 
-    user_id: Optional[int] = payload.get("user_id")
-    if user_id is None:
-        return None
 
-    # Fetch user from database
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+async def get_current_user_optional(
+    access_token: Optional[str] = Cookie(None),
+    db: AsyncSession = Depends(get_db)
+) -> Optional[User]:
+    """
+    Dependency to optionally get the current authenticated user.
+    Returns None if not authenticated instead of raising an exception.
 
-    if user is None or not user.is_active:
-        return None
+    Args:
+        access_token: JWT access token from httpOnly cookie
+        db: Database session
 
-    # Banned users get None (treated as not authenticated)
-    if user.is_banned:
+    Returns:
+        Current authenticated user or None if not authenticated
+    """
+    # Banned and actively suspended users are treated as not authenticated
+    try:
+        return await _load_user(access_token, db)
+    except _AUTH_ERRORS:
         return None
 
-    # Suspended users get None if suspension is active
-    if user.is_suspended:
-        from datetime import datetime
-        if user.suspended_until and user.suspended_until > datetime.utcnow():
-            return None
-
-    return user
-
 
 async def get_current_active_user(
     current_user: User = Depends(get_current_user)
@@ -1,12 +1,12 @@
 """Public challenge API endpoints - browsing and viewing challenges."""
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Path as PathParam, Query
+from fastapi import APIRouter, Depends, Path as PathParam, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.db.session import get_db
-from app.api.deps import get_current_user_optional
-from app.models.user import User
+from app.api.deps import AuthPrincipal, get_current_principal_optional
 from app.models.review_request import ContentType
 from app.models.challenge import ChallengeStatus, ChallengeType
 from app.core.exceptions import NotFoundError, InvalidInputError, InternalError, AdminRequiredError
@@ -19,6 +19,7 @@ from app.schemas.challenge import (
     OpenSlotChallengeResponse,
 )
 from app.services.challenges import ChallengeService
+from app.services.infrastructure.response_cache import cached_response
 from app.api.v1.challenges.common import (
     build_challenge_response,
     _build_prompt_response,
@@ -34,14 +35,16 @@ router = APIRouter(tags=["Challenges - Public"])
     response_model=ChallengeListResponse,
     summary="Get challenges"
 )
+@cached_response("challenges", ttl_seconds=settings.CHALLENGE_CACHE_TTL_SECONDS, per_user=True)
 async def get_challenges(
+    request: Request,
     status_filter: Optional[ChallengeStatus] = Query(None, alias="status", description="Filter by status"),
     challenge_type: Optional[ChallengeType] = Query(None, description="Filter by challenge type"),
     content_type: Optional[ContentType] = Query(None, description="Filter by content type"),
     is_featured: Optional[bool] = Query(None, description="Filter by featured status"),
     skip: int = Query(0, ge=0, description="Number to skip"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number"),
-    current_user: Optional[User] = Depends(get_current_user_optional),
+    current_user: Optional[AuthPrincipal] = Depends(get_current_principal_optional),
     db: AsyncSession = Depends(get_db)
 ) -> ChallengeListResponse:
     """Get challenges with filters."""
@@ -75,7 +78,9 @@ async def get_challenges(
     response_model=List[OpenSlotChallengeResponse],
     summary="Get 1v1 challenges with available slots"
 )
+@cached_response("challenges", ttl_seconds=settings.CHALLENGE_CACHE_TTL_SECONDS)
 async def get_open_slot_challenges(
+    request: Request,
     content_type: Optional[ContentType] = Query(None, description="Filter by content type"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number"),
     db: AsyncSession = Depends(get_db)
@@ -127,10 +132,12 @@ async def get_open_slot_challenges(
     response_model=List[ChallengeResponse],
     summary="Get challenges in voting phase"
 )
+@cached_response("challenges", ttl_seconds=settings.CHALLENGE_CACHE_TTL_SECONDS, per_user=True)
 async def get_active_challenges(
+    request: Request,
     content_type: Optional[ContentType] = Query(None, description="Filter by content type"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number"),
-    current_user: Optional[User] = Depends(get_current_user_optional),
+    current_user: Optional[AuthPrincipal] = Depends(get_current_principal_optional),
     db: AsyncSession = Depends(get_db)
 ) -> List[ChallengeResponse]:
     """Get challenges currently in voting phase."""
@@ -154,9 +161,11 @@ async def get_active_challenges(
     response_model=ChallengeLeaderboardResponse,
     summary="Get challenge leaderboard"
 )
+@cached_response("challenges", ttl_seconds=settings.CHALLENGE_CACHE_TTL_SECONDS, per_user=True)
 async def get_leaderboard(
+    request: Request,
     limit: int = Query(50, ge=1, le=100, description="Maximum entries"),
-    current_user: Optional[User] = Depends(get_current_user_optional),
+    current_user: Optional[AuthPrincipal] = Depends(get_current_principal_optional),
     db: AsyncSession = Depends(get_db)
 ) -> ChallengeLeaderboardResponse:
     """Get challenge leaderboard ranked by wins."""
@@ -187,9 +196,11 @@ async def get_leaderboard(
     response_model=ChallengeResponse,
     summary="Get a specific challenge"
 )
+@cached_response("challenges", ttl_seconds=settings.CHALLENGE_CACHE_TTL_SECONDS, per_user=True)
 async def get_challenge(
+    request: Request,
     challenge_id: int = PathParam(..., ge=1, description="Challenge ID"),
-    current_user: Optional[User] = Depends(get_current_user_optional),
+    current_user: Optional[AuthPrincipal] = Depends(get_current_principal_optional),
     db: AsyncSession = Depends(get_db)
 ) -> ChallengeResponse:
     """Get a specific challenge by ID."""
@@ -1,12 +1,21 @@
 """Voting and statistics endpoints for challenges."""
 
-from fastapi import APIRouter, Depends, Path as PathParam
+from fastapi import APIRouter, BackgroundTasks, Depends, Path as PathParam, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.db.session import get_db
 from app.api.deps import get_current_user
 from app.models.user import User
-from app.core.exceptions import NotFoundError, InvalidInputError, InternalError, AdminRequiredError
+from app.core.exceptions import (
+    NotFoundError,
+    InvalidInputError,
+    InvalidStateError,
+    InternalError,
+    AdminRequiredError,
+    AlreadyExistsError,
+    ForbiddenError,
+)
 from app.schemas.challenge import (
     ChallengeVoteCreate,
     ChallengeVoteResponse,
@@ -14,6 +23,8 @@ from app.schemas.challenge import (
     ChallengeStats,
 )
 from app.services.challenges import ChallengeService
+from app.services.challenges.entry_service import award_vote_karma
+from app.services.infrastructure.response_cache import cached_response
 from app.api.v1.challenges.common import logger
 
 router = APIRouter(tags=["Challenges - Voting"])
@@ -30,6 +41,7 @@ router = APIRouter(tags=["Challenges - Voting"])
 )
 async def cast_vote(
     vote_data: ChallengeVoteCreate,
+    background_tasks: BackgroundTasks,
     challenge_id: int = PathParam(..., ge=1, description="Challenge ID"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
@@ -42,6 +54,7 @@ async def cast_vote(
             voter_id=current_user.id,
             entry_id=vote_data.entry_id
         )
+        background_tasks.add_task(award_vote_karma, current_user.id)
 
         logger.info(
             f"Vote cast: challenge={challenge_id}, entry={vote_data.entry_id}, user={current_user.email}"
@@ -54,6 +67,8 @@ async def cast_vote(
             entry_id=vote.entry_id,
             voted_at=vote.voted_at
         )
+    except (NotFoundError, InvalidStateError, AlreadyExistsError, ForbiddenError):
+        raise
     except ValueError as e:
         raise InvalidInputError(message=str(e))
     except Exception as e:
@@ -102,7 +117,12 @@ async def get_my_stats(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ) -> ChallengeStats:
-    """Get challenge statistics for the current user."""
+    """
+    Get challenge statistics for the current user.
+
+    Not cached: votes don't invalidate the challenge cache, and a voter
+    should see their own vote count right away.
+    """
     try:
         service = ChallengeService(db)
         stats = await service.get_user_challenge_stats(current_user.id)
@@ -118,7 +138,9 @@ async def get_my_stats(
     response_model=ChallengeStats,
     summary="Get user challenge stats"
 )
+@cached_response("challenges", ttl_seconds=settings.CHALLENGE_CACHE_TTL_SECONDS)
 async def get_user_stats(
+    request: Request,
     user_id: int = PathParam(..., ge=1, description="User ID"),
     db: AsyncSession = Depends(get_db)
 ) -> ChallengeStats:
@@ -12,6 +12,7 @@ from sqlalchemy import select, and_, or_, func, desc, asc
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.crud import review_loading
 from .common import (
     create_router,
     limiter,
@@ -251,7 +252,7 @@ async def get_desktop_creator_my_requests(
         query = (
             select(ReviewRequest)
             .where(ReviewRequest.user_id == current_user.id)
-            .options(selectinload(ReviewRequest.slots))
+            .options(*review_loading.SLOT_SUMMARY)
         )
 
         # Apply status filter (multiple)
@@ -24,6 +24,7 @@ from slowapi.util import get_remote_address
 from app.api.deps import get_current_user, get_db
 from app.constants import RateLimits, PaginationDefaults
 from app.core.exceptions import InternalError, InvalidInputError
+from app.crud import review_loading
 from app.models.user import User
 from app.models.review_slot import ReviewSlot, ReviewSlotStatus, PaymentStatus
 from app.models.review_request import ReviewRequest, ReviewStatus
@@ -207,7 +208,7 @@ async def get_creator_my_requests(
         query = (
             select(ReviewRequest)
             .where(ReviewRequest.user_id == current_user.id)
-            .options(selectinload(ReviewRequest.slots))
+            .options(*review_loading.SLOT_SUMMARY)
         )
 
         # Apply status filter
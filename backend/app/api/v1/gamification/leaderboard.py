@@ -11,15 +11,17 @@ Provides rankings for users based on various metrics:
 
 from typing import List, Optional
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, Query, Response, Cookie
+from fastapi import APIRouter, Depends, Query, Request, Cookie
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_, case, literal_column
 from sqlalchemy.sql import Select
 
 from app.db.session import get_db
+from app.core.config import settings
 from app.core.security import decode_access_token
 from app.api.deps import get_current_user
 from app.models.user import User, UserTier
+from app.services.infrastructure.response_cache import cached_response
 from app.schemas.leaderboard import (
     LeaderboardResponse,
     LeaderboardEntry,
@@ -320,8 +322,9 @@ async def build_leaderboard(
 # ==================== Endpoints ====================
 
 @router.get("/karma", response_model=LeaderboardResponse)
+@cached_response("leaderboards", ttl_seconds=settings.LEADERBOARD_CACHE_TTL_SECONDS, per_user=True)
 async def get_karma_leaderboard(
-    response: Response,
+    request: Request,
     period: str = Query("all_time", regex="^(weekly|monthly|all_time)$"),
     tier: Optional[str] = Query(None, description="Filter by tier (novice, contributor, skilled, trusted_advisor, expert, master)"),
     limit: int = Query(50, ge=1, le=100),
@@ -341,9 +344,6 @@ async def get_karma_leaderboard(
     Returns:
         Leaderboard with top users by karma points, including current user's position
     """
-    # Add cache headers (5 minute cache)
-    response.headers["Cache-Control"] = "public, max-age=300"
-
     return await build_leaderboard(
         db=db,
         stat_column=User.sparks_points,
@@ -357,8 +357,9 @@ async def get_karma_leaderboard(
 
 
 @router.get("/acceptance-rate", response_model=LeaderboardResponse)
+@cached_response("leaderboards", ttl_seconds=settings.LEADERBOARD_CACHE_TTL_SECONDS, per_user=True)
 async def get_acceptance_rate_leaderboard(
-    response: Response,
+    request: Request,
     period: str = Query("all_time", regex="^(weekly|monthly|all_time)$"),
     tier: Optional[str] = Query(None, description="Filter by tier"),
     limit: int = Query(50, ge=1, le=100),
@@ -380,9 +381,6 @@ async def get_acceptance_rate_leaderboard(
     Returns:
         Leaderboard with top users by acceptance rate
     """
-    # Add cache headers (5 minute cache)
-    response.headers["Cache-Control"] = "public, max-age=300"
-
     return await build_leaderboard(
         db=db,
         stat_column=User.acceptance_rate,
@@ -396,8 +394,9 @@ async def get_acceptance_rate_leaderboard(
 
 
 @router.get("/streak", response_model=LeaderboardResponse)
+@cached_response("leaderboards", ttl_seconds=settings.LEADERBOARD_CACHE_TTL_SECONDS, per_user=True)
 async def get_streak_leaderboard(
-    response: Response,
+    request: Request,
     period: str = Query("all_time", regex="^(weekly|monthly|all_time)$"),
     tier: Optional[str] = Query(None, description="Filter by tier"),
     limit: int = Query(50, ge=1, le=100),
@@ -417,9 +416,6 @@ async def get_streak_leaderboard(
     Returns:
         Leaderboard with top users by current streak
     """
-    # Add cache headers (5 minute cache)
-    response.headers["Cache-Control"] = "public, max-age=300"
-
     return await build_leaderboard(
         db=db,
         stat_column=User.current_streak,
@@ -433,8 +429,9 @@ async def get_streak_leaderboard(
 
 
 @router.get("/reviews", response_model=LeaderboardResponse)
+@cached_response("leaderboards", ttl_seconds=settings.LEADERBOARD_CACHE_TTL_SECONDS, per_user=True)
 async def get_reviews_leaderboard(
-    response: Response,
+    request: Request,
     period: str = Query("all_time", regex="^(weekly|monthly|all_time)$"),
     tier: Optional[str] = Query(None, description="Filter by tier"),
     limit: int = Query(50, ge=1, le=100),
@@ -454,9 +451,6 @@ async def get_reviews_leaderboard(
     Returns:
         Leaderboard with top users by accepted review count
     """
-    # Add cache headers (5 minute cache)
-    response.headers["Cache-Control"] = "public, max-age=300"
-
     return await build_leaderboard(
         db=db,
         stat_column=User.accepted_reviews_count,
@@ -470,8 +464,9 @@ async def get_reviews_leaderboard(
 
 
 @router.get("/helpful", response_model=LeaderboardResponse)
+@cached_response("leaderboards", ttl_seconds=settings.LEADERBOARD_CACHE_TTL_SECONDS, per_user=True)
 async def get_helpful_leaderboard(
-    response: Response,
+    request: Request,
     period: str = Query("all_time", regex="^(weekly|monthly|all_time)$"),
     tier: Optional[str] = Query(None, description="Filter by tier"),
     limit: int = Query(50, ge=1, le=100),
@@ -493,9 +488,6 @@ async def get_helpful_leaderboard(
     Returns:
         Leaderboard with top users by average rating
     """
-    # Add cache headers (5 minute cache)
-    response.headers["Cache-Control"] = "public, max-age=300"
-
     return await build_leaderboard(
         db=db,
         stat_column=User.avg_rating,
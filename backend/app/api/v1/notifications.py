@@ -10,8 +10,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
-from app.api.deps import get_current_user
-from app.models.user import User
+from app.api.deps import AuthPrincipal, get_current_principal
 from app.models.notification import NotificationType, NotificationPriority, EntityType
 from app.schemas.notification import (
     NotificationResponse,
@@ -42,7 +41,7 @@ async def get_notifications(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_principal),
 ):
     """
     Get paginated list of notifications for the current user.
@@ -111,7 +110,7 @@ async def get_notifications(
 @router.get("/unread-count", response_model=dict)
 async def get_unread_count(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_principal),
 ):
     """
     Get count of unread notifications for the current user.
@@ -133,7 +132,7 @@ async def get_unread_count(
 @router.get("/stats", response_model=NotificationStatsResponse)
 async def get_notification_stats(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_principal),
 ):
     """
     Get notification statistics for the current user.
@@ -169,7 +168,7 @@ async def get_notification_stats(
 async def get_notification(
     notification_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_principal),
 ):
     """Get a specific notification by ID"""
     try:
@@ -197,7 +196,7 @@ async def mark_notification_read(
     notification_id: int,
     data: NotificationMarkRead,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_principal),
 ):
     """
     Mark a notification as read or unread.
@@ -237,7 +236,7 @@ async def mark_notification_read(
 async def mark_all_notifications_read(
     data: NotificationMarkAllRead,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_principal),
 ):
     """
     Mark all unread notifications as read for the current user.
@@ -264,7 +263,7 @@ async def archive_notification(
     notification_id: int,
     data: NotificationArchive,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_principal),
 ):
     """
     Archive or unarchive a notification.
@@ -303,7 +302,7 @@ async def archive_notification(
 async def delete_notification(
     notification_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_principal),
 ):
     """
     Delete a notification permanently.
@@ -333,7 +332,7 @@ async def delete_notification(
 @router.get("/preferences/me", response_model=NotificationPreferencesResponse)
 async def get_notification_preferences(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_principal),
 ):
     """
     Get notification preferences for the current user.
@@ -360,7 +359,7 @@ async def get_notification_preferences(
 async def update_notification_preferences(
     updates: NotificationPreferencesUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_principal),
 ):
     """
     Update notification preferences for the current user.
@@ -36,6 +36,7 @@ from app.schemas.profile import (
     is_username_reserved,
 )
 from app.crud import profile as profile_crud
+from app.services.infrastructure.response_cache import cached_response, response_cache
 from app.core.config import settings
 from app.core.logging_config import logging
 from app.services.infrastructure.image_service import ImageService, ImageValidationError, ImageProcessingError
@@ -76,6 +77,11 @@ def _ensure_absolute_avatar_url(avatar_url: Optional[str]) -> Optional[str]:
     return avatar_url
 
 
+async def _invalidate_public_pages() -> None:
+    """Drop cached public profile, reviewer directory and leaderboard responses after a profile change"""
+    await response_cache.invalidate("profiles", "reviewers", "leaderboards")
+
+
 @router.get("/me", response_model=ProfileResponse)
 async def get_my_profile(
     current_user: User = Depends(get_current_user),
@@ -184,7 +190,9 @@ async def check_username_availability(
 
 
 @router.get("/{identifier}", response_model=ProfileResponse)
+@cached_response("profiles", ttl_seconds=settings.PROFILE_CACHE_TTL_SECONDS, private=True)
 async def get_user_profile(
+    request: Request,
     identifier: str,
     db: AsyncSession = Depends(get_db),
 ) -> ProfileResponse:
@@ -281,6 +289,7 @@ async def update_my_profile(
         raise NotFoundError(resource="User")
 
     logger.info(f"Profile updated for user {current_user.id}")
+    await _invalidate_public_pages()
 
     # Parse JSON fields
     specialty_tags = profile_crud.parse_user_specialty_tags(updated_user)
@@ -437,6 +446,7 @@ async def upload_avatar(
 
         try:
             updated_user = await profile_crud.update_avatar(db, current_user.id, avatar_url)
+            await _invalidate_public_pages()
 
             if not updated_user:
                 # Clean up uploaded files if database update fails
@@ -522,6 +532,7 @@ async def delete_avatar(
 
         # Clear avatar URL from database
         updated_user = await profile_crud.update_avatar(db, current_user.id, None)
+        await _invalidate_public_pages()
 
         if not updated_user:
             raise NotFoundError(resource="User")
@@ -569,7 +580,9 @@ async def get_my_avatar(
 
 
 @router.get("/{user_id}/stats", response_model=ProfileStatsResponse)
+@cached_response("profiles", ttl_seconds=settings.PROFILE_CACHE_TTL_SECONDS)
 async def get_user_stats(
+    request: Request,
     user_id: int,
     db: AsyncSession = Depends(get_db),
 ) -> ProfileStatsResponse:
@@ -623,6 +636,7 @@ async def refresh_my_stats(
     await profile_crud.award_badges(db, current_user.id)
 
     logger.info(f"Stats refreshed for user {current_user.id}")
+    await _invalidate_public_pages()
 
     return ProfileStatsResponse(
         total_reviews_given=updated_user.total_reviews_given,
@@ -634,7 +648,9 @@ async def refresh_my_stats(
 
 
 @router.get("/{user_id}/badges")
+@cached_response("profiles", ttl_seconds=settings.PROFILE_CACHE_TTL_SECONDS)
 async def get_user_badges(
+    request: Request,
     user_id: int,
     db: AsyncSession = Depends(get_db),
 ) -> dict:
@@ -729,8 +745,8 @@ async def recalculate_my_dna(
     """
     Recalculate authenticated user's Reviewer DNA
 
-    Triggers a full recalculation of DNA dimensions based on
-    all review history. Use this after significant review activity.
+    Recomputes DNA dimensions from the reviewer's running review
+    statistics (kept up to date as reviews are submitted and accepted).
 
     Returns:
         Updated DNA profile
@@ -824,6 +840,7 @@ async def complete_onboarding(
 
     await db.commit()
     await db.refresh(current_user)
+    await _invalidate_public_pages()
 
     logger.info(
         f"Onboarding completed for user {current_user.id}: "
@@ -893,6 +910,7 @@ async def update_reviewer_settings(
 
     await db.commit()
     await db.refresh(current_user)
+    await _invalidate_public_pages()
 
     logger.info(f"Reviewer settings updated for user {current_user.id}")
 
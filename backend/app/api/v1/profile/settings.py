@@ -10,6 +10,7 @@ from app.models.user import User
 from app.models.privacy_settings import PrivacySettings, ProfileVisibility as DBProfileVisibility
 from app.schemas.privacy import PrivacySettingsResponse, PrivacySettingsUpdate, ProfileVisibility
 from app.api.deps import get_current_user
+from app.services.infrastructure.response_cache import response_cache
 
 router = APIRouter(prefix="/settings", tags=["Settings"])
 
@@ -88,6 +89,7 @@ async def update_privacy_settings(
 
     # Apply updates
     update_data = updates.model_dump(exclude_unset=True)
+    visibility_before = (settings.show_on_leaderboard, settings.profile_visibility)
 
     for field, value in update_data.items():
         if field == "profile_visibility" and value is not None:
@@ -100,6 +102,9 @@ async def update_privacy_settings(
     await db.commit()
     await db.refresh(settings)
 
+    if (settings.show_on_leaderboard, settings.profile_visibility) != visibility_before:
+        await response_cache.invalidate("leaderboards", "profiles", "reviewers")
+
     return PrivacySettingsResponse(
         profile_visibility=ProfileVisibility(settings.profile_visibility.value),
         show_on_leaderboard=settings.show_on_leaderboard,
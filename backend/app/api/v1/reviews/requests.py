@@ -27,6 +27,7 @@ from app.schemas.review import (
     ReviewRequestListResponse,
     ReviewRequestStats,
 )
+from app.crud import review_loading
 from app.crud.review import review_crud
 from app.core.logging_config import get_logger
 from app.services.subscription_service import SubscriptionService
@@ -301,6 +302,14 @@ async def get_review_request(
         if not (is_owner or is_reviewer or is_available_for_claiming):
             raise ForbiddenError(message="You don't have permission to view this review")
 
+        # Slot content is deferred: load it only for submitted slots this
+        # user is allowed to read (see the slot filter below)
+        await review_loading.load_slot_content(db, [
+            slot for slot in review.slots
+            if slot.submitted_at is not None
+            and (is_owner or slot.reviewer_id == current_user.id or slot.status == "accepted")
+        ])
+
         # Prepare response with requester information
         response_data = ReviewRequestResponse.model_validate(review)
 
@@ -5,14 +5,15 @@ Provides a searchable/filterable directory of reviewers.
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query, Response
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
 from pydantic import BaseModel, Field
-import json
 
+from app.core.config import settings
 from app.db.session import get_db
-from app.models.user import User, UserTier, ReviewerAvailability
+from app.models.user import UserTier
+from app.services.infrastructure.response_cache import cached_response
+from app.services.reviewer_directory_service import ReviewerDirectoryService
 
 
 router = APIRouter(prefix="/reviewers", tags=["Reviewers"])
@@ -78,8 +79,9 @@ class ReviewerFiltersResponse(BaseModel):
 # ==================== Endpoints ====================
 
 @router.get("", response_model=ReviewerDirectoryResponse)
+@cached_response("reviewers", ttl_seconds=settings.REVIEWER_DIRECTORY_CACHE_TTL_SECONDS)
 async def get_reviewer_directory(
-    response: Response,
+    request: Request,
     search: Optional[str] = Query(None, description="Search by name or username"),
     tier: Optional[str] = Query(None, description="Filter by tier (novice, contributor, skilled, trusted_advisor, expert, master)"),
     specialty: Optional[str] = Query(None, description="Filter by specialty tag"),
@@ -109,115 +111,52 @@ async def get_reviewer_directory(
 
     Returns:
         Paginated list of reviewers with metadata
-    """
-    # Add cache headers (5 minute cache)
-    response.headers["Cache-Control"] = "public, max-age=300"
-
-    # Build base query - users who have opted into the reviewer directory
-    query = select(User).where(
-        and_(
-            User.is_active == True,
-            User.is_listed_as_reviewer == True,
-            User.total_reviews_given >= min_reviews
-        )
-    )
-
-    # Apply search filter
-    if search:
-        search_term = f"%{search.lower()}%"
-        query = query.where(
-            or_(
-                func.lower(User.full_name).like(search_term),
-                func.lower(User.username).like(search_term)
-            )
-        )
 
-    # Apply tier filter
+    Cached for 5 minutes per filter set (ETag/304 supported).
+    """
+    tier_enum = None
     if tier:
         try:
             tier_enum = UserTier(tier.lower())
-            query = query.where(User.user_tier == tier_enum)
         except ValueError:
             pass  # Invalid tier, ignore filter
 
-    # Apply specialty filter
-    if specialty:
-        # specialty_tags is stored as JSON text, search within it
-        query = query.where(
-            func.lower(User.specialty_tags).like(f'%"{specialty.lower()}"%')
-        )
-
-    # Apply minimum rating filter
-    if min_rating is not None:
-        query = query.where(User.avg_rating >= min_rating)
-
-    # Get total count before pagination
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total_entries = total_result.scalar_one()
-
-    # Apply sorting
-    sort_column_map = {
-        "karma": User.sparks_points,
-        "rating": User.avg_rating,
-        "reviews": User.total_reviews_given,
-        "response_time": User.avg_response_time_hours,
-        "acceptance_rate": User.acceptance_rate,
-    }
-    sort_column = sort_column_map.get(sort_by, User.sparks_points)
-
-    if sort_order == "desc":
-        # For response_time, nulls should be last (slower is worse)
-        if sort_by == "response_time":
-            query = query.order_by(sort_column.asc().nulls_last(), User.id)
-        else:
-            query = query.order_by(sort_column.desc().nulls_last(), User.id)
-    else:
-        if sort_by == "response_time":
-            query = query.order_by(sort_column.desc().nulls_last(), User.id)
-        else:
-            query = query.order_by(sort_column.asc().nulls_first(), User.id)
-
-    # Apply pagination
-    query = query.limit(limit).offset(offset)
-
-    # Execute query
-    result = await db.execute(query)
-    users = result.scalars().all()
-
-    # Build reviewer entries
-    reviewers = []
-    for user in users:
-        # Parse specialty tags from JSON
-        specialty_tags = []
-        if user.specialty_tags:
-            try:
-                specialty_tags = json.loads(user.specialty_tags)
-                if not isinstance(specialty_tags, list):
-                    specialty_tags = []
-            except (json.JSONDecodeError, TypeError):
-                specialty_tags = []
-
-        entry = ReviewerEntry(
-            user_id=user.id,
-            username=user.username,
-            full_name=user.full_name,
-            avatar_url=user.avatar_url,
-            title=user.title,
-            bio=user.bio[:200] + "..." if user.bio and len(user.bio) > 200 else user.bio,
-            reviewer_tagline=user.reviewer_tagline,
-            user_tier=user.user_tier.value,
-            specialty_tags=specialty_tags[:5],  # Limit to first 5 tags
-            availability=user.reviewer_availability.value if user.reviewer_availability else "available",
-            total_reviews_given=user.total_reviews_given or 0,
-            accepted_reviews_count=user.accepted_reviews_count or 0,
-            acceptance_rate=float(user.acceptance_rate) if user.acceptance_rate else None,
-            avg_rating=float(user.avg_rating) if user.avg_rating else None,
-            avg_response_time_hours=user.avg_response_time_hours,
-            karma_points=user.sparks_points or 0,
-            current_streak=user.current_streak or 0,
+    service = ReviewerDirectoryService(db)
+    rows, total_entries = await service.list_reviewers(
+        search=search,
+        tier=tier_enum,
+        specialty=specialty,
+        min_reviews=min_reviews,
+        min_rating=min_rating,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        limit=limit,
+        offset=offset,
+    )
+    specialty_labels = await service.get_specialty_labels([row.id for row in rows])
+
+    reviewers = [
+        ReviewerEntry(
+            user_id=row.id,
+            username=row.username,
+            full_name=row.full_name,
+            avatar_url=row.avatar_url,
+            title=row.title,
+            bio=row.bio[:200] + "..." if row.bio and len(row.bio) > 200 else row.bio,
+            reviewer_tagline=row.reviewer_tagline,
+            user_tier=row.user_tier.value,
+            specialty_tags=specialty_labels.get(row.id, []),  # First 5 tags
+            availability=row.reviewer_availability.value if row.reviewer_availability else "available",
+            total_reviews_given=row.total_reviews_given or 0,
+            accepted_reviews_count=row.accepted_reviews_count or 0,
+            acceptance_rate=float(row.acceptance_rate) if row.acceptance_rate else None,
+            avg_rating=float(row.avg_rating) if row.avg_rating else None,
+            avg_response_time_hours=row.avg_response_time_hours,
+            karma_points=row.sparks_points or 0,
+            current_streak=row.current_streak or 0,
         )
-        reviewers.append(entry)
+        for row in rows
+    ]
 
     # Build metadata
     metadata = ReviewerDirectoryMetadata(
@@ -236,62 +175,28 @@ async def get_reviewer_directory(
 
 
 @router.get("/filters", response_model=ReviewerFiltersResponse)
+@cached_response("reviewers", ttl_seconds=settings.REVIEWER_FILTERS_CACHE_TTL_SECONDS)
 async def get_reviewer_filters(
-    response: Response,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """
     Get available filters for the reviewer directory.
 
     Returns all tiers and popular specialty tags with counts.
+    Cached for 10 minutes (ETag/304 supported).
     """
-    # Add cache headers (10 minute cache)
-    response.headers["Cache-Control"] = "public, max-age=600"
-
-    # Get total reviewers count (users who have opted into directory)
-    total_query = select(func.count()).where(
-        and_(
-            User.is_active == True,
-            User.is_listed_as_reviewer == True
-        )
-    )
-    total_result = await db.execute(total_query)
-    total_reviewers = total_result.scalar_one()
-
-    # Get all tiers
-    tiers = [tier.value for tier in UserTier]
-
-    # Get specialty tags with counts (only from listed reviewers)
-    # This is a bit complex since specialty_tags is JSON stored as text
-    users_query = select(User.specialty_tags).where(
-        and_(
-            User.is_active == True,
-            User.is_listed_as_reviewer == True,
-            User.specialty_tags.isnot(None)
-        )
-    )
-    users_result = await db.execute(users_query)
-
-    # Count specialty tags
-    tag_counts: dict[str, int] = {}
-    for (tags_json,) in users_result.all():
-        if tags_json:
-            try:
-                tags = json.loads(tags_json)
-                if isinstance(tags, list):
-                    for tag in tags:
-                        if isinstance(tag, str):
-                            tag_lower = tag.lower()
-                            tag_counts[tag_lower] = tag_counts.get(tag_lower, 0) + 1
-            except (json.JSONDecodeError, TypeError):
-                pass
-
-    # Sort by count and take top 20
-    sorted_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)[:20]
-    specialties = [SpecialtyCount(tag=tag, count=count) for tag, count in sorted_tags]
+    service = ReviewerDirectoryService(db)
+    total_reviewers = await service.count_listed_reviewers()
+
+    # Popular specialty tags among listed reviewers (top 20)
+    specialties = [
+        SpecialtyCount(tag=tag, count=count)
+        for tag, count in await service.get_top_specialties(limit=20)
+    ]
 
     return ReviewerFiltersResponse(
-        tiers=tiers,
+        tiers=[tier.value for tier in UserTier],
         specialties=specialties,
         total_reviewers=total_reviewers,
     )
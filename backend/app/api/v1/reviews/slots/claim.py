@@ -15,6 +15,7 @@ from app.services.claim_service import (
     TierPermissionError as ServiceTierPermission,
 )
 from app.services.gamification.review_sparks_hooks import on_claim_abandoned
+from app.services.infrastructure.draft_buffer import draft_buffer
 from app.services.notifications.triggers import notify_slot_claimed, notify_slot_abandoned
 from app.core.exceptions import (
     ApplicationRequiredError,
@@ -102,6 +103,7 @@ async def abandon_review_slot(
             db, slot_id, current_user.id
         )
 
+        draft_buffer.discard(slot_id)
         await on_claim_abandoned(db, abandoned_slot.id, current_user.id)
         await notify_slot_abandoned(db, slot_id, current_user.id)
         logger.info(f"User {current_user.id} abandoned slot {slot_id}")
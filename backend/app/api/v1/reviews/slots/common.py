@@ -1,8 +1,9 @@
 """Common dependencies and helpers for review slots endpoints"""
 
 import logging
+from datetime import datetime
 from functools import wraps
-from typing import Callable, TypeVar
+from typing import Any, Callable, Optional, Tuple, TypeVar
 
 from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,6 +15,7 @@ from app.models.user import User
 from app.models.review_slot import ReviewSlot
 from app.models.review_request import ReviewRequest
 from app.crud import review_slot as crud_review_slot
+from app.services.infrastructure.draft_buffer import draft_buffer
 from app.core.exceptions import (
     SlotNotFoundError,
     NotOwnerError,
@@ -81,6 +83,26 @@ async def get_slot_with_access_check(
     return slot
 
 
+def load_draft(slot: ReviewSlot) -> Tuple[Any, Optional[int], datetime]:
+    """
+    The slot's current draft, preferring a newer autosave not yet written back.
+
+    Returns:
+        (draft_sections, rating, last_saved_at); draft_sections is either the
+        stored JSON string or the buffered draft itself
+    """
+    entry = draft_buffer.get(slot.id)
+    if (
+        entry is not None
+        and entry.reviewer_id == slot.reviewer_id
+        and slot.status == "claimed"
+        and (slot.draft_saved_at is None or entry.saved_at > slot.draft_saved_at)
+    ):
+        rating = entry.rating if entry.rating is not None else slot.rating
+        return entry.draft, rating, entry.saved_at
+    return slot.draft_sections, slot.rating, slot.draft_saved_at or slot.updated_at
+
+
 def require_admin(user: User) -> None:
     """
     Verify user is an admin.
@@ -1,11 +1,18 @@
-"""Draft operations for review slots (legacy, smart review, and studio formats)"""
+"""Draft operations for review slots (legacy, smart review, and studio formats)
+
+Autosaves go through the draft buffer (app.services.infrastructure.draft_buffer):
+each save replaces the slot's buffered draft and the buffer writes it to
+review_slots.draft_sections in batches. Saves with ?partial=true send only
+the changed sections, which are sanitized and merged into the current draft.
+"""
 
 import json
 import logging
 from datetime import datetime
+from typing import Any, Optional, Tuple
 
 from bleach import clean
-from fastapi import APIRouter, Depends, Request, status
+from fastapi import APIRouter, Depends, Query, Request, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -13,6 +20,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.deps import get_current_user, get_db
 from app.crud import review_slot as crud_review_slot
 from app.models.user import User
+from app.services.infrastructure.draft_buffer import BufferedDraft, draft_buffer
 from app.schemas.review_slot import (
     FeedbackSection,
     DraftSave,
@@ -28,7 +36,7 @@ from app.core.exceptions import (
     InternalError,
 )
 
-from .common import limiter, get_slot_with_access_check
+from .common import limiter, get_slot_with_access_check, load_draft
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +45,67 @@ router = APIRouter(tags=["review-slots"])
 # Allowed HTML tags for sanitization
 ALLOWED_TAGS = ['b', 'i', 'u', 'br', 'p', 'ul', 'ol', 'li', 'strong', 'em']
 
+PARTIAL_QUERY = Query(False, description="Merge the sent sections into the current draft instead of replacing it")
+
+
+def _parse_draft(draft_sections: Any) -> Any:
+    if isinstance(draft_sections, str):
+        try:
+            return json.loads(draft_sections)
+        except json.JSONDecodeError:
+            return None
+    return draft_sections
+
+
+async def _current_draft(db: AsyncSession, slot_id: int, user_id: int) -> Tuple[Any, Optional[int]]:
+    """
+    The draft and rating an autosave builds on, checking access.
+
+    The slot is loaded on every save, so a reviewer who lost the claim can't
+    keep saving into this worker's buffer. A buffered draft is used only if
+    it's newer than the draft stored on the slot (which another worker may
+    have written since).
+    """
+    slot = await get_slot_with_access_check(
+        db, slot_id, user_id,
+        require_reviewer=True,
+        allowed_statuses=["claimed"]
+    )
+    draft_sections, rating, _ = load_draft(slot)
+    return _parse_draft(draft_sections), rating
+
+
+async def _store_draft(db: AsyncSession, slot_id: int, entry: BufferedDraft) -> datetime:
+    """Buffer the draft, or write it through if the buffer is off or unreachable."""
+    if not draft_buffer.save(slot_id, entry):
+        if not await draft_buffer.write(db, slot_id, entry):
+            raise InvalidStateError(
+                message="Cannot save a draft for this slot",
+                allowed_states=["claimed"]
+            )
+    return entry.saved_at
+
+
+def _merge_sections(current: Any, changed: list) -> list:
+    """Replace legacy sections by section_id, appending new ones."""
+    merged = list(current) if isinstance(current, list) else []
+    positions = {
+        section.get("section_id"): i
+        for i, section in enumerate(merged) if isinstance(section, dict)
+    }
+    for section in changed:
+        if section["section_id"] in positions:
+            merged[positions[section["section_id"]]] = section
+        else:
+            positions[section["section_id"]] = len(merged)
+            merged.append(section)
+    return merged
+
+
+def _merge_keys(current: Any, changed: dict) -> dict:
+    """Replace top-level draft sections (phases or studio cards)."""
+    return {**current, **changed} if isinstance(current, dict) else changed
+
 
 # =============================================================================
 # Legacy Draft Endpoints
@@ -52,23 +121,22 @@ async def save_review_draft(
     request: Request,
     slot_id: int,
     draft_data: DraftSave,
+    partial: bool = PARTIAL_QUERY,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Auto-save review draft (legacy format)
 
+    With ?partial=true, only the sent sections are replaced (by section_id).
+
     **Requirements:**
     - User must be the reviewer who claimed the slot
     - Slot must be in 'claimed' status
 
     **Rate Limit:** 60 requests per minute (for frequent auto-saves)
     """
-    slot = await get_slot_with_access_check(
-        db, slot_id, current_user.id,
-        require_reviewer=True,
-        allowed_statuses=["claimed"]
-    )
+    current, rating = await _current_draft(db, slot_id, current_user.id)
 
     # Sanitize and convert sections to dict
     sections_data = []
@@ -81,20 +149,21 @@ async def save_review_draft(
         )
         sections_data.append(section_dict)
 
-    slot.draft_sections = json.dumps(sections_data)
+    if partial:
+        sections_data = _merge_sections(current, sections_data)
 
     if draft_data.rating is not None:
-        slot.rating = draft_data.rating
+        rating = draft_data.rating
 
-    slot.updated_at = datetime.utcnow()
-    await db.commit()
-    await db.refresh(slot)
+    last_saved_at = await _store_draft(
+        db, slot_id, BufferedDraft(current_user.id, sections_data, rating)
+    )
 
-    logger.info(f"User {current_user.id} saved draft for slot {slot_id}")
+    logger.debug("User %s saved draft for slot %s", current_user.id, slot_id)
 
     return DraftSaveSuccess(
         success=True,
-        last_saved_at=slot.updated_at
+        last_saved_at=last_saved_at
     )
 
 
@@ -120,11 +189,13 @@ async def load_review_draft(
         require_reviewer=True
     )
 
-    if not slot.draft_sections:
+    draft_sections, rating, last_saved_at = load_draft(slot)
+
+    if not draft_sections:
         raise SlotNotFoundError(message="No draft found")
 
     try:
-        draft_sections_data = json.loads(slot.draft_sections) if isinstance(slot.draft_sections, str) else slot.draft_sections
+        draft_sections_data = json.loads(draft_sections) if isinstance(draft_sections, str) else draft_sections
     except json.JSONDecodeError as e:
         logger.error(f"Corrupted draft data for slot {slot_id}: {e}")
         raise InvalidInputError(message="Draft data is corrupted and cannot be loaded")
@@ -137,12 +208,12 @@ async def load_review_draft(
         raise InvalidInputError(message="Invalid draft format")
 
     sections = [FeedbackSection(**section) for section in draft_sections_data]
-    logger.info(f"User {current_user.id} loaded draft for slot {slot_id}")
+    logger.debug("User %s loaded draft for slot %s", current_user.id, slot_id)
 
     return DraftResponse(
         sections=sections,
-        rating=slot.rating,
-        last_saved_at=slot.updated_at
+        rating=rating,
+        last_saved_at=last_saved_at
     )
 
 
@@ -160,23 +231,22 @@ async def save_smart_review_draft(
     request: Request,
     slot_id: int,
     draft_data: SmartReviewDraft,
+    partial: bool = PARTIAL_QUERY,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Save Smart Adaptive Review Editor draft
 
+    With ?partial=true, only the sent phases are replaced.
+
     **Requirements:**
     - User must be the reviewer who claimed the slot
     - Slot must be in 'claimed' status
 
     **Rate Limit:** 60 requests per minute (for frequent auto-saves)
     """
-    slot = await get_slot_with_access_check(
-        db, slot_id, current_user.id,
-        require_reviewer=True,
-        allowed_statuses=["claimed"]
-    )
+    current, rating = await _current_draft(db, slot_id, current_user.id)
 
     draft_dict = draft_data.model_dump(exclude_none=True)
 
@@ -196,18 +266,20 @@ async def save_smart_review_draft(
         if 'additional_notes' in phase3:
             phase3['additional_notes'] = clean(phase3['additional_notes'], tags=ALLOWED_TAGS, strip=True)
 
-    slot.draft_sections = json.dumps(jsonable_encoder(draft_dict))
-
     if draft_dict.get('phase1_quick_assessment', {}).get('overall_rating'):
-        slot.rating = draft_dict['phase1_quick_assessment']['overall_rating']
+        rating = draft_dict['phase1_quick_assessment']['overall_rating']
 
-    slot.updated_at = datetime.utcnow()
-    await db.commit()
-    await db.refresh(slot)
+    draft_dict = jsonable_encoder(draft_dict)
+    if partial:
+        draft_dict = _merge_keys(current, draft_dict)
 
-    logger.info(f"User {current_user.id} saved Smart Review draft for slot {slot_id}")
+    last_saved_at = await _store_draft(
+        db, slot_id, BufferedDraft(current_user.id, draft_dict, rating)
+    )
 
-    return DraftSaveSuccess(success=True, last_saved_at=slot.updated_at)
+    logger.debug("User %s saved Smart Review draft for slot %s", current_user.id, slot_id)
+
+    return DraftSaveSuccess(success=True, last_saved_at=last_saved_at)
 
 
 @router.get(
@@ -236,9 +308,11 @@ async def get_smart_review_draft(
         require_reviewer=True
     )
 
-    if slot.draft_sections:
+    draft_sections, _, _ = load_draft(slot)
+
+    if draft_sections:
         try:
-            draft_data = json.loads(slot.draft_sections)
+            draft_data = json.loads(draft_sections) if isinstance(draft_sections, str) else draft_sections
         except json.JSONDecodeError as e:
             logger.error(f"Corrupted Smart Review draft data for slot {slot_id}: {e}")
             raise InvalidInputError(message="Draft data is corrupted and cannot be loaded")
@@ -260,6 +334,7 @@ async def get_smart_review_draft(
 async def save_studio_draft(
     request: Request,
     slot_id: int,
+    partial: bool = PARTIAL_QUERY,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -268,6 +343,7 @@ async def save_studio_draft(
 
     Accepts raw JSON and stores it directly in draft_sections without conversion.
     This preserves all card data including annotations with their linked card IDs.
+    With ?partial=true, only the sent top-level keys are replaced.
 
     **Requirements:**
     - User must be the reviewer who claimed the slot
@@ -276,28 +352,27 @@ async def save_studio_draft(
     **Rate Limit:** 60 requests per minute
     """
     body = await request.json()
+    if not isinstance(body, dict):
+        raise InvalidInputError(message="Studio draft must be a JSON object")
 
-    slot = await get_slot_with_access_check(
-        db, slot_id, current_user.id,
-        require_reviewer=True,
-        allowed_statuses=["claimed"]
-    )
+    current, rating = await _current_draft(db, slot_id, current_user.id)
 
     # Mark as studio format and store directly
     body["_format"] = "studio"
     body["_version"] = "2.0"
-    slot.draft_sections = json.dumps(body)
+    if partial:
+        body = _merge_keys(current, body)
 
     if body.get("verdictCard", {}).get("rating"):
-        slot.rating = body["verdictCard"]["rating"]
+        rating = body["verdictCard"]["rating"]
 
-    slot.updated_at = datetime.utcnow()
-    await db.commit()
-    await db.refresh(slot)
+    last_saved_at = await _store_draft(
+        db, slot_id, BufferedDraft(current_user.id, body, rating)
+    )
 
-    logger.info(f"User {current_user.id} saved Studio draft for slot {slot_id}")
+    logger.debug("User %s saved Studio draft for slot %s", current_user.id, slot_id)
 
-    return DraftSaveSuccess(success=True, last_saved_at=slot.updated_at)
+    return DraftSaveSuccess(success=True, last_saved_at=last_saved_at)
 
 
 @router.get(
@@ -336,9 +411,11 @@ async def get_studio_draft(
     if is_creator and not is_reviewer and slot.status != "submitted":
         raise NotOwnerError(message="Review not yet submitted")
 
-    if slot.draft_sections:
+    draft_sections, _, _ = load_draft(slot)
+
+    if draft_sections:
         try:
-            draft_data = json.loads(slot.draft_sections)
+            draft_data = json.loads(draft_sections) if isinstance(draft_sections, str) else draft_sections
         except json.JSONDecodeError as e:
             logger.error(f"Corrupted Studio draft data for slot {slot_id}: {e}")
             raise InvalidInputError(message="Draft data is corrupted and cannot be loaded")
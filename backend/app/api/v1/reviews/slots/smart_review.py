@@ -18,17 +18,20 @@ from app.schemas.review_slot import (
     DraftSaveSuccess,
     SmartReviewSubmit,
 )
+from app.config.template_registry import get_section_set, rubric_response
+from app.core.config import settings
 from app.services.gamification.review_sparks_hooks import on_review_submitted
+from app.services.infrastructure.draft_buffer import draft_buffer
+from app.services.infrastructure.response_cache import send_cached
 from app.services.notifications.triggers import notify_review_submitted, notify_elaboration_submitted
 from app.core.exceptions import (
     SlotNotFoundError,
     NotOwnerError,
     InvalidStateError,
     InvalidInputError,
-    InternalError,
 )
 
-from .common import limiter, get_slot_with_access_check
+from .common import limiter, get_slot_with_access_check, load_draft
 
 logger = logging.getLogger(__name__)
 
@@ -60,18 +63,16 @@ async def get_rubric(
     - video: filmed, edited_clip, animation, game_capture, tutorial, short_form
     - writing: blog_article, technical, creative, marketing_copy, script, academic
 
-    Returns focus areas, rating dimensions, and section prompts.
+    Returns focus areas, rating dimensions, and section prompts, served
+    from the precompiled template registry (ETag/304 supported).
 
     **Rate Limit:** 120 requests per minute
     """
-    from app.constants.rubrics import get_rubric as get_rubric_config
-
-    try:
-        rubric = get_rubric_config(content_type, subcategory)
-        return rubric
-    except Exception as e:
-        logger.error(f"Error getting rubric for content type {content_type} (subcategory: {subcategory}): {e}")
-        raise InternalError(message="An error occurred while fetching rubric")
+    return send_cached(
+        request,
+        rubric_response(content_type, subcategory),
+        f"public, max-age={settings.RUBRIC_CACHE_TTL_SECONDS}",
+    )
 
 
 @router.get(
@@ -107,34 +108,30 @@ async def get_review_sections(
     if not review_request:
         raise SlotNotFoundError(resource="Review request")
 
-    from app.config.review_sections import get_sections, calculate_min_total_words
-
-    sections = get_sections(
+    section_set = get_section_set(
         content_type=review_request.content_type.value,
         feedback_priority=review_request.feedback_priority.value if review_request.feedback_priority else "specific_fixes",
-        review_tier=review_request.review_tier.value if review_request.review_tier else "standard"
+        review_tier=review_request.tier.value if review_request.tier else "standard"
     )
 
-    # Merge with draft data if available
-    if slot.draft_sections:
-        try:
-            draft_sections = json.loads(slot.draft_sections) if isinstance(slot.draft_sections, str) else slot.draft_sections
-            section_dict = {s["id"]: s for s in sections}
-            for draft in draft_sections:
-                if draft["id"] in section_dict:
-                    section_dict[draft["id"]]["content"] = draft.get("content", "")
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
-            logger.error(f"Failed to parse draft sections for slot {slot_id}: {e}")
+    saved_draft, _, _ = load_draft(slot)
+    if not saved_draft:
+        return send_cached(request, section_set.response, "private, no-cache")
+
+    # Merge with draft data
+    sections = [dict(section) for section in section_set.sections]
+    try:
+        draft_sections = json.loads(saved_draft) if isinstance(saved_draft, str) else saved_draft
+        section_dict = {s["id"]: s for s in sections}
+        for draft in draft_sections:
+            if draft["id"] in section_dict:
+                section_dict[draft["id"]]["content"] = draft.get("content", "")
+    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        logger.error(f"Failed to parse draft sections for slot {slot_id}: {e}")
 
     return JSONResponse({
         "sections": sections,
-        "context": {
-            "content_type": review_request.content_type.value,
-            "feedback_priority": review_request.feedback_priority.value if review_request.feedback_priority else "specific_fixes",
-            "review_tier": review_request.review_tier.value if review_request.review_tier else "standard",
-            "min_total_words": calculate_min_total_words(sections),
-            "has_draft": bool(slot.draft_sections)
-        }
+        "context": {**section_set.context, "has_draft": True}
     })
 
 
@@ -227,14 +224,15 @@ async def submit_smart_review(
 
     await db.commit()
     await db.refresh(slot)
+    draft_buffer.discard(slot_id)  # The submitted review replaces the draft
 
     if is_elaboration_response:
         await notify_elaboration_submitted(db, slot_id, current_user.id)
-        logger.info(f"User {current_user.id} responded to elaboration request for slot {slot_id}")
+        logger.info("User %s responded to elaboration request for slot %s", current_user.id, slot_id)
     else:
         await on_review_submitted(db, slot.id, current_user.id)
         await notify_review_submitted(db, slot_id, current_user.id)
-        logger.info(f"User {current_user.id} submitted Smart Review for slot {slot_id}")
+        logger.info("User %s submitted Smart Review for slot %s", current_user.id, slot_id)
 
     return slot
 
@@ -320,13 +318,14 @@ async def submit_studio_review(
 
     await db.commit()
     await db.refresh(slot)
+    draft_buffer.discard(slot_id)  # The submitted review replaces the draft
 
     if is_elaboration_response:
         await notify_elaboration_submitted(db, slot_id, current_user.id)
-        logger.info(f"User {current_user.id} responded to elaboration request (Studio) for slot {slot_id}")
+        logger.info("User %s responded to elaboration request (Studio) for slot %s", current_user.id, slot_id)
     else:
         await on_review_submitted(db, slot.id, current_user.id)
         await notify_review_submitted(db, slot_id, current_user.id)
-        logger.info(f"User {current_user.id} submitted Studio Review for slot {slot_id}")
+        logger.info("User %s submitted Studio Review for slot %s", current_user.id, slot_id)
 
     return slot
@@ -25,6 +25,7 @@ from app.services.notifications.triggers import (
     notify_review_rejected,
     notify_elaboration_requested,
 )
+from app.services.infrastructure.draft_buffer import draft_buffer
 from app.services.payments import PaymentService
 from app.core.exceptions import (
     NotOwnerError,
@@ -73,6 +74,9 @@ async def submit_review(
         if review_data.annotations:
             annotations = [annotation.model_dump() for annotation in review_data.annotations]
 
+        # Keep the latest autosave alongside the submitted review
+        await draft_buffer.flush(db, [slot_id])
+
         submitted_slot = await crud_review_slot.submit_review(
             db,
             slot_id,
@@ -84,6 +88,8 @@ async def submit_review(
             annotations
         )
 
+        draft_buffer.discard(slot_id)
+
         await on_review_submitted(db, submitted_slot.id, current_user.id)
         await notify_review_submitted(db, slot_id, current_user.id)
         logger.info(f"User {current_user.id} submitted review for slot {slot_id}")
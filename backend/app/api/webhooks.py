@@ -1,15 +1,14 @@
 """Webhook handlers for external services"""
 
 import logging
-from typing import Any, Dict
+from typing import Dict
 import stripe
 from fastapi import APIRouter, Depends, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.db.session import get_db
-from app.services.subscription_service import SubscriptionService
-from app.services.payments import PaymentService
+from app.services.payments.webhook_inbox import webhook_inbox, webhook_worker_pool
 from app.core.exceptions import InvalidInputError, InternalError
 
 logger = logging.getLogger(__name__)
@@ -27,24 +26,30 @@ async def stripe_webhook(
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, str]:
     """
-    Handle Stripe webhook events for subscription management.
+    Receive Stripe webhook events.
 
-    This endpoint processes events from Stripe including:
+    Verified events are stored in the webhook inbox and acknowledged
+    immediately; the webhook worker pool processes them in the background
+    (see app.services.payments.webhook_inbox). Duplicate deliveries are
+    acknowledged without being stored again.
+
+    Handled events include:
     - subscription.created: New subscription created
     - subscription.updated: Subscription status changed
     - subscription.deleted: Subscription cancelled
     - invoice.payment_succeeded: Payment successful
     - invoice.payment_failed: Payment failed
+    - balance.available, payout.*, transfer.*: Connect balance changed
 
     Security:
     - Validates webhook signature to ensure authenticity
     - Uses Stripe's webhook secret for verification
 
     Returns:
-        Success message
+        Acknowledgement ("accepted" or "duplicate")
 
     Raises:
-        HTTPException: If signature verification fails or processing error occurs
+        InvalidInputError: If signature verification fails
     """
     # Get the raw request body for signature verification
     payload = await request.body()
@@ -72,51 +77,15 @@ async def stripe_webhook(
         logger.warning(f"Invalid webhook signature: {str(e)}")
         raise InvalidInputError(message="Invalid signature")
 
-    # Get event type and data
     event_type = event["type"]
-    event_data = event["data"]["object"]
-
-    logger.info(f"Received Stripe webhook: {event_type} (id: {event['id']})")
-
-    try:
-        # Handle different event types
-        if event_type == "customer.subscription.created":
-            await SubscriptionService.handle_subscription_created(event_data, db)
-
-        elif event_type == "customer.subscription.updated":
-            await SubscriptionService.handle_subscription_updated(event_data, db)
-
-        elif event_type == "customer.subscription.deleted":
-            await SubscriptionService.handle_subscription_deleted(event_data, db)
-
-        elif event_type == "invoice.payment_succeeded":
-            await SubscriptionService.handle_invoice_payment_succeeded(event_data, db)
-
-        elif event_type == "invoice.payment_failed":
-            await SubscriptionService.handle_invoice_payment_failed(event_data, db)
-
-        # Payment Intent events (expert review payments)
-        elif event_type == "payment_intent.succeeded":
-            await PaymentService.handle_payment_success(event_data, db)
-
-        elif event_type == "payment_intent.payment_failed":
-            await PaymentService.handle_payment_failed(event_data, db)
-
-        # Refund events
-        elif event_type == "charge.refunded":
-            await PaymentService.handle_refund_completed(event_data, db)
-
-        # Connect account events (reviewer payouts)
-        elif event_type == "account.updated":
-            await PaymentService.handle_connect_account_updated(event_data, db)
 
-        else:
-            logger.info(f"Unhandled webhook event type: {event_type}")
+    # Persist and acknowledge; the webhook worker pool runs the handlers
+    created = await webhook_inbox.enqueue(db, payload, event)
+    if not created:
+        logger.info(f"Duplicate Stripe webhook ignored: {event_type} (id: {event['id']})")
+        return {"status": "duplicate", "event_type": event_type}
 
-        return {"status": "success", "event_type": event_type}
+    webhook_worker_pool.notify()
+    logger.info(f"Queued Stripe webhook: {event_type} (id: {event['id']})")
 
-    except Exception as e:
-        logger.error(f"Error processing webhook {event_type}: {str(e)}", exc_info=True)
-        # Return 200 to acknowledge receipt, but log the error
-        # Stripe will retry failed webhooks automatically
-        return {"status": "error", "message": str(e)}
+    return {"status": "accepted", "event_type": event_type}
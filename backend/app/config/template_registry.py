@@ -0,0 +1,126 @@
+"""
+Precompiled Rubric and Section Template Registry
+
+Rubrics and section templates only change on deploy, so every variant the
+API can serve is built once at import time instead of per request:
+
+- Rubrics: one per (content_type, subcategory), including the base rubric
+  (subcategory None) for each content type
+- Section sets: one per (content_type, feedback_priority, review_tier)
+  combination of the model enums, with its min_total_words
+
+Each entry holds read-only data plus its serialized JSON body and ETag
+(a CachedResponse), so endpoints can send the bytes as-is:
+
+    entry = rubric_response("design", "ui_ux")
+    entry.body, entry.etag
+
+    section_set = get_section_set("design", "specific_fixes", "standard")
+    section_set.sections, section_set.min_total_words, section_set.response
+
+Lookups resolve unknown keys the same way get_rubric and get_sections
+fall back, so they return exactly what those functions would.
+"""
+
+from dataclasses import dataclass
+from itertools import product
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from app.config.review_sections import calculate_min_total_words, get_sections
+from app.constants.rubrics import RUBRICS, SUBCATEGORY_RATING_OVERRIDES, get_rubric
+from app.models.review_request import ContentType, FeedbackPriority, ReviewTier
+from app.services.infrastructure.response_cache import CachedResponse
+
+DEFAULT_RUBRIC_CONTENT_TYPE = "design"
+
+
+@dataclass(frozen=True)
+class CompiledSections:
+    """A section set with its precomputed totals and response body"""
+    sections: Tuple[Mapping[str, Any], ...]
+    min_total_words: int
+    context: Mapping[str, Any]
+    response: CachedResponse  # Body for a slot without a draft
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of JSON-like data (dicts become mapping proxies, lists tuples)."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _compile_rubrics() -> Dict[Tuple[str, Optional[str]], CachedResponse]:
+    compiled = {}
+    for content_type in RUBRICS:
+        compiled[(content_type, None)] = CachedResponse.from_content(get_rubric(content_type))
+        for subcategory, overrides in SUBCATEGORY_RATING_OVERRIDES.get(content_type, {}).items():
+            if overrides:
+                compiled[(content_type, subcategory)] = CachedResponse.from_content(
+                    get_rubric(content_type, subcategory)
+                )
+    return compiled
+
+
+def _compile_section_set(content_type: str, feedback_priority: str, review_tier: str) -> CompiledSections:
+    sections = get_sections(content_type, feedback_priority, review_tier)
+    min_total_words = calculate_min_total_words(sections)
+    context = {
+        "content_type": content_type,
+        "feedback_priority": feedback_priority,
+        "review_tier": review_tier,
+        "min_total_words": min_total_words,
+    }
+    return CompiledSections(
+        sections=_freeze(sections),
+        min_total_words=min_total_words,
+        context=_freeze(context),
+        response=CachedResponse.from_content({
+            "sections": sections,
+            "context": {**context, "has_draft": False},
+        }),
+    )
+
+
+def _compile_section_sets() -> Dict[Tuple[str, str, str], CompiledSections]:
+    return {
+        key: _compile_section_set(*key)
+        for key in product(
+            [content_type.value for content_type in ContentType],
+            [priority.value for priority in FeedbackPriority],
+            [tier.value for tier in ReviewTier],
+        )
+    }
+
+
+RUBRIC_RESPONSES: Mapping[Tuple[str, Optional[str]], CachedResponse] = MappingProxyType(_compile_rubrics())
+SECTION_SETS: Mapping[Tuple[str, str, str], CompiledSections] = MappingProxyType(_compile_section_sets())
+
+
+def rubric_response(content_type: str, subcategory: Optional[str] = None) -> CachedResponse:
+    """
+    Precompiled rubric for a content type and optional subcategory.
+
+    Subcategories without overrides get the base rubric, and unknown
+    content types the design rubric, as in get_rubric.
+    """
+    if (content_type, subcategory) in RUBRIC_RESPONSES:
+        return RUBRIC_RESPONSES[(content_type, subcategory)]
+    if content_type in RUBRICS:
+        return RUBRIC_RESPONSES[(content_type, None)]
+    return RUBRIC_RESPONSES[(DEFAULT_RUBRIC_CONTENT_TYPE, None)]
+
+
+def get_section_set(content_type: str, feedback_priority: str, review_tier: str) -> CompiledSections:
+    """
+    Precompiled section set for a review context.
+
+    Combinations outside the model enums are compiled on demand (not cached).
+    """
+    key = (content_type, feedback_priority, review_tier)
+    if key in SECTION_SETS:
+        return SECTION_SETS[key]
+    return _compile_section_set(*key)
@@ -19,6 +19,9 @@ class Settings(BaseSettings):
 
     # Logging
     LOG_LEVEL: str = "INFO"  # DEBUG, INFO, WARNING, ERROR, CRITICAL
+    LOG_JSON: bool = False  # One JSON object per line (with request_id and extra fields)
+    LOG_INFO_RATE_LIMIT: int = 100  # INFO/DEBUG records per logger per second before the rest are dropped (0: no limit)
+    LOG_QUEUE_MAX_SIZE: int = 10000  # Records waiting for the writer thread before new ones are dropped
 
     # Security
     SECRET_KEY: str = "CHANGE_THIS_IN_PRODUCTION_USE_LONG_RANDOM_STRING"
@@ -26,6 +29,11 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60  # 1 hour
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30  # 30 days
 
+    # Password hashing
+    BCRYPT_ROUNDS: int = 12  # Raising this rehashes existing passwords on their next login
+    PASSWORD_HASH_WORKERS: int = 4  # Threads dedicated to bcrypt hashing/verification
+    PASSWORD_HASH_MAX_PENDING: int = 64  # Queued + running hash jobs before new ones are shed (503)
+
     # CORS - comma-separated list in .env file
     ALLOWED_ORIGINS: str = "http://localhost:3000,http://localhost:3001,http://127.0.0.1:3000"
 
@@ -63,6 +71,15 @@ class Settings(BaseSettings):
     DATABASE_POOL_RECYCLE: int = 3600  # Recycle connections after N seconds (1 hour)
     DATABASE_POOL_PRE_PING: bool = True  # Verify connections before using them
 
+    # Query Instrumentation
+    DB_INSTRUMENTATION_ENABLED: bool = True  # Count and time queries per request (headers outside production)
+    DB_SLOW_QUERY_MS: float = 200.0  # Log statements slower than this
+    DB_REPEATED_QUERY_THRESHOLD: int = 5  # Same statement this many times in one request is logged as N+1
+
+    # Metrics
+    METRICS_ENABLED: bool = True  # Record per-route request latency and serve Prometheus text metrics at /metrics
+    METRICS_TOKEN: str = ""  # Bearer token required for /metrics; without one, /metrics is only served in development
+
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
 
@@ -87,6 +104,22 @@ class Settings(BaseSettings):
     STRIPE_WEBHOOK_SECRET: str = ""
     STRIPE_PRO_PRICE_ID: str = ""  # Stripe Price ID for Pro subscription ($9/month)
     STRIPE_PUBLISHABLE_KEY: str = ""  # Frontend publishable key
+    STRIPE_API_BASE: str = "https://api.stripe.com"
+    STRIPE_TIMEOUT_SECONDS: float = 10.0  # Default per-call timeout for Stripe API requests
+    STRIPE_MAX_CONNECTIONS: int = 20  # HTTP connection pool size for the Stripe client
+    STRIPE_MAX_CONCURRENCY: int = 10  # Max Stripe requests in flight at once
+    STRIPE_MAX_RETRIES: int = 2  # Retries on network errors, 429s and 5xx responses
+    STRIPE_BALANCE_CACHE_TTL_SECONDS: int = 60  # Connect balance/payout cache freshness
+    STRIPE_BALANCE_CACHE_STALE_SECONDS: int = 3600  # Serve stale balances up to this age if Stripe is slow
+    STRIPE_BALANCE_CACHE_REFRESH_TIMEOUT_SECONDS: float = 2.0  # Wait this long for a refresh before serving stale
+
+    # Stripe webhook inbox
+    WEBHOOK_WORKERS_ENABLED: bool = True  # Process stored webhooks in this process
+    WEBHOOK_WORKER_CONCURRENCY: int = 4  # Webhook events processed at once
+    WEBHOOK_POLL_INTERVAL_SECONDS: float = 5.0  # Inbox poll interval when idle
+    WEBHOOK_MAX_ATTEMPTS: int = 8  # Attempts before an event is marked failed
+    WEBHOOK_RETRY_BASE_SECONDS: int = 30  # First retry delay (doubles each attempt, max 1 hour)
+    WEBHOOK_PROCESSING_TIMEOUT_MINUTES: int = 10  # Re-queue events stuck in processing this long
 
     # Stripe Connect (for reviewer payouts)
     STRIPE_PLATFORM_FEE_PERCENT: float = 0.25  # 25% platform fee on expert reviews
@@ -96,6 +129,29 @@ class Settings(BaseSettings):
     EMAIL_API_KEY: str = ""  # Resend API key (re_xxxxx)
     EMAIL_REPLY_TO: str = ""  # Optional reply-to address
 
+    # HTTP Response Cache (public read endpoints)
+    RESPONSE_CACHE_ENABLED: bool = True  # Serve cached bodies and ETag/304 for @cached_response endpoints
+    RESPONSE_CACHE_MAX_ENTRIES: int = 5000  # In-process LRU size per worker
+    RESPONSE_CACHE_USE_REDIS: bool = False  # Share entries and invalidations across workers via Redis
+    PROFILE_CACHE_TTL_SECONDS: int = 60  # Public profile/stats/badges (stats change without a profile edit)
+    CHALLENGE_CACHE_TTL_SECONDS: int = 60  # Public challenge listings and detail
+    LEADERBOARD_CACHE_TTL_SECONDS: int = 300  # Leaderboards (per viewer, for their own position)
+    RUBRIC_CACHE_TTL_SECONDS: int = 3600  # Client max-age for rubric configs (precompiled, change only on deploy)
+
+    # Reviewer Directory
+    REVIEWER_DIRECTORY_CACHE_TTL_SECONDS: int = 300  # Directory pages (matches their Cache-Control max-age)
+    REVIEWER_FILTERS_CACHE_TTL_SECONDS: int = 600  # Tier/specialty filter counts
+    REVIEWER_STATS_CACHE_TTL_SECONDS: int = 300  # Per-user review/rating/response-time aggregates (slot changes clear them)
+
+    # Review Draft Autosave
+    DRAFT_BUFFER_ENABLED: bool = True  # Buffer autosaves and write them back in batches (off: write each save)
+    DRAFT_BUFFER_USE_REDIS: bool = False  # Share buffered drafts across workers via Redis
+    DRAFT_BUFFER_FLUSH_SECONDS: float = 15.0  # How often buffered drafts are written to the database
+    DRAFT_BUFFER_ENTRY_TTL_SECONDS: int = 3600  # Keep flushed drafts readable from the buffer this long
+
+    # Admin Dashboard
+    ADMIN_STATS_CACHE_TTL_SECONDS: int = 30  # Shared stats snapshot (moderation actions clear it)
+
     # Google OAuth
     GOOGLE_CLIENT_ID: str = ""
     GOOGLE_CLIENT_SECRET: str = ""
@@ -15,12 +15,13 @@ Exempt paths:
 - OAuth callbacks (authenticated via OAuth state parameter)
 """
 
-import secrets
 import logging
-from typing import Set
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+import secrets
+from typing import FrozenSet, Set, Tuple
+
+from starlette.requests import cookie_parser
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.config import settings
 
@@ -61,21 +62,39 @@ def generate_csrf_token() -> str:
     return secrets.token_urlsafe(32)
 
 
+# Frozen for the hot path: one hash lookup, then one C-level startswith
+# over all prefixes
+_EXEMPT_EXACT: FrozenSet[str] = frozenset(EXEMPT_PATHS)
+_EXEMPT_PREFIXES: Tuple[str, ...] = tuple(EXEMPT_PATH_PREFIXES)
+
+
 def is_path_exempt(path: str) -> bool:
     """Check if a path is exempt from CSRF protection"""
-    # Check exact matches
-    if path in EXEMPT_PATHS:
-        return True
+    return path in _EXEMPT_EXACT or path.startswith(_EXEMPT_PREFIXES)
+
+
+_CSRF_FAILURES = {
+    "missing": "CSRF token missing. Please refresh the page and try again.",
+    "mismatch": "CSRF token invalid. Please refresh the page and try again.",
+}
 
-    # Check prefix matches
-    for prefix in EXEMPT_PATH_PREFIXES:
-        if path.startswith(prefix):
-            return True
 
-    return False
+def _csrf_cookie_header() -> Tuple[bytes, bytes]:
+    """Set-Cookie header carrying a new CSRF token."""
+    response = Response()
+    response.set_cookie(
+        key=CSRF_COOKIE_NAME,
+        value=generate_csrf_token(),
+        httponly=False,  # Must be readable by JavaScript
+        secure=settings.is_production,  # HTTPS only in production
+        samesite="lax",  # Lax allows normal navigation but blocks cross-site requests
+        max_age=60 * 60 * 24 * 7,  # 7 days
+        path="/",
+    )
+    return response.raw_headers[-1]
 
 
-class CSRFMiddleware(BaseHTTPMiddleware):
+class CSRFMiddleware:
     """
     Middleware to enforce CSRF protection using double-submit cookie pattern.
 
@@ -85,67 +104,61 @@ class CSRFMiddleware(BaseHTTPMiddleware):
 
     For all requests:
     - Sets/refreshes CSRF token cookie if not present
+
+    Implemented as plain ASGI: headers are read straight from the scope and
+    the cookie is appended to the response start message, so responses
+    (including streaming ones) pass through unbuffered.
     """
 
-    async def dispatch(self, request: Request, call_next):
-        method = request.method.upper()
-        path = request.url.path
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        # Get existing CSRF token from cookie
-        csrf_cookie = request.cookies.get(CSRF_COOKIE_NAME)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Check if CSRF validation is needed
-        if method in PROTECTED_METHODS and not is_path_exempt(path):
-            # Get CSRF token from header
-            csrf_header = request.headers.get(CSRF_HEADER_NAME)
+        cookie_header = csrf_header = None
+        for name, value in scope["headers"]:
+            if name == b"cookie":
+                cookie_header = value.decode("latin-1")
+            elif name == b"x-csrf-token":
+                csrf_header = value.decode("latin-1")
+        csrf_cookie = cookie_parser(cookie_header).get(CSRF_COOKIE_NAME) if cookie_header else None
 
-            # Validate CSRF token
+        # Check if CSRF validation is needed
+        method = scope["method"]
+        if method in PROTECTED_METHODS and not is_path_exempt(scope["path"]):
+            failure = None
             if not csrf_cookie or not csrf_header:
+                failure = "missing"
                 logger.warning(
-                    f"CSRF validation failed: missing token. "
-                    f"Path: {path}, Method: {method}, "
-                    f"Has cookie: {bool(csrf_cookie)}, Has header: {bool(csrf_header)}"
-                )
-                return JSONResponse(
-                    status_code=403,
-                    content={
-                        "error": {
-                            "code": "CSRF_VALIDATION_FAILED",
-                            "message": "CSRF token missing. Please refresh the page and try again."
-                        }
-                    }
+                    "CSRF validation failed: missing token. Path: %s, Method: %s, Has cookie: %s, Has header: %s",
+                    scope["path"], method, bool(csrf_cookie), bool(csrf_header),
                 )
-
             # Compare tokens (constant-time comparison to prevent timing attacks)
-            if not secrets.compare_digest(csrf_cookie, csrf_header):
+            elif not secrets.compare_digest(csrf_cookie, csrf_header):
+                failure = "mismatch"
                 logger.warning(
-                    f"CSRF validation failed: token mismatch. "
-                    f"Path: {path}, Method: {method}"
+                    "CSRF validation failed: token mismatch. Path: %s, Method: %s", scope["path"], method
                 )
-                return JSONResponse(
+
+            if failure:
+                response = JSONResponse(
                     status_code=403,
-                    content={
-                        "error": {
-                            "code": "CSRF_VALIDATION_FAILED",
-                            "message": "CSRF token invalid. Please refresh the page and try again."
-                        }
-                    }
+                    content={"error": {"code": "CSRF_VALIDATION_FAILED", "message": _CSRF_FAILURES[failure]}},
                 )
+                await response(scope, receive, send)
+                return
 
-        # Process the request
-        response: Response = await call_next(request)
+        if csrf_cookie:
+            await self.app(scope, receive, send)
+            return
 
         # Set CSRF cookie if not present (for all responses)
-        if not csrf_cookie:
-            new_token = generate_csrf_token()
-            response.set_cookie(
-                key=CSRF_COOKIE_NAME,
-                value=new_token,
-                httponly=False,  # Must be readable by JavaScript
-                secure=settings.is_production,  # HTTPS only in production
-                samesite="lax",  # Lax allows normal navigation but blocks cross-site requests
-                max_age=60 * 60 * 24 * 7,  # 7 days
-                path="/",
-            )
-
-        return response
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), _csrf_cookie_header()]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
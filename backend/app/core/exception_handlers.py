@@ -255,6 +255,7 @@ def get_default_error_code(status_code: int) -> str:
         422: ErrorCode.VALIDATION_ERROR.value,
         429: ErrorCode.RATE_LIMITED.value,
         500: ErrorCode.INTERNAL_ERROR.value,
+        503: ErrorCode.SERVICE_OVERLOADED.value,
     }
     return mapping.get(status_code, ErrorCode.INTERNAL_ERROR.value)
 
@@ -64,6 +64,9 @@ class ErrorCode(str, Enum):
     DATABASE_ERROR = "DATABASE_ERROR"
     EXTERNAL_SERVICE_ERROR = "EXTERNAL_SERVICE_ERROR"
 
+    # Overload errors (503)
+    SERVICE_OVERLOADED = "SERVICE_OVERLOADED"
+
 
 class CritvueException(Exception):
     """
@@ -398,3 +401,14 @@ class ExternalServiceError(InternalError):
             kwargs["message"] = f"External service '{service}' is unavailable"
             kwargs["details"] = {"service": service}
         super().__init__(*args, **kwargs)
+
+
+class ServiceOverloadedError(InternalError):
+    """Raised when a bounded resource is saturated and the request is shed (503)"""
+    status_code = 503
+    default_code = ErrorCode.SERVICE_OVERLOADED
+    default_message = "The server is busy. Please try again shortly."
+
+    def __init__(self, retry_after: int = 1, *args, **kwargs):
+        kwargs.setdefault("headers", {"Retry-After": str(retry_after)})
+        super().__init__(*args, **kwargs)
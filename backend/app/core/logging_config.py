@@ -1,39 +1,244 @@
-"""Logging configuration for the application"""
-
+"""
+Logging configuration for the application
+
+Records are handed to a queue by the calling code and written to stdout
+by a background listener thread, so a slow or blocked stdout never stalls
+the event loop:
+
+    caller -> QueueHandler (request id, sampling) -> queue -> QueueListener -> stdout
+
+- LOG_JSON switches output to one JSON object per line, including the
+  request id and any `extra=` fields
+- RequestIdMiddleware tags every record logged while handling a request
+  with its X-Request-ID (taken from the request or generated)
+- INFO and DEBUG records are rate limited per logger (LOG_INFO_RATE_LIMIT
+  per second); records over the limit are dropped before they are
+  formatted, and the next record that gets through reports how many were
+  suppressed. Warnings and errors are never dropped
+- Log with %-style arguments (logger.info("Saved %s", slot_id)) rather
+  than f-strings, so messages for disabled levels are never built
+"""
+
+import atexit
+import copy
+import json
 import logging
+import queue
 import sys
-from typing import Any, Dict
-from datetime import datetime
+import time
+import uuid
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+from datetime import datetime, timezone
 from fastapi import Request
 
 from app.core.config import settings
+from app.core.metrics import metrics
 
 # Configure logging format
-LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s"
 LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+REQUEST_ID_HEADER = "X-Request-ID"
+
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+DROPPED_RECORDS = metrics.counter(
+    "log_records_dropped_total",
+    "Log records dropped by rate limiting or a full queue",
+    labelnames=("reason",),
+)
+
+# Attributes every LogRecord has; anything else came from `extra=`
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "request_id"}
+
+_listener: Optional[QueueListener] = None
+
+
+class RequestIdFilter(logging.Filter):
+    """Tag records with the id of the request being handled"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Drop INFO/DEBUG records beyond `rate` per logger per second.
+
+    The first record let through after drops carries the number dropped
+    in its `suppressed` attribute.
+    """
+
+    def __init__(self, rate: int):
+        super().__init__()
+        self.rate = rate
+        self._windows: Dict[str, list] = {}  # logger name -> [window start, count, suppressed]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or self.rate <= 0:
+            return True
+
+        now = time.monotonic()
+        window = self._windows.get(record.name)
+        if window is None or now - window[0] >= 1.0:
+            suppressed = window[2] if window else 0
+            window = self._windows[record.name] = [now, 0, 0]
+            if suppressed:
+                record.suppressed = suppressed
+
+        window[1] += 1
+        if window[1] > self.rate:
+            window[2] += 1
+            DROPPED_RECORDS.inc(reason="rate_limited")
+            return False
+        return True
+
 
-def setup_logging(level: str = "INFO") -> None:
+class AsyncQueueHandler(QueueHandler):
+    """
+    QueueHandler that never blocks the caller
+
+    The message is merged with its args here (they may change once the
+    caller moves on) but everything else is formatted by the listener.
+    Records are dropped and counted when the queue is full.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            DROPPED_RECORDS.inc(reason="queue_full")
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per record, with request id and extra fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = record.stack_info
+        return json.dumps(entry, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """LOG_FORMAT lines, noting how many records were suppressed before this one"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        if not hasattr(record, "request_id"):
+            record.request_id = "-"
+        line = super().format(record)
+        suppressed = getattr(record, "suppressed", None)
+        return f"{line} ({suppressed} similar records suppressed)" if suppressed else line
+
+
+def setup_logging(level: str = "INFO", json_output: Optional[bool] = None) -> None:
     """
     Configure application-wide logging
 
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        json_output: Write JSON lines (default LOG_JSON)
     """
-    logging.basicConfig(
-        level=getattr(logging, level.upper()),
-        format=LOG_FORMAT,
-        datefmt=LOG_DATE_FORMAT,
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    global _listener
+    if json_output is None:
+        json_output = settings.LOG_JSON
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JSONFormatter() if json_output else TextFormatter(LOG_FORMAT, LOG_DATE_FORMAT))
+
+    queue_handler = AsyncQueueHandler(queue.Queue(maxsize=settings.LOG_QUEUE_MAX_SIZE))
+    queue_handler.addFilter(RequestIdFilter())
+    queue_handler.addFilter(RateLimitFilter(settings.LOG_INFO_RATE_LIMIT))
+
+    root = logging.getLogger()
+    stop_logging()
+    for handler in [h for h in root.handlers if isinstance(h, AsyncQueueHandler)]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(getattr(logging, level.upper()))
+
+    _listener = QueueListener(queue_handler.queue, stream_handler, respect_handler_level=True)
+    _listener.start()
 
     # Set third-party loggers to WARNING to reduce noise
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
 
+def stop_logging() -> None:
+    """Write out queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
+
+
+class RequestIdMiddleware:
+    """
+    ASGI middleware binding a request id to the request's log records
+
+    Uses the incoming X-Request-ID header if present (so ids from a proxy
+    carry through) or generates one, and echoes it on the response.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")[:128]
+                break
+        if not request_id:
+            request_id = uuid.uuid4().hex
+        header = (b"x-request-id", request_id.encode("latin-1"))
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), header]
+            await send(message)
+
+        token = request_id_var.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
+
+
 def get_client_ip_secure(request: Request) -> str:
     """
     Securely extract client IP from request.
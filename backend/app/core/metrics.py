@@ -0,0 +1,309 @@
+"""
+Lightweight Prometheus-style metrics
+
+Counters, gauges and histograms kept in process memory and rendered in
+the Prometheus text exposition format by the /metrics endpoint:
+
+    queries = metrics.counter("db_queries_total", "SQL statements executed")
+    queries.inc()
+
+    latency = metrics.histogram(
+        "http_request_duration_seconds", "Request latency",
+        labelnames=("method", "route"), buckets=(0.01, 0.1, 1.0),
+    )
+    latency.observe(0.042, method="GET", route="/health")
+
+    # Gauges can be read from a callback when /metrics is scraped
+    metrics.gauge("redis_available", "Redis reachable", callback=lambda: int(redis_service.available))
+
+    # Values that need I/O (e.g. a database count) are refreshed by an async
+    # hook awaited by collect() before rendering, so only scrapes pay for them
+    metrics.on_collect(refresh_queue_depth)
+
+HTTPMetricsMiddleware records per-route request latency and in-flight
+requests; EXTERNAL_CALL_DURATION times outbound email and Stripe calls.
+
+Values are per worker process; Prometheus sums them across workers when
+each worker is scraped. Updates run on the event loop thread, so they
+aren't locked.
+"""
+
+import time
+from bisect import bisect_left
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+class Metric:
+    """Base class: a named metric with a fixed set of label names"""
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        """(suffixed name, formatted labels, value) for each sample"""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+        lines.extend(f"{name}{labels} {_format_value(value)}" for name, labels, value in self.samples())
+        return lines
+
+
+class Counter(Metric):
+    """A value that only goes up"""
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self):
+        for key, value in self._values.items():
+            yield self.name, _format_labels(self.labelnames, key), value
+
+
+GaugeValue = Union[float, Dict[Tuple[str, ...], float], None]
+
+
+class Gauge(Metric):
+    """
+    A value that goes up and down
+
+    If a callback is given, it's called on render and returns the value,
+    a {label values: value} dict, or None for no samples.
+    """
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callable[[], GaugeValue]] = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self):
+        values = self._values
+        if self.callback is not None:
+            try:
+                result = self.callback()
+            except Exception:
+                return
+            if result is None:
+                return
+            values = result if isinstance(result, dict) else {(): result}
+        for key, value in values.items():
+            yield self.name, _format_labels(self.labelnames, key), value
+
+
+class Histogram(Metric):
+    """Observations counted into cumulative buckets, with their sum and count"""
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [per-bucket counts (last is +Inf), sum, count]
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        series = self._values.get(key)
+        if series is None:
+            series = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def count(self, **labels: str) -> int:
+        series = self._values.get(self._key(labels))
+        return series[2] if series else 0
+
+    def samples(self):
+        bucket_labels = self.labelnames + ("le",)
+        bounds = [_format_value(bound) for bound in self.buckets] + ["+Inf"]
+        for key, (counts, total, count) in self._values.items():
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, counts):
+                cumulative += bucket_count
+                yield f"{self.name}_bucket", _format_labels(bucket_labels, key + (bound,)), cumulative
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, count
+
+
+class MetricsRegistry:
+    """Named metrics rendered together"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._collect_hooks: List[Callable[[], Awaitable[None]]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                raise ValueError(f"Metric {metric.name} is already registered differently")
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callable[[], GaugeValue]] = None,
+    ) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, callback))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def on_collect(self, hook: Callable[[], Awaitable[None]]) -> None:
+        """Await `hook` before each collect(), e.g. to refresh gauges read from the database"""
+        self._collect_hooks.append(hook)
+
+    async def collect(self) -> str:
+        """Run the collect hooks, then render (a failing hook leaves its gauges stale)"""
+        for hook in self._collect_hooks:
+            try:
+                await hook()
+            except Exception:
+                pass
+        return self.render()
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Global metrics registry
+metrics = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = metrics.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    labelnames=("method", "route", "status"),
+)
+HTTP_REQUESTS_IN_PROGRESS = metrics.gauge("http_requests_in_progress", "HTTP requests being handled")
+
+EXTERNAL_CALL_DURATION = metrics.histogram(
+    "external_call_duration_seconds",
+    "Outbound API call latency (one observation per attempt)",
+    labelnames=("service", "operation", "outcome"),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+
+def observe_external_call(service: str, operation: str, outcome: str, started: float) -> None:
+    """Record an outbound call that began at time.perf_counter() `started`."""
+    EXTERNAL_CALL_DURATION.observe(time.perf_counter() - started, service=service, operation=operation, outcome=outcome)
+
+
+class HTTPMetricsMiddleware:
+    """
+    ASGI middleware recording request latency by method, route and status
+
+    Routes are labelled by their template ("/api/v1/reviews/{review_id}"),
+    so label cardinality stays bounded; requests that matched no route
+    (404s, static files) share the "<other>" label. A request whose
+    handler raised is recorded with status 500.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_PROGRESS.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - started
+            HTTP_REQUESTS_IN_PROGRESS.dec()
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.observe(
+                duration,
+                method=scope["method"],
+                route=getattr(route, "path_format", None) or getattr(route, "path", None) or "<other>",
+                status=str(status),
+            )
@@ -1,28 +1,156 @@
 """Security utilities for password hashing and JWT tokens"""
 
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
+from app.core.exceptions import ServiceOverloadedError
+from app.core.metrics import metrics
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context (hashes below BCRYPT_ROUNDS report needs_update)
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
 
 # JWT configuration
 ALGORITHM = "HS256"
 
+PASSWORD_HASH_SHED = metrics.counter("password_hash_shed_total", "Hashing jobs rejected because the pool was saturated")
+PASSWORD_HASH_QUEUE_WAIT = metrics.histogram(
+    "password_hash_queue_wait_seconds",
+    "Time hashing jobs waited for a pool thread",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plain password against a hashed password"""
+    """Verify a plain password against a hashed password (blocking; prefer verify_password_async)"""
     return pwd_context.verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    """Hash a password"""
+    """Hash a password (blocking; prefer get_password_hash_async)"""
     return pwd_context.hash(password)
 
 
+class PasswordHasher:
+    """
+    Runs bcrypt on a dedicated, size-limited thread pool.
+
+    bcrypt takes tens to hundreds of milliseconds of CPU per call; run on
+    the event loop it stalls every other request on the worker. The bcrypt
+    C extension releases the GIL, so a small thread pool hashes in parallel
+    without blocking the loop.
+
+    At most `max_pending` jobs may be queued or running; beyond that new
+    jobs are shed with ServiceOverloadedError (503 + Retry-After) instead
+    of queueing unboundedly behind a login burst.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None):
+        self.workers = workers or settings.PASSWORD_HASH_WORKERS
+        self.max_pending = max_pending or settings.PASSWORD_HASH_MAX_PENDING
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.pending = 0
+        self.max_pending_seen = 0
+        self.completed = 0
+        self.shed = 0
+        self.wait_total = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a hashing function on the pool, shedding load when saturated."""
+        if self.pending >= self.max_pending:
+            self.shed += 1
+            PASSWORD_HASH_SHED.inc()
+            raise ServiceOverloadedError()
+
+        self.pending += 1
+        self.max_pending_seen = max(self.max_pending_seen, self.pending)
+        queued_at = time.perf_counter()
+
+        def timed() -> Tuple[float, Any]:
+            started_at = time.perf_counter()
+            return started_at - queued_at, func(*args)
+
+        try:
+            waited, result = await asyncio.get_running_loop().run_in_executor(self._get_executor(), timed)
+        finally:
+            self.pending -= 1
+        self.completed += 1
+        self.wait_total += waited
+        PASSWORD_HASH_QUEUE_WAIT.observe(waited)
+        return result
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and shedding figures for monitoring."""
+        return {
+            "workers": self.workers,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "max_pending_seen": self.max_pending_seen,
+            "completed": self.completed,
+            "shed": self.shed,
+            "queue_wait_avg_ms": round(self.wait_total / self.completed * 1000, 2) if self.completed else 0.0,
+        }
+
+
+password_hasher = PasswordHasher()
+
+metrics.gauge("password_hash_pending", "Hashing jobs queued or running", callback=lambda: password_hasher.pending)
+metrics.gauge("password_hash_max_pending", "Hashing jobs allowed before shedding", callback=lambda: password_hasher.max_pending)
+
+_dummy_hash: Optional[str] = None
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a plain password against a hashed password on the hashing pool"""
+    return await password_hasher.run(pwd_context.verify, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password on the hashing pool"""
+    return await password_hasher.run(pwd_context.hash, password)
+
+
+async def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and rehash it if its hash is outdated (e.g. BCRYPT_ROUNDS was raised).
+
+    Returns:
+        (is_valid, new_hash) where new_hash is None unless the caller should store it
+    """
+    return await password_hasher.run(pwd_context.verify_and_update, plain_password, hashed_password)
+
+
+async def verify_dummy_password(plain_password: str) -> bool:
+    """
+    Spend the same time as a real verification, for unknown accounts.
+
+    Keeps login timing identical whether or not the email exists.
+    """
+    global _dummy_hash
+    if _dummy_hash is None:
+        _dummy_hash = await get_password_hash_async("critvue-timing-equalization")
+    await verify_password_async(plain_password, _dummy_hash)
+    return False
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token
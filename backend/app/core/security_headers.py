@@ -0,0 +1,74 @@
+"""
+Security headers added to every HTTP response
+
+The header lists are encoded once at startup; the middleware appends them
+to the response start message as raw header tuples, without wrapping the
+response in a Request/Response pair.
+"""
+
+from typing import List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+Header = Tuple[bytes, bytes]
+
+
+def _encode(headers: List[Tuple[str, str]]) -> List[Header]:
+    return [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers]
+
+
+SECURITY_HEADERS: List[Header] = _encode([
+    # Prevent MIME type sniffing
+    ("X-Content-Type-Options", "nosniff"),
+    # Prevent clickjacking
+    ("X-Frame-Options", "DENY"),
+    # XSS protection (legacy but still useful)
+    ("X-XSS-Protection", "1; mode=block"),
+    # Referrer policy
+    ("Referrer-Policy", "strict-origin-when-cross-origin"),
+    # Permissions policy (disable dangerous features)
+    ("Permissions-Policy", "geolocation=(), microphone=(), camera=()"),
+])
+
+# Production-only security headers
+PRODUCTION_SECURITY_HEADERS: List[Header] = _encode([
+    # HSTS - enforce HTTPS for 1 year, include subdomains
+    ("Strict-Transport-Security", "max-age=31536000; includeSubDomains; preload"),
+    # Content Security Policy - restrictive default, allow self and trusted sources
+    ("Content-Security-Policy", (
+        "default-src 'self'; "
+        "script-src 'self' 'unsafe-inline' https://js.stripe.com; "
+        "style-src 'self' 'unsafe-inline'; "
+        "img-src 'self' data: https:; "
+        "font-src 'self' data:; "
+        "connect-src 'self' https://api.stripe.com; "
+        "frame-src https://js.stripe.com https://hooks.stripe.com; "
+        "object-src 'none'; "
+        "base-uri 'self'; "
+        "form-action 'self';"
+    )),
+])
+
+
+class SecurityHeadersMiddleware:
+    """Add security headers to all responses"""
+
+    def __init__(self, app: ASGIApp, production: Optional[bool] = None):
+        self.app = app
+        if production is None:
+            production = settings.is_production
+        self.headers = SECURITY_HEADERS + (PRODUCTION_SECURITY_HEADERS if production else [])
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *self.headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -4,8 +4,8 @@ from datetime import datetime, timedelta
 from typing import Optional, List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_
-from sqlalchemy.orm import selectinload, joinedload
 
+from app.crud import review_loading
 from app.models.review_request import ReviewRequest, ReviewStatus, ContentType, ReviewType
 from app.models.user import User
 from app.models.review_file import ReviewFile
@@ -190,10 +190,7 @@ class BrowseCRUD:
                 select(ReviewRequest)
                 .join(User, ReviewRequest.user_id == User.id)
                 .outerjoin(ReviewFile, ReviewRequest.id == ReviewFile.review_request_id)
-                .options(
-                    joinedload(ReviewRequest.user),
-                    selectinload(ReviewRequest.files)
-                )
+                .options(*review_loading.LIST_CARD)
                 .where(
                     # Show pending OR in_review (if not fully claimed)
                     or_(
@@ -5,14 +5,15 @@ import re
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Optional, List, Dict, Any
-from sqlalchemy import select, func, and_, case
+from sqlalchemy import select, func, case, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
-from app.models.review_slot import ReviewSlot, ReviewSlotStatus
-from app.models.review_request import ReviewRequest, ReviewStatus
-from app.models.reviewer_rating import ReviewerRating, ReviewerStats
+from app.models.user_specialty import UserSpecialty
+from app.models.review_request import ReviewStatus
 from app.schemas.profile import ProfileUpdate, is_username_reserved
+from app.services.ratings.reviewer_stats import compute_reviewer_stats
+from app.services.reviewer_directory_service import normalize_specialty_tags
 
 
 async def get_user_profile(db: AsyncSession, user_id: int) -> Optional[User]:
@@ -211,6 +212,7 @@ async def update_profile(
         if field == "specialty_tags" and value is not None:
             # Convert list to JSON string for SQLite
             setattr(user, field, json.dumps(value))
+            await sync_user_specialties(db, user.id, value)
         else:
             setattr(user, field, value)
 
@@ -222,6 +224,24 @@ async def update_profile(
     return user
 
 
+async def sync_user_specialties(db: AsyncSession, user_id: int, tags: List[str]) -> None:
+    """
+    Replace a user's rows in user_specialties with the given tag list
+
+    Call whenever User.specialty_tags changes; the caller commits.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        tags: The user's specialty tags, in display order
+    """
+    await db.execute(delete(UserSpecialty).where(UserSpecialty.user_id == user_id))
+    db.add_all([
+        UserSpecialty(user_id=user_id, tag=tag, label=label, position=position)
+        for position, (tag, label) in enumerate(normalize_specialty_tags(tags))
+    ])
+
+
 async def update_avatar(
     db: AsyncSession, user_id: int, avatar_url: Optional[str]
 ) -> Optional[User]:
@@ -262,81 +282,12 @@ async def calculate_user_stats(db: AsyncSession, user_id: int) -> Dict[str, Any]
     Returns:
         Dictionary with calculated stats
     """
-    # Count reviews given (accepted review slots as reviewer)
-    reviews_given_result = await db.execute(
-        select(func.count(ReviewSlot.id)).where(
-            and_(
-                ReviewSlot.reviewer_id == user_id,
-                ReviewSlot.status == ReviewSlotStatus.ACCEPTED.value,
-            )
-        )
-    )
-    total_reviews_given = reviews_given_result.scalar() or 0
-
-    # Count reviews received (accepted review slots for user's requests)
-    reviews_received_result = await db.execute(
-        select(func.count(ReviewSlot.id))
-        .select_from(ReviewSlot)
-        .join(ReviewRequest, ReviewSlot.review_request_id == ReviewRequest.id)
-        .where(
-            and_(
-                ReviewRequest.user_id == user_id,
-                ReviewSlot.status == ReviewSlotStatus.ACCEPTED.value,
-            )
-        )
-    )
-    total_reviews_received = reviews_received_result.scalar() or 0
-
-    # Calculate average rating from reviewer ratings (two-way rating system)
-    # This is the rating the reviewer RECEIVES from requesters
-    avg_rating_result = await db.execute(
-        select(func.avg(ReviewerRating.overall_rating)).where(
-            ReviewerRating.reviewer_id == user_id
-        )
-    )
-    avg_rating = avg_rating_result.scalar()
-    if avg_rating:
-        avg_rating = round(float(avg_rating), 2)
-    else:
-        # Fallback: check reviewer_stats table for cached avg_overall
-        stats_result = await db.execute(
-            select(ReviewerStats.avg_overall).where(ReviewerStats.user_id == user_id)
-        )
-        cached_avg = stats_result.scalar()
-        if cached_avg:
-            avg_rating = round(float(cached_avg), 2)
-
-    # Calculate average response time (time from claimed to submitted)
-    response_times_result = await db.execute(
-        select(
-            func.avg(
-                func.julianday(ReviewSlot.submitted_at)
-                - func.julianday(ReviewSlot.claimed_at)
-            )
-            * 24  # Convert days to hours
-        ).where(
-            and_(
-                ReviewSlot.reviewer_id == user_id,
-                ReviewSlot.status.in_(
-                    [
-                        ReviewSlotStatus.SUBMITTED.value,
-                        ReviewSlotStatus.ACCEPTED.value,
-                    ]
-                ),
-                ReviewSlot.claimed_at.isnot(None),
-                ReviewSlot.submitted_at.isnot(None),
-            )
-        )
-    )
-    avg_response_time = response_times_result.scalar()
-    if avg_response_time:
-        avg_response_time = int(round(avg_response_time))
-
+    stats = await compute_reviewer_stats(db, user_id)
     return {
-        "total_reviews_given": total_reviews_given,
-        "total_reviews_received": total_reviews_received,
-        "avg_rating": avg_rating,
-        "avg_response_time_hours": avg_response_time,
+        "total_reviews_given": stats.total_reviews_given if stats else 0,
+        "total_reviews_received": stats.total_reviews_received if stats else 0,
+        "avg_rating": stats.avg_rating if stats else None,
+        "avg_response_time_hours": stats.avg_response_time_hours if stats else None,
     }
 
 
@@ -4,8 +4,8 @@ from datetime import datetime
 from typing import Optional, List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_
-from sqlalchemy.orm import selectinload
 
+from app.crud import review_loading
 from app.models.review_request import ReviewRequest, ReviewStatus
 from app.models.review_file import ReviewFile
 from app.schemas.review import ReviewRequestCreate, ReviewRequestUpdate, ReviewFileCreate
@@ -72,9 +72,8 @@ class ReviewCRUD:
                     payment_amount
                 )
 
-                # Refresh to get slots relationship
-                await db.refresh(review)
-
+            # Load the collections the response includes
+            await db.refresh(review, ["files", "slots"])
             return review
         except Exception as e:
             await db.rollback()
@@ -101,11 +100,7 @@ class ReviewCRUD:
             Exception: If database operation fails
         """
         try:
-            query = select(ReviewRequest).options(
-                selectinload(ReviewRequest.files),
-                selectinload(ReviewRequest.slots),
-                selectinload(ReviewRequest.user)
-            ).where(
+            query = select(ReviewRequest).options(*review_loading.DETAIL).where(
                 ReviewRequest.id == review_id,
                 ReviewRequest.deleted_at.is_(None)
             )
@@ -145,9 +140,7 @@ class ReviewCRUD:
         """
         try:
             # Build base query
-            query = select(ReviewRequest).options(
-                selectinload(ReviewRequest.files)
-            ).where(
+            query = select(ReviewRequest).options(*review_loading.OWNER_LIST).where(
                 ReviewRequest.user_id == user_id,
                 ReviewRequest.deleted_at.is_(None)
             )
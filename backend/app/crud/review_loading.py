@@ -0,0 +1,118 @@
+"""
+Loading profiles for review requests.
+
+ReviewRequest's collections (files, slots, nda_signatures,
+slot_applications) are lazy="raise": a query loads none of them unless
+it asks, and touching one that wasn't loaded raises instead of issuing
+a hidden query. Each profile is the option set for one kind of read:
+
+- LIST_CARD: browse cards - requester and files (preview image)
+- SLOT_SUMMARY: dashboard rows - slots, limited to the columns the
+  status counts and urgency read; anything else raises
+- DETAIL: the review request page - requester, files and slots, with
+  the submitted content (SLOT_CONTENT) deferred; load_slot_content()
+  fetches it for the slots the viewer may read
+- OWNER_LIST: the owner's own requests - files and slots, content
+  deferred
+- CLAIM: claim and unclaim locks - the request row limited to ownership,
+  status and the claim counters
+- JOB: scheduler sweeps - the request row limited to status and the
+  claim/completion counters. JOB_SLOT_REQUEST is the same set for
+  sweeps that start from ReviewSlot
+
+Deferred columns raise when read before they're loaded;
+ReviewSlotResponse leaves deferred content unset instead of reading it.
+
+Usage:
+    from app.crud import review_loading
+
+    query = select(ReviewRequest).options(*review_loading.DETAIL)
+"""
+
+from typing import Iterable
+
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, joinedload, load_only, selectinload
+
+from app.models.review_request import ReviewRequest
+from app.models.review_slot import ReviewSlot
+
+# Reviewer-written slot columns: the bulk of a slot row, read only where
+# the review itself is shown
+SLOT_CONTENT = (
+    ReviewSlot.review_text,
+    ReviewSlot.review_attachments,
+    ReviewSlot.feedback_sections,
+    ReviewSlot.annotations,
+    ReviewSlot.draft_sections,
+)
+
+_DEFER_SLOT_CONTENT = tuple(defer(column, raiseload=True) for column in SLOT_CONTENT)
+
+_CLAIM_COLUMNS = (
+    ReviewRequest.id,
+    ReviewRequest.user_id,
+    ReviewRequest.status,
+    ReviewRequest.reviews_requested,
+    ReviewRequest.reviews_claimed,
+    ReviewRequest.updated_at,
+)
+
+_JOB_COLUMNS = _CLAIM_COLUMNS + (
+    ReviewRequest.reviews_completed,
+    ReviewRequest.completed_at,
+)
+
+LIST_CARD = (
+    joinedload(ReviewRequest.user),
+    selectinload(ReviewRequest.files),
+)
+
+SLOT_SUMMARY = (
+    selectinload(ReviewRequest.slots).load_only(
+        ReviewSlot.id,
+        ReviewSlot.review_request_id,
+        ReviewSlot.status,
+        ReviewSlot.auto_accept_at,
+        raiseload=True,
+    ),
+)
+
+DETAIL = (
+    selectinload(ReviewRequest.user),
+    selectinload(ReviewRequest.files),
+    selectinload(ReviewRequest.slots).options(*_DEFER_SLOT_CONTENT),
+)
+
+OWNER_LIST = (
+    selectinload(ReviewRequest.files),
+    selectinload(ReviewRequest.slots).options(*_DEFER_SLOT_CONTENT),
+)
+
+CLAIM = (load_only(*_CLAIM_COLUMNS, raiseload=True),)
+
+JOB = (load_only(*_JOB_COLUMNS, raiseload=True),)
+
+JOB_SLOT_REQUEST = (
+    selectinload(ReviewSlot.review_request).load_only(*_JOB_COLUMNS, raiseload=True),
+)
+
+
+async def load_slot_content(db: AsyncSession, slots: Iterable[ReviewSlot]) -> None:
+    """
+    Load the deferred SLOT_CONTENT columns for the given slots in one query.
+
+    Slots whose content is already loaded are skipped, so this is a no-op
+    for rows loaded without a deferring profile.
+    """
+    content_keys = {column.key for column in SLOT_CONTENT}
+    slot_ids = [slot.id for slot in slots if inspect(slot).unloaded & content_keys]
+    if not slot_ids:
+        return
+
+    await db.execute(
+        select(ReviewSlot)
+        .where(ReviewSlot.id.in_(slot_ids))
+        .options(load_only(ReviewSlot.id, *SLOT_CONTENT))
+    )
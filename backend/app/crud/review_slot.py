@@ -18,6 +18,7 @@ from app.models.review_slot import (
 from app.models.review_request import ReviewRequest, ReviewType
 from app.models.user import User
 from app.schemas.review_slot import ReviewSlotCreate
+from app.crud import review_loading
 
 logger = logging.getLogger(__name__)
 
@@ -325,7 +326,9 @@ async def claim_review_slot(
     slot.claim(reviewer_id, claim_hours)
 
     # Update review request's reviews_claimed count
-    request = await db.get(ReviewRequest, slot.review_request_id)
+    request = await db.get(
+        ReviewRequest, slot.review_request_id, options=review_loading.CLAIM
+    )
     if request:
         request.reviews_claimed += 1
 
@@ -380,7 +383,9 @@ async def abandon_review_slot(
     slot.abandon()
 
     # Update review request's reviews_claimed count
-    request = await db.get(ReviewRequest, slot.review_request_id)
+    request = await db.get(
+        ReviewRequest, slot.review_request_id, options=review_loading.CLAIM
+    )
     if request:
         request.reviews_claimed = max(0, request.reviews_claimed - 1)
 
@@ -900,7 +905,9 @@ async def process_expired_claims(db: AsyncSession) -> int:
             slot.abandon()
 
             # Update review request's reviews_claimed count
-            request = await db.get(ReviewRequest, slot.review_request_id)
+            request = await db.get(
+                ReviewRequest, slot.review_request_id, options=review_loading.JOB
+            )
             if request:
                 request.reviews_claimed = max(0, request.reviews_claimed - 1)
 
@@ -933,12 +940,13 @@ async def process_auto_accepts(db: AsyncSession) -> int:
             ReviewSlot.status == ReviewSlotStatus.SUBMITTED.value,
             ReviewSlot.auto_accept_at < now
         )
-    ).options(selectinload(ReviewSlot.review_request))
+    ).options(*review_loading.JOB_SLOT_REQUEST)
 
     result = await db.execute(query)
     auto_accept_slots = list(result.scalars().all())
 
     count = 0
+    accepted_slots = []
     for slot in auto_accept_slots:
         try:
             slot.accept(is_auto=True)
@@ -974,6 +982,7 @@ async def process_auto_accepts(db: AsyncSession) -> int:
                     logger.error(f"Error releasing payment for auto-accepted slot {slot.id}: {payment_error}")
 
             count += 1
+            accepted_slots.append(slot)
         except Exception as e:
             logger.error(f"Error auto-accepting slot {slot.id}: {e}")
 
@@ -981,4 +990,13 @@ async def process_auto_accepts(db: AsyncSession) -> int:
         await db.commit()
         logger.info(f"Auto-accepted {count} review slots")
 
+        # Update reviewer DNA statistics (auto-accepts don't go through the sparks hooks)
+        from app.services.ratings.reviewer_dna_service import ReviewerDNAService
+        dna_service = ReviewerDNAService(db)
+        for slot in accepted_slots:
+            try:
+                await dna_service.record_acceptance(slot)
+            except Exception as e:
+                logger.error(f"Error updating DNA for auto-accepted slot {slot.id}: {e}")
+
     return count
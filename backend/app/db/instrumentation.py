@@ -0,0 +1,208 @@
+"""
+Query count and latency instrumentation
+
+Engine events time every SQL statement. Statements run while handling a
+request (or inside track_queries()) are also recorded on that request's
+QueryStats:
+
+    with track_queries() as stats:
+        await db.execute(...)
+    stats.count, stats.total_seconds, stats.slowest_statement
+    stats.repeated()  # {fingerprint: count} for likely N+1 patterns
+
+- QueryStatsMiddleware tracks each HTTP request. Outside production it
+  adds X-DB-Query-Count, X-DB-Time-Ms, X-DB-Slowest-Ms and
+  X-DB-Repeated-Queries response headers
+- Requests that run the same statement fingerprint at least
+  DB_REPEATED_QUERY_THRESHOLD times are logged as N+1 suspects, with the
+  stats as structured log fields; other requests log them at DEBUG
+- Statements slower than DB_SLOW_QUERY_MS are logged as they finish
+- Process-wide counts and latencies are exported at /metrics
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+QUERY_DURATION = metrics.histogram(
+    "db_query_duration_seconds",
+    "SQL statement execution time",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+SLOW_QUERIES = metrics.counter("db_slow_queries_total", "SQL statements slower than DB_SLOW_QUERY_MS")
+QUERIES_PER_REQUEST = metrics.histogram(
+    "db_queries_per_request",
+    "SQL statements executed per HTTP request",
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100),
+)
+REPEATED_QUERY_REQUESTS = metrics.counter(
+    "db_repeated_query_requests_total",
+    "HTTP requests that repeated a statement DB_REPEATED_QUERY_THRESHOLD or more times",
+)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\?|%s|\$\d+|:\w+)(?:\s*,\s*(?:\?|%s|\$\d+|:\w+))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """Statement with literals and IN-list lengths normalized away."""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST.sub("(?)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+@dataclass
+class QueryStats:
+    """Queries run during one request or tracked block"""
+    count: int = 0
+    total_seconds: float = 0.0
+    slowest_seconds: float = 0.0
+    slowest_statement: Optional[str] = None
+    statements: Counter = field(default_factory=Counter)  # Raw statement -> executions
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: Optional[int] = None) -> Dict[str, int]:
+        """Statement fingerprints run at least `threshold` times (likely N+1)."""
+        if threshold is None:
+            threshold = settings.DB_REPEATED_QUERY_THRESHOLD
+        by_fingerprint: Counter = Counter()
+        for statement, count in self.statements.items():
+            by_fingerprint[fingerprint(statement)] += count
+        return {statement: count for statement, count in by_fingerprint.items() if count >= threshold}
+
+    def headers(self) -> List[Tuple[bytes, bytes]]:
+        return [
+            (b"x-db-query-count", str(self.count).encode()),
+            (b"x-db-time-ms", f"{self.total_seconds * 1000:.1f}".encode()),
+            (b"x-db-slowest-ms", f"{self.slowest_seconds * 1000:.1f}".encode()),
+            (b"x-db-repeated-queries", str(len(self.repeated())).encode()),
+        ]
+
+    def log_fields(self) -> dict:
+        return {
+            "db_query_count": self.count,
+            "db_time_ms": round(self.total_seconds * 1000, 1),
+            "db_slowest_ms": round(self.slowest_seconds * 1000, 1),
+            "db_slowest_statement": self.slowest_statement,
+            "db_repeated_queries": self.repeated(),
+        }
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Stats for the request being handled, if it's tracked."""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Record the queries run inside the block (nested blocks record their own)."""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    seconds = time.perf_counter() - context._query_started
+    QUERY_DURATION.observe(seconds)
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, seconds)
+
+    if seconds * 1000 >= settings.DB_SLOW_QUERY_MS:
+        SLOW_QUERIES.inc()
+        logger.warning(
+            "Slow query (%.1f ms): %s", seconds * 1000, statement[:500],
+            extra={"db_query_ms": round(seconds * 1000, 1), "db_statement": statement},
+        )
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Attach the timing listeners to an engine (once)."""
+    sync_engine = engine.sync_engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryStatsMiddleware:
+    """ASGI middleware tracking the queries each HTTP request runs"""
+
+    def __init__(self, app, expose_headers: bool = True):
+        self.app = app
+        self.expose_headers = expose_headers
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + stats.headers()
+            await send(message)
+
+        token = _current_stats.set(stats)
+        try:
+            await self.app(scope, receive, send_with_headers if self.expose_headers else send)
+        finally:
+            _current_stats.reset(token)
+            self._report(scope, stats)
+
+    @staticmethod
+    def _report(scope, stats: QueryStats) -> None:
+        QUERIES_PER_REQUEST.observe(stats.count)
+        if not stats.count:
+            return
+
+        repeated = stats.repeated()
+        if repeated:
+            REPEATED_QUERY_REQUESTS.inc()
+            logger.warning(
+                "Repeated queries on %s %s (%d queries, %.1f ms): %s",
+                scope["method"], scope["path"], stats.count, stats.total_seconds * 1000, repeated,
+                extra={**stats.log_fields(), "http_method": scope["method"], "http_path": scope["path"]},
+            )
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "%s %s ran %d queries in %.1f ms",
+                scope["method"], scope["path"], stats.count, stats.total_seconds * 1000,
+                extra={**stats.log_fields(), "http_method": scope["method"], "http_path": scope["path"]},
+            )
@@ -4,6 +4,8 @@ from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import NullPool, QueuePool
 from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.instrumentation import instrument_engine
 
 # Determine if we're using SQLite (for development) or PostgreSQL (for production)
 is_sqlite = settings.DATABASE_URL.startswith("sqlite")
@@ -38,6 +40,27 @@ else:
         },
     )
 
+# Time queries for per-request stats, slow-query logs and /metrics
+if settings.DB_INSTRUMENTATION_ENABLED:
+    instrument_engine(engine)
+
+
+def _pool_gauge(method_name: str):
+    # NullPool (SQLite) has no counters, so its gauges export no samples
+    def read():
+        method = getattr(engine.sync_engine.pool, method_name, None)
+        return method() if method else None
+    return read
+
+
+metrics.gauge("db_pool_size", "Connections kept in the pool", callback=_pool_gauge("size"))
+metrics.gauge("db_pool_checked_out", "Pool connections in use", callback=_pool_gauge("checkedout"))
+metrics.gauge(
+    "db_pool_overflow",
+    "Connections open beyond the pool size (negative while the pool isn't full)",
+    callback=_pool_gauge("overflow"),
+)
+
 # Create async session factory
 async_session_maker = async_sessionmaker(
     engine,
@@ -3,8 +3,11 @@ Critvue FastAPI Application
 Main entry point for the backend API
 """
 
-from fastapi import FastAPI, Request, Depends
+import secrets
+
+from fastapi import FastAPI, HTTPException, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.sessions import SessionMiddleware
 from slowapi import Limiter, _rate_limit_exceeded_handler
@@ -14,12 +17,20 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from pathlib import Path
 
 from app.core.config import settings
+from app.core.csrf import CSRFMiddleware
+from app.core.metrics import HTTPMetricsMiddleware, metrics
+from app.core.security import password_hasher
+from app.core.security_headers import SecurityHeadersMiddleware
 from app.core.exception_handlers import register_exception_handlers
 from app.api import auth, webhooks
 from app.api.v1 import reviews, browse, profile, notifications, dashboard, admin, gamification, challenges, payments, unsubscribe
-from app.core.logging_config import setup_logging
+from app.core.logging_config import RequestIdMiddleware, setup_logging
+from app.db.instrumentation import QueryStatsMiddleware
 from app.db.session import close_db, get_db
+from app.services.infrastructure.draft_buffer import draft_flusher
 from app.services.infrastructure.scheduler import start_background_jobs, stop_background_jobs
+from app.services.payments.stripe_client import close_stripe_client
+from app.services.payments.webhook_inbox import webhook_worker_pool
 
 # Setup logging
 setup_logging(level=settings.LOG_LEVEL)
@@ -64,48 +75,7 @@ app.include_router(challenges.router, prefix="/api/v1")  # Platform-curated crea
 app.include_router(payments.router, prefix="/api/v1")  # Payments (transactions, subscriptions)
 app.include_router(unsubscribe.router, prefix="/api/v1")  # Email unsubscribe for compliance
 
-# CSRF Protection middleware
-from app.core.csrf import CSRFMiddleware
-
 # Security headers middleware
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
-
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Add security headers to all responses"""
-    async def dispatch(self, request, call_next):
-        response: Response = await call_next(request)
-        # Prevent MIME type sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        # Prevent clickjacking
-        response.headers["X-Frame-Options"] = "DENY"
-        # XSS protection (legacy but still useful)
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        # Referrer policy
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        # Permissions policy (disable dangerous features)
-        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
-
-        # Production-only security headers
-        if settings.is_production:
-            # HSTS - enforce HTTPS for 1 year, include subdomains
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains; preload"
-            # Content Security Policy - restrictive default, allow self and trusted sources
-            response.headers["Content-Security-Policy"] = (
-                "default-src 'self'; "
-                "script-src 'self' 'unsafe-inline' https://js.stripe.com; "
-                "style-src 'self' 'unsafe-inline'; "
-                "img-src 'self' data: https:; "
-                "font-src 'self' data:; "
-                "connect-src 'self' https://api.stripe.com; "
-                "frame-src https://js.stripe.com https://hooks.stripe.com; "
-                "object-src 'none'; "
-                "base-uri 'self'; "
-                "form-action 'self';"
-            )
-
-        return response
-
 app.add_middleware(SecurityHeadersMiddleware)
 
 # CSRF Protection middleware (must be after CORS, before request processing)
@@ -129,9 +99,20 @@ app.add_middleware(
         "X-Requested-With",
         "X-CSRF-Token",  # Required for CSRF protection
     ],
-    expose_headers=["X-Total-Count", "X-Page", "X-Page-Size"],
+    expose_headers=["X-Total-Count", "X-Page", "X-Page-Size", "X-Request-ID"],
 )
 
+# Per-request query counts and timings (X-DB-* headers outside production)
+if settings.DB_INSTRUMENTATION_ENABLED:
+    app.add_middleware(QueryStatsMiddleware, expose_headers=not settings.is_production)
+
+# Per-route latency histograms and in-flight requests for /metrics (wraps the middleware above, so their cost is included)
+if settings.METRICS_ENABLED:
+    app.add_middleware(HTTPMetricsMiddleware)
+
+# Request ids for log records and the X-Request-ID response header
+app.add_middleware(RequestIdMiddleware)
+
 # Mount static files for uploaded content
 uploads_dir = Path("/home/user/Critvue/backend/uploads")
 uploads_dir.mkdir(parents=True, exist_ok=True)
@@ -148,6 +129,24 @@ async def root():
     }
 
 
+def _metrics_authorized(request: Request) -> bool:
+    """Whether the caller may read /metrics (METRICS_TOKEN as a bearer token)"""
+    if not settings.METRICS_TOKEN:
+        # Open without a token only in local development, never on staging
+        return settings.ENVIRONMENT.lower() == "development"
+    return secrets.compare_digest(
+        request.headers.get("authorization", ""), f"Bearer {settings.METRICS_TOKEN}"
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint(request: Request):
+    """Prometheus text-format metrics for this worker process"""
+    if not settings.METRICS_ENABLED or not _metrics_authorized(request):
+        raise HTTPException(status_code=404, detail="Not Found")
+    return PlainTextResponse(await metrics.collect(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 @app.get("/health")
 async def health_check(db: AsyncSession = Depends(get_db)):
     """
@@ -181,7 +180,7 @@ async def health_check(db: AsyncSession = Depends(get_db)):
         "service": "critvue-backend",
         "database": db_status,
         "version": settings.VERSION,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": datetime.utcnow().isoformat(),
     }
 
 
@@ -224,6 +223,17 @@ async def startup_event():
         logger.error(f"Failed to start background job scheduler: {e}", exc_info=True)
         # Don't fail startup if scheduler fails
 
+    # Start webhook inbox workers
+    if settings.WEBHOOK_WORKERS_ENABLED:
+        try:
+            webhook_worker_pool.start()
+        except Exception as e:
+            logger.error(f"Failed to start webhook worker pool: {e}", exc_info=True)
+
+    # Start writing back buffered draft autosaves
+    if settings.DRAFT_BUFFER_ENABLED:
+        draft_flusher.start()
+
     logger.info("Critvue backend startup complete")
 
 
@@ -242,6 +252,27 @@ async def shutdown_event():
     except Exception as e:
         logger.error(f"Error stopping background job scheduler: {e}", exc_info=True)
 
+    # Stop webhook inbox workers (finishes the current batch)
+    try:
+        await webhook_worker_pool.stop()
+    except Exception as e:
+        logger.error(f"Error stopping webhook worker pool: {e}", exc_info=True)
+
+    # Write back buffered draft autosaves
+    try:
+        await draft_flusher.stop()
+    except Exception as e:
+        logger.error(f"Error flushing buffered drafts: {e}", exc_info=True)
+
+    # Stop password hashing threads
+    password_hasher.shutdown()
+
+    # Close Stripe connection pool
+    try:
+        await close_stripe_client()
+    except Exception as e:
+        logger.error(f"Error closing Stripe client: {e}", exc_info=True)
+
     # Close database connections
     await close_db()
 
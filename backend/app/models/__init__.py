@@ -43,6 +43,10 @@ from app.models.admin_audit_log import AdminAuditLog, AdminAction
 from app.models.privacy_settings import PrivacySettings, ProfileVisibility
 # User sessions
 from app.models.user_session import UserSession
+# Webhook inbox
+from app.models.webhook_event import WebhookEvent, WebhookEventStatus
+# Reviewer directory
+from app.models.user_specialty import UserSpecialty
 
 __all__ = [
     "User",
@@ -119,4 +123,8 @@ __all__ = [
     "ProfileVisibility",
     # User sessions
     "UserSession",
+    # Webhook inbox
+    "WebhookEvent",
+    "WebhookEventStatus",
+    "UserSpecialty",
 ]
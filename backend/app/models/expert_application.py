@@ -84,6 +84,10 @@ class ExpertApplication(AsyncAttrs, Base):
     # Final rejection reason summary (for applicant notification)
     rejection_summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
+    # Denormalized review queue state, maintained by CommitteeService on claim/release/vote
+    claim_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    has_active_claim: Mapped[bool] = mapped_column(Boolean, default=False, server_default="0", nullable=False)
+
     # Relationship to user
     user: Mapped["User"] = relationship("User", back_populates="expert_applications")
 
@@ -98,6 +102,10 @@ class ExpertApplication(AsyncAttrs, Base):
     __table_args__ = (
         Index("idx_expert_app_user_status", "user_id", "status"),
         Index("idx_expert_app_created", "created_at"),
+        # Review queue: unclaimed submitted applications, oldest first
+        Index("idx_expert_app_queue", "status", "has_active_claim", "submitted_at"),
+        # Dashboard monthly decision counts
+        Index("idx_expert_app_status_decided", "status", "decided_at"),
     )
 
     def __repr__(self) -> str:
@@ -75,7 +75,8 @@ class RequesterStats(Base):
     """
     Aggregated requester statistics for quick lookup.
 
-    Updated whenever a new rating is submitted.
+    Each new rating is added to the stored sums and averages in one atomic
+    UPDATE; a weekly recompute from requester_ratings corrects any drift.
     """
 
     __tablename__ = "requester_stats"
@@ -97,6 +98,12 @@ class RequesterStats(Base):
     avg_fairness = Column(Numeric(3, 2), nullable=True)
     avg_overall = Column(Numeric(3, 2), nullable=True)
 
+    # Running sums of each rating dimension (averages are sum / total_ratings)
+    clarity_sum = Column(Integer, default=0, nullable=False)
+    responsiveness_sum = Column(Integer, default=0, nullable=False)
+    fairness_sum = Column(Integer, default=0, nullable=False)
+    overall_sum = Column(Integer, default=0, nullable=False)
+
     # Counts
     total_ratings = Column(Integer, default=0, nullable=False)
     total_reviews_requested = Column(Integer, default=0, nullable=False)
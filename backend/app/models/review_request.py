@@ -227,30 +227,32 @@ class ReviewRequest(Base):
     )
 
     # Relationships
+    # Collections are lazy="raise": queries opt in with a loading profile
+    # from app.crud.review_loading, so an unplanned load fails loudly
     user = relationship("User", back_populates="review_requests")
     files = relationship(
         "ReviewFile",
         back_populates="review_request",
         cascade="all, delete-orphan",
-        lazy="selectin"  # Eager load files when fetching review requests
+        lazy="raise"
     )
     slots = relationship(
         "ReviewSlot",
         back_populates="review_request",
         cascade="all, delete-orphan",
-        lazy="selectin"  # Eager load slots for status calculations
+        lazy="raise"
     )
     nda_signatures = relationship(
         "NDASignature",
         back_populates="review_request",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy="raise"
     )
     slot_applications = relationship(
         "SlotApplication",
         back_populates="review_request",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy="raise"
     )
 
     def __repr__(self) -> str:
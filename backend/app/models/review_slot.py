@@ -14,6 +14,7 @@ from sqlalchemy import (
     Numeric,
     String,
     Text,
+    text,
     CheckConstraint
 )
 from sqlalchemy.dialects.postgresql import JSON
@@ -114,6 +115,7 @@ class ReviewSlot(Base):
     feedback_sections = Column(JSON, nullable=True)  # Structured section-based feedback
     annotations = Column(JSON, nullable=True)        # Context-specific annotations (pins, timestamps, etc.)
     draft_sections = Column(JSON, nullable=True)     # Auto-saved section drafts
+    draft_saved_at = Column(DateTime, nullable=True)  # When the stored draft was saved (newer drafts win)
 
     # Acceptance/Rejection metadata (use String for SQLite compatibility)
     acceptance_type = Column(String(20), nullable=True)
@@ -172,6 +174,15 @@ class ReviewSlot(Base):
         Index('idx_slot_status_auto_accept', 'status', 'auto_accept_at'),  # Auto-accept processing
         Index('idx_slot_reviewer_status', 'reviewer_id', 'status'),  # Reviewer dashboard
         Index('idx_slot_request_status', 'review_request_id', 'status'),  # Request detail page
+        # One active (claimed or submitted) slot per reviewer per request
+        Index(
+            'uq_slot_active_claim',
+            'review_request_id',
+            'reviewer_id',
+            unique=True,
+            postgresql_where=text("status IN ('claimed', 'submitted')"),
+            sqlite_where=text("status IN ('claimed', 'submitted')"),
+        ),
     )
 
     # Relationships
@@ -44,6 +44,25 @@ class ReviewerDNA(Base):
     version = Column(Integer, default=1, nullable=False)
     reviews_analyzed = Column(Integer, default=0, nullable=False)
 
+    # Running sufficient statistics (updated incrementally on slot events)
+    # Each metric keeps count, sum and sum of squares so mean/variance can be
+    # derived without rescanning review history.
+    response_time_count = Column(Integer, default=0, nullable=False)
+    response_time_sum = Column(Float, default=0.0, nullable=False)  # Hours, capped at 168 per review
+    response_time_sum_sq = Column(Float, default=0.0, nullable=False)
+    feedback_count = Column(Integer, default=0, nullable=False)  # Reviews with feedback text
+    word_count_sum = Column(Float, default=0.0, nullable=False)
+    word_count_sum_sq = Column(Float, default=0.0, nullable=False)
+    action_items_sum = Column(Float, default=0.0, nullable=False)
+    action_items_sum_sq = Column(Float, default=0.0, nullable=False)
+    specificity_hits_sum = Column(Float, default=0.0, nullable=False)  # Specificity markers in feedback
+    encouragement_hits_sum = Column(Float, default=0.0, nullable=False)  # Encouraging phrases in feedback
+    rating_count = Column(Integer, default=0, nullable=False)
+    rating_sum = Column(Float, default=0.0, nullable=False)
+    rating_sum_sq = Column(Float, default=0.0, nullable=False)
+    accepted_count = Column(Integer, default=0, nullable=False)
+    rejected_count = Column(Integer, default=0, nullable=False)
+
     # Timestamps
     calculated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
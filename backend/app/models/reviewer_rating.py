@@ -75,7 +75,8 @@ class ReviewerStats(Base):
     """
     Aggregated reviewer statistics for quick lookup.
 
-    Updated whenever a new rating is submitted.
+    Each new rating is added to the stored sums and averages in one atomic
+    UPDATE; a weekly recompute from reviewer_ratings corrects any drift.
     This supplements the existing reviewer_dna metrics with requester feedback.
     """
 
@@ -98,6 +99,12 @@ class ReviewerStats(Base):
     avg_helpfulness = Column(Numeric(3, 2), nullable=True)
     avg_overall = Column(Numeric(3, 2), nullable=True)
 
+    # Running sums of each rating dimension (averages are sum / total_ratings)
+    quality_sum = Column(Integer, default=0, nullable=False)
+    professionalism_sum = Column(Integer, default=0, nullable=False)
+    helpfulness_sum = Column(Integer, default=0, nullable=False)
+    overall_sum = Column(Integer, default=0, nullable=False)
+
     # Counts
     total_ratings = Column(Integer, default=0, nullable=False)
     total_reviews_completed = Column(Integer, default=0, nullable=False)
@@ -3,7 +3,7 @@
 import enum
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import Boolean, Column, DateTime, Enum, Integer, Numeric, String, Text
+from sqlalchemy import DDL, Boolean, Column, DateTime, Enum, Index, Integer, Numeric, String, Text, event
 from sqlalchemy.orm import DeclarativeBase, relationship
 
 if TYPE_CHECKING:
@@ -160,6 +160,10 @@ class User(Base):
     challenges_drawn = Column(Integer, default=0, nullable=False, server_default='0')
     challenge_win_streak = Column(Integer, default=0, nullable=False, server_default='0')
     best_challenge_streak = Column(Integer, default=0, nullable=False, server_default='0')
+    # Rollups for the challenge stats endpoints, kept current by challenge events
+    challenge_votes_received = Column(Integer, default=0, nullable=False, server_default='0')  # In completed challenges
+    challenge_votes_cast = Column(Integer, default=0, nullable=False, server_default='0')
+    category_challenges_joined = Column(Integer, default=0, nullable=False, server_default='0')
 
     # Moderation fields
     is_banned = Column(Boolean, default=False, nullable=False, server_default='0')
@@ -191,6 +195,11 @@ class User(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     last_login = Column(DateTime, nullable=True)
 
+    __table_args__ = (
+        # Challenge leaderboard: ORDER BY challenges_won DESC, best_challenge_streak DESC
+        Index("idx_users_challenge_leaderboard", "challenges_won", "best_challenge_streak"),
+    )
+
     # Relationships
     review_requests = relationship("ReviewRequest", back_populates="user", cascade="all, delete-orphan")
     expert_applications = relationship("ExpertApplication", back_populates="user", cascade="all, delete-orphan")
@@ -201,9 +210,36 @@ class User(Base):
     reviewer_dna = relationship("ReviewerDNA", back_populates="user", uselist=False, cascade="all, delete-orphan")
     committee_membership = relationship("CommitteeMember", back_populates="user", uselist=False, cascade="all, delete-orphan")
     slot_applications = relationship("SlotApplication", back_populates="applicant", cascade="all, delete-orphan")
+    specialties = relationship("UserSpecialty", cascade="all, delete-orphan", order_by="UserSpecialty.position")
 
     # Note: earned_badges and leaderboard_entries relationships are defined via backref
     # in badge.py and leaderboard.py respectively to avoid circular import issues
 
     def __repr__(self) -> str:
         return f"<User {self.email}>"
+
+
+# SQLite admin search index: an FTS5 trigram index over email and full_name,
+# kept in sync by triggers (PostgreSQL uses pg_trgm indexes from migrations).
+# Existing databases get it from the admin user search migration.
+USERS_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5("
+    "email, full_name, content='users', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS users_fts_ai AFTER INSERT ON users BEGIN "
+    "INSERT INTO users_fts(rowid, email, full_name) VALUES (new.id, new.email, new.full_name); END",
+    "CREATE TRIGGER IF NOT EXISTS users_fts_ad AFTER DELETE ON users BEGIN "
+    "INSERT INTO users_fts(users_fts, rowid, email, full_name) "
+    "VALUES ('delete', old.id, old.email, old.full_name); END",
+    "CREATE TRIGGER IF NOT EXISTS users_fts_au AFTER UPDATE OF email, full_name ON users BEGIN "
+    "INSERT INTO users_fts(users_fts, rowid, email, full_name) "
+    "VALUES ('delete', old.id, old.email, old.full_name); "
+    "INSERT INTO users_fts(rowid, email, full_name) VALUES (new.id, new.email, new.full_name); END",
+)
+
+for _statement in USERS_FTS_DDL:
+    event.listen(User.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(
+    User.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS users_fts").execute_if(dialect="sqlite"),
+)
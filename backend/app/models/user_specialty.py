@@ -0,0 +1,34 @@
+"""User Specialty model (normalized reviewer specialty tags)"""
+
+from sqlalchemy import Column, ForeignKey, Index, Integer, String
+
+from app.models.user import Base
+
+
+class UserSpecialty(Base):
+    """
+    One specialty tag of a user.
+
+    Mirrors the JSON list in User.specialty_tags (which stays the source
+    for profile pages) so the reviewer directory can filter and count
+    tags with index lookups. Kept in sync by
+    crud.profile.sync_user_specialties.
+    """
+
+    __tablename__ = "user_specialties"
+
+    user_id = Column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    tag = Column(String(50), primary_key=True)  # Lowercased, used for filtering
+    label = Column(String(50), nullable=False)  # As entered by the user, for display
+    position = Column(Integer, nullable=False, default=0)  # Order in the user's list
+
+    __table_args__ = (
+        Index("idx_user_specialties_tag_user", "tag", "user_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<UserSpecialty user={self.user_id} tag={self.tag}>"
@@ -0,0 +1,63 @@
+"""Webhook Event database model (inbox for incoming provider webhooks)"""
+
+import enum
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, UniqueConstraint
+
+from app.models.user import Base
+
+
+class WebhookEventStatus(str, enum.Enum):
+    """Processing status of an inbox event"""
+    PENDING = "pending"        # Received, waiting for a worker (or a retry)
+    PROCESSING = "processing"  # Claimed by a worker
+    PROCESSED = "processed"    # Handler finished successfully
+    FAILED = "failed"          # Gave up after the maximum number of attempts
+
+
+class WebhookEvent(Base):
+    """
+    Webhook inbox entry.
+
+    Webhooks are stored here and acknowledged immediately; a worker pool
+    processes them afterwards. The unique (provider, event_id) constraint
+    drops duplicate deliveries, and object_id keeps events about the same
+    object (e.g. one Payment Intent) processed in order.
+    """
+
+    __tablename__ = "webhook_events"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Event identification
+    provider = Column(String(20), nullable=False, default="stripe")
+    event_id = Column(String(255), nullable=False)
+    event_type = Column(String(100), nullable=False, index=True)
+    object_id = Column(String(255), nullable=True)  # Ordering key (id of the event's data object)
+    account_id = Column(String(255), nullable=True)  # Connect account the event belongs to
+    payload = Column(Text, nullable=False)  # Raw verified event JSON
+
+    # Processing state (use String for SQLite compatibility)
+    status = Column(
+        String(20),
+        nullable=False,
+        default=WebhookEventStatus.PENDING.value,
+    )
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+
+    # Timestamps
+    event_created_at = Column(DateTime, nullable=True)  # Provider's event timestamp
+    received_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    locked_at = Column(DateTime, nullable=True)  # When a worker claimed it
+    processed_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("provider", "event_id", name="uq_webhook_events_provider_event_id"),
+        Index("idx_webhook_events_status_next_attempt", "status", "next_attempt_at"),
+        Index("idx_webhook_events_object", "object_id", "status"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<WebhookEvent {self.event_id} type={self.event_type} status={self.status}>"
@@ -3,7 +3,8 @@
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Optional, List, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+from sqlalchemy import inspect
 
 from app.constants.time import SECONDS_PER_DAY, SECONDS_PER_HOUR, SECONDS_PER_MINUTE
 from app.models.review_slot import (
@@ -17,6 +18,15 @@ from app.models.review_slot import (
 from .submission import FeedbackSection, Annotation
 
 
+# Slot content fields the review loading profiles may defer
+_CONTENT_FIELDS = frozenset({
+    "review_text",
+    "review_attachments",
+    "feedback_sections",
+    "annotations",
+})
+
+
 class ReviewerInfo(BaseModel):
     """Minimal reviewer information for public display"""
     id: int
@@ -79,6 +89,22 @@ class ReviewSlotResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    @model_validator(mode="before")
+    @classmethod
+    def skip_deferred_content(cls, data: Any) -> Any:
+        """Leave review content unset when the loading profile deferred it"""
+        state = inspect(data, raiseerr=False)
+        if state is None:
+            return data
+        deferred = state.unloaded & _CONTENT_FIELDS
+        if not deferred:
+            return data
+        return {
+            name: getattr(data, name)
+            for name in cls.model_fields
+            if name not in deferred
+        }
+
     # Computed fields
     @property
     def review_preview(self) -> Optional[str]:
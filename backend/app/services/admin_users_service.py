@@ -3,9 +3,11 @@
 import logging
 from datetime import datetime, timedelta
 from typing import Optional, Tuple, List
-from sqlalchemy import select, func, or_, and_, desc, asc
+from sqlalchemy import select, func, or_, and_, desc, asc, literal_column, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+
 from app.models.user import User, UserRole, UserTier
 from app.models.admin_audit_log import AdminAuditLog, AdminAction
 from app.models.expert_application import ExpertApplication, ApplicationStatus
@@ -16,9 +18,18 @@ from app.core.exceptions import (
     ForbiddenError,
     InvalidStateError,
 )
+from app.services.infrastructure.ttl_cache import TTLCache
+from app.utils.query_helpers import count_where
 
 logger = logging.getLogger(__name__)
 
+# Dashboard stats snapshot, shared by all admins; moderation actions clear it
+admin_stats_cache = TTLCache(
+    "admin_stats",
+    ttl_seconds=settings.ADMIN_STATS_CACHE_TTL_SECONDS,
+    max_entries=1,
+)
+
 
 class AdminUsersService:
     """Service for admin user management operations"""
@@ -47,13 +58,7 @@ class AdminUsersService:
         conditions = []
 
         if query:
-            search = f"%{query}%"
-            conditions.append(
-                or_(
-                    User.email.ilike(search),
-                    User.full_name.ilike(search),
-                )
-            )
+            conditions.append(self._search_condition(query))
 
         if role:
             conditions.append(User.role == role)
@@ -144,6 +149,7 @@ class AdminUsersService:
         )
 
         await self.db.commit()
+        admin_stats_cache.clear()
         await self.db.refresh(user)
 
         logger.info(f"User {user_id} role changed from {old_role} to {new_role} by admin {admin.id}")
@@ -193,6 +199,7 @@ class AdminUsersService:
         )
 
         await self.db.commit()
+        admin_stats_cache.clear()
         await self.db.refresh(user)
 
         logger.info(f"User {user_id} banned by admin {admin.id}: {reason}")
@@ -229,6 +236,7 @@ class AdminUsersService:
         )
 
         await self.db.commit()
+        admin_stats_cache.clear()
         await self.db.refresh(user)
 
         logger.info(f"User {user_id} unbanned by admin {admin.id}")
@@ -282,6 +290,7 @@ class AdminUsersService:
         )
 
         await self.db.commit()
+        admin_stats_cache.clear()
         await self.db.refresh(user)
 
         logger.info(f"User {user_id} suspended for {duration_hours}h by admin {admin.id}: {reason}")
@@ -324,6 +333,7 @@ class AdminUsersService:
         )
 
         await self.db.commit()
+        admin_stats_cache.clear()
         await self.db.refresh(user)
 
         logger.info(f"User {user_id} unsuspended by admin {admin.id}")
@@ -510,115 +520,77 @@ class AdminUsersService:
         return log_entries, total
 
     async def get_admin_stats(self) -> dict:
-        """Get admin dashboard statistics"""
+        """Get admin dashboard statistics (a snapshot shared for ADMIN_STATS_CACHE_TTL_SECONDS)"""
+        return await admin_stats_cache.get_or_load("stats", self._compute_admin_stats)
+
+    async def _compute_admin_stats(self) -> dict:
+        """Compute every dashboard count in one round trip (one pass over users)"""
         now = datetime.utcnow()
         week_ago = now - timedelta(days=7)
-        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-
-        # Total users
-        total_users_result = await self.db.execute(select(func.count(User.id)))
-        total_users = total_users_result.scalar() or 0
-
-        # New users this week
-        new_users_result = await self.db.execute(
-            select(func.count(User.id)).where(User.created_at >= week_ago)
-        )
-        new_users_this_week = new_users_result.scalar() or 0
-
-        # Active users today
         today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        active_today_result = await self.db.execute(
-            select(func.count(User.id)).where(User.last_login >= today_start)
-        )
-        active_users_today = active_today_result.scalar() or 0
-
-        # Reviewers count
-        reviewers_result = await self.db.execute(
-            select(func.count(User.id)).where(User.role == UserRole.REVIEWER)
-        )
-        total_reviewers = reviewers_result.scalar() or 0
-
-        # Admins count
-        admins_result = await self.db.execute(
-            select(func.count(User.id)).where(User.role == UserRole.ADMIN)
-        )
-        total_admins = admins_result.scalar() or 0
-
-        # Banned users
-        banned_result = await self.db.execute(
-            select(func.count(User.id)).where(User.is_banned == True)
-        )
-        banned_users = banned_result.scalar() or 0
-
-        # Suspended users
-        suspended_result = await self.db.execute(
-            select(func.count(User.id)).where(User.is_suspended == True)
-        )
-        suspended_users = suspended_result.scalar() or 0
+        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
-        # Pending applications (submitted or under review)
-        pending_result = await self.db.execute(
-            select(func.count(ExpertApplication.id)).where(
+        def count_applications(*conditions):
+            return select(func.count(ExpertApplication.id)).where(*conditions).scalar_subquery()
+
+        stmt = select(
+            func.count().label("total_users"),
+            count_where(User.created_at >= week_ago).label("new_users_this_week"),
+            count_where(User.last_login >= today_start).label("active_users_today"),
+            count_where(User.role == UserRole.REVIEWER).label("total_reviewers"),
+            count_where(User.role == UserRole.ADMIN).label("total_admins"),
+            count_where(User.is_banned == True).label("banned_users"),
+            count_where(User.is_suspended == True).label("suspended_users"),
+            count_applications(
                 ExpertApplication.status.in_([
-                    ApplicationStatus.SUBMITTED,
-                    ApplicationStatus.UNDER_REVIEW,
-                    ApplicationStatus.RESUBMITTED
+                    ApplicationStatus.SUBMITTED.value,
+                    ApplicationStatus.UNDER_REVIEW.value,
+                    ApplicationStatus.RESUBMITTED.value
                 ])
-            )
-        )
-        pending_applications = pending_result.scalar() or 0
-
-        # Approved this month
-        approved_result = await self.db.execute(
-            select(func.count(ExpertApplication.id)).where(
-                and_(
-                    ExpertApplication.status == ApplicationStatus.APPROVED,
-                    ExpertApplication.updated_at >= month_start
-                )
-            )
-        )
-        approved_this_month = approved_result.scalar() or 0
-
-        # Rejected this month
-        rejected_result = await self.db.execute(
-            select(func.count(ExpertApplication.id)).where(
-                and_(
-                    ExpertApplication.status == ApplicationStatus.REJECTED,
-                    ExpertApplication.updated_at >= month_start
-                )
-            )
-        )
-        rejected_this_month = rejected_result.scalar() or 0
-
-        # Active challenges
-        active_challenges_result = await self.db.execute(
+            ).label("pending_applications"),
+            count_applications(
+                ExpertApplication.status == ApplicationStatus.APPROVED.value,
+                ExpertApplication.updated_at >= month_start
+            ).label("approved_this_month"),
+            count_applications(
+                ExpertApplication.status == ApplicationStatus.REJECTED.value,
+                ExpertApplication.updated_at >= month_start
+            ).label("rejected_this_month"),
             select(func.count(Challenge.id)).where(
                 Challenge.status.in_([ChallengeStatus.ACTIVE, ChallengeStatus.OPEN, ChallengeStatus.VOTING])
+            ).scalar_subquery().label("active_challenges"),
+            select(func.count(ReviewSlot.id)).where(
+                ReviewSlot.status == 'completed'
+            ).scalar_subquery().label("total_reviews"),
+        ).select_from(User)
+
+        result = await self.db.execute(stmt)
+        stats = dict(result.one()._mapping)
+        stats["avg_review_time_days"] = 2.5  # TODO: Calculate actual average
+        return stats
+
+    def _search_condition(self, query: str):
+        """
+        Substring match on email or full name.
+
+        PostgreSQL serves lower(...) LIKE from the pg_trgm indexes on users.
+        SQLite matches through the users_fts trigram index, which needs at
+        least three characters; shorter queries fall back to LIKE.
+        """
+        term = query.strip().lower()
+        if self.db.bind.dialect.name == "sqlite" and len(term) >= 3:
+            phrase = '"' + term.replace('"', '""') + '"'
+            return User.id.in_(
+                select(literal_column("rowid"))
+                .select_from(text("users_fts"))
+                .where(text("users_fts MATCH :users_fts_query").bindparams(users_fts_query=phrase))
             )
-        )
-        active_challenges = active_challenges_result.scalar() or 0
 
-        # Total completed reviews
-        total_reviews_result = await self.db.execute(
-            select(func.count(ReviewSlot.id)).where(ReviewSlot.status == 'completed')
+        search = f"%{term}%"
+        return or_(
+            func.lower(User.email).like(search),
+            func.lower(User.full_name).like(search),
         )
-        total_reviews = total_reviews_result.scalar() or 0
-
-        return {
-            "total_users": total_users,
-            "new_users_this_week": new_users_this_week,
-            "active_users_today": active_users_today,
-            "total_reviewers": total_reviewers,
-            "total_admins": total_admins,
-            "banned_users": banned_users,
-            "suspended_users": suspended_users,
-            "pending_applications": pending_applications,
-            "approved_this_month": approved_this_month,
-            "rejected_this_month": rejected_this_month,
-            "active_challenges": active_challenges,
-            "total_reviews": total_reviews,
-            "avg_review_time_days": 2.5,  # TODO: Calculate actual average
-        }
 
     async def _log_action(
         self,
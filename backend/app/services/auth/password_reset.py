@@ -11,7 +11,7 @@ from sqlalchemy import select, and_, delete
 from app.models.user import User
 from app.core.exceptions import InvalidInputError
 from app.models.password_reset import PasswordResetToken
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash_async
 
 
 # Configuration constants
@@ -209,7 +209,7 @@ async def reset_password(
         )
 
     # Update user's password
-    user.hashed_password = get_password_hash(new_password)
+    user.hashed_password = await get_password_hash_async(new_password)
 
     # Mark token as used
     reset_token.mark_as_used()
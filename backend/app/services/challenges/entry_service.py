@@ -2,12 +2,15 @@
 Challenge Entry Service - Manages entry submission and voting.
 """
 
+import logging
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.user import User
 from app.models.challenge import Challenge, ChallengeStatus, ChallengeType
 from app.models.challenge_entry import ChallengeEntry
 from app.models.challenge_vote import ChallengeVote
@@ -16,6 +19,7 @@ from app.models.sparks_transaction import SparksAction as KarmaAction
 from app.services.gamification.sparks_service import SparksService as KarmaService
 from app.services.challenges.base import BaseChallengeService
 from app.constants.challenges import KARMA_VALUES
+from app.db.session import async_session_maker
 from app.core.exceptions import (
     NotFoundError,
     InvalidInputError,
@@ -24,6 +28,27 @@ from app.core.exceptions import (
     ForbiddenError,
 )
 
+logger = logging.getLogger(__name__)
+
+
+async def award_vote_karma(voter_id: int) -> None:
+    """
+    Award the voting karma in its own session.
+
+    Runs after the vote response is sent (see the vote endpoint), so the
+    voter's user row is never locked on the vote path.
+    """
+    try:
+        async with async_session_maker() as db:
+            await KarmaService(db).award_sparks(
+                user_id=voter_id,
+                action=KarmaAction.CHALLENGE_VOTE_CAST,
+                reason="Voted in a challenge",
+                custom_points=KARMA_VALUES["vote_cast"]
+            )
+    except Exception as e:
+        logger.error(f"Failed to award vote karma to user {voter_id}: {e}", exc_info=True)
+
 
 class ChallengeEntryService(BaseChallengeService):
     """Service for managing challenge entries and voting."""
@@ -185,8 +210,23 @@ class ChallengeEntryService(BaseChallengeService):
         - One vote per user per challenge
         - Cannot vote on challenge you're participating in
         - Votes are final
+
+        The vote is an INSERT ... ON CONFLICT DO NOTHING against the
+        (challenge_id, voter_id) unique constraint and the counters are
+        incremented in the database, so concurrent votes are never lost
+        or double counted. Voting karma is not awarded here; callers
+        schedule award_vote_karma after responding.
         """
-        challenge = await self.get_challenge_with_relations(challenge_id)
+        result = await self.db.execute(
+            select(
+                Challenge.status,
+                Challenge.challenge_type,
+                Challenge.voting_deadline,
+                Challenge.participant1_id,
+                Challenge.participant2_id,
+            ).where(Challenge.id == challenge_id)
+        )
+        challenge = result.first()
         if not challenge:
             raise NotFoundError(resource="Challenge", resource_id=challenge_id)
 
@@ -209,49 +249,73 @@ class ChallengeEntryService(BaseChallengeService):
             if participant:
                 raise ForbiddenError(message="Cannot vote on a challenge you're participating in")
 
-        # Check if already voted
-        existing_vote = await self.get_user_vote(challenge_id, voter_id)
-        if existing_vote:
-            raise AlreadyExistsError(resource="Vote", message="Already voted in this challenge")
-
         # Validate entry belongs to this challenge
-        entry = await self.db.get(ChallengeEntry, entry_id)
-        if not entry or entry.challenge_id != challenge_id:
+        result = await self.db.execute(
+            select(ChallengeEntry.user_id).where(
+                ChallengeEntry.id == entry_id,
+                ChallengeEntry.challenge_id == challenge_id
+            )
+        )
+        entry_user_id = result.scalar_one_or_none()
+        if entry_user_id is None:
             raise NotFoundError(resource="Entry", resource_id=entry_id)
 
-        # Create vote
-        vote = ChallengeVote(
-            challenge_id=challenge_id,
-            voter_id=voter_id,
-            entry_id=entry_id,
-            voted_at=datetime.utcnow()
+        # Record the vote; a second vote by the same user inserts nothing
+        voted_at = datetime.utcnow()
+        dialect = postgresql if self.db.bind.dialect.name == "postgresql" else sqlite
+        result = await self.db.execute(
+            dialect.insert(ChallengeVote)
+            .values(
+                challenge_id=challenge_id,
+                voter_id=voter_id,
+                entry_id=entry_id,
+                voted_at=voted_at
+            )
+            .on_conflict_do_nothing(index_elements=["challenge_id", "voter_id"])
+            .returning(ChallengeVote.id)
         )
-
-        self.db.add(vote)
+        vote_id = result.scalar_one_or_none()
+        if vote_id is None:
+            await self.db.rollback()
+            raise AlreadyExistsError(resource="Vote", message="Already voted in this challenge")
 
         # Update vote counts
-        entry.vote_count += 1
-        challenge.total_votes += 1
+        await self.db.execute(
+            update(ChallengeEntry)
+            .where(ChallengeEntry.id == entry_id)
+            .values(vote_count=ChallengeEntry.vote_count + 1)
+            .execution_options(synchronize_session=False)
+        )
 
+        counts = {"total_votes": Challenge.total_votes + 1}
         # For 1v1, track participant votes
         if challenge.challenge_type == ChallengeType.ONE_ON_ONE:
-            if entry.user_id == challenge.participant1_id:
-                challenge.participant1_votes += 1
+            if entry_user_id == challenge.participant1_id:
+                counts["participant1_votes"] = Challenge.participant1_votes + 1
             else:
-                challenge.participant2_votes += 1
+                counts["participant2_votes"] = Challenge.participant2_votes + 1
+        await self.db.execute(
+            update(Challenge)
+            .where(Challenge.id == challenge_id)
+            .values(**counts)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.execute(
+            update(User)
+            .where(User.id == voter_id)
+            .values(challenge_votes_cast=User.challenge_votes_cast + 1)
+            .execution_options(synchronize_session=False)
+        )
 
         await self.db.commit()
-        await self.db.refresh(vote)
-
-        # Award karma for voting
-        await self.karma_service.award_karma(
-            user_id=voter_id,
-            action=KarmaAction.CHALLENGE_VOTE_CAST,
-            reason="Voted in a challenge",
-            custom_points=KARMA_VALUES["vote_cast"]
-        )
 
-        return vote
+        return ChallengeVote(
+            id=vote_id,
+            challenge_id=challenge_id,
+            voter_id=voter_id,
+            entry_id=entry_id,
+            voted_at=voted_at
+        )
 
     async def get_vote_stats(self, challenge_id: int) -> Dict[str, Any]:
         """Get vote statistics for a challenge (only after voting ends)."""
@@ -324,6 +388,12 @@ class ChallengeEntryService(BaseChallengeService):
 
         self.db.add(participant)
         challenge.total_entries += 1
+        await self.db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(category_challenges_joined=User.category_challenges_joined + 1)
+            .execution_options(synchronize_session=False)
+        )
 
         await self.db.commit()
         await self.db.refresh(participant)
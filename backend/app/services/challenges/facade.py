@@ -8,6 +8,7 @@ when you need access to multiple challenge operations.
 For new code, prefer importing the specific services directly.
 """
 
+import functools
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Tuple
 
@@ -26,6 +27,7 @@ from app.services.challenges.invitation_service import ChallengeInvitationServic
 from app.services.challenges.entry_service import ChallengeEntryService
 from app.services.challenges.lifecycle_service import ChallengeLifecycleService
 from app.services.challenges.query_service import ChallengeQueryService
+from app.services.infrastructure.response_cache import response_cache
 from app.constants.challenges import (
     KARMA_VALUES,
     DEFAULT_SUBMISSION_HOURS,
@@ -35,6 +37,16 @@ from app.constants.challenges import (
 )
 
 
+def _invalidates_challenge_pages(method):
+    """Drop cached public challenge responses after a successful write"""
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        result = await method(self, *args, **kwargs)
+        await response_cache.invalidate("challenges")
+        return result
+    return wrapper
+
+
 class ChallengeFacade:
     """
     Facade providing unified access to all challenge operations.
@@ -52,6 +64,9 @@ class ChallengeFacade:
 
         # Or access sub-services directly
         prompts = await service.prompts.get_prompts()
+
+    Write methods invalidate the cached public challenge responses
+    ("challenges" response cache namespace).
     """
 
     # Re-export constants for backward compatibility
@@ -84,6 +99,7 @@ class ChallengeFacade:
     async def get_prompt(self, prompt_id: int) -> Optional[ChallengePrompt]:
         return await self.prompts.get_prompt(prompt_id)
 
+    @_invalidates_challenge_pages
     async def create_prompt(
         self,
         title: str,
@@ -94,14 +110,17 @@ class ChallengeFacade:
     ) -> ChallengePrompt:
         return await self.prompts.create_prompt(title, description, content_type, difficulty, is_active)
 
+    @_invalidates_challenge_pages
     async def update_prompt(self, prompt_id: int, **kwargs) -> Optional[ChallengePrompt]:
         return await self.prompts.update_prompt(prompt_id, **kwargs)
 
+    @_invalidates_challenge_pages
     async def delete_prompt(self, prompt_id: int) -> bool:
         return await self.prompts.delete_prompt(prompt_id)
 
     # ==================== CHALLENGE CREATION ====================
 
+    @_invalidates_challenge_pages
     async def create_challenge(
         self,
         admin_id: int,
@@ -124,11 +143,13 @@ class ChallengeFacade:
             is_featured, banner_image_url, prize_description, invitation_mode
         )
 
+    @_invalidates_challenge_pages
     async def update_challenge(self, challenge_id: int, **kwargs) -> Optional[Challenge]:
         return await self.lifecycle.update_challenge(challenge_id, **kwargs)
 
     # ==================== INVITATIONS ====================
 
+    @_invalidates_challenge_pages
     async def invite_creator(
         self,
         challenge_id: int,
@@ -138,6 +159,7 @@ class ChallengeFacade:
     ) -> ChallengeInvitation:
         return await self.invitations.invite_creator(challenge_id, user_id, slot, message)
 
+    @_invalidates_challenge_pages
     async def replace_invitation(
         self,
         challenge_id: int,
@@ -147,6 +169,7 @@ class ChallengeFacade:
     ) -> ChallengeInvitation:
         return await self.invitations.replace_invitation(challenge_id, slot, new_user_id, message)
 
+    @_invalidates_challenge_pages
     async def respond_to_invitation(
         self,
         invitation_id: int,
@@ -160,12 +183,15 @@ class ChallengeFacade:
 
     # ==================== LIFECYCLE ====================
 
+    @_invalidates_challenge_pages
     async def open_challenge(self, challenge_id: int) -> Challenge:
         return await self.lifecycle.open_challenge(challenge_id)
 
+    @_invalidates_challenge_pages
     async def activate_challenge(self, challenge_id: int) -> Challenge:
         return await self.lifecycle.activate_challenge(challenge_id)
 
+    @_invalidates_challenge_pages
     async def open_challenge_slots(
         self,
         challenge_id: int,
@@ -173,6 +199,7 @@ class ChallengeFacade:
     ) -> Challenge:
         return await self.lifecycle.open_challenge_slots(challenge_id, duration_hours)
 
+    @_invalidates_challenge_pages
     async def claim_challenge_slot(
         self,
         challenge_id: int,
@@ -180,14 +207,20 @@ class ChallengeFacade:
     ) -> Dict[str, Any]:
         return await self.lifecycle.claim_challenge_slot(challenge_id, user_id)
 
+    @_invalidates_challenge_pages
     async def close_submissions(self, challenge_id: int) -> Challenge:
         return await self.lifecycle.close_submissions(challenge_id)
 
+    @_invalidates_challenge_pages
     async def complete_challenge(self, challenge_id: int) -> Challenge:
-        return await self.lifecycle.complete_challenge(challenge_id)
+        challenge = await self.lifecycle.complete_challenge(challenge_id)
+        # Prize sparks are awarded in bulk, bypassing SparksService.award_sparks
+        await response_cache.invalidate("leaderboards")
+        return challenge
 
     # ==================== ENTRIES ====================
 
+    @_invalidates_challenge_pages
     async def create_entry(
         self,
         challenge_id: int,
@@ -203,6 +236,7 @@ class ChallengeFacade:
             file_urls, external_links, thumbnail_url
         )
 
+    @_invalidates_challenge_pages
     async def submit_entry(self, challenge_id: int, user_id: int) -> ChallengeEntry:
         entry = await self.entries.submit_entry(challenge_id, user_id)
 
@@ -221,6 +255,7 @@ class ChallengeFacade:
     ) -> List[ChallengeEntry]:
         return await self.entries.get_entries(challenge_id, current_user_id)
 
+    @_invalidates_challenge_pages
     async def join_category_challenge(
         self,
         challenge_id: int,
@@ -230,6 +265,8 @@ class ChallengeFacade:
 
     # ==================== VOTING ====================
 
+    # Not invalidating: running vote totals may lag by the cache TTL, and
+    # a busy vote would otherwise empty the challenge cache on every vote
     async def cast_vote(
         self,
         challenge_id: int,
@@ -3,9 +3,9 @@ Challenge Lifecycle Service - Handles challenge state transitions and completion
 """
 
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
-from sqlalchemy import select, or_
+from sqlalchemy import case, func, select, or_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -14,6 +14,7 @@ from app.models.review_request import ContentType
 from app.models.challenge import Challenge, ChallengeStatus, ChallengeType, InvitationMode
 from app.models.challenge_entry import ChallengeEntry
 from app.models.challenge_invitation import ChallengeInvitation, InvitationStatus
+from app.models.challenge_participant import ChallengeParticipant
 from app.models.sparks_transaction import SparksAction as KarmaAction
 from app.models.notification import NotificationType, NotificationPriority, EntityType
 from app.services.gamification.sparks_service import SparksService as KarmaService
@@ -329,8 +330,16 @@ class ChallengeLifecycleService(BaseChallengeService):
     # ==================== CHALLENGE COMPLETION ====================
 
     async def complete_challenge(self, challenge_id: int) -> Challenge:
-        """Complete a challenge and determine winner(s)."""
-        challenge = await self.get_challenge_with_relations(challenge_id)
+        """
+        Complete a challenge and determine winner(s).
+
+        The status change, placements, user stats and sparks are written in
+        one transaction, starting with a conditional UPDATE that moves the
+        challenge out of VOTING. A run that fails rolls back entirely and
+        can be retried; a repeated or concurrent run finds the challenge no
+        longer in voting and changes nothing.
+        """
+        challenge = await self.db.get(Challenge, challenge_id)
         if not challenge:
             raise NotFoundError(resource="Challenge", resource_id=challenge_id)
 
@@ -341,59 +350,115 @@ class ChallengeLifecycleService(BaseChallengeService):
                 allowed_states=["voting"]
             )
 
-        if challenge.challenge_type == ChallengeType.ONE_ON_ONE:
-            await self._complete_1v1_challenge(challenge)
-        else:
-            await self._complete_category_challenge(challenge)
-
-        challenge.completed_at = datetime.utcnow()
-        await self.db.commit()
-        await self.db.refresh(challenge)
+        try:
+            if challenge.challenge_type == ChallengeType.ONE_ON_ONE:
+                await self._complete_1v1_challenge(challenge)
+            else:
+                await self._complete_category_challenge(challenge)
+            await self._add_votes_received(challenge)
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+
+        # Bulk updates bypass the session, so reload before responding
+        self.db.expire_all()
+        challenge = await self.get_challenge_with_relations(challenge_id)
 
         # Notify participants
         await self._notify_challenge_completed(challenge)
 
         return challenge
 
+    async def _claim_completion(self, challenge: Challenge, status: ChallengeStatus, **values) -> None:
+        """Move the challenge from VOTING to its final status, or fail if another run did."""
+        result = await self.db.execute(
+            update(Challenge)
+            .where(
+                Challenge.id == challenge.id,
+                Challenge.status == ChallengeStatus.VOTING
+            )
+            .values(status=status, completed_at=datetime.utcnow(), **values)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            raise InvalidStateError(message="Challenge has already been completed")
+
+    async def _add_votes_received(self, challenge: Challenge) -> None:
+        """Add each entrant's final vote count to their challenge_votes_received rollup."""
+        entry_votes = (
+            select(func.coalesce(func.sum(ChallengeEntry.vote_count), 0))
+            .where(
+                ChallengeEntry.challenge_id == challenge.id,
+                ChallengeEntry.user_id == User.id
+            )
+            .scalar_subquery()
+        )
+        await self.db.execute(
+            update(User)
+            .where(User.id.in_(
+                select(ChallengeEntry.user_id).where(ChallengeEntry.challenge_id == challenge.id)
+            ))
+            .values(challenge_votes_received=User.challenge_votes_received + entry_votes)
+            .execution_options(synchronize_session=False)
+        )
+
     async def _complete_1v1_challenge(self, challenge: Challenge) -> None:
         """Complete a 1v1 challenge."""
         total = challenge.total_votes
 
         if total == 0:
-            challenge.status = ChallengeStatus.CANCELLED
+            await self._claim_completion(challenge, ChallengeStatus.CANCELLED)
             return
 
         vote_margin = abs(challenge.participant1_votes - challenge.participant2_votes)
         margin_percentage = (vote_margin / total) * 100
 
         if margin_percentage <= DRAW_THRESHOLD_PERCENT:
-            challenge.status = ChallengeStatus.DRAW
+            await self._claim_completion(challenge, ChallengeStatus.DRAW)
             await self._award_1v1_draw(challenge)
+            return
+
+        if challenge.participant1_votes > challenge.participant2_votes:
+            winner_id, loser_id = challenge.participant1_id, challenge.participant2_id
         else:
-            challenge.status = ChallengeStatus.COMPLETED
-            if challenge.participant1_votes > challenge.participant2_votes:
-                challenge.winner_id = challenge.participant1_id
-                await self._award_1v1_winner(
-                    challenge,
-                    challenge.participant1_id,
-                    challenge.participant2_id,
-                    margin_percentage
-                )
-            else:
-                challenge.winner_id = challenge.participant2_id
-                await self._award_1v1_winner(
-                    challenge,
-                    challenge.participant2_id,
-                    challenge.participant1_id,
-                    margin_percentage
-                )
+            winner_id, loser_id = challenge.participant2_id, challenge.participant1_id
 
-    async def _complete_category_challenge(self, challenge: Challenge) -> None:
-        """Complete a category challenge with multiple winners."""
-        challenge.status = ChallengeStatus.COMPLETED
+        margin_bonus = int((margin_percentage / 100) * KARMA_VALUES["win_margin_bonus_max"])
+        winner_karma = KARMA_VALUES["win_base"] + margin_bonus
 
-        # Sort entries by votes
-        entries_sorted = sorted(challenge.entries, key=lambda e: e.vote_count, reverse=True)
+        await self._claim_completion(
+            challenge,
+            ChallengeStatus.COMPLETED,
+            winner_id=winner_id,
+            winner_karma_reward=winner_karma
+        )
+        await self._award_1v1_winner(challenge, winner_id, loser_id, winner_karma)
+
+    async def _complete_category_challenge(self, challenge: Challenge) -> None:
+        """
+        Complete a category challenge with multiple winners.
+
+        Placements come from one ranked query (most votes first, earliest
+        entry on ties); every other entrant gets participation karma in a
+        single bulk award.
+        """
+        ranked = (
+            select(
+                ChallengeEntry.user_id,
+                func.row_number().over(
+                    order_by=(ChallengeEntry.vote_count.desc(), ChallengeEntry.id)
+                ).label("placement")
+            )
+            .where(ChallengeEntry.challenge_id == challenge.id)
+            .subquery()
+        )
+        result = await self.db.execute(
+            select(ranked.c.user_id, ranked.c.placement)
+            .where(ranked.c.placement <= challenge.max_winners)
+            .order_by(ranked.c.placement)
+        )
+        winners = result.all()
 
         # Award placements
         karma_rewards = [
@@ -401,121 +466,145 @@ class ChallengeLifecycleService(BaseChallengeService):
             KARMA_VALUES["category_2nd"],
             KARMA_VALUES["category_3rd"],
         ]
+        rewards = {
+            user_id: (
+                karma_rewards[placement - 1]
+                if placement <= len(karma_rewards)
+                else KARMA_VALUES["category_participation"]
+            )
+            for user_id, placement in winners
+        }
+
+        # Set winner_id to first place
+        first_place = winners[0].user_id if winners else None
+        await self._claim_completion(
+            challenge,
+            ChallengeStatus.COMPLETED,
+            winner_id=first_place,
+            winner_karma_reward=rewards.get(first_place)
+        )
 
-        for i, entry in enumerate(entries_sorted[:challenge.max_winners]):
-            participant = await self.get_participant(challenge.id, entry.user_id)
-            if participant:
-                placement = i + 1
-                karma = karma_rewards[i] if i < len(karma_rewards) else KARMA_VALUES["category_participation"]
-                participant.placement = placement
-                participant.karma_earned = karma
-
-                # Set winner_id to first place
-                if i == 0:
-                    challenge.winner_id = entry.user_id
-                    challenge.winner_karma_reward = karma
-
-                await self.karma_service.award_karma(
-                    user_id=entry.user_id,
-                    action=KarmaAction.CHALLENGE_WIN,
-                    reason=f"Placed #{placement} in challenge: {challenge.title}",
-                    custom_points=karma
+        if winners:
+            placements = {user_id: placement for user_id, placement in winners}
+            await self.db.execute(
+                update(ChallengeParticipant)
+                .where(
+                    ChallengeParticipant.challenge_id == challenge.id,
+                    ChallengeParticipant.user_id.in_(placements)
+                )
+                .values(
+                    placement=case(placements, value=ChallengeParticipant.user_id),
+                    karma_earned=case(rewards, value=ChallengeParticipant.user_id)
                 )
+                .execution_options(synchronize_session=False)
+            )
+
+        for user_id, placement in winners:
+            await self.karma_service.award_sparks_bulk(
+                [user_id],
+                action=KarmaAction.CHALLENGE_WIN,
+                reason=f"Placed #{placement} in challenge: {challenge.title}",
+                points=rewards[user_id]
+            )
 
-                # Update user stats for 1st place
-                if placement == 1:
-                    await self._update_user_challenge_stats(entry.user_id, "win")
+        # Update user stats for 1st place
+        if first_place is not None:
+            await self._update_user_challenge_stats([first_place], "win")
 
         # Award participation karma to non-winners
-        winners = {e.user_id for e in entries_sorted[:challenge.max_winners]}
-        for entry in entries_sorted[challenge.max_winners:]:
-            if entry.user_id not in winners:
-                await self.karma_service.award_karma(
-                    user_id=entry.user_id,
-                    action=KarmaAction.CHALLENGE_LOSS,
-                    reason=f"Participated in challenge: {challenge.title}",
-                    custom_points=KARMA_VALUES["category_participation"]
-                )
+        await self.karma_service.award_sparks_bulk(
+            select(ChallengeEntry.user_id).where(
+                ChallengeEntry.challenge_id == challenge.id,
+                ChallengeEntry.user_id.not_in(list(rewards))
+            ),
+            action=KarmaAction.CHALLENGE_LOSS,
+            reason=f"Participated in challenge: {challenge.title}",
+            points=KARMA_VALUES["category_participation"]
+        )
 
     async def _award_1v1_winner(
         self,
         challenge: Challenge,
         winner_id: int,
         loser_id: int,
-        margin_percentage: float
+        winner_karma: int
     ) -> None:
         """Award karma to 1v1 winner and loser."""
-        margin_bonus = int((margin_percentage / 100) * KARMA_VALUES["win_margin_bonus_max"])
-        winner_karma = KARMA_VALUES["win_base"] + margin_bonus
-        challenge.winner_karma_reward = winner_karma
-
-        await self.karma_service.award_karma(
-            user_id=winner_id,
+        await self.karma_service.award_sparks_bulk(
+            [winner_id],
             action=KarmaAction.CHALLENGE_WIN,
             reason=f"Won challenge: {challenge.title}",
-            custom_points=winner_karma
+            points=winner_karma
         )
 
-        await self.karma_service.award_karma(
-            user_id=loser_id,
+        await self.karma_service.award_sparks_bulk(
+            [loser_id],
             action=KarmaAction.CHALLENGE_LOSS,
             reason=f"Participated in challenge: {challenge.title}",
-            custom_points=KARMA_VALUES["loss_participation"]
+            points=KARMA_VALUES["loss_participation"]
         )
 
-        await self._update_user_challenge_stats(winner_id, "win")
-        await self._update_user_challenge_stats(loser_id, "loss")
+        await self._update_user_challenge_stats([winner_id], "win")
+        await self._update_user_challenge_stats([loser_id], "loss")
 
     async def _award_1v1_draw(self, challenge: Challenge) -> None:
         """Award karma for a 1v1 draw."""
-        draw_karma = KARMA_VALUES["draw"]
-
-        for user_id in [challenge.participant1_id, challenge.participant2_id]:
-            if user_id:
-                await self.karma_service.award_karma(
-                    user_id=user_id,
-                    action=KarmaAction.CHALLENGE_DRAW,
-                    reason=f"Draw in challenge: {challenge.title}",
-                    custom_points=draw_karma
-                )
-                await self._update_user_challenge_stats(user_id, "draw")
+        user_ids = [
+            user_id for user_id in [challenge.participant1_id, challenge.participant2_id]
+            if user_id
+        ]
+        await self.karma_service.award_sparks_bulk(
+            user_ids,
+            action=KarmaAction.CHALLENGE_DRAW,
+            reason=f"Draw in challenge: {challenge.title}",
+            points=KARMA_VALUES["draw"]
+        )
+        await self._update_user_challenge_stats(user_ids, "draw")
 
-    async def _update_user_challenge_stats(self, user_id: int, result: str) -> None:
-        """Update user's challenge statistics."""
-        user = await self.db.get(User, user_id)
-        if not user:
+    async def _update_user_challenge_stats(self, user_ids: List[int], result: str) -> None:
+        """Update users' challenge statistics (in the caller's transaction)."""
+        if not user_ids:
             return
 
         if result == "win":
-            user.challenges_won += 1
-            user.challenge_win_streak += 1
-            if user.challenge_win_streak > user.best_challenge_streak:
-                user.best_challenge_streak = user.challenge_win_streak
-
-            # Check for streak bonuses
-            if user.challenge_win_streak == 3:
-                await self.karma_service.award_karma(
-                    user_id=user_id,
-                    action=KarmaAction.CHALLENGE_WIN_STREAK_3,
-                    reason="3-challenge win streak!",
-                    custom_points=KARMA_VALUES["win_streak_3"]
-                )
-            elif user.challenge_win_streak == 5:
-                await self.karma_service.award_karma(
-                    user_id=user_id,
-                    action=KarmaAction.CHALLENGE_WIN_STREAK_5,
-                    reason="5-challenge win streak!",
-                    custom_points=KARMA_VALUES["win_streak_5"]
-                )
-
+            values = {
+                "challenges_won": User.challenges_won + 1,
+                "challenge_win_streak": User.challenge_win_streak + 1,
+                "best_challenge_streak": case(
+                    (User.challenge_win_streak + 1 > User.best_challenge_streak, User.challenge_win_streak + 1),
+                    else_=User.best_challenge_streak
+                ),
+            }
         elif result == "loss":
-            user.challenges_lost += 1
-            user.challenge_win_streak = 0
+            values = {"challenges_lost": User.challenges_lost + 1, "challenge_win_streak": 0}
+        else:
+            values = {"challenges_drawn": User.challenges_drawn + 1}
 
-        elif result == "draw":
-            user.challenges_drawn += 1
+        await self.db.execute(
+            update(User)
+            .where(User.id.in_(user_ids))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
 
-        await self.db.commit()
+        if result != "win":
+            return
+
+        # Check for streak bonuses
+        streak_bonuses = [
+            (3, KarmaAction.CHALLENGE_WIN_STREAK_3, "3-challenge win streak!", KARMA_VALUES["win_streak_3"]),
+            (5, KarmaAction.CHALLENGE_WIN_STREAK_5, "5-challenge win streak!", KARMA_VALUES["win_streak_5"]),
+        ]
+        for streak, action, reason, karma in streak_bonuses:
+            await self.karma_service.award_sparks_bulk(
+                select(User.id).where(
+                    User.id.in_(user_ids),
+                    User.challenge_win_streak == streak
+                ),
+                action=action,
+                reason=reason,
+                points=karma
+            )
 
     # ==================== NOTIFICATION HELPERS ====================
 
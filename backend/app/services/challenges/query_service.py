@@ -12,7 +12,6 @@ from app.models.user import User
 from app.models.review_request import ContentType
 from app.models.challenge import Challenge, ChallengeStatus, ChallengeType, InvitationMode
 from app.models.challenge_entry import ChallengeEntry
-from app.models.challenge_vote import ChallengeVote
 from app.models.challenge_invitation import ChallengeInvitation
 from app.models.challenge_participant import ChallengeParticipant
 from app.services.challenges.base import BaseChallengeService
@@ -149,35 +148,31 @@ class ChallengeQueryService(BaseChallengeService):
         return [c for c in challenges if c.available_slots > 0]
 
     async def get_user_challenge_stats(self, user_id: int) -> Dict[str, Any]:
-        """Get challenge statistics for a user."""
-        user = await self.db.get(User, user_id)
+        """
+        Get challenge statistics for a user.
+
+        Reads the rollup columns on users, which challenge events keep
+        current (votes received are added when a challenge completes).
+        """
+        result = await self.db.execute(
+            select(
+                User.challenges_won,
+                User.challenges_lost,
+                User.challenges_drawn,
+                User.challenge_win_streak,
+                User.best_challenge_streak,
+                User.challenge_votes_received,
+                User.challenge_votes_cast,
+                User.category_challenges_joined,
+            ).where(User.id == user_id)
+        )
+        user = result.first()
         if not user:
             return {}
 
         total = user.challenges_won + user.challenges_lost + user.challenges_drawn
         win_rate = (user.challenges_won / total * 100) if total > 0 else 0
 
-        # Get total votes received
-        stmt = select(func.sum(ChallengeEntry.vote_count)).where(
-            ChallengeEntry.user_id == user_id
-        )
-        result = await self.db.execute(stmt)
-        total_votes_received = result.scalar() or 0
-
-        # Get total votes cast
-        stmt = select(func.count(ChallengeVote.id)).where(
-            ChallengeVote.voter_id == user_id
-        )
-        result = await self.db.execute(stmt)
-        total_votes_cast = result.scalar() or 0
-
-        # Get category participations
-        stmt = select(func.count(ChallengeParticipant.id)).where(
-            ChallengeParticipant.user_id == user_id
-        )
-        result = await self.db.execute(stmt)
-        category_participations = result.scalar() or 0
-
         return {
             "challenges_won": user.challenges_won,
             "challenges_lost": user.challenges_lost,
@@ -186,22 +181,33 @@ class ChallengeQueryService(BaseChallengeService):
             "win_rate": round(win_rate, 1),
             "current_streak": user.challenge_win_streak,
             "best_streak": user.best_challenge_streak,
-            "total_votes_received": total_votes_received,
-            "total_votes_cast": total_votes_cast,
-            "category_participations": category_participations
+            "total_votes_received": user.challenge_votes_received,
+            "total_votes_cast": user.challenge_votes_cast,
+            "category_participations": user.category_challenges_joined
         }
 
     async def get_leaderboard(self, limit: int = 50) -> List[Dict[str, Any]]:
-        """Get challenge leaderboard."""
+        """Get challenge leaderboard (served by idx_users_challenge_leaderboard)."""
         stmt = (
-            select(User)
+            select(
+                User.id,
+                User.username,
+                User.full_name,
+                User.email,
+                User.avatar_url,
+                User.user_tier,
+                User.challenges_won,
+                User.challenges_lost,
+                User.challenges_drawn,
+                User.best_challenge_streak,
+            )
             .where(User.challenges_won > 0)
             .order_by(User.challenges_won.desc(), User.best_challenge_streak.desc())
             .limit(limit)
         )
 
         result = await self.db.execute(stmt)
-        users = list(result.scalars().all())
+        users = result.all()
 
         leaderboard = []
         for rank, user in enumerate(users, 1):
@@ -5,13 +5,40 @@ between the browse API and review-slots API.
 """
 
 from typing import Optional, Tuple
-from datetime import datetime
-from sqlalchemy import select, and_
+from datetime import datetime, timedelta
+from sqlalchemy import select, update, exists, and_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.review_request import ReviewRequest, ReviewStatus
 from app.models.review_slot import ReviewSlot, ReviewSlotStatus
 from app.models.user import User
+from app.crud import review_loading
+
+
+_ALREADY_CLAIMED = (
+    "You have already claimed a slot for this review request. "
+    "Complete or abandon your current claim before claiming another."
+)
+
+
+def _active_claim(review_id: int, reviewer_id: int):
+    """Condition for a reviewer's claimed or submitted slot on a request."""
+    return and_(
+        ReviewSlot.review_request_id == review_id,
+        ReviewSlot.reviewer_id == reviewer_id,
+        ReviewSlot.status.in_([
+            ReviewSlotStatus.CLAIMED.value,
+            ReviewSlotStatus.SUBMITTED.value
+        ])
+    )
+
+
+def _fully_claimed(review: ReviewRequest) -> str:
+    return (
+        "All review slots are already claimed. "
+        f"{review.reviews_claimed}/{review.reviews_requested} slots filled."
+    )
 
 
 class ClaimValidationError(ValueError):
@@ -131,6 +158,155 @@ class ClaimService:
             # Tier system not available, allow claim
             return True, None
 
+    @staticmethod
+    async def _validate_claim(
+        db: AsyncSession,
+        review_id: int,
+        reviewer_id: int,
+        slot: ReviewSlot
+    ) -> None:
+        """
+        Run the per-reviewer claim checks against an unlocked read.
+
+        The duplicate claim, application and tier checks only depend on the
+        reviewer and the slot's payment, so they run before the claim
+        statements instead of inside a locked transaction.
+
+        Raises:
+            ClaimValidationError: If the reviewer already holds a slot
+            ApplicationRequiredError: If a paid slot needs an accepted application
+            TierPermissionError: If the reviewer's tier can't claim a paid slot
+        """
+        # APPLICATION CHECK: For paid reviews, require application approval
+        requires_app, app_error = await ClaimService.check_application_required(
+            db=db,
+            slot=slot,
+            reviewer_id=reviewer_id
+        )
+
+        if requires_app:
+            raise ApplicationRequiredError(app_error or "Application required for paid reviews")
+
+        # Check if reviewer already has a slot for this request
+        existing_claim_query = select(ReviewSlot.id).where(
+            _active_claim(review_id, reviewer_id)
+        ).limit(1)
+
+        existing_result = await db.execute(existing_claim_query)
+        if existing_result.scalar_one_or_none() is not None:
+            raise ClaimValidationError(_ALREADY_CLAIMED)
+
+        # TIER PERMISSION CHECK: Verify user's tier allows claiming this slot
+        if ClaimService.is_paid_slot(slot):
+            reviewer = await db.get(User, reviewer_id)
+            if reviewer:
+                can_claim, tier_error = await ClaimService.check_tier_permissions(
+                    db=db,
+                    user=reviewer,
+                    slot=slot
+                )
+
+                if not can_claim:
+                    raise TierPermissionError(tier_error or "Your tier doesn't allow claiming this paid review")
+
+    @staticmethod
+    async def _claim_slot(
+        db: AsyncSession,
+        review_id: int,
+        reviewer_id: int,
+        claim_hours: int,
+        slot_id: Optional[int] = None
+    ) -> Optional[int]:
+        """
+        Atomically claim a slot and bump the request's claimed counter.
+
+        The slot is taken with a conditional UPDATE ... RETURNING: either the
+        given slot or, on PostgreSQL, the first available slot not locked by
+        another claim (SKIP LOCKED), so concurrent reviewers on the same
+        request land on different slots instead of queueing. The counter is
+        bumped last, guarded by reviews_claimed < reviews_requested, so the
+        request row is only locked for the final statement and commit.
+
+        The NOT EXISTS check on the reviewer's active claims reads the
+        statement's snapshot, so it can't see a concurrent claim by the same
+        reviewer on another slot; the uq_slot_active_claim partial unique
+        index rejects that second claim.
+
+        Returns:
+            The claimed slot ID (committed), or None if no slot could be taken
+
+        Raises:
+            ClaimValidationError: If the reviewer already holds an active
+                claim on the request
+        """
+        now = datetime.utcnow()
+
+        if slot_id is None:
+            slot_id = (
+                select(ReviewSlot.id)
+                .where(
+                    ReviewSlot.review_request_id == review_id,
+                    ReviewSlot.status == ReviewSlotStatus.AVAILABLE.value
+                )
+                .order_by(ReviewSlot.id)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+                .scalar_subquery()
+            )
+
+        try:
+            claimed = await db.execute(
+                update(ReviewSlot)
+                .where(
+                    ReviewSlot.id == slot_id,
+                    ReviewSlot.review_request_id == review_id,
+                    ReviewSlot.status == ReviewSlotStatus.AVAILABLE.value,
+                    ~exists().where(_active_claim(review_id, reviewer_id))
+                )
+                .values(
+                    reviewer_id=reviewer_id,
+                    status=ReviewSlotStatus.CLAIMED.value,
+                    claimed_at=now,
+                    claim_deadline=now + timedelta(hours=claim_hours),
+                    updated_at=now
+                )
+                .returning(ReviewSlot.id)
+                .execution_options(synchronize_session=False)
+            )
+        except IntegrityError:
+            await db.rollback()
+            raise ClaimValidationError(_ALREADY_CLAIMED)
+        claimed_slot_id = claimed.scalar_one_or_none()
+
+        if claimed_slot_id is None:
+            await db.rollback()
+            return None
+
+        # Update review request's claimed counter; the first claim moves it
+        # from PENDING to IN_REVIEW
+        counted = await db.execute(
+            update(ReviewRequest)
+            .where(
+                ReviewRequest.id == review_id,
+                ReviewRequest.deleted_at.is_(None),
+                ReviewRequest.status.in_([ReviewStatus.PENDING, ReviewStatus.IN_REVIEW]),
+                ReviewRequest.reviews_claimed < ReviewRequest.reviews_requested
+            )
+            .values(
+                reviews_claimed=ReviewRequest.reviews_claimed + 1,
+                status=ReviewStatus.IN_REVIEW,
+                updated_at=now
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        if counted.rowcount != 1:
+            await db.rollback()
+            return None
+
+        await db.commit()
+        return claimed_slot_id
+
     @staticmethod
     async def claim_review_by_request_id(
         db: AsyncSession,
@@ -142,10 +318,13 @@ class ClaimService:
         Claim a review slot by review request ID.
 
         This method:
-        1. Finds an available slot for the review request
-        2. Validates the claim (ownership, availability, duplicate check)
-        3. Claims the slot
-        4. Updates the review request's claimed counter
+        1. Validates the claim (ownership, availability, duplicate check)
+           against plain reads
+        2. Claims the first available slot with a conditional UPDATE
+        3. Bumps the review request's claimed counter with a guarded UPDATE
+
+        No row is locked while validating, so reviewers racing for the same
+        request only contend on the two claim statements.
 
         Args:
             db: Database session
@@ -160,14 +339,9 @@ class ClaimService:
             ClaimValidationError: If claim validation fails
             RuntimeError: If review request not found or no slots available
         """
-        # Get review request with row lock to prevent race conditions
-        review_query = (
-            select(ReviewRequest)
-            .where(
-                ReviewRequest.id == review_id,
-                ReviewRequest.deleted_at.is_(None)
-            )
-            .with_for_update()
+        review_query = select(ReviewRequest).options(*review_loading.CLAIM).where(
+            ReviewRequest.id == review_id,
+            ReviewRequest.deleted_at.is_(None)
         )
 
         review_result = await db.execute(review_query)
@@ -187,7 +361,8 @@ class ClaimService:
                 "Only pending or in-review requests can be claimed."
             )
 
-        # Find an available slot for this review request
+        # Any available slot stands in for the one we'll claim: all slots of
+        # a request share its payment amount
         slot_query = (
             select(ReviewSlot)
             .where(
@@ -196,7 +371,6 @@ class ClaimService:
                     ReviewSlot.status == ReviewSlotStatus.AVAILABLE.value
                 )
             )
-            .with_for_update()  # Lock the slot
             .limit(1)
         )
 
@@ -204,71 +378,18 @@ class ClaimService:
         slot = slot_result.scalar_one_or_none()
 
         if not slot:
-            raise ClaimValidationError(
-                "All review slots are already claimed. "
-                f"{review.reviews_claimed}/{review.reviews_requested} slots filled."
-            )
-
-        # APPLICATION CHECK: For paid reviews, require application approval
-        requires_app, app_error = await ClaimService.check_application_required(
-            db=db,
-            slot=slot,
-            reviewer_id=reviewer_id
-        )
+            raise ClaimValidationError(_fully_claimed(review))
 
-        if requires_app:
-            raise ApplicationRequiredError(app_error or "Application required for paid reviews")
+        await ClaimService._validate_claim(db, review_id, reviewer_id, slot)
 
-        # Check if reviewer already has a slot for this request
-        existing_claim_query = select(ReviewSlot).where(
-            and_(
-                ReviewSlot.review_request_id == review_id,
-                ReviewSlot.reviewer_id == reviewer_id,
-                ReviewSlot.status.in_([
-                    ReviewSlotStatus.CLAIMED.value,
-                    ReviewSlotStatus.SUBMITTED.value
-                ])
-            )
-        )
+        slot_id = await ClaimService._claim_slot(db, review_id, reviewer_id, claim_hours)
 
-        existing_result = await db.execute(existing_claim_query)
-        existing_claim = existing_result.scalar_one_or_none()
+        if slot_id is None:
+            await db.refresh(review)
+            raise ClaimValidationError(_fully_claimed(review))
 
-        if existing_claim:
-            raise ClaimValidationError(
-                "You have already claimed a slot for this review request. "
-                "Complete or abandon your current claim before claiming another."
-            )
-
-        # TIER PERMISSION CHECK: Verify user's tier allows claiming this slot
-        reviewer = await db.get(User, reviewer_id)
-        if reviewer:
-            can_claim, tier_error = await ClaimService.check_tier_permissions(
-                db=db,
-                user=reviewer,
-                slot=slot
-            )
-
-            if not can_claim:
-                raise TierPermissionError(tier_error or "Your tier doesn't allow claiming this paid review")
-
-        # Claim the slot
-        slot.claim(reviewer_id, claim_hours)
-
-        # Update review request's claimed counter
-        review.reviews_claimed += 1
-
-        # If this was the first claim, change status to IN_REVIEW
-        if review.reviews_claimed == 1 and review.status == ReviewStatus.PENDING:
-            review.status = ReviewStatus.IN_REVIEW
-
-        review.updated_at = datetime.utcnow()
-
-        await db.commit()
-        await db.refresh(slot)
         await db.refresh(review)
-
-        return slot
+        return await db.get(ReviewSlot, slot_id, populate_existing=True)
 
     @staticmethod
     async def claim_review_by_slot_id(
@@ -281,7 +402,8 @@ class ClaimService:
         Claim a specific review slot by slot ID.
 
         This method is used when the frontend already knows the slot_id
-        (e.g., from browsing available slots directly).
+        (e.g., from browsing available slots directly). Validation and the
+        claim statements work as in claim_review_by_request_id.
 
         Args:
             db: Database session
@@ -296,15 +418,7 @@ class ClaimService:
             ClaimValidationError: If claim validation fails
             RuntimeError: If slot not found
         """
-        # Get slot with row lock
-        slot_query = (
-            select(ReviewSlot)
-            .where(ReviewSlot.id == slot_id)
-            .with_for_update()
-        )
-
-        slot_result = await db.execute(slot_query)
-        slot = slot_result.scalar_one_or_none()
+        slot = await db.get(ReviewSlot, slot_id)
 
         if not slot:
             raise RuntimeError(f"Review slot {slot_id} not found")
@@ -316,7 +430,9 @@ class ClaimService:
             )
 
         # Get review request to validate ownership
-        review = await db.get(ReviewRequest, slot.review_request_id)
+        review = await db.get(
+            ReviewRequest, slot.review_request_id, options=review_loading.CLAIM
+        )
         if not review:
             raise RuntimeError("Review request not found")
 
@@ -326,65 +442,19 @@ class ClaimService:
                 "You cannot claim review slots for your own requests"
             )
 
-        # APPLICATION CHECK: For paid reviews, require application approval
-        requires_app, app_error = await ClaimService.check_application_required(
-            db=db,
-            slot=slot,
-            reviewer_id=reviewer_id
-        )
-
-        if requires_app:
-            raise ApplicationRequiredError(app_error or "Application required for paid reviews")
+        await ClaimService._validate_claim(db, review.id, reviewer_id, slot)
 
-        # Check if reviewer already has a slot for this request
-        existing_claim_query = select(ReviewSlot).where(
-            and_(
-                ReviewSlot.review_request_id == slot.review_request_id,
-                ReviewSlot.reviewer_id == reviewer_id,
-                ReviewSlot.status.in_([
-                    ReviewSlotStatus.CLAIMED.value,
-                    ReviewSlotStatus.SUBMITTED.value
-                ])
-            )
+        claimed_slot_id = await ClaimService._claim_slot(
+            db, review.id, reviewer_id, claim_hours, slot_id=slot_id
         )
 
-        existing_result = await db.execute(existing_claim_query)
-        existing_claim = existing_result.scalar_one_or_none()
-
-        if existing_claim:
+        await db.refresh(slot)
+        if claimed_slot_id is None:
             raise ClaimValidationError(
-                "You have already claimed a slot for this review request. "
-                "Complete or abandon your current claim before claiming another."
-            )
-
-        # TIER PERMISSION CHECK: Verify user's tier allows claiming this slot
-        reviewer = await db.get(User, reviewer_id)
-        if reviewer:
-            can_claim, tier_error = await ClaimService.check_tier_permissions(
-                db=db,
-                user=reviewer,
-                slot=slot
+                f"Slot is not available (current status: {slot.status})"
             )
 
-            if not can_claim:
-                raise TierPermissionError(tier_error or "Your tier doesn't allow claiming this paid review")
-
-        # Claim the slot
-        slot.claim(reviewer_id, claim_hours)
-
-        # Update review request's claimed counter
-        review.reviews_claimed += 1
-
-        # If this was the first claim, change status to IN_REVIEW
-        if review.reviews_claimed == 1 and review.status == ReviewStatus.PENDING:
-            review.status = ReviewStatus.IN_REVIEW
-
-        review.updated_at = datetime.utcnow()
-
-        await db.commit()
-        await db.refresh(slot)
         await db.refresh(review)
-
         return slot
 
     @staticmethod
@@ -429,7 +499,9 @@ class ClaimService:
             pass
 
         # Update review request's claimed counter
-        review = await db.get(ReviewRequest, slot.review_request_id)
+        review = await db.get(
+            ReviewRequest, slot.review_request_id, options=review_loading.CLAIM
+        )
         if review:
             review.reviews_claimed = max(0, review.reviews_claimed - 1)
 
@@ -4,7 +4,7 @@ import logging
 from datetime import datetime, timedelta
 from math import ceil
 from typing import Optional
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, func, and_, or_, case, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -34,6 +34,7 @@ from app.core.exceptions import (
     InvalidStateError,
     AlreadyExistsError,
 )
+from app.utils.query_helpers import count_where, days_between
 
 logger = logging.getLogger(__name__)
 
@@ -83,34 +84,15 @@ class CommitteeService:
         """Get applications waiting for review (submitted or resubmitted)"""
         escalation_cutoff = datetime.utcnow() - timedelta(days=ESCALATION_DAYS)
 
-        # Base query for unclaimed submitted applications
+        # Unclaimed submitted applications, served by idx_expert_app_queue
         base_conditions = [
             ExpertApplication.status.in_([
                 ApplicationStatus.SUBMITTED.value,
                 ApplicationStatus.RESUBMITTED.value
-            ])
+            ]),
+            ExpertApplication.has_active_claim == False,
         ]
 
-        # Count subquery for how many times an app has been claimed
-        claim_count_subq = (
-            select(
-                ApplicationReview.application_id,
-                func.count(ApplicationReview.id).label('claim_count')
-            )
-            .group_by(ApplicationReview.application_id)
-            .subquery()
-        )
-
-        # Applications that have no active claims
-        active_claim_subq = (
-            select(ApplicationReview.application_id)
-            .where(ApplicationReview.status == ReviewStatus.CLAIMED.value)
-        )
-
-        base_conditions.append(
-            ~ExpertApplication.id.in_(active_claim_subq)
-        )
-
         if include_escalated_only:
             base_conditions.append(
                 ExpertApplication.submitted_at <= escalation_cutoff
@@ -123,27 +105,18 @@ class CommitteeService:
 
         # Fetch applications
         stmt = (
-            select(
-                ExpertApplication,
-                func.coalesce(claim_count_subq.c.claim_count, 0).label('claim_count')
-            )
-            .outerjoin(
-                claim_count_subq,
-                ExpertApplication.id == claim_count_subq.c.application_id
-            )
+            select(ExpertApplication)
             .where(*base_conditions)
             .order_by(ExpertApplication.submitted_at.asc())  # Oldest first
             .offset((page - 1) * page_size)
             .limit(page_size)
         )
         result = await self.db.execute(stmt)
-        rows = result.all()
+        applications = result.scalars().all()
 
         queue_items = []
         now = datetime.utcnow()
-        for row in rows:
-            app = row[0]
-            claim_count = row[1]
+        for app in applications:
             days_in_queue = (now - app.submitted_at).days if app.submitted_at else 0
 
             queue_items.append(ApplicationQueueItem(
@@ -156,7 +129,7 @@ class CommitteeService:
                 created_at=app.created_at,
                 days_in_queue=days_in_queue,
                 is_escalated=days_in_queue >= ESCALATION_DAYS,
-                claim_count=claim_count
+                claim_count=app.claim_count
             ))
 
         return queue_items, total
@@ -191,17 +164,6 @@ class CommitteeService:
                 allowed_states=["submitted", "resubmitted"]
             )
 
-        # Check if already claimed by someone else
-        existing_claim_stmt = select(ApplicationReview).where(
-            ApplicationReview.application_id == application_id,
-            ApplicationReview.status == ReviewStatus.CLAIMED.value
-        )
-        existing_result = await self.db.execute(existing_claim_stmt)
-        existing_claim = existing_result.scalar_one_or_none()
-
-        if existing_claim:
-            raise AlreadyExistsError(resource="Claim", message="Application is already claimed by another reviewer")
-
         # Check if this member already voted on this application
         already_voted_stmt = select(ApplicationReview).where(
             ApplicationReview.application_id == application_id,
@@ -212,6 +174,23 @@ class CommitteeService:
         if already_voted_result.scalar_one_or_none():
             raise AlreadyExistsError(resource="Vote", message="You have already voted on this application")
 
+        # Take the claim flag atomically; only one concurrent claimer matches
+        claim_result = await self.db.execute(
+            update(ExpertApplication)
+            .where(
+                ExpertApplication.id == application_id,
+                ExpertApplication.has_active_claim == False
+            )
+            .values(
+                has_active_claim=True,
+                claim_count=ExpertApplication.claim_count + 1,
+                status=ApplicationStatus.UNDER_REVIEW.value,
+                updated_at=datetime.utcnow()
+            )
+        )
+        if claim_result.rowcount != 1:
+            raise AlreadyExistsError(resource="Claim", message="Application is already claimed by another reviewer")
+
         # Create the review/claim
         review = ApplicationReview(
             application_id=application_id,
@@ -221,10 +200,6 @@ class CommitteeService:
         )
         self.db.add(review)
 
-        # Update application status to UNDER_REVIEW
-        application.status = ApplicationStatus.UNDER_REVIEW.value
-        application.updated_at = datetime.utcnow()
-
         await self.db.commit()
         await self.db.refresh(review)
 
@@ -255,6 +230,7 @@ class CommitteeService:
         review.released_at = datetime.utcnow()
         if reason:
             review.internal_notes = f"Released: {reason}"
+        await self._clear_active_claims([application_id])
 
         # Check if there are other active reviews
         other_reviews_stmt = select(func.count(ApplicationReview.id)).where(
@@ -277,6 +253,15 @@ class CommitteeService:
         await self.db.commit()
         logger.info(f"Application {application_id} released by committee member {committee_member.id}")
 
+    async def _clear_active_claims(self, application_ids: list[int]) -> None:
+        """Return applications' queue flag to unclaimed (in the caller's transaction)"""
+        await self.db.execute(
+            update(ExpertApplication)
+            .where(ExpertApplication.id.in_(application_ids))
+            .values(has_active_claim=False)
+            .execution_options(synchronize_session=False)
+        )
+
     # ============ Voting ============
 
     async def submit_vote(
@@ -318,6 +303,7 @@ class CommitteeService:
         review.additional_feedback = vote_request.additional_feedback
         review.internal_notes = vote_request.internal_notes
         review.voted_at = datetime.utcnow()
+        await self._clear_active_claims([application_id])
 
         await self.db.commit()
         await self.db.refresh(review)
@@ -702,59 +688,41 @@ class CommitteeService:
         now = datetime.utcnow()
         month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
-        # Pending applications
-        pending_stmt = select(func.count(ExpertApplication.id)).where(
+        decided_this_month = and_(
             ExpertApplication.status.in_([
-                ApplicationStatus.SUBMITTED.value,
-                ApplicationStatus.RESUBMITTED.value
-            ])
-        )
-        pending_result = await self.db.execute(pending_stmt)
-        pending = pending_result.scalar() or 0
-
-        # Under review
-        under_review_stmt = select(func.count(ExpertApplication.id)).where(
-            ExpertApplication.status == ApplicationStatus.UNDER_REVIEW.value
-        )
-        under_review_result = await self.db.execute(under_review_stmt)
-        under_review = under_review_result.scalar() or 0
-
-        # Approved this month
-        approved_stmt = select(func.count(ExpertApplication.id)).where(
-            ExpertApplication.status == ApplicationStatus.APPROVED.value,
+                ApplicationStatus.APPROVED.value,
+                ApplicationStatus.REJECTED.value
+            ]),
             ExpertApplication.decided_at >= month_start
         )
-        approved_result = await self.db.execute(approved_stmt)
-        approved = approved_result.scalar() or 0
 
-        # Rejected this month
-        rejected_stmt = select(func.count(ExpertApplication.id)).where(
-            ExpertApplication.status == ApplicationStatus.REJECTED.value,
-            ExpertApplication.decided_at >= month_start
-        )
-        rejected_result = await self.db.execute(rejected_stmt)
-        rejected = rejected_result.scalar() or 0
-
-        # Avg review time (for decided applications this month)
-        # This is a simplified calculation
-        avg_time_stmt = (
-            select(
-                func.avg(
-                    func.julianday(ExpertApplication.decided_at) -
-                    func.julianday(ExpertApplication.submitted_at)
-                )
-            )
-            .where(
-                ExpertApplication.status.in_([
-                    ApplicationStatus.APPROVED.value,
-                    ApplicationStatus.REJECTED.value
-                ]),
-                ExpertApplication.decided_at >= month_start,
-                ExpertApplication.submitted_at.isnot(None)
-            )
-        )
-        avg_time_result = await self.db.execute(avg_time_stmt)
-        avg_time = avg_time_result.scalar() or 0
+        # One pass over applications for every dashboard count
+        counts_stmt = select(
+            count_where(ExpertApplication.status.in_([
+                ApplicationStatus.SUBMITTED.value,
+                ApplicationStatus.RESUBMITTED.value
+            ])),
+            count_where(ExpertApplication.status == ApplicationStatus.UNDER_REVIEW.value),
+            count_where(
+                ExpertApplication.status == ApplicationStatus.APPROVED.value,
+                ExpertApplication.decided_at >= month_start
+            ),
+            count_where(
+                ExpertApplication.status == ApplicationStatus.REJECTED.value,
+                ExpertApplication.decided_at >= month_start
+            ),
+            # Avg review time for decided applications this month (avg skips NULLs)
+            func.avg(case(
+                (
+                    and_(decided_this_month, ExpertApplication.submitted_at.isnot(None)),
+                    days_between(ExpertApplication.decided_at, ExpertApplication.submitted_at)
+                ),
+                else_=None
+            )),
+        )
+        counts_result = await self.db.execute(counts_stmt)
+        pending, under_review, approved, rejected, avg_time = counts_result.one()
+        avg_time = float(avg_time or 0)
 
         # My claimed count
         my_claimed = await self.get_committee_member_current_claims(committee_member.id)
@@ -860,6 +828,7 @@ class CommitteeService:
             released_count += 1
 
         if released_count > 0:
+            await self._clear_active_claims([review.application_id for review in stale_reviews])
             await self.db.commit()
             logger.info(f"Auto-released {released_count} stale claims")
 
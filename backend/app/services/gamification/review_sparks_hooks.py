@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.review_slot import ReviewSlot, ReviewSlotStatus, AcceptanceType, DisputeResolution
 from app.models.sparks_transaction import SparksAction
 from app.services.gamification.sparks_service import SparksService
+from app.services.ratings.reviewer_dna_service import ReviewerDNAService
 
 
 class ReviewSparksHooks:
@@ -18,12 +19,14 @@ class ReviewSparksHooks:
     Provides hook methods to award sparks for review slot events.
 
     Each method corresponds to a ReviewSlot state transition and awards
-    appropriate sparks points based on the action taken.
+    appropriate sparks points based on the action taken. The reviewer's
+    DNA running statistics are updated on the same transitions.
     """
 
     def __init__(self, db: AsyncSession):
         self.db = db
         self.sparks_service = SparksService(db)
+        self.dna_service = ReviewerDNAService(db)
 
     async def on_review_submitted(self, review_slot: ReviewSlot) -> None:
         """
@@ -51,6 +54,9 @@ class ReviewSparksHooks:
         # Update streak (may award streak bonuses)
         await self.sparks_service.update_streak(review_slot.reviewer_id)
 
+        # Fold the submission into the reviewer's DNA statistics
+        await self.dna_service.record_submission(review_slot)
+
     async def on_review_accepted(
         self,
         review_slot: ReviewSlot,
@@ -103,6 +109,8 @@ class ReviewSparksHooks:
         # Check for tier promotion
         await self.sparks_service.check_tier_promotion(review_slot.reviewer_id)
 
+        await self.dna_service.record_acceptance(review_slot)
+
     async def on_review_rejected(self, review_slot: ReviewSlot) -> None:
         """
         Hook called when a review is rejected.
@@ -139,6 +147,8 @@ class ReviewSparksHooks:
         # Update acceptance rate
         await self.sparks_service.calculate_acceptance_rate(review_slot.reviewer_id)
 
+        await self.dna_service.record_rejection(review_slot)
+
     async def on_claim_abandoned(self, review_slot: ReviewSlot) -> None:
         """
         Hook called when a reviewer abandons a claimed slot.
@@ -187,6 +197,9 @@ class ReviewSparksHooks:
 
             # Check for tier promotion
             await self.sparks_service.check_tier_promotion(review_slot.reviewer_id)
+
+            # Rejection overturned: move it to the accepted column of the DNA stats
+            await self.dna_service.record_acceptance(review_slot, overturned_rejection=True)
         else:
             # Reviewer lost the dispute
             await self.sparks_service.award_sparks(
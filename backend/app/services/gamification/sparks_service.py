@@ -1,9 +1,10 @@
 """Sparks Service for managing user reputation points - Modern System"""
 
+import functools
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Optional, List, Dict, Any, Tuple
-from sqlalchemy import func, select, case, and_
+from sqlalchemy import func, select, case, and_, exists, insert, literal, update, String, cast
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.constants import SparksConfig
@@ -13,6 +14,19 @@ from app.models.review_slot import ReviewSlot, ReviewSlotStatus
 from app.core.exceptions import NotFoundError
 
 
+def _invalidates_leaderboards(method):
+    """Drop cached leaderboard responses after a write that changes ranked stats"""
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        # Imported here: app.services.infrastructure imports the scheduler, which imports this module
+        from app.services.infrastructure.response_cache import response_cache
+
+        result = await method(self, *args, **kwargs)
+        await response_cache.invalidate("leaderboards")
+        return result
+    return wrapper
+
+
 class SparksService:
     """
     Modern Sparks Service for managing XP, reputation, and engagement.
@@ -100,6 +114,7 @@ class SparksService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    @_invalidates_leaderboards
     async def award_sparks(
         self,
         user_id: int,
@@ -186,6 +201,73 @@ class SparksService:
 
         return transaction
 
+    async def award_sparks_bulk(
+        self,
+        user_ids,
+        action: SparksAction,
+        reason: str,
+        points: int
+    ) -> int:
+        """
+        Award the same sparks to many users in two statements.
+
+        Applies award_sparks' rules to every user (sparks floored at 0, XP
+        for positive points, activity date reset, reputation restore) with
+        one UPDATE, then records the transactions with one INSERT ... SELECT.
+        Doesn't commit, so it can be part of a larger transaction.
+
+        Args:
+            user_ids: List of user IDs, or a select of user IDs
+            action: The action that triggered the change
+            reason: Human-readable description for user display
+            points: Points for each user (can be negative)
+
+        Returns:
+            Number of transactions recorded
+        """
+        if isinstance(user_ids, (list, tuple, set)) and not user_ids:
+            return 0
+
+        now = datetime.utcnow()
+        recipients = User.id.in_(user_ids)
+
+        values = {
+            "sparks_points": case(
+                (User.sparks_points + points < 0, 0),
+                else_=User.sparks_points + points
+            ),
+            "last_active_date": now,
+            "reputation_score": case(
+                (User.reputation_score >= 100, User.reputation_score),
+                (User.reputation_score > 95, 100),
+                else_=User.reputation_score + 5
+            ),
+        }
+        if points > 0:
+            values["xp_points"] = User.xp_points + int(points * self.XP_MULTIPLIER)
+
+        await self.db.execute(
+            update(User)
+            .where(recipients)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+        result = await self.db.execute(
+            insert(SparksTransaction).from_select(
+                ["user_id", "action", "points", "balance_after", "reason", "created_at"],
+                select(
+                    User.id,
+                    literal(action, SparksTransaction.__table__.c.action.type),
+                    literal(points),
+                    User.sparks_points,
+                    literal(reason),
+                    literal(now, SparksTransaction.__table__.c.created_at.type),
+                ).where(recipients)
+            )
+        )
+        return result.rowcount or 0
+
     async def process_claim_abandoned(
         self,
         user_id: int,
@@ -253,6 +335,7 @@ class SparksService:
             )
             return transaction, False
 
+    @_invalidates_leaderboards
     async def update_streak(self, user_id: int) -> Optional[SparksTransaction]:
         """
         Update user's review streak with shield and weekend grace support.
@@ -507,6 +590,101 @@ class SparksService:
 
         return transaction
 
+    async def apply_reputation_decay_batch(self, now: Optional[datetime] = None) -> int:
+        """
+        Apply one week of reputation decay to every inactive user.
+
+        Meant to run daily from the scheduler. A user is due when they have
+        been inactive for DECAY_START_DAYS plus a week, are above
+        DECAY_FLOOR and haven't decayed in the last 6 days, so each user
+        loses at most DECAY_RATE_PER_WEEK per week whatever the run cadence.
+
+        Runs as one INSERT ... SELECT of the decay transactions followed by
+        one UPDATE of the users those transactions name.
+
+        Returns:
+            Number of users decayed
+        """
+        now = now or datetime.utcnow()
+
+        headroom = User.reputation_score - self.DECAY_FLOOR
+        decay_amount = case(
+            (headroom < self.DECAY_RATE_PER_WEEK, headroom),
+            else_=self.DECAY_RATE_PER_WEEK,
+        )
+        recently_decayed = exists().where(
+            SparksTransaction.user_id == User.id,
+            SparksTransaction.action == SparksAction.REPUTATION_DECAY,
+            SparksTransaction.created_at > now - timedelta(days=6),
+        )
+        due = select(
+            User.id,
+            literal(SparksAction.REPUTATION_DECAY, SparksTransaction.__table__.c.action.type),
+            literal(0),
+            User.sparks_points,
+            literal("Reputation adjusted by ") + cast(decay_amount, String) + literal(" while you were away"),
+            literal(now, SparksTransaction.__table__.c.created_at.type),
+        ).where(
+            User.last_active_date <= now - timedelta(days=self.DECAY_START_DAYS + 7),
+            User.reputation_score > self.DECAY_FLOOR,
+            ~recently_decayed,
+        )
+
+        result = await self.db.execute(
+            insert(SparksTransaction).from_select(
+                ["user_id", "action", "points", "balance_after", "reason", "created_at"],
+                due,
+            )
+        )
+        decayed = result.rowcount or 0
+
+        if decayed:
+            this_run = select(SparksTransaction.user_id).where(
+                SparksTransaction.action == SparksAction.REPUTATION_DECAY,
+                SparksTransaction.created_at == now,
+            )
+            await self.db.execute(
+                update(User)
+                .where(User.id.in_(this_run))
+                .values(reputation_score=User.reputation_score - decay_amount)
+                .execution_options(synchronize_session=False)
+            )
+
+        await self.db.commit()
+        return decayed
+
+    async def recalculate_percentiles(self) -> int:
+        """
+        Store every active user's sparks percentile in reputation_percentile.
+
+        One UPDATE from a rank()/count() window query; the value is the
+        share of active users with fewer sparks, as in
+        _calculate_sparks_percentile.
+
+        Returns:
+            Number of users updated
+        """
+        ranked = (
+            select(
+                User.id.label("user_id"),
+                (
+                    (func.rank().over(order_by=User.sparks_points) - 1) * 100
+                    // func.count().over()
+                ).label("percentile"),
+            )
+            .where(User.is_active == True)
+            .subquery()
+        )
+        result = await self.db.execute(
+            update(User)
+            .where(User.id == ranked.c.user_id)
+            .values(reputation_percentile=ranked.c.percentile)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+        return result.rowcount or 0
+
+    @_invalidates_leaderboards
     async def calculate_acceptance_rate(self, user_id: int) -> Optional[Decimal]:
         """
         Calculate and cache the user's review acceptance rate.
@@ -610,8 +788,10 @@ class SparksService:
             else:
                 negative_total += abs(points)
 
-        # Calculate percentile
-        percentile = await self._calculate_sparks_percentile(user.sparks_points)
+        # Percentile is refreshed by the daily reputation job
+        percentile = user.reputation_percentile
+        if percentile is None:
+            percentile = await self._calculate_sparks_percentile(user.sparks_points)
 
         return {
             "total_sparks": user.sparks_points,
@@ -698,6 +878,7 @@ class SparksService:
             reason="First review of the day!"
         )
 
+    @_invalidates_leaderboards
     async def check_tier_promotion(self, user_id: int) -> bool:
         """Check if user qualifies for tier promotion."""
         from app.services.gamification.tier_service import TierService
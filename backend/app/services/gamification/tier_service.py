@@ -193,18 +193,10 @@ class TierService:
         Returns:
             Average helpful rating, or None if no ratings
         """
-        stmt = select(
-            func.avg(ReviewSlot.requester_helpful_rating)
-        ).where(
-            ReviewSlot.reviewer_id == user_id,
-            ReviewSlot.status == ReviewSlotStatus.ACCEPTED.value,
-            ReviewSlot.requester_helpful_rating.isnot(None)
-        )
-
-        result = await self.db.execute(stmt)
-        avg_rating = result.scalar()
+        from app.services.ratings.reviewer_stats import get_reviewer_stats
 
-        return float(avg_rating) if avg_rating else None
+        stats = await get_reviewer_stats(self.db, user_id)
+        return stats.avg_helpful_rating if stats else None
 
     async def promote_to_tier(
         self,
@@ -6,6 +6,9 @@ This module consolidates infrastructure-related services:
 - storage_service: File storage (S3/local)
 - image_service: Image processing and validation
 - scheduler: Background job scheduler
+- ttl_cache: In-process TTL cache for computed read models
+- response_cache: HTTP response cache with ETag/304 for public GET endpoints
+- draft_buffer: Write-behind buffer for review draft autosaves
 
 Usage:
     from app.services.infrastructure import redis_service
@@ -19,6 +22,9 @@ from app.services.infrastructure.image_service import (
     ImageValidationError,
     ImageProcessingError,
 )
+from app.services.infrastructure.ttl_cache import TTLCache
+from app.services.infrastructure.response_cache import response_cache, cached_response
+from app.services.infrastructure.draft_buffer import draft_buffer, draft_flusher, BufferedDraft
 from app.services.infrastructure.scheduler import (
     start_background_jobs,
     stop_background_jobs,
@@ -35,6 +41,14 @@ __all__ = [
     "ImageService",
     "ImageValidationError",
     "ImageProcessingError",
+    # Caching
+    "TTLCache",
+    "response_cache",
+    "cached_response",
+    # Draft autosave
+    "draft_buffer",
+    "draft_flusher",
+    "BufferedDraft",
     # Scheduler
     "start_background_jobs",
     "stop_background_jobs",
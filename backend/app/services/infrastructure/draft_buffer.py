@@ -0,0 +1,429 @@
+"""
+Write-behind buffer for review draft autosaves.
+
+Autosave endpoints used to load the slot, serialize the whole draft into
+review_slots.draft_sections and commit on every keystroke pause. The
+buffer keeps the latest draft per slot and writes it back later:
+
+    # Autosave: buffered, coalesced per slot
+    draft_buffer.save(slot_id, BufferedDraft(reviewer_id, draft, rating))
+
+    # Reads see buffered drafts first
+    entry = draft_buffer.get(slot_id)
+
+    # Submit: write (or drop) the slot's pending draft first
+    await draft_buffer.flush(db, [slot_id])
+    draft_buffer.discard(slot_id)
+
+- Repeated saves for a slot overwrite one entry; a flush writes each
+  dirty slot once, however many saves it received
+- The flusher task writes dirty drafts every DRAFT_BUFFER_FLUSH_SECONDS
+  and once more on shutdown
+- A flush only writes to slots still claimed by the draft's reviewer,
+  so drafts for abandoned, expired or submitted slots are dropped
+- Every write records the draft's saved_at in review_slots.draft_saved_at
+  and only replaces an older draft, so a worker flushing an old entry
+  can't overwrite a newer draft another worker already wrote
+- Entries live in process memory or, if DRAFT_BUFFER_USE_REDIS is set and
+  Redis is reachable, in Redis so every worker sees the same drafts.
+  Entries stay readable (clean) for DRAFT_BUFFER_ENTRY_TTL_SECONDS after
+  the last save.
+- With DRAFT_BUFFER_ENABLED off, or if Redis fails, a save returns False
+  and the caller writes the draft straight to the database
+
+Without Redis each worker only sees its own entries: a partial save on a
+worker that doesn't hold the slot's entry merges into the newest flushed
+draft, so sections buffered on another worker and not yet flushed are lost.
+Set DRAFT_BUFFER_USE_REDIS when running several workers.
+
+Saves, writes, dropped drafts and store errors are exported on /metrics
+(draft_buffer_*); the dirty count is read from the store on each scrape.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import or_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.models.review_slot import ReviewSlot, ReviewSlotStatus
+from app.services.infrastructure.redis_service import redis_service
+
+DRAFT_EVENTS = metrics.counter(
+    "draft_buffer_events_total",
+    "Draft buffer activity (saved, written, dropped, flushed, store_error)",
+    labelnames=("event",),
+)
+
+logger = logging.getLogger(__name__)
+
+REDIS_PREFIX = "drafts"
+
+
+@dataclass
+class BufferedDraft:
+    """The latest sanitized draft for a slot, as it will be stored"""
+    reviewer_id: int
+    draft: Any
+    rating: Optional[int] = None
+    saved_at: datetime = field(default_factory=datetime.utcnow)
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "reviewer_id": self.reviewer_id,
+            "draft": self.draft,
+            "rating": self.rating,
+            "saved_at": self.saved_at.isoformat(),
+        })
+
+    @classmethod
+    def from_json(cls, raw: str) -> "BufferedDraft":
+        data = json.loads(raw)
+        return cls(
+            reviewer_id=data["reviewer_id"],
+            draft=data["draft"],
+            rating=data.get("rating"),
+            saved_at=datetime.fromisoformat(data["saved_at"]),
+        )
+
+
+class MemoryDraftStore:
+    """Entries and dirty marks for a single process"""
+
+    def __init__(self, entry_ttl_seconds: float):
+        self.entry_ttl_seconds = entry_ttl_seconds
+        self._entries: Dict[int, tuple] = {}  # slot_id -> (entry, expires_at)
+        self._dirty: set = set()
+
+    def get(self, slot_id: int) -> Optional[BufferedDraft]:
+        item = self._entries.get(slot_id)
+        if item is None:
+            return None
+        entry, expires_at = item
+        if expires_at <= time.monotonic() and slot_id not in self._dirty:
+            del self._entries[slot_id]
+            return None
+        return entry
+
+    def put(self, slot_id: int, entry: BufferedDraft) -> None:
+        self._entries[slot_id] = (entry, time.monotonic() + self.entry_ttl_seconds)
+        self._dirty.add(slot_id)
+
+    def take_dirty(self, slot_ids: Optional[Iterable[int]] = None) -> Dict[int, BufferedDraft]:
+        if slot_ids is None:
+            self._evict_expired()
+        taken = set(self._dirty) if slot_ids is None else self._dirty.intersection(slot_ids)
+        self._dirty -= taken
+        return {slot_id: self._entries[slot_id][0] for slot_id in taken}
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        expired = [
+            slot_id for slot_id, (_, expires_at) in self._entries.items()
+            if expires_at <= now and slot_id not in self._dirty
+        ]
+        for slot_id in expired:
+            del self._entries[slot_id]
+
+    def mark_dirty(self, slot_ids: Iterable[int]) -> None:
+        self._dirty.update(slot_id for slot_id in slot_ids if slot_id in self._entries)
+
+    def discard(self, slot_id: int) -> None:
+        self._entries.pop(slot_id, None)
+        self._dirty.discard(slot_id)
+
+    def dirty_count(self) -> int:
+        return len(self._dirty)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._dirty.clear()
+
+
+class RedisDraftStore:
+    """Entries and dirty marks shared by all workers through Redis"""
+
+    def __init__(self, client, entry_ttl_seconds: float):
+        self.client = client
+        self.entry_ttl_seconds = int(entry_ttl_seconds)
+        self._dirty_key = f"{REDIS_PREFIX}:dirty"
+
+    def _key(self, slot_id: int) -> str:
+        return f"{REDIS_PREFIX}:entry:{slot_id}"
+
+    def get(self, slot_id: int) -> Optional[BufferedDraft]:
+        raw = self.client.get(self._key(slot_id))
+        return BufferedDraft.from_json(raw) if raw else None
+
+    def put(self, slot_id: int, entry: BufferedDraft) -> None:
+        pipe = self.client.pipeline()
+        pipe.setex(self._key(slot_id), self.entry_ttl_seconds, entry.to_json())
+        pipe.sadd(self._dirty_key, slot_id)
+        pipe.execute()
+
+    def take_dirty(self, slot_ids: Optional[Iterable[int]] = None) -> Dict[int, BufferedDraft]:
+        if slot_ids is None:
+            # SPOP hands each dirty slot to exactly one flushing worker
+            taken = [int(slot_id) for slot_id in self.client.spop(self._dirty_key, 1000) or []]
+        else:
+            taken = [slot_id for slot_id in slot_ids if self.client.srem(self._dirty_key, slot_id)]
+        if not taken:
+            return {}
+        raws = self.client.mget([self._key(slot_id) for slot_id in taken])
+        return {slot_id: BufferedDraft.from_json(raw) for slot_id, raw in zip(taken, raws) if raw}
+
+    def mark_dirty(self, slot_ids: Iterable[int]) -> None:
+        slot_ids = list(slot_ids)
+        if slot_ids:
+            self.client.sadd(self._dirty_key, *slot_ids)
+
+    def discard(self, slot_id: int) -> None:
+        pipe = self.client.pipeline()
+        pipe.delete(self._key(slot_id))
+        pipe.srem(self._dirty_key, slot_id)
+        pipe.execute()
+
+    def dirty_count(self) -> int:
+        return self.client.scard(self._dirty_key)
+
+    def clear(self) -> None:
+        self.client.delete(self._dirty_key)
+
+
+class DraftBuffer:
+    """Coalesces draft autosaves per slot and writes them back in batches"""
+
+    def __init__(self, store=None):
+        self._store = store
+        self.saves = 0
+        self.writes = 0
+        self.dropped = 0
+        self.flushes = 0
+        self.store_errors = 0
+        # Dirty count read by the /metrics gauge, refreshed on each scrape
+        self.last_dirty: Optional[int] = None
+
+    def _store_failed(self) -> None:
+        self.store_errors += 1
+        DRAFT_EVENTS.inc(event="store_error")
+
+    @property
+    def store(self):
+        if self._store is None:
+            if settings.DRAFT_BUFFER_USE_REDIS and redis_service.available:
+                self._store = RedisDraftStore(redis_service.client, settings.DRAFT_BUFFER_ENTRY_TTL_SECONDS)
+            else:
+                self._store = MemoryDraftStore(settings.DRAFT_BUFFER_ENTRY_TTL_SECONDS)
+        return self._store
+
+    def get(self, slot_id: int) -> Optional[BufferedDraft]:
+        """The slot's buffered draft, if any (None if the store is unreachable)"""
+        try:
+            return self.store.get(slot_id)
+        except Exception:
+            self._store_failed()
+            return None
+
+    def save(self, slot_id: int, entry: BufferedDraft) -> bool:
+        """
+        Buffer a draft, replacing any earlier one for the slot.
+
+        Returns False if the draft wasn't buffered (buffer disabled or store
+        unreachable); the caller must then write it to the database itself.
+        """
+        if not settings.DRAFT_BUFFER_ENABLED:
+            return False
+        try:
+            self.store.put(slot_id, entry)
+        except Exception:
+            self._store_failed()
+            return False
+        self.saves += 1
+        DRAFT_EVENTS.inc(event="saved")
+        return True
+
+    def discard(self, slot_id: int) -> None:
+        """Drop the slot's buffered draft (after a submit or abandon)."""
+        try:
+            self.store.discard(slot_id)
+        except Exception:
+            self._store_failed()
+
+    async def write(self, db: AsyncSession, slot_id: int, entry: BufferedDraft) -> bool:
+        """
+        Write a draft straight to the database (when save() returned False).
+
+        Returns False if the slot is no longer claimed by the draft's reviewer
+        or already holds a newer draft.
+        """
+        written = await self._update(db, slot_id, entry)
+        await db.commit()
+        if written:
+            self.writes += 1
+            DRAFT_EVENTS.inc(event="written")
+        return written
+
+    @staticmethod
+    async def _update(db: AsyncSession, slot_id: int, entry: BufferedDraft) -> bool:
+        values = {
+            "draft_sections": json.dumps(entry.draft),
+            "draft_saved_at": entry.saved_at,
+            "updated_at": entry.saved_at,
+        }
+        if entry.rating is not None:
+            values["rating"] = entry.rating
+        result = await db.execute(
+            update(ReviewSlot)
+            .where(
+                ReviewSlot.id == slot_id,
+                ReviewSlot.reviewer_id == entry.reviewer_id,
+                ReviewSlot.status == ReviewSlotStatus.CLAIMED.value,
+                or_(ReviewSlot.draft_saved_at.is_(None), ReviewSlot.draft_saved_at < entry.saved_at),
+            )
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    async def flush(self, db: AsyncSession, slot_ids: Optional[Iterable[int]] = None) -> int:
+        """
+        Write dirty drafts to the database in one transaction.
+
+        Args:
+            db: Database session
+            slot_ids: Only flush these slots (default: every dirty slot)
+
+        Returns:
+            Number of slots written
+        """
+        try:
+            entries = self.store.take_dirty(slot_ids)
+        except Exception:
+            self._store_failed()
+            return 0
+        if not entries:
+            return 0
+
+        written = 0
+        stale = []
+        try:
+            for slot_id, entry in entries.items():
+                if await self._update(db, slot_id, entry):
+                    written += 1
+                else:
+                    stale.append(slot_id)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            self.store.mark_dirty(entries)
+            raise
+
+        for slot_id in stale:
+            self.discard(slot_id)
+        self.writes += written
+        self.dropped += len(stale)
+        self.flushes += 1
+        DRAFT_EVENTS.inc(written, event="written")
+        DRAFT_EVENTS.inc(len(stale), event="dropped")
+        DRAFT_EVENTS.inc(event="flushed")
+        return written
+
+    def clear(self) -> None:
+        try:
+            self.store.clear()
+        except Exception:
+            self._store_failed()
+
+    def _dirty_count(self) -> Optional[int]:
+        try:
+            return self.store.dirty_count()
+        except Exception:
+            self._store_failed()
+            return None
+
+    async def refresh_metrics(self) -> None:
+        """Read the dirty count for the /metrics gauge (a Redis call with DRAFT_BUFFER_USE_REDIS)."""
+        self.last_dirty = await run_in_threadpool(self._dirty_count)
+
+    def stats(self) -> dict:
+        dirty = self._dirty_count()
+        return {
+            "enabled": settings.DRAFT_BUFFER_ENABLED,
+            "redis_enabled": isinstance(self.store, RedisDraftStore),
+            "dirty": dirty,
+            "saves": self.saves,
+            "writes": self.writes,
+            "dropped": self.dropped,
+            "flushes": self.flushes,
+            "store_errors": self.store_errors,
+        }
+
+
+class DraftFlusher:
+    """Background task flushing the draft buffer on an interval"""
+
+    def __init__(self, buffer: DraftBuffer, session_maker=None, interval: Optional[float] = None):
+        self.buffer = buffer
+        self.session_maker = session_maker
+        self.interval = interval if interval is not None else settings.DRAFT_BUFFER_FLUSH_SECONDS
+        self._task: Optional[asyncio.Task] = None
+        self._stopping: Optional[asyncio.Event] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start flushing on the running event loop."""
+        if self.running:
+            return
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Draft flusher started (every {self.interval}s)")
+
+    async def stop(self) -> None:
+        """Stop the task and write whatever is still buffered."""
+        if self.running:
+            self._stopping.set()
+            await self._task
+            self._task = None
+        await self.flush()
+        logger.info("Draft flusher stopped")
+
+    async def flush(self) -> int:
+        if self.session_maker is None:
+            from app.db.session import async_session_maker
+            self.session_maker = async_session_maker
+        async with self.session_maker() as db:
+            return await self.buffer.flush(db)
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+            if self._stopping.is_set():
+                return
+            try:
+                written = await self.flush()
+                if written:
+                    logger.debug("Flushed %d buffered draft(s)", written)
+            except Exception as e:
+                logger.error(f"Draft flush failed: {e}", exc_info=True)
+
+
+# Global draft buffer and flusher
+draft_buffer = DraftBuffer()
+draft_flusher = DraftFlusher(draft_buffer)
+
+metrics.on_collect(draft_buffer.refresh_metrics)
+metrics.gauge("draft_buffer_dirty", "Buffered drafts not yet written back", callback=lambda: draft_buffer.last_dirty)
@@ -4,6 +4,7 @@ import redis
 from typing import Optional
 from datetime import datetime, timedelta
 from app.core.config import settings
+from app.core.metrics import metrics
 
 
 class RedisService:
@@ -176,3 +177,5 @@ class RedisService:
 
 # Global Redis service instance
 redis_service = RedisService()
+
+metrics.gauge("redis_available", "1 if Redis was reachable at startup", callback=lambda: int(redis_service.available))
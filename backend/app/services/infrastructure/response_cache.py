@@ -0,0 +1,334 @@
+"""
+HTTP response cache for public read endpoints.
+
+Caches the serialized JSON body of GET endpoints and answers conditional
+requests with 304 Not Modified:
+
+    @router.get("/reviewers", response_model=ReviewerDirectoryResponse)
+    @cached_response("reviewers", ttl_seconds=300)
+    async def get_reviewer_directory(request: Request, ...):
+        ...
+
+    # In write paths:
+    await response_cache.invalidate("reviewers")
+
+- The key is the path plus the sorted query string; with per_user=True it
+  also includes the caller's user ID (anonymous callers share one entry)
+  and the response is marked private. private=True marks a shared entry
+  private too, for bodies shared caches must not keep (e.g. with emails)
+- Bodies are serialized through the route's response_model (with its
+  include/exclude options), exactly as FastAPI would send them
+- Each body gets a strong ETag; a matching If-None-Match returns 304
+- Entries live in an in-process LRU and, if RESPONSE_CACHE_USE_REDIS is
+  set and Redis is reachable, in Redis as a second level shared by all
+  workers. Redis calls run in the threadpool, off the event loop.
+- invalidate(namespace) bumps the namespace's version, which is part of
+  every key, so old entries are never served again. With Redis the
+  version is shared, so an invalidation reaches every worker.
+
+The decorated endpoint must take a `request: Request` parameter (as for
+slowapi's @limiter.limit). Endpoints returning a Response object bypass
+the cache. Endpoints serving bodies built ahead of time can return
+send_cached(request, CachedResponse.from_content(...), cache_control)
+for the same ETag/304 handling.
+
+Lookups, 304s, invalidations and Redis errors are exported on /metrics
+(http_response_cache_*).
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import logging
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.core.security import decode_access_token
+from app.services.infrastructure.redis_service import redis_service
+from app.services.infrastructure.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+REDIS_PREFIX = "respcache"
+
+CACHE_LOOKUPS = metrics.counter(
+    "http_response_cache_lookups_total",
+    "Response cache lookups by namespace and result (hit, redis_hit, miss)",
+    labelnames=("namespace", "result"),
+)
+CACHE_NOT_MODIFIED = metrics.counter("http_response_cache_not_modified_total", "Cached responses answered with 304")
+CACHE_INVALIDATIONS = metrics.counter(
+    "http_response_cache_invalidations_total",
+    "Response cache namespace invalidations",
+    labelnames=("namespace",),
+)
+CACHE_REDIS_ERRORS = metrics.counter("http_response_cache_redis_errors_total", "Failed response cache Redis calls")
+
+
+@dataclass
+class CachedResponse:
+    """A cached response body and its ETag"""
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_content(cls, content) -> "CachedResponse":
+        body = JSONResponse(content=jsonable_encoder(content)).body
+        return cls(body=body, etag=make_etag(body))
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches etag (weak comparison)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class ResponseCache:
+    """Two-level (in-process LRU, optional Redis) cache of response bodies"""
+
+    def __init__(self, max_entries: Optional[int] = None, redis=None):
+        self._local = TTLCache(
+            "http_responses",
+            ttl_seconds=60,
+            max_entries=max_entries or settings.RESPONSE_CACHE_MAX_ENTRIES,
+        )
+        self._redis = redis
+        self._versions: Dict[str, int] = {}
+        self.not_modified = 0
+        self.redis_hits = 0
+        self.redis_errors = 0
+
+    def _redis_failed(self) -> None:
+        self.redis_errors += 1
+        CACHE_REDIS_ERRORS.inc()
+
+    @property
+    def redis(self):
+        if self._redis is not None:
+            return self._redis
+        if settings.RESPONSE_CACHE_USE_REDIS and redis_service.available:
+            return redis_service.client
+        return None
+
+    def _shared_version(self, client, namespace: str) -> str:
+        try:
+            return client.get(f"{REDIS_PREFIX}:version:{namespace}") or "0"
+        except Exception:
+            self._redis_failed()
+            return "x"  # Redis unreachable: don't mix with entries keyed on its version
+
+    async def _full_key(self, namespace: str, key: str, client) -> str:
+        version = str(self._versions.get(namespace, 0))
+        if client is not None:
+            shared = await run_in_threadpool(self._shared_version, client, namespace)
+            version = f"{version}.{shared}"
+        return f"{namespace}:{version}:{key}"
+
+    def _redis_get(self, client, redis_key: str) -> Optional[str]:
+        try:
+            return client.get(redis_key)
+        except Exception:
+            self._redis_failed()
+            return None
+
+    def _redis_call(self, method: Callable, *args) -> None:
+        try:
+            method(*args)
+        except Exception:
+            self._redis_failed()
+
+    async def get(self, namespace: str, key: str) -> Optional[CachedResponse]:
+        client = self.redis
+        full_key = await self._full_key(namespace, key, client)
+        entry = self._local.get(full_key)
+        if entry is not None:
+            self._local.hits += 1
+            CACHE_LOOKUPS.inc(namespace=namespace, result="hit")
+            return entry
+
+        if client is not None:
+            raw = await run_in_threadpool(self._redis_get, client, f"{REDIS_PREFIX}:{full_key}")
+            if raw:
+                data = json.loads(raw)
+                entry = CachedResponse(body=data["body"].encode(), etag=data["etag"])
+                ttl = data.get("ttl", 60)
+                self._local.set(full_key, entry, ttl_seconds=ttl)
+                self._local.hits += 1
+                self.redis_hits += 1
+                CACHE_LOOKUPS.inc(namespace=namespace, result="redis_hit")
+                return entry
+
+        self._local.misses += 1
+        CACHE_LOOKUPS.inc(namespace=namespace, result="miss")
+        return None
+
+    async def set(self, namespace: str, key: str, entry: CachedResponse, ttl_seconds: float) -> None:
+        client = self.redis
+        full_key = await self._full_key(namespace, key, client)
+        self._local.set(full_key, entry, ttl_seconds=ttl_seconds)
+
+        if client is not None:
+            payload = json.dumps({
+                "body": entry.body.decode(),
+                "etag": entry.etag,
+                "ttl": ttl_seconds,
+            })
+            await run_in_threadpool(
+                self._redis_call, client.setex, f"{REDIS_PREFIX}:{full_key}", int(ttl_seconds), payload
+            )
+
+    async def invalidate(self, *namespaces: str) -> None:
+        """Stop serving every cached response in the given namespaces"""
+        client = self.redis
+        for namespace in namespaces:
+            self._versions[namespace] = self._versions.get(namespace, 0) + 1
+            self._local.invalidations += 1
+            CACHE_INVALIDATIONS.inc(namespace=namespace)
+            if client is not None:
+                await run_in_threadpool(self._redis_call, client.incr, f"{REDIS_PREFIX}:version:{namespace}")
+
+    def clear(self) -> None:
+        self._local.clear()
+        self._versions.clear()
+
+    def stats(self) -> dict:
+        stats = self._local.stats()
+        stats.update({
+            "not_modified": self.not_modified,
+            "redis_enabled": self.redis is not None,
+            "redis_hits": self.redis_hits,
+            "redis_errors": self.redis_errors,
+        })
+        return stats
+
+
+# Global response cache instance
+response_cache = ResponseCache()
+
+metrics.gauge(
+    "http_response_cache_entries",
+    "Responses held in this worker's in-process cache",
+    callback=lambda: len(response_cache._local._entries),
+)
+
+
+def _caller_id(request: Request) -> str:
+    """User ID from the access token cookie, or 'anon' (mirrors get_current_user_optional)"""
+    token = request.cookies.get("access_token")
+    if not token or redis_service.is_token_blacklisted(token):
+        return "anon"
+    payload = decode_access_token(token)
+    user_id = payload.get("user_id") if payload else None
+    return str(user_id) if user_id is not None else "anon"
+
+
+def _request_key(request: Request, per_user: bool) -> str:
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    key = f"{request.url.path}?{query}"
+    if per_user:
+        key = f"{key}#user={_caller_id(request)}"
+    return key
+
+
+def send_cached(request: Request, entry: CachedResponse, cache_control: str, per_user: bool = False) -> Response:
+    """Send a cached body with its ETag, or 304 if the client already has it"""
+    headers = {"ETag": entry.etag, "Cache-Control": cache_control}
+    if per_user:
+        headers["Vary"] = "Cookie"
+
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        response_cache.not_modified += 1
+        CACHE_NOT_MODIFIED.inc()
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+async def _serialize(request: Request, result) -> CachedResponse:
+    """Serialize an endpoint's return value as its route would (response_model and options)"""
+    route = request.scope.get("route")
+    field = getattr(route, "response_field", None)
+    if field is None:
+        return CachedResponse.from_content(result)
+
+    content = await serialize_response(
+        field=field,
+        response_content=result,
+        include=route.response_model_include,
+        exclude=route.response_model_exclude,
+        by_alias=route.response_model_by_alias,
+        exclude_unset=route.response_model_exclude_unset,
+        exclude_defaults=route.response_model_exclude_defaults,
+        exclude_none=route.response_model_exclude_none,
+    )
+    return CachedResponse.from_content(content)
+
+
+def cached_response(
+    namespace: str,
+    ttl_seconds: float,
+    per_user: bool = False,
+    max_age: Optional[int] = None,
+    private: bool = False,
+) -> Callable:
+    """
+    Cache a GET endpoint's JSON response and serve ETag/304.
+
+    Args:
+        namespace: Invalidation group (see ResponseCache.invalidate)
+        ttl_seconds: How long the server keeps an entry
+        per_user: Vary the cache by the signed-in user (for responses that
+            include viewer-specific fields); responses become private
+        max_age: Cache-Control max-age for clients (defaults to ttl_seconds)
+        private: Mark responses private even though all callers share an
+            entry, so proxies and CDNs don't store them
+    """
+    client_max_age = int(max_age if max_age is not None else ttl_seconds)
+    cache_control = f"{'private' if per_user or private else 'public'}, max-age={client_max_age}"
+
+    def decorator(endpoint: Callable) -> Callable:
+        if "request" not in inspect.signature(endpoint).parameters:
+            raise TypeError(f"{endpoint.__name__} must take a 'request: Request' parameter to be cached")
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            request: Request = kwargs["request"]
+            if not settings.RESPONSE_CACHE_ENABLED or request.method != "GET":
+                return await endpoint(*args, **kwargs)
+
+            key = _request_key(request, per_user)
+            entry = await response_cache.get(namespace, key)
+            if entry is None:
+                result = await endpoint(*args, **kwargs)
+                if isinstance(result, Response):
+                    return result
+                entry = await _serialize(request, result)
+                await response_cache.set(namespace, key, entry, ttl_seconds)
+
+            return send_cached(request, entry, cache_control, per_user)
+
+        return wrapper
+
+    return decorator
@@ -5,24 +5,62 @@ Handles:
 - Abandoning claimed reviews after timeout (72 hours default)
 - Auto-accepting submitted reviews after timeout (7 days default)
 - Sending daily and weekly email digests
+- Rebuilding Reviewer DNA statistics weekly (drift correction)
+- Applying reputation decay and refreshing sparks percentiles daily
+- Refreshing listed reviewers' denormalized directory stats daily
+- Rebuilding reviewer/requester rating stats weekly (drift correction)
 """
 
+import functools
 import logging
+import time
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import async_session_maker
 from app.crud.review_slot import process_expired_claims, process_auto_accepts
+from app.core.metrics import metrics
 from app.core.scheduler_config import scheduler_settings
 from app.services.committee_service import CommitteeService
+from app.services.gamification.sparks_service import SparksService
 from app.services.notifications.email_digest import send_daily_digests, send_weekly_digests
+from app.services.ratings.reviewer_dna_service import ReviewerDNAService
+from app.services.reviewer_directory_service import ReviewerDirectoryService
 
 logger = logging.getLogger(__name__)
 
 # Initialize scheduler
 scheduler = AsyncIOScheduler()
 
+JOB_DURATION = metrics.histogram(
+    "scheduler_job_duration_seconds",
+    "Background job run time",
+    labelnames=("job",),
+    buckets=(0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0, 900.0, 3600.0),
+)
+metrics.gauge("scheduler_running", "1 if the background job scheduler is running", callback=lambda: int(scheduler.running))
+metrics.gauge(
+    "scheduler_jobs",
+    "Scheduled background jobs",
+    callback=lambda: len(scheduler.get_jobs()) if scheduler.running else 0,
+)
+
+
+def timed_job(func):
+    """Record each run's duration in scheduler_job_duration_seconds."""
+    job = func.__name__.removesuffix("_job")
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            JOB_DURATION.observe(time.perf_counter() - started, job=job)
+
+    return wrapper
+
 
 async def get_db_session() -> AsyncSession:
     """
@@ -123,6 +161,56 @@ def start_background_jobs():
     )
     logger.info("Scheduled job: send_weekly_digests (every hour at :10)")
 
+    # Job 6: Rebuild Reviewer DNA statistics (weekly, Sunday at 3:30 AM)
+    # DNA is kept current incrementally; this corrects any drift
+    scheduler.add_job(
+        recalculate_reviewer_dna_job,
+        CronTrigger(day_of_week='sun', hour=3, minute=30),
+        id='recalculate_reviewer_dna',
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+        misfire_grace_time=3600  # 1 hour grace period
+    )
+    logger.info("Scheduled job: recalculate_reviewer_dna (weekly, Sunday at 3:30 AM)")
+
+    # Job 7: Reputation decay and sparks percentiles (daily at 4:15 AM)
+    scheduler.add_job(
+        update_reputation_job,
+        CronTrigger(hour=4, minute=15),
+        id='update_reputation',
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+        misfire_grace_time=3600  # 1 hour grace period
+    )
+    logger.info("Scheduled job: update_reputation (daily at 4:15 AM)")
+
+    # Job 8: Refresh reviewer directory stats (daily at 4:45 AM)
+    scheduler.add_job(
+        refresh_reviewer_stats_job,
+        CronTrigger(hour=4, minute=45),
+        id='refresh_reviewer_stats',
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+        misfire_grace_time=3600  # 1 hour grace period
+    )
+    logger.info("Scheduled job: refresh_reviewer_stats (daily at 4:45 AM)")
+
+    # Job 9: Rebuild rating stats (weekly, Sunday at 4:00 AM)
+    # Ratings are applied incrementally; this corrects any drift
+    scheduler.add_job(
+        recalculate_rating_stats_job,
+        CronTrigger(day_of_week='sun', hour=4, minute=0),
+        id='recalculate_rating_stats',
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+        misfire_grace_time=3600  # 1 hour grace period
+    )
+    logger.info("Scheduled job: recalculate_rating_stats (weekly, Sunday at 4:00 AM)")
+
     # Start the scheduler
     scheduler.start()
     logger.info("Background job scheduler started successfully")
@@ -142,6 +230,7 @@ def stop_background_jobs():
     logger.info("Background job scheduler stopped successfully")
 
 
+@timed_job
 async def process_expired_claims_job():
     """
     Background job: Mark expired claims as abandoned
@@ -174,6 +263,7 @@ async def process_expired_claims_job():
         )
 
 
+@timed_job
 async def process_auto_accepts_job():
     """
     Background job: Auto-accept submitted reviews after timeout
@@ -208,6 +298,7 @@ async def process_auto_accepts_job():
         )
 
 
+@timed_job
 async def process_stale_application_claims_job():
     """
     Background job: Auto-release stale expert application review claims
@@ -242,6 +333,7 @@ async def process_stale_application_claims_job():
         )
 
 
+@timed_job
 async def send_daily_digests_job():
     """
     Background job: Send daily email digests
@@ -269,6 +361,7 @@ async def send_daily_digests_job():
         )
 
 
+@timed_job
 async def send_weekly_digests_job():
     """
     Background job: Send weekly email digests
@@ -296,6 +389,115 @@ async def send_weekly_digests_job():
         )
 
 
+@timed_job
+async def recalculate_reviewer_dna_job():
+    """
+    Background job: Rebuild Reviewer DNA statistics from review history
+
+    This job runs weekly and streams all completed review slots, rebuilding
+    each reviewer's running statistics and DNA dimensions. Slot events keep
+    DNA current between runs; this pass corrects drift.
+    """
+    try:
+        async with async_session_maker() as db:
+            count = await ReviewerDNAService(db).recalculate_all_dna()
+            logger.info(f"Recalculated Reviewer DNA for {count} reviewer(s)")
+
+    except Exception as e:
+        logger.error(
+            f"Error in recalculate_reviewer_dna job: {e}",
+            exc_info=True,
+            extra={
+                "job": "recalculate_reviewer_dna",
+                "error_type": type(e).__name__
+            }
+        )
+
+
+@timed_job
+async def update_reputation_job():
+    """
+    Background job: Apply reputation decay and refresh sparks percentiles
+
+    This job runs daily and:
+    - Decays reputation for users inactive past the decay threshold
+      (at most one weekly step per user per week)
+    - Recomputes reputation_percentile for all active users in one query
+    """
+    try:
+        async with async_session_maker() as db:
+            service = SparksService(db)
+            decayed = await service.apply_reputation_decay_batch()
+            ranked = await service.recalculate_percentiles()
+            logger.info(f"Applied reputation decay to {decayed} user(s), ranked {ranked} user(s)")
+
+    except Exception as e:
+        logger.error(
+            f"Error in update_reputation job: {e}",
+            exc_info=True,
+            extra={
+                "job": "update_reputation",
+                "error_type": type(e).__name__
+            }
+        )
+
+
+@timed_job
+async def refresh_reviewer_stats_job():
+    """
+    Background job: Recompute listed reviewers' directory stats
+
+    This job runs daily and rewrites total reviews, average rating and
+    average response time on each listed reviewer's user row, a page of
+    reviewers per aggregate query, so directory filters and sorts don't
+    depend on reviewers refreshing their own stats.
+    """
+    try:
+        async with async_session_maker() as db:
+            count = await ReviewerDirectoryService(db).refresh_listed_reviewer_stats()
+            logger.info("Refreshed directory stats for %d reviewer(s)", count)
+
+    except Exception as e:
+        logger.error(
+            f"Error in refresh_reviewer_stats job: {e}",
+            exc_info=True,
+            extra={
+                "job": "refresh_reviewer_stats",
+                "error_type": type(e).__name__
+            }
+        )
+
+
+@timed_job
+async def recalculate_rating_stats_job():
+    """
+    Background job: Rebuild reviewer and requester rating stats
+
+    This job runs weekly and recomputes rating sums, counts and averages
+    (and the users' avg_rating) from the rating tables. Each new rating
+    updates them incrementally; this pass corrects drift.
+    """
+    from app.services.ratings import RequesterRatingService, ReviewerRatingService
+
+    try:
+        async with async_session_maker() as db:
+            reviewers = await ReviewerRatingService(db).recalculate_all_stats()
+            requesters = await RequesterRatingService(db).recalculate_all_stats()
+            logger.info(
+                "Recalculated rating stats for %d reviewer(s) and %d requester(s)", reviewers, requesters
+            )
+
+    except Exception as e:
+        logger.error(
+            f"Error in recalculate_rating_stats job: {e}",
+            exc_info=True,
+            extra={
+                "job": "recalculate_rating_stats",
+                "error_type": type(e).__name__
+            }
+        )
+
+
 # ===== Manual Trigger Functions (for testing/admin use) =====
 
 async def trigger_expired_claims_now():
@@ -361,6 +563,54 @@ async def trigger_weekly_digests_now():
     await send_weekly_digests_job()
 
 
+async def trigger_reviewer_dna_now():
+    """
+    Manually trigger a full Reviewer DNA rebuild
+
+    Useful for:
+    - Seeding DNA statistics after the running-stats migration
+    - Admin manual intervention
+    """
+    logger.info("Manually triggering Reviewer DNA rebuild...")
+    await recalculate_reviewer_dna_job()
+
+
+async def trigger_reputation_update_now():
+    """
+    Manually trigger reputation decay and percentile recomputation
+
+    Useful for:
+    - Seeding reputation_percentile after deploy
+    - Admin manual intervention
+    """
+    logger.info("Manually triggering reputation update...")
+    await update_reputation_job()
+
+
+async def trigger_reviewer_stats_now():
+    """
+    Manually trigger a directory stats refresh
+
+    Useful for:
+    - Seeding denormalized stats after deploy
+    - Admin manual intervention
+    """
+    logger.info("Manually triggering reviewer stats refresh...")
+    await refresh_reviewer_stats_job()
+
+
+async def trigger_rating_stats_now():
+    """
+    Manually trigger a rating stats rebuild
+
+    Useful for:
+    - Checking the incremental aggregates after a data fix
+    - Admin manual intervention
+    """
+    logger.info("Manually triggering rating stats rebuild...")
+    await recalculate_rating_stats_job()
+
+
 def get_scheduler_status() -> dict:
     """
     Get current scheduler status and job information
@@ -0,0 +1,135 @@
+"""
+In-process TTL cache for computed read models.
+
+For pages and aggregates that are expensive to build and may be a few
+minutes stale (directory listings, leaderboards, dashboard stats).
+
+- Entries expire after ttl_seconds (overridable per call)
+- Concurrent misses for the same key share one load
+- clear()/invalidate() also discard loads that were in flight, so a
+  result computed before a write isn't cached after it
+- The least recently used entry is evicted beyond max_entries
+
+Each worker process has its own cache; an invalidation only reaches the
+worker that made the change, so the TTL bounds staleness elsewhere.
+
+Usage:
+    from app.services.infrastructure.ttl_cache import TTLCache
+
+    cache = TTLCache("reviewer_directory", ttl_seconds=300)
+    page = await cache.get_or_load(key, lambda: build_page(db, ...))
+    cache.clear()
+    cache.stats()
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Async single-flight cache with per-entry expiry"""
+
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: float,
+        max_entries: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        # key -> (expires_at, value)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl_seconds: Optional[float] = None,
+    ) -> Any:
+        """
+        Return the cached value for key, calling loader() on a miss.
+
+        Errors from loader() propagate to every waiter and are not cached.
+        """
+        value = self.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.hits += 1
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        self.loads += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except BaseException as e:
+            future.set_exception(e)
+            # Waiters (if any) re-raise it; don't warn about an unretrieved exception
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            # Only store if nothing invalidated the key while loading
+            if self._inflight.get(key) is future and value is not None:
+                self.set(key, value, ttl_seconds)
+            return value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop one key (and ignore the result of a load already running for it)"""
+        self.invalidations += 1
+        self._entries.pop(key, None)
+        self._inflight.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry and ignore the results of loads already running"""
+        self.invalidations += 1
+        self._entries.clear()
+        self._inflight.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "loads": self.loads,
+            "invalidations": self.invalidations,
+        }
@@ -115,8 +115,8 @@ class NotificationService:
             await self.db.refresh(notification)
 
             logger.info(
-                f"Created notification {notification.id} for user {user_id}: "
-                f"{notification_type.value} (channels: {enabled_channels})"
+                "Created notification %s for user %s: %s (channels: %s)",
+                notification.id, user_id, notification_type.value, enabled_channels,
             )
 
             # Deliver notification through enabled channels
@@ -166,7 +166,7 @@ class NotificationService:
                 logger.error(f"Error creating bulk notification for user {user_id}: {e}")
                 continue
 
-        logger.info(f"Created {len(notifications)} bulk notifications of type {notification_type.value}")
+        logger.info("Created %d bulk notifications of type %s", len(notifications), notification_type.value)
         return notifications
 
     # ==================== Channel Delivery ====================
@@ -221,9 +221,9 @@ class NotificationService:
             await self._send_immediate_email(notification)
         else:
             # Notification is already in database and will be included in next digest
-            logger.info(
-                f"Notification {notification.id} queued for email digest "
-                f"({prefs.email_digest_frequency.value})"
+            logger.debug(
+                "Notification %s queued for email digest (%s)",
+                notification.id, prefs.email_digest_frequency.value,
             )
 
     async def _send_immediate_email(self, notification: Notification) -> None:
@@ -248,7 +248,7 @@ class NotificationService:
             )
 
             if success:
-                logger.info(f"Email notification {notification.id} sent to {user.email}")
+                logger.info("Email notification %s sent to %s", notification.id, user.email)
             else:
                 logger.warning(f"Failed to send email notification {notification.id} to {user.email}")
 
@@ -302,13 +302,13 @@ class NotificationService:
 
     async def _send_push_notification(self, notification: Notification) -> None:
         """Send push notification (placeholder for future implementation)"""
-        logger.info(f"Push notification {notification.id} - not yet implemented")
+        logger.debug("Push notification %s - not yet implemented", notification.id)
         # TODO: Implement push notification via Firebase Cloud Messaging or similar
         pass
 
     async def _send_sms_notification(self, notification: Notification) -> None:
         """Send SMS notification (placeholder for future implementation)"""
-        logger.info(f"SMS notification {notification.id} - not yet implemented")
+        logger.debug("SMS notification %s - not yet implemented", notification.id)
         # TODO: Implement SMS via Twilio or similar
         pass
 
@@ -534,7 +534,7 @@ class NotificationService:
 
         if count > 0:
             await self.db.commit()
-            logger.info(f"Marked {count} notifications as read for user {user_id}")
+            logger.info("Marked %d notifications as read for user %s", count, user_id)
 
         return count
 
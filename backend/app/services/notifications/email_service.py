@@ -14,6 +14,7 @@ Setup:
 
 import asyncio
 import logging
+import time
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timezone
 from pathlib import Path
@@ -21,6 +22,7 @@ from pathlib import Path
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
 from app.core.config import settings
+from app.core.metrics import observe_external_call
 
 logger = logging.getLogger(__name__)
 
@@ -205,20 +207,13 @@ class EmailService:
         """
         Development email sender - logs to console and saves to file
         """
-        logger.info("=" * 80)
-        logger.info("DEVELOPMENT EMAIL")
-        logger.info("=" * 80)
-        logger.info(f"From: {self.email_from}")
-        logger.info(f"To: {to_email}")
-        logger.info(f"Subject: {subject}")
-        logger.info("-" * 80)
-        logger.info("HTML Content:")
-        logger.info(html_content)
-        if text_content:
-            logger.info("-" * 80)
-            logger.info("Text Content:")
-            logger.info(text_content)
-        logger.info("=" * 80)
+        # One record (one write) for the whole email
+        logger.info(
+            "DEVELOPMENT EMAIL\n%s\nFrom: %s\nTo: %s\nSubject: %s\n%s\nHTML Content:\n%s%s\n%s",
+            "=" * 80, self.email_from, to_email, subject, "-" * 80, html_content,
+            f"\n{'-' * 80}\nText Content:\n{text_content}" if text_content else "",
+            "=" * 80,
+        )
 
         # Save to file with timestamp
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
@@ -235,7 +230,7 @@ class EmailService:
             f.write(f"-->\n\n")
             f.write(html_content)
 
-        logger.info(f"Email saved to: {filepath}")
+        logger.info("Email saved to: %s", filepath)
         return True
 
     async def _send_email_production(
@@ -280,13 +275,15 @@ class EmailService:
         # Send with retry logic
         last_exception = None
         for attempt in range(MAX_RETRIES):
+            started = time.perf_counter()
             try:
                 response = resend.Emails.send(params)
+                observe_external_call("email", "send", "ok" if response and response.get("id") else "no_id", started)
 
                 if response and response.get("id"):
                     logger.info(
-                        f"Email sent successfully. ID: {response['id']}, "
-                        f"To: {to_email}, Attempt: {attempt + 1}"
+                        "Email sent successfully. ID: %s, To: %s, Attempt: %d",
+                        response["id"], to_email, attempt + 1,
                     )
                     return True
                 else:
@@ -298,6 +295,7 @@ class EmailService:
                     return False
 
             except Exception as e:
+                observe_external_call("email", "send", "error", started)
                 last_exception = e
 
                 # Check if error is retryable
@@ -297,9 +297,7 @@ async def send_notification(
             entity_type=entity_type,
             entity_id=entity_id,
         )
-        logger.info(
-            f"Sent {notification_type.value} notification to user {recipient_id}"
-        )
+        logger.info("Sent %s notification to user %s", notification_type.value, recipient_id)
         return True
     except Exception as e:
         logger.error(
@@ -0,0 +1,231 @@
+"""
+Connect Balance Cache.
+
+Per-account cache for Stripe Connect balances and payout history, which
+reviewers load on every earnings page view.
+
+- Entries are fresh for STRIPE_BALANCE_CACHE_TTL_SECONDS
+- Webhooks (balance.available, payout.*, transfer.*) invalidate an account
+  immediately via invalidate()
+- Expired or invalidated entries are kept for STRIPE_BALANCE_CACHE_STALE_SECONDS
+  and served if Stripe fails or doesn't answer within
+  STRIPE_BALANCE_CACHE_REFRESH_TIMEOUT_SECONDS
+- Concurrent misses for the same key share one upstream request
+
+The cache is in-process, so in multi-worker deployments an invalidation
+only reaches the worker that received the webhook; the TTL bounds how
+stale other workers can be.
+
+Usage:
+    from app.services.payments.balance_cache import balance_cache
+
+    balance = await balance_cache.get(account_id, "balance", fetch_balance)
+    balance_cache.invalidate(account_id)
+    balance_cache.stats()
+
+Hit, stale-hit and miss counts, invalidations and upstream latency are
+also exported on /metrics (stripe_balance_cache_*).
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import stripe
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.services.payments.base import logger
+
+CacheKey = Tuple[str, str]
+
+CACHE_LOOKUPS = metrics.counter(
+    "stripe_balance_cache_lookups_total",
+    "Connect balance cache lookups by result (hit, stale_hit, miss)",
+    labelnames=("result",),
+)
+CACHE_INVALIDATIONS = metrics.counter("stripe_balance_cache_invalidations_total", "Accounts invalidated by webhooks")
+UPSTREAM_DURATION = metrics.histogram(
+    "stripe_balance_cache_upstream_seconds",
+    "Stripe fetches made on cache misses and refreshes",
+    labelnames=("outcome",),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+
+@dataclass
+class _Entry:
+    value: Any
+    fetched_at: float
+    fresh: bool = True
+
+
+class ConnectBalanceCache:
+    """TTL cache keyed by (Connect account, kind) with stale fallback"""
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[float] = None,
+        stale_seconds: Optional[float] = None,
+        refresh_timeout_seconds: Optional[float] = None,
+        max_entries: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.STRIPE_BALANCE_CACHE_TTL_SECONDS
+        self.stale_seconds = stale_seconds if stale_seconds is not None else settings.STRIPE_BALANCE_CACHE_STALE_SECONDS
+        self.refresh_timeout_seconds = (
+            refresh_timeout_seconds if refresh_timeout_seconds is not None
+            else settings.STRIPE_BALANCE_CACHE_REFRESH_TIMEOUT_SECONDS
+        )
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: Dict[CacheKey, _Entry] = {}
+        self._inflight: Dict[CacheKey, asyncio.Future] = {}
+        # Bumped on invalidation so a fetch started before it isn't stored as fresh
+        self._generations: Dict[str, int] = {}
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.upstream_calls = 0
+        self.upstream_errors = 0
+        self.upstream_latency_total = 0.0
+        self.upstream_latency_max = 0.0
+
+    async def get(self, account_id: str, kind: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Get a cached value, fetching it from Stripe when missing or expired.
+
+        Args:
+            account_id: Stripe Connect account ID
+            kind: What is cached for the account (e.g. "balance", "payouts:10")
+            fetch: Coroutine function loading the value from Stripe
+
+        Returns:
+            The cached or freshly fetched value
+
+        Raises:
+            stripe.StripeError: If Stripe fails and there is no stale value to serve
+        """
+        key = (account_id, kind)
+        entry = self._entries.get(key)
+        age = self._clock() - entry.fetched_at if entry else None
+
+        if entry and entry.fresh and age < self.ttl_seconds:
+            self.hits += 1
+            CACHE_LOOKUPS.inc(result="hit")
+            return entry.value
+
+        if entry and age < self.stale_seconds:
+            try:
+                value = await asyncio.wait_for(
+                    asyncio.shield(self._refresh(key, fetch)),
+                    timeout=self.refresh_timeout_seconds,
+                )
+            except (asyncio.TimeoutError, stripe.StripeError) as e:
+                # The refresh keeps running in the background and fills the cache
+                self.stale_hits += 1
+                CACHE_LOOKUPS.inc(result="stale_hit")
+                logger.warning(f"Serving stale Stripe {kind} for {account_id}: {str(e) or 'refresh timed out'}")
+                return entry.value
+            self.misses += 1
+            CACHE_LOOKUPS.inc(result="miss")
+            return value
+
+        self.misses += 1
+        CACHE_LOOKUPS.inc(result="miss")
+        return await self._refresh(key, fetch)
+
+    def invalidate(self, account_id: str) -> None:
+        """Mark every cached value for an account as expired (kept as stale fallback)."""
+        self._generations[account_id] = self._generations.get(account_id, 0) + 1
+        self.invalidations += 1
+        CACHE_INVALIDATIONS.inc()
+        for (entry_account, _), entry in self._entries.items():
+            if entry_account == account_id:
+                entry.fresh = False
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        self._entries.clear()
+        self._generations.clear()
+        self._reset_counters()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit ratio and upstream latency figures for monitoring."""
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_ratio": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "upstream_calls": self.upstream_calls,
+            "upstream_errors": self.upstream_errors,
+            "upstream_latency_avg_ms": (
+                round(self.upstream_latency_total / self.upstream_calls * 1000, 1)
+                if self.upstream_calls else 0.0
+            ),
+            "upstream_latency_max_ms": round(self.upstream_latency_max * 1000, 1),
+        }
+
+    def _refresh(self, key: CacheKey, fetch: Callable[[], Awaitable[Any]]) -> asyncio.Future:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, fetch))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._refresh_done(key, done))
+        return task
+
+    def _refresh_done(self, key: CacheKey, task: asyncio.Future) -> None:
+        self._inflight.pop(key, None)
+        # Mark a background refresh's error as retrieved; callers waiting on it still see it
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch(self, key: CacheKey, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        account_id = key[0]
+        generation = self._generations.get(account_id, 0)
+        started = time.perf_counter()
+        self.upstream_calls += 1
+        outcome = "error"
+        try:
+            value = await fetch()
+            outcome = "ok"
+        except Exception:
+            self.upstream_errors += 1
+            raise
+        finally:
+            latency = time.perf_counter() - started
+            self.upstream_latency_total += latency
+            self.upstream_latency_max = max(self.upstream_latency_max, latency)
+            UPSTREAM_DURATION.observe(latency, outcome=outcome)
+
+        self._store(key, _Entry(
+            value=value,
+            fetched_at=self._clock(),
+            fresh=self._generations.get(account_id, 0) == generation,
+        ))
+        return value
+
+    def _store(self, key: CacheKey, entry: _Entry) -> None:
+        self._entries[key] = entry
+        if len(self._entries) <= self.max_entries:
+            return
+        # Drop entries past the stale window, then the oldest if still over
+        now = self._clock()
+        for stale_key in [k for k, e in self._entries.items() if now - e.fetched_at >= self.stale_seconds]:
+            del self._entries[stale_key]
+        while len(self._entries) > self.max_entries:
+            oldest = min(self._entries, key=lambda k: self._entries[k].fetched_at)
+            del self._entries[oldest]
+
+
+# Global cache instance
+balance_cache = ConnectBalanceCache()
+metrics.gauge("stripe_balance_cache_entries", "Cached Connect balance entries", callback=lambda: len(balance_cache._entries))
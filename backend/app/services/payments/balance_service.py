@@ -2,6 +2,9 @@
 Balance Service.
 
 Handles balance inquiries and payout history for reviewers.
+
+Results are cached per Connect account (see balance_cache) and
+invalidated by balance, payout and transfer webhooks.
 """
 
 from datetime import datetime
@@ -12,6 +15,8 @@ import stripe
 
 from app.models.user import User
 from app.services.payments.base import logger
+from app.services.payments.balance_cache import balance_cache
+from app.services.payments.stripe_client import get_stripe_client
 
 
 class BalanceService:
@@ -34,28 +39,15 @@ class BalanceService:
                 "pending_balance": Decimal("0")
             }
 
+        account_id = user.stripe_connect_account_id
+
         try:
-            balance = stripe.Balance.retrieve(
-                stripe_account=user.stripe_connect_account_id
+            return await balance_cache.get(
+                account_id,
+                "balance",
+                lambda: BalanceService._fetch_balance(account_id)
             )
 
-            # Get USD balances (Stripe returns amounts in cents)
-            available = Decimal("0")
-            pending = Decimal("0")
-
-            for item in balance.available:
-                if item.currency == "usd":
-                    available = Decimal(item.amount) / 100
-
-            for item in balance.pending:
-                if item.currency == "usd":
-                    pending = Decimal(item.amount) / 100
-
-            return {
-                "available_balance": available,
-                "pending_balance": pending
-            }
-
         except stripe.StripeError as e:
             logger.error(f"Failed to get balance for user {user.id}: {e}")
             return {
@@ -81,23 +73,56 @@ class BalanceService:
         if not user.stripe_connect_account_id:
             return []
 
+        account_id = user.stripe_connect_account_id
+
         try:
-            payouts = stripe.Payout.list(
-                limit=limit,
-                stripe_account=user.stripe_connect_account_id
+            return await balance_cache.get(
+                account_id,
+                f"payouts:{limit}",
+                lambda: BalanceService._fetch_payouts(account_id, limit)
             )
 
-            return [
-                {
-                    "payout_id": p.id,
-                    "amount": Decimal(p.amount) / 100,
-                    "status": p.status,
-                    "created_at": datetime.fromtimestamp(p.created),
-                    "arrival_date": datetime.fromtimestamp(p.arrival_date) if p.arrival_date else None
-                }
-                for p in payouts.data
-            ]
-
         except stripe.StripeError as e:
             logger.error(f"Failed to get payout history for user {user.id}: {e}")
             return []
+
+    @staticmethod
+    async def _fetch_balance(account_id: str) -> Dict[str, Decimal]:
+        balance = await get_stripe_client().retrieve_balance(
+            stripe_account=account_id
+        )
+
+        # Get USD balances (Stripe returns amounts in cents)
+        available = Decimal("0")
+        pending = Decimal("0")
+
+        for item in balance.available:
+            if item.currency == "usd":
+                available = Decimal(item.amount) / 100
+
+        for item in balance.pending:
+            if item.currency == "usd":
+                pending = Decimal(item.amount) / 100
+
+        return {
+            "available_balance": available,
+            "pending_balance": pending
+        }
+
+    @staticmethod
+    async def _fetch_payouts(account_id: str, limit: int) -> List[Dict[str, Any]]:
+        payouts = await get_stripe_client().list_payouts(
+            limit=limit,
+            stripe_account=account_id
+        )
+
+        return [
+            {
+                "payout_id": p.id,
+                "amount": Decimal(p.amount) / 100,
+                "status": p.status,
+                "created_at": datetime.fromtimestamp(p.created),
+                "arrival_date": datetime.fromtimestamp(p.arrival_date) if p.arrival_date else None
+            }
+            for p in payouts.data
+        ]
@@ -1,14 +1,10 @@
 """
 Base module for payment services.
 
-Contains shared utilities and Stripe initialization.
+Contains shared utilities. Stripe API calls go through the async
+client in app.services.payments.stripe_client.
 """
 
 import logging
-import stripe
-from app.core.config import settings
 
 logger = logging.getLogger(__name__)
-
-# Initialize Stripe
-stripe.api_key = settings.STRIPE_API_KEY
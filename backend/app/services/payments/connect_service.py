@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
 from app.services.payments.base import logger
+from app.services.payments.stripe_client import get_stripe_client
 from app.core.exceptions import InvalidStateError
 
 
@@ -35,7 +36,8 @@ class StripeConnectService:
         if user.stripe_connect_account_id:
             return user.stripe_connect_account_id
 
-        account = stripe.Account.create(
+        account = await get_stripe_client().create_account(
+            idempotency_key=f"connect-account-user-{user.id}",
             type="express",
             email=user.email,
             capabilities={
@@ -78,7 +80,7 @@ class StripeConnectService:
         if not user.stripe_connect_account_id:
             await StripeConnectService.create_connect_account(user, db)
 
-        account_link = stripe.AccountLink.create(
+        account_link = await get_stripe_client().create_account_link(
             account=user.stripe_connect_account_id,
             refresh_url=refresh_url,
             return_url=return_url,
@@ -104,7 +106,7 @@ class StripeConnectService:
         if not user.stripe_connect_account_id:
             raise InvalidStateError(message="User does not have a Connect account")
 
-        login_link = stripe.Account.create_login_link(
+        login_link = await get_stripe_client().create_login_link(
             user.stripe_connect_account_id
         )
 
@@ -134,7 +136,7 @@ class StripeConnectService:
             }
 
         try:
-            account = stripe.Account.retrieve(user.stripe_connect_account_id)
+            account = await get_stripe_client().retrieve_account(user.stripe_connect_account_id)
 
             is_onboarded = account.details_submitted
             payouts_enabled = account.payouts_enabled
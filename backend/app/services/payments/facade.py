@@ -5,7 +5,7 @@ Provides backward-compatible interface that delegates to specialized services.
 """
 
 from decimal import Decimal
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -110,6 +110,19 @@ class PaymentFacade:
             db=db
         )
 
+    @staticmethod
+    async def handle_connect_balance_event(
+        event_type: str,
+        event_object: Dict[str, Any],
+        connected_account: Optional[str] = None
+    ) -> None:
+        """Handle balance.available, payout.* and transfer.* webhooks."""
+        return await PaymentWebhookHandlers.handle_connect_balance_event(
+            event_type=event_type,
+            event_object=event_object,
+            connected_account=connected_account
+        )
+
     # ===== Payment Release (to Reviewer) =====
 
     @staticmethod
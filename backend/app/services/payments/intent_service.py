@@ -14,6 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user import User
 from app.models.review_request import ReviewRequest, ReviewType
 from app.services.payments.base import logger
+from app.services.payments.stripe_client import get_stripe_client, idempotency_key_for
 from app.services.payments.calculation import PaymentCalculationService
 from app.core.exceptions import InvalidInputError, InvalidStateError
 
@@ -49,7 +50,9 @@ class PaymentIntentService:
         if review_request.stripe_payment_intent_id:
             # Payment Intent already exists, retrieve it
             try:
-                intent = stripe.PaymentIntent.retrieve(review_request.stripe_payment_intent_id)
+                intent = await get_stripe_client().retrieve_payment_intent(
+                    review_request.stripe_payment_intent_id
+                )
                 if intent.status in ["succeeded", "processing"]:
                     raise InvalidStateError(message="Payment has already been processed")
                 return {
@@ -77,17 +80,22 @@ class PaymentIntentService:
 
         # Ensure user has Stripe customer ID
         if not user.stripe_customer_id:
-            customer = stripe.Customer.create(
-                email=user.email,
-                name=user.full_name,
-                metadata={"user_id": str(user.id)}
+            customer_params = {
+                "email": user.email,
+                "name": user.full_name,
+                "metadata": {"user_id": str(user.id)},
+            }
+            customer = await get_stripe_client().create_customer(
+                idempotency_key=idempotency_key_for(f"customer-payment-user-{user.id}", customer_params),
+                **customer_params
             )
             user.stripe_customer_id = customer.id
             await db.commit()
             logger.info(f"Created Stripe customer {customer.id} for user {user.id}")
 
         # Create Payment Intent
-        intent = stripe.PaymentIntent.create(
+        intent = await get_stripe_client().create_payment_intent(
+            idempotency_key=f"payment-intent-{review_request.id}-{amount_cents}",
             amount=amount_cents,
             currency="usd",
             customer=user.stripe_customer_id,
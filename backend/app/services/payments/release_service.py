@@ -15,6 +15,8 @@ from app.models.review_request import ReviewRequest
 from app.models.review_slot import ReviewSlot, PaymentStatus
 from app.constants.payments import PLATFORM_FEE_PERCENT
 from app.services.payments.base import logger
+from app.services.payments.stripe_client import get_stripe_client
+from app.services.payments.balance_cache import balance_cache
 
 
 class PaymentReleaseService:
@@ -66,7 +68,9 @@ class PaymentReleaseService:
 
         try:
             # Create transfer to Connect account
-            transfer = stripe.Transfer.create(
+            # One transfer per slot, even if the release is retried
+            transfer = await get_stripe_client().create_transfer(
+                idempotency_key=f"transfer-slot-{slot.id}",
                 amount=net_amount_cents,
                 currency="usd",
                 destination=reviewer.stripe_connect_account_id,
@@ -89,6 +93,7 @@ class PaymentReleaseService:
             slot.net_amount_to_reviewer = net_amount
 
             await db.commit()
+            balance_cache.invalidate(reviewer.stripe_connect_account_id)
 
             logger.info(
                 f"Released ${net_amount} to reviewer {reviewer.id} for slot {slot.id} "
@@ -150,7 +155,8 @@ class PaymentReleaseService:
 
         try:
             # Create refund
-            refund = stripe.Refund.create(
+            refund = await get_stripe_client().create_refund(
+                idempotency_key=f"refund-slot-{slot.id}",
                 payment_intent=review_request.stripe_payment_intent_id,
                 amount=refund_amount_cents,
                 metadata={
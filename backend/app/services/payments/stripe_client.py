@@ -0,0 +1,374 @@
+"""
+Async Stripe Client.
+
+Non-blocking access to the Stripe REST API for payment and subscription
+services. The stripe SDK's resource methods (stripe.Transfer.create, ...)
+perform blocking HTTP calls, which stall the event loop for the duration
+of every Stripe round trip.
+
+This client provides:
+- A pooled httpx.AsyncClient shared by the whole process
+- Per-call timeouts (default STRIPE_TIMEOUT_SECONDS)
+- Idempotency keys on every POST (deterministic keys can be passed by callers,
+  see idempotency_key_for)
+- A concurrency limit on in-flight Stripe requests (STRIPE_MAX_CONCURRENCY)
+- Retries with exponential backoff for network errors, 429s and 5xx responses
+- Per-attempt latency in external_call_duration_seconds (service="stripe")
+
+Responses are returned as stripe.StripeObject instances, so callers keep
+attribute access (transfer.id, balance.available) and errors are raised as
+stripe.StripeError subclasses, so existing `except stripe.StripeError`
+handlers keep working.
+
+Usage:
+    from app.services.payments.stripe_client import get_stripe_client
+
+    client = get_stripe_client()
+    transfer = await client.create_transfer(
+        amount=1000, currency="usd", destination=account_id,
+        idempotency_key=f"transfer-slot-{slot.id}",
+    )
+"""
+
+import asyncio
+import hashlib
+import logging
+import random
+import re
+import time
+import uuid
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import httpx
+import stripe
+
+from app.core.config import settings
+from app.core.metrics import observe_external_call
+
+logger = logging.getLogger(__name__)
+
+# Backoff between retries: 0.5s, 1s, 2s, ... capped, with jitter
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 5.0
+
+# Object IDs in paths ("/v1/accounts/acct_123") are replaced for metric labels
+_OBJECT_ID = re.compile(r"/[a-z]+_(?=[^/]*[0-9A-Z])[A-Za-z0-9_]+")
+
+
+def encode_params(params: Mapping[str, Any], prefix: str = "") -> List[Tuple[str, str]]:
+    """
+    Flatten request params into Stripe's form encoding.
+
+    Nested dicts become ``metadata[user_id]``, lists become
+    ``line_items[0][price]``, booleans become "true"/"false" and None
+    values are dropped.
+    """
+    pairs: List[Tuple[str, str]] = []
+    for key, value in params.items():
+        name = f"{prefix}[{key}]" if prefix else str(key)
+        if value is None:
+            continue
+        if isinstance(value, Mapping):
+            pairs.extend(encode_params(value, name))
+        elif isinstance(value, (list, tuple)):
+            for index, item in enumerate(value):
+                item_name = f"{name}[{index}]"
+                if isinstance(item, Mapping):
+                    pairs.extend(encode_params(item, item_name))
+                else:
+                    pairs.append((item_name, _encode_scalar(item)))
+        else:
+            pairs.append((name, _encode_scalar(value)))
+    return pairs
+
+
+def idempotency_key_for(prefix: str, params: Mapping[str, Any]) -> str:
+    """
+    Deterministic idempotency key for a call site and its params.
+
+    Stripe rejects a reused key whose params differ, so the key carries a
+    hash of the encoded params: a retry with the same params replays, while
+    changed params (a new email, say) get a new key.
+    """
+    digest = hashlib.sha256(repr(encode_params(params)).encode()).hexdigest()[:16]
+    return f"{prefix}-{digest}"
+
+
+def _encode_scalar(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _error_from_response(response: httpx.Response) -> stripe.StripeError:
+    """Build the stripe.StripeError subclass matching an error response."""
+    try:
+        json_body = response.json()
+    except ValueError:
+        json_body = None
+
+    error = (json_body or {}).get("error", {}) if isinstance(json_body, dict) else {}
+    message = error.get("message") or f"Stripe request failed with status {response.status_code}"
+    code = error.get("code")
+    param = error.get("param")
+    common = {
+        "http_body": response.text,
+        "http_status": response.status_code,
+        "json_body": json_body,
+        "headers": dict(response.headers),
+    }
+
+    status_code = response.status_code
+    if error.get("type") == "idempotency_error":
+        return stripe.IdempotencyError(message, code=code, **common)
+    if status_code == 402 or error.get("type") == "card_error":
+        return stripe.CardError(message, param, code, **common)
+    if status_code in (400, 404):
+        return stripe.InvalidRequestError(message, param, code, **common)
+    if status_code == 401:
+        return stripe.AuthenticationError(message, code=code, **common)
+    if status_code == 403:
+        return stripe.PermissionError(message, code=code, **common)
+    if status_code == 429:
+        return stripe.RateLimitError(message, code=code, **common)
+    return stripe.APIError(message, code=code, **common)
+
+
+class StripeClient:
+    """Async Stripe API client with pooling, timeouts, retries and a concurrency limit"""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Args:
+            api_key: Stripe secret key (default STRIPE_API_KEY)
+            base_url: API base URL (default STRIPE_API_BASE)
+            timeout: Default per-call timeout in seconds
+            max_connections: Size of the HTTP connection pool
+            max_concurrency: Max Stripe requests in flight at once
+            max_retries: Retries for network errors, 429s and 5xx responses
+            transport: Custom httpx transport (used by the fake Stripe server in tests)
+        """
+        self.api_key = api_key if api_key is not None else settings.STRIPE_API_KEY
+        self.base_url = (base_url or settings.STRIPE_API_BASE).rstrip("/")
+        self.timeout = timeout if timeout is not None else settings.STRIPE_TIMEOUT_SECONDS
+        self.max_connections = max_connections or settings.STRIPE_MAX_CONNECTIONS
+        self.max_concurrency = max_concurrency or settings.STRIPE_MAX_CONCURRENCY
+        self.max_retries = max_retries if max_retries is not None else settings.STRIPE_MAX_RETRIES
+        self._transport = transport
+        self._http: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_http(self) -> httpx.AsyncClient:
+        # Created lazily so the pool and semaphore bind to the running event loop
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                transport=self._transport,
+            )
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the connection pool."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        self._semaphore = None
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Mapping[str, Any]] = None,
+        *,
+        stripe_account: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> stripe.StripeObject:
+        """
+        Make a Stripe API request.
+
+        Args:
+            method: HTTP method ("GET" or "POST")
+            path: API path, e.g. "/v1/transfers"
+            params: Request parameters (query string for GET, form body for POST)
+            stripe_account: Connect account to act on (Stripe-Account header)
+            idempotency_key: Idempotency key for POSTs (a random key is used if omitted)
+            timeout: Per-call timeout in seconds
+
+        Returns:
+            The response as a StripeObject
+
+        Raises:
+            stripe.StripeError: On API errors, or stripe.APIConnectionError
+                when the request can't be completed after retries
+        """
+        method = method.upper()
+        http = self._get_http()
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Stripe-Version": stripe.api_version,
+        }
+        if stripe_account:
+            headers["Stripe-Account"] = stripe_account
+        if method == "POST":
+            # A fixed key per logical call makes retries safe to replay
+            headers["Idempotency-Key"] = idempotency_key or str(uuid.uuid4())
+
+        encoded = encode_params(params or {})
+        request_kwargs: Dict[str, Any] = {
+            "headers": headers,
+            "timeout": timeout if timeout is not None else self.timeout,
+        }
+        if method == "GET":
+            request_kwargs["params"] = encoded
+        else:
+            request_kwargs["data"] = dict(encoded)
+
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    response = await self._send(http, method, path, request_kwargs)
+            except httpx.HTTPError as e:
+                if attempt < self.max_retries:
+                    await self._backoff(attempt, method, path, str(e))
+                    attempt += 1
+                    continue
+                raise stripe.APIConnectionError(
+                    f"Could not reach Stripe ({method} {path}): {e}",
+                    should_retry=False,
+                ) from e
+
+            if response.status_code < 400:
+                return stripe.StripeObject.construct_from(
+                    response.json(),
+                    self.api_key,
+                    stripe_account=stripe_account,
+                )
+
+            if attempt < self.max_retries and self._should_retry(response):
+                await self._backoff(attempt, method, path, f"HTTP {response.status_code}")
+                attempt += 1
+                continue
+
+            raise _error_from_response(response)
+
+    @staticmethod
+    async def _send(
+        http: httpx.AsyncClient, method: str, path: str, request_kwargs: Dict[str, Any]
+    ) -> httpx.Response:
+        """One HTTP attempt, recorded in the outbound call metrics."""
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            response = await http.request(method, path, **request_kwargs)
+            outcome = f"{response.status_code // 100}xx"
+            return response
+        finally:
+            observe_external_call("stripe", f"{method} {_OBJECT_ID.sub('/{id}', path)}", outcome, started)
+
+    @staticmethod
+    def _should_retry(response: httpx.Response) -> bool:
+        # Stripe says explicitly whether a request is safe to retry
+        should_retry = response.headers.get("Stripe-Should-Retry")
+        if should_retry is not None:
+            return should_retry == "true"
+        return response.status_code == 429 or response.status_code >= 500
+
+    @staticmethod
+    async def _backoff(attempt: int, method: str, path: str, reason: str) -> None:
+        delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt))
+        delay *= 0.5 + random.random() / 2
+        logger.warning(f"Retrying Stripe {method} {path} in {delay:.2f}s ({reason})")
+        await asyncio.sleep(delay)
+
+    # ===== Payment Intents & Customers =====
+
+    async def create_customer(self, *, idempotency_key: Optional[str] = None, **params) -> stripe.StripeObject:
+        return await self.request("POST", "/v1/customers", params, idempotency_key=idempotency_key)
+
+    async def create_payment_intent(self, *, idempotency_key: Optional[str] = None, **params) -> stripe.StripeObject:
+        return await self.request("POST", "/v1/payment_intents", params, idempotency_key=idempotency_key)
+
+    async def retrieve_payment_intent(self, payment_intent_id: str) -> stripe.StripeObject:
+        return await self.request("GET", f"/v1/payment_intents/{payment_intent_id}")
+
+    # ===== Transfers, Refunds, Balances & Payouts =====
+
+    async def create_transfer(self, *, idempotency_key: Optional[str] = None, **params) -> stripe.StripeObject:
+        return await self.request("POST", "/v1/transfers", params, idempotency_key=idempotency_key)
+
+    async def create_refund(self, *, idempotency_key: Optional[str] = None, **params) -> stripe.StripeObject:
+        return await self.request("POST", "/v1/refunds", params, idempotency_key=idempotency_key)
+
+    async def retrieve_balance(self, *, stripe_account: Optional[str] = None) -> stripe.StripeObject:
+        return await self.request("GET", "/v1/balance", stripe_account=stripe_account)
+
+    async def list_payouts(self, *, stripe_account: Optional[str] = None, **params) -> stripe.StripeObject:
+        return await self.request("GET", "/v1/payouts", params, stripe_account=stripe_account)
+
+    # ===== Connect Accounts =====
+
+    async def create_account(self, *, idempotency_key: Optional[str] = None, **params) -> stripe.StripeObject:
+        return await self.request("POST", "/v1/accounts", params, idempotency_key=idempotency_key)
+
+    async def retrieve_account(self, account_id: str) -> stripe.StripeObject:
+        return await self.request("GET", f"/v1/accounts/{account_id}")
+
+    async def create_account_link(self, **params) -> stripe.StripeObject:
+        return await self.request("POST", "/v1/account_links", params)
+
+    async def create_login_link(self, account_id: str) -> stripe.StripeObject:
+        return await self.request("POST", f"/v1/accounts/{account_id}/login_links")
+
+    # ===== Subscriptions =====
+
+    async def create_checkout_session(self, **params) -> stripe.StripeObject:
+        return await self.request("POST", "/v1/checkout/sessions", params)
+
+    async def create_portal_session(self, **params) -> stripe.StripeObject:
+        return await self.request("POST", "/v1/billing_portal/sessions", params)
+
+    async def list_subscriptions(self, **params) -> stripe.StripeObject:
+        return await self.request("GET", "/v1/subscriptions", params)
+
+
+_client: Optional[StripeClient] = None
+
+
+def get_stripe_client() -> StripeClient:
+    """Get the process-wide Stripe client."""
+    global _client
+    if _client is None:
+        _client = StripeClient()
+    return _client
+
+
+def set_stripe_client(client: Optional[StripeClient]) -> None:
+    """Replace the process-wide Stripe client (tests point it at the fake server)."""
+    global _client
+    _client = client
+
+
+async def close_stripe_client() -> None:
+    """Close the process-wide Stripe client's connection pool."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
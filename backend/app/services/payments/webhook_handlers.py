@@ -5,7 +5,7 @@ Handles Stripe webhook events for payments and Connect accounts.
 """
 
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,6 +14,7 @@ from app.models.user import User
 from app.models.review_request import ReviewRequest
 from app.models.review_slot import ReviewSlot, PaymentStatus
 from app.services.payments.base import logger
+from app.services.payments.balance_cache import balance_cache
 
 
 class PaymentWebhookHandlers:
@@ -192,3 +193,31 @@ class PaymentWebhookHandlers:
             f"onboarded={user.stripe_connect_onboarded}, "
             f"payouts_enabled={user.stripe_connect_payouts_enabled}"
         )
+
+    @staticmethod
+    async def handle_connect_balance_event(
+        event_type: str,
+        event_object: Dict[str, Any],
+        connected_account: Optional[str] = None
+    ) -> None:
+        """
+        Handle balance.available, payout.* and transfer.* webhooks.
+        Invalidate the cached balance and payouts of the affected Connect account.
+
+        Args:
+            event_type: Stripe event type
+            event_object: The event's data object (Payout, Transfer or Balance)
+            connected_account: The event's `account` field (set for Connect events)
+        """
+        if event_type.startswith("transfer."):
+            # Transfers live on the platform account; the reviewer is the destination
+            account_id = event_object.get("destination")
+        else:
+            account_id = connected_account
+
+        if not account_id:
+            logger.debug(f"{event_type} webhook is for the platform account, nothing to invalidate")
+            return
+
+        balance_cache.invalidate(account_id)
+        logger.info(f"Invalidated cached balance for Connect account {account_id} ({event_type})")
@@ -0,0 +1,469 @@
+"""
+Webhook Inbox.
+
+Stripe webhooks are persisted to the webhook_events table and acknowledged
+immediately; WebhookWorkerPool processes them in the background. This keeps
+the webhook endpoint fast (Stripe retries deliveries that take too long)
+and makes processing idempotent:
+
+- Duplicate deliveries hit the unique (provider, event_id) constraint and are dropped
+- Events about the same object (e.g. one Payment Intent) are processed in
+  order; an event waits while an earlier one for its object is pending
+  or being processed
+- Failed events are retried with exponential backoff and marked failed
+  after WEBHOOK_MAX_ATTEMPTS
+- Events stuck in processing (worker crash) are returned to the queue
+- replay() re-queues processed or failed events
+- stats() reports queue depth and processing lag; the same figures are
+  exported on /metrics (queue depth is only counted when /metrics is scraped)
+
+Usage:
+    from app.services.payments.webhook_inbox import webhook_inbox, webhook_worker_pool
+
+    created = await webhook_inbox.enqueue(db, payload, event)
+    webhook_worker_pool.notify()
+"""
+
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import and_, exists, func, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import aliased
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.session import async_session_maker
+from app.models.webhook_event import WebhookEvent, WebhookEventStatus
+from app.services.payments.base import logger
+from app.services.payments.facade import PaymentService
+from app.services.subscription_service import SubscriptionService
+
+STRIPE_PROVIDER = "stripe"
+MAX_RETRY_DELAY_SECONDS = 3600
+MAX_ERROR_LENGTH = 2000
+
+PENDING = WebhookEventStatus.PENDING.value
+PROCESSING = WebhookEventStatus.PROCESSING.value
+PROCESSED = WebhookEventStatus.PROCESSED.value
+FAILED = WebhookEventStatus.FAILED.value
+
+WEBHOOK_EVENTS = metrics.counter(
+    "webhook_events_total",
+    "Webhook processing attempts by outcome (processed, retried, failed)",
+    labelnames=("outcome",),
+)
+WEBHOOK_LAG = metrics.histogram(
+    "webhook_processing_lag_seconds",
+    "Time from receiving a webhook to processing it",
+    buckets=(0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0, 900.0, 3600.0),
+)
+
+
+async def dispatch_stripe_event(event: Dict[str, Any], db: AsyncSession) -> None:
+    """
+    Route a verified Stripe event to its handler.
+
+    Args:
+        event: Stripe event as a dict
+        db: Database session for the handler
+    """
+    event_type = event["type"]
+    event_data = event["data"]["object"]
+
+    if event_type == "customer.subscription.created":
+        await SubscriptionService.handle_subscription_created(event_data, db)
+
+    elif event_type == "customer.subscription.updated":
+        await SubscriptionService.handle_subscription_updated(event_data, db)
+
+    elif event_type == "customer.subscription.deleted":
+        await SubscriptionService.handle_subscription_deleted(event_data, db)
+
+    elif event_type == "invoice.payment_succeeded":
+        await SubscriptionService.handle_invoice_payment_succeeded(event_data, db)
+
+    elif event_type == "invoice.payment_failed":
+        await SubscriptionService.handle_invoice_payment_failed(event_data, db)
+
+    # Payment Intent events (expert review payments)
+    elif event_type == "payment_intent.succeeded":
+        await PaymentService.handle_payment_success(event_data, db)
+
+    elif event_type == "payment_intent.payment_failed":
+        await PaymentService.handle_payment_failed(event_data, db)
+
+    # Refund events
+    elif event_type == "charge.refunded":
+        await PaymentService.handle_refund_completed(event_data, db)
+
+    # Connect account events (reviewer payouts)
+    elif event_type == "account.updated":
+        await PaymentService.handle_connect_account_updated(event_data, db)
+
+    # Connect balance events (invalidate cached reviewer earnings)
+    elif event_type == "balance.available" or event_type.startswith(("payout.", "transfer.")):
+        await PaymentService.handle_connect_balance_event(
+            event_type, event_data, event.get("account")
+        )
+
+    else:
+        logger.info(f"Unhandled webhook event type: {event_type}")
+
+
+class WebhookInbox:
+    """Persistent webhook queue backed by the webhook_events table"""
+
+    def __init__(self, session_maker: async_sessionmaker = async_session_maker):
+        self.session_maker = session_maker
+        self.processed_count = 0
+        self.failed_count = 0
+        self.retried_count = 0
+        self.lag_total = 0.0
+        self.lag_max = 0.0
+        # Last stats() result, read by the /metrics queue depth gauges
+        self.last_stats: Dict[str, Any] = {}
+
+    async def enqueue(self, db: AsyncSession, payload: bytes, event: Dict[str, Any]) -> bool:
+        """
+        Store a verified event in the inbox.
+
+        Args:
+            db: Database session
+            payload: Raw request body (the verified event JSON)
+            event: The parsed event
+
+        Returns:
+            True if stored, False if the event was already received
+        """
+        data_object = event.get("data", {}).get("object", {})
+        created = event.get("created")
+
+        db.add(WebhookEvent(
+            provider=STRIPE_PROVIDER,
+            event_id=event["id"],
+            event_type=event["type"],
+            object_id=data_object.get("id"),
+            account_id=event.get("account"),
+            payload=payload.decode("utf-8"),
+            status=PENDING,
+            event_created_at=datetime.utcfromtimestamp(created) if created else None,
+        ))
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            return False
+        return True
+
+    async def claim_batch(self, limit: int) -> List[WebhookEvent]:
+        """
+        Claim up to `limit` due events, respecting per-object ordering.
+
+        Each event is claimed with a conditional UPDATE, so concurrent
+        workers (or processes) never claim the same event twice.
+        """
+        now = datetime.utcnow()
+        other = aliased(WebhookEvent)
+        blocked = exists().where(
+            other.provider == WebhookEvent.provider,
+            other.object_id == WebhookEvent.object_id,
+            other.id != WebhookEvent.id,
+            or_(
+                other.status == PROCESSING,
+                and_(
+                    other.status == PENDING,
+                    or_(
+                        other.event_created_at < WebhookEvent.event_created_at,
+                        and_(
+                            other.event_created_at == WebhookEvent.event_created_at,
+                            other.id < WebhookEvent.id,
+                        ),
+                    ),
+                ),
+            ),
+        )
+
+        async with self.session_maker() as db:
+            result = await db.execute(
+                select(WebhookEvent)
+                .where(
+                    WebhookEvent.status == PENDING,
+                    WebhookEvent.next_attempt_at <= now,
+                    ~blocked,
+                )
+                .order_by(WebhookEvent.event_created_at, WebhookEvent.id)
+                .limit(limit)
+            )
+            candidates = result.scalars().all()
+
+            claimed = []
+            for event in candidates:
+                claim = await db.execute(
+                    update(WebhookEvent)
+                    .where(WebhookEvent.id == event.id, WebhookEvent.status == PENDING)
+                    .values(status=PROCESSING, locked_at=now, attempts=WebhookEvent.attempts + 1)
+                    .execution_options(synchronize_session=False)
+                )
+                if claim.rowcount == 1:
+                    claimed.append(event)
+            await db.commit()
+
+            # Detach so the in-memory copies can mirror the claim without another flush
+            for event in claimed:
+                db.expunge(event)
+                event.status = PROCESSING
+                event.attempts += 1
+            return claimed
+
+    async def process(self, event: WebhookEvent) -> bool:
+        """
+        Run the handler for a claimed event and record the outcome.
+
+        Returns:
+            True if the handler succeeded
+        """
+        async with self.session_maker() as db:
+            try:
+                await dispatch_stripe_event(json.loads(event.payload), db)
+            except Exception as e:
+                await db.rollback()
+                await self._record_failure(db, event, e)
+                return False
+
+            now = datetime.utcnow()
+            await db.execute(
+                update(WebhookEvent)
+                .where(WebhookEvent.id == event.id)
+                .values(status=PROCESSED, processed_at=now, locked_at=None, last_error=None)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+
+        lag = (now - event.received_at).total_seconds()
+        self.processed_count += 1
+        self.lag_total += lag
+        self.lag_max = max(self.lag_max, lag)
+        WEBHOOK_EVENTS.inc(outcome="processed")
+        WEBHOOK_LAG.observe(lag)
+        return True
+
+    async def _record_failure(self, db: AsyncSession, event: WebhookEvent, error: Exception) -> None:
+        if event.attempts >= settings.WEBHOOK_MAX_ATTEMPTS:
+            values = {"status": FAILED}
+            self.failed_count += 1
+            WEBHOOK_EVENTS.inc(outcome="failed")
+            logger.error(
+                f"Webhook {event.event_id} ({event.event_type}) failed after {event.attempts} attempts: {error}",
+                exc_info=True,
+            )
+        else:
+            delay = min(MAX_RETRY_DELAY_SECONDS, settings.WEBHOOK_RETRY_BASE_SECONDS * 2 ** (event.attempts - 1))
+            values = {"status": PENDING, "next_attempt_at": datetime.utcnow() + timedelta(seconds=delay)}
+            self.retried_count += 1
+            WEBHOOK_EVENTS.inc(outcome="retried")
+            logger.warning(
+                f"Webhook {event.event_id} ({event.event_type}) attempt {event.attempts} failed, "
+                f"retrying in {delay}s: {error}"
+            )
+
+        await db.execute(
+            update(WebhookEvent)
+            .where(WebhookEvent.id == event.id)
+            .values(locked_at=None, last_error=str(error)[:MAX_ERROR_LENGTH], **values)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+    async def recover_stuck(self) -> int:
+        """Return events stuck in processing (e.g. after a crash) to the queue."""
+        cutoff = datetime.utcnow() - timedelta(minutes=settings.WEBHOOK_PROCESSING_TIMEOUT_MINUTES)
+        async with self.session_maker() as db:
+            result = await db.execute(
+                update(WebhookEvent)
+                .where(WebhookEvent.status == PROCESSING, WebhookEvent.locked_at < cutoff)
+                .values(status=PENDING, locked_at=None, next_attempt_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        if result.rowcount:
+            logger.warning(f"Re-queued {result.rowcount} webhook events stuck in processing")
+        return result.rowcount
+
+    async def replay(
+        self,
+        event_ids: Optional[Sequence[str]] = None,
+        status: Optional[str] = None,
+        event_type: Optional[str] = None,
+        since: Optional[datetime] = None,
+    ) -> int:
+        """
+        Re-queue stored events for processing.
+
+        Args:
+            event_ids: Specific provider event IDs
+            status: Only events with this status (e.g. "failed")
+            event_type: Only events of this type
+            since: Only events received at or after this time
+
+        Returns:
+            Number of events re-queued
+        """
+        if not any([event_ids, status, event_type, since]):
+            raise ValueError("Refusing to replay every webhook event; pass at least one filter")
+
+        conditions = [WebhookEvent.status != PROCESSING]
+        if event_ids:
+            conditions.append(WebhookEvent.event_id.in_(event_ids))
+        if status:
+            conditions.append(WebhookEvent.status == status)
+        if event_type:
+            conditions.append(WebhookEvent.event_type == event_type)
+        if since:
+            conditions.append(WebhookEvent.received_at >= since)
+
+        async with self.session_maker() as db:
+            result = await db.execute(
+                update(WebhookEvent)
+                .where(*conditions)
+                .values(status=PENDING, attempts=0, last_error=None, next_attempt_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        logger.info(f"Re-queued {result.rowcount} webhook events for replay")
+        return result.rowcount
+
+    async def stats(self) -> Dict[str, Any]:
+        """Queue depth and lag figures for monitoring."""
+        async with self.session_maker() as db:
+            counts = dict((await db.execute(
+                select(WebhookEvent.status, func.count())
+                .where(WebhookEvent.status.in_([PENDING, PROCESSING, FAILED]))
+                .group_by(WebhookEvent.status)
+            )).all())
+            oldest_pending = (await db.execute(
+                select(func.min(WebhookEvent.received_at)).where(WebhookEvent.status == PENDING)
+            )).scalar()
+
+        self.last_stats = {
+            "pending": counts.get(PENDING, 0),
+            "processing": counts.get(PROCESSING, 0),
+            "failed": counts.get(FAILED, 0),
+            "oldest_pending_age_seconds": (
+                round((datetime.utcnow() - oldest_pending).total_seconds(), 1) if oldest_pending else 0.0
+            ),
+            "processed_since_start": self.processed_count,
+            "retried_since_start": self.retried_count,
+            "failed_since_start": self.failed_count,
+            "processing_lag_avg_seconds": (
+                round(self.lag_total / self.processed_count, 3) if self.processed_count else 0.0
+            ),
+            "processing_lag_max_seconds": round(self.lag_max, 3),
+        }
+        return self.last_stats
+
+    async def refresh_metrics(self) -> None:
+        """Recount queue depth for the /metrics gauges (run on each scrape)."""
+        await self.stats()
+
+
+class WebhookWorkerPool:
+    """Background workers draining the webhook inbox"""
+
+    RECOVERY_INTERVAL_SECONDS = 60
+
+    def __init__(
+        self,
+        inbox: WebhookInbox,
+        concurrency: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+    ):
+        self.inbox = inbox
+        self.concurrency = concurrency or settings.WEBHOOK_WORKER_CONCURRENCY
+        self.poll_interval = poll_interval if poll_interval is not None else settings.WEBHOOK_POLL_INTERVAL_SECONDS
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start draining the inbox on the running event loop."""
+        if self.running:
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Webhook worker pool started ({self.concurrency} workers)")
+
+    async def stop(self) -> None:
+        """Finish the current batch and stop."""
+        if not self.running:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+        logger.info("Webhook worker pool stopped")
+
+    def notify(self) -> None:
+        """Wake the pool up (called after a new event is stored)."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def drain(self) -> int:
+        """
+        Process due events until none are left or the pool is stopping;
+        returns how many ran.
+        """
+        processed = 0
+        while not self._stopping:
+            batch = await self.inbox.claim_batch(self.concurrency)
+            if not batch:
+                break
+            await asyncio.gather(*(self.inbox.process(event) for event in batch))
+            processed += len(batch)
+        return processed
+
+    async def _run(self) -> None:
+        last_recovery = 0.0
+        while not self._stopping:
+            try:
+                if time.monotonic() - last_recovery >= self.RECOVERY_INTERVAL_SECONDS:
+                    await self.inbox.recover_stuck()
+                    last_recovery = time.monotonic()
+                await self.drain()
+            except Exception as e:
+                logger.error(f"Webhook worker pool error: {e}", exc_info=True)
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+
+# Global inbox and worker pool
+webhook_inbox = WebhookInbox()
+webhook_worker_pool = WebhookWorkerPool(webhook_inbox)
+
+metrics.on_collect(webhook_inbox.refresh_metrics)
+metrics.gauge(
+    "webhook_inbox_events",
+    "Webhook events waiting or in flight, by status",
+    labelnames=("status",),
+    callback=lambda: {
+        (status,): webhook_inbox.last_stats[status] for status in (PENDING, PROCESSING, FAILED)
+    } if webhook_inbox.last_stats else None,
+)
+metrics.gauge(
+    "webhook_inbox_oldest_pending_age_seconds",
+    "Age of the oldest pending webhook event",
+    callback=lambda: webhook_inbox.last_stats.get("oldest_pending_age_seconds"),
+)
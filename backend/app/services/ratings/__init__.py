@@ -5,6 +5,9 @@ This module consolidates all rating-related services:
 - requester_rating_service: Rating system for requesters
 - reviewer_rating_service: Rating system for reviewers
 - reviewer_dna_service: Reviewer DNA/profile analysis
+- feedback_analysis: Single-pass feedback text signals (word count, action items, tone)
+- reviewer_stats: One-query reviewer stats aggregation (single and batch), cached per user
+- rating_aggregates: Incremental rating sums/averages for reviewer and requester stats
 
 Usage:
     from app.services.ratings import RequesterRatingService, ReviewerRatingService
@@ -13,9 +16,25 @@ Usage:
 from app.services.ratings.requester_rating_service import RequesterRatingService
 from app.services.ratings.reviewer_rating_service import ReviewerRatingService
 from app.services.ratings.reviewer_dna_service import ReviewerDNAService
+from app.services.ratings.reviewer_stats import (
+    ReviewerStatsSnapshot,
+    compute_reviewer_stats,
+    compute_reviewer_stats_batch,
+    get_reviewer_stats,
+    get_reviewer_stats_batch,
+    invalidate_reviewer_stats,
+    refresh_user_stats,
+)
 
 __all__ = [
     "RequesterRatingService",
     "ReviewerRatingService",
     "ReviewerDNAService",
+    "ReviewerStatsSnapshot",
+    "compute_reviewer_stats",
+    "compute_reviewer_stats_batch",
+    "get_reviewer_stats",
+    "get_reviewer_stats_batch",
+    "invalidate_reviewer_stats",
+    "refresh_user_stats",
 ]
@@ -0,0 +1,155 @@
+"""
+Feedback Text Analysis
+
+Extracts quality signals from review feedback text in a single pass:
+- Word count
+- Action-item keywords ("should", "consider", "fix", ...)
+- Specificity markers ("for example", "section", "because", ...)
+- Encouragement keywords ("great", "nice", "well done", ...)
+
+All vocabularies are compiled into one trie-shaped alternation regex that
+only matches whole words (or phrases), so adding keywords doesn't add
+passes over the text and false positives inside other words ("padding",
+"address" -> "add", "improvements" -> "improve") are avoided.
+
+Usage:
+    from app.services.ratings.feedback_analysis import analyze_feedback, analyze_feedback_batch
+
+    signals = analyze_feedback(slot.review_text)
+    signals.word_count, signals.action_items, signals.specificity_hits
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+
+ACTION_KEYWORDS = (
+    "should", "could", "try", "consider", "recommend",
+    "suggest", "would", "improve", "add", "remove",
+    "change", "update", "fix", "refactor", "optimize",
+)
+
+SPECIFICITY_MARKERS = (
+    "for example", "for instance", "e.g.", "specifically", "such as",
+    "because", "instead", "line", "section", "paragraph",
+    "timestamp", "frame", "pixel",
+)
+
+ENCOURAGEMENT_KEYWORDS = (
+    "great", "love", "nice", "well done", "awesome",
+    "excellent", "impressive", "beautiful", "good job", "strong",
+    "keep it up", "fantastic", "enjoyed",
+)
+
+ACTION = "action"
+SPECIFICITY = "specificity"
+ENCOURAGEMENT = "encouragement"
+
+_KEYWORD_CATEGORY: Dict[str, str] = {
+    **{keyword: ENCOURAGEMENT for keyword in ENCOURAGEMENT_KEYWORDS},
+    **{keyword: SPECIFICITY for keyword in SPECIFICITY_MARKERS},
+    **{keyword: ACTION for keyword in ACTION_KEYWORDS},
+}
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Build a regex alternation shaped like a trie.
+
+    Shared prefixes are factored out ("re(?:commend|factor|move)") so the
+    engine never re-reads a character to try the next alternative.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        is_end = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if is_end:
+            # Optional tail is greedy, so the longest keyword wins
+            return "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+# (?!\w) rather than a trailing \b so markers ending in punctuation ("e.g.") still match
+KEYWORD_MATCHER = re.compile(r"\b(?:" + _trie_pattern(_KEYWORD_CATEGORY) + r")(?!\w)", re.ASCII)
+
+
+@dataclass(frozen=True)
+class FeedbackSignals:
+    """Quality signals extracted from one piece of feedback text."""
+    word_count: int = 0
+    action_hits: int = 0
+    specificity_hits: int = 0
+    encouragement_hits: int = 0
+
+    @property
+    def action_items(self) -> int:
+        """Estimated actionable suggestions (roughly 1 per 2 action keywords)."""
+        if not self.word_count:
+            return 0
+        return max(1, self.action_hits // 2)
+
+
+EMPTY_SIGNALS = FeedbackSignals()
+
+
+def _signals_from_matches(word_count: int, matches: List[str]) -> FeedbackSignals:
+    counts = {ACTION: 0, SPECIFICITY: 0, ENCOURAGEMENT: 0}
+    # Tally distinct keywords in C, then classify at most one entry per keyword
+    for keyword, hits in Counter(matches).items():
+        counts[_KEYWORD_CATEGORY[keyword]] += hits
+    return FeedbackSignals(
+        word_count=word_count,
+        action_hits=counts[ACTION],
+        specificity_hits=counts[SPECIFICITY],
+        encouragement_hits=counts[ENCOURAGEMENT],
+    )
+
+
+def analyze_feedback(text: Optional[str]) -> FeedbackSignals:
+    """
+    Analyze a single feedback text in one pass.
+
+    Args:
+        text: Feedback text (None or empty returns zeroed signals)
+
+    Returns:
+        FeedbackSignals for the text
+    """
+    if not text:
+        return EMPTY_SIGNALS
+    return _signals_from_matches(len(text.split()), KEYWORD_MATCHER.findall(text.lower()))
+
+
+def analyze_feedback_batch(texts: Iterable[Optional[str]]) -> List[FeedbackSignals]:
+    """
+    Analyze many feedback texts at once (used by bulk DNA recalculation).
+
+    Produces the same signals as calling analyze_feedback on each text,
+    without the per-call overhead.
+
+    Args:
+        texts: Feedback texts (None entries yield zeroed signals)
+
+    Returns:
+        FeedbackSignals for each text, in input order
+    """
+    texts = list(texts)
+    lowered = [text.lower() if text else "" for text in texts]
+    matches = map(KEYWORD_MATCHER.findall, lowered)
+
+    return [
+        _signals_from_matches(len(text.split()), text_matches) if text else EMPTY_SIGNALS
+        for text, text_matches in zip(lowered, matches)
+    ]
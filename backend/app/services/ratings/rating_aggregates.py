@@ -0,0 +1,201 @@
+"""
+Incremental rating aggregates
+
+Reviewer and requester stats rows keep the running sum of each rating
+dimension next to its average:
+
+- add_rating folds one new rating into the sums, total_ratings, averages
+  and flags in a single atomic UPDATE (every SET expression reads the row
+  as it was before the statement, so concurrent ratings can't lose
+  updates), instead of re-aggregating all of the user's ratings
+- recalculate rebuilds sums and counts from the rating table for a batch
+  of users, then derives averages with the same SQL expressions, so both
+  paths round identically; the services' recalculate_all_stats page
+  through every rated user with it weekly to correct drift
+
+Averages are rounded to 2 decimals in SQL; a flag is set while its
+dimension averages at least 4 (and while there are no ratings yet).
+
+Usage:
+    from app.services.ratings.rating_aggregates import REVIEWER_AGGREGATE, add_rating
+
+    await add_rating(db, REVIEWER_AGGREGATE, reviewer_id, ratings={"quality": 5, ...})
+    await db.commit()
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from sqlalchemy import func, literal_column, select, union, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.requester_rating import RequesterRating, RequesterStats
+from app.models.reviewer_rating import ReviewerRating, ReviewerStats
+
+FLAG_THRESHOLD = 4.0
+
+
+@dataclass(frozen=True)
+class RatingAggregate:
+    """
+    How a rating table rolls up into a stats table.
+
+    Each dimension maps <dimension>_rating on the rating model to
+    <dimension>_sum and avg_<dimension> on the stats model.
+    """
+
+    stats_model: Any
+    rating_model: Any
+    rated_user_column: str
+    dimensions: Tuple[str, ...]
+    flags: Mapping[str, str]  # flag column -> dimension
+
+    @property
+    def rated_user(self):
+        return getattr(self.rating_model, self.rated_user_column)
+
+    def sum_column(self, dimension: str):
+        return getattr(self.stats_model, f"{dimension}_sum")
+
+
+REVIEWER_AGGREGATE = RatingAggregate(
+    stats_model=ReviewerStats,
+    rating_model=ReviewerRating,
+    rated_user_column="reviewer_id",
+    dimensions=("quality", "professionalism", "helpfulness", "overall"),
+    flags={"is_high_quality": "quality", "is_professional": "professionalism"},
+)
+
+REQUESTER_AGGREGATE = RatingAggregate(
+    stats_model=RequesterStats,
+    rating_model=RequesterRating,
+    rated_user_column="requester_id",
+    dimensions=("clarity", "responsiveness", "fairness", "overall"),
+    flags={"is_responsive": "responsiveness", "is_fair": "fairness"},
+)
+
+
+def _average_values(aggregate: RatingAggregate, sums: Dict[str, Any], count) -> Dict[str, Any]:
+    """SET values for the averages and flags, given sum and count expressions"""
+    values = {}
+    for dimension in aggregate.dimensions:
+        values[f"avg_{dimension}"] = func.round(
+            sums[dimension] * literal_column("1.0") / func.nullif(count, 0), 2
+        )
+    for flag, dimension in aggregate.flags.items():
+        values[flag] = func.coalesce(values[f"avg_{dimension}"] >= FLAG_THRESHOLD, True)
+    return values
+
+
+async def ensure_stats_rows(db: AsyncSession, aggregate: RatingAggregate, user_ids: Iterable[int]) -> None:
+    """Create empty stats rows for users that don't have one yet"""
+    now = datetime.utcnow()
+    rows = [{"user_id": user_id, "updated_at": now} for user_id in user_ids]
+    if not rows:
+        return
+    dialect = postgresql if db.bind.dialect.name == "postgresql" else sqlite
+    await db.execute(
+        dialect.insert(aggregate.stats_model)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=["user_id"])
+    )
+
+
+async def add_rating(
+    db: AsyncSession,
+    aggregate: RatingAggregate,
+    user_id: int,
+    ratings: Mapping[str, int],
+    extra_values: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Fold one rating into a user's stats row. The caller commits.
+
+    Args:
+        ratings: Rating value per dimension
+        extra_values: Other columns to SET in the same statement
+    """
+    stats = aggregate.stats_model
+    await ensure_stats_rows(db, aggregate, [user_id])
+
+    sums = {dimension: aggregate.sum_column(dimension) + ratings[dimension] for dimension in aggregate.dimensions}
+    values = {f"{dimension}_sum": expr for dimension, expr in sums.items()}
+    values["total_ratings"] = stats.total_ratings + 1
+    values.update(_average_values(aggregate, sums, stats.total_ratings + 1))
+    values["updated_at"] = datetime.utcnow()
+    values.update(extra_values or {})
+
+    await db.execute(
+        update(stats)
+        .where(stats.user_id == user_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def recalculate(
+    db: AsyncSession,
+    aggregate: RatingAggregate,
+    user_ids: List[int],
+    extra_values: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Rebuild stats rows for these users from the rating table. The caller commits.
+
+    Args:
+        extra_values: Other columns to SET alongside the sums (may be
+            subqueries correlated to the stats row)
+    """
+    if not user_ids:
+        return
+    stats = aggregate.stats_model
+    ratings = aggregate.rating_model
+    await ensure_stats_rows(db, aggregate, user_ids)
+
+    def ratings_of_row(*columns):
+        return select(*columns).where(aggregate.rated_user == stats.user_id).scalar_subquery()
+
+    values = {
+        f"{dimension}_sum": ratings_of_row(
+            func.coalesce(func.sum(getattr(ratings, f"{dimension}_rating")), 0)
+        )
+        for dimension in aggregate.dimensions
+    }
+    values["total_ratings"] = ratings_of_row(func.count())
+    values["updated_at"] = datetime.utcnow()
+    values.update(extra_values or {})
+    await db.execute(
+        update(stats)
+        .where(stats.user_id.in_(user_ids))
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+
+    # Averages from the sums just written (a SET can only see the old row)
+    sums = {dimension: aggregate.sum_column(dimension) for dimension in aggregate.dimensions}
+    await db.execute(
+        update(stats)
+        .where(stats.user_id.in_(user_ids))
+        .values(**_average_values(aggregate, sums, stats.total_ratings))
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def rated_user_pages(db: AsyncSession, aggregate: RatingAggregate, page_size: int):
+    """Yield pages of ids of users with ratings or a stats row, in id order"""
+    ids = union(
+        select(aggregate.rated_user.label("user_id")),
+        select(aggregate.stats_model.user_id.label("user_id")),
+    ).subquery()
+    last_id = 0
+    while True:
+        result = await db.execute(
+            select(ids.c.user_id).where(ids.c.user_id > last_id).order_by(ids.c.user_id).limit(page_size)
+        )
+        user_ids = result.scalars().all()
+        if not user_ids:
+            return
+        yield user_ids
+        last_id = user_ids[-1]
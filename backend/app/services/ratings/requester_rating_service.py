@@ -1,7 +1,6 @@
 """Requester Rating Service for two-sided reputation"""
 
 from datetime import datetime, timedelta
-from decimal import Decimal
 from typing import Optional, List, Dict, Any
 from sqlalchemy import func, select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,6 +9,12 @@ from app.models.requester_rating import RequesterRating, RequesterStats
 from app.models.user import User
 from app.models.review_slot import ReviewSlot, ReviewSlotStatus
 from app.models.review_request import ReviewRequest
+from app.services.ratings.rating_aggregates import (
+    REQUESTER_AGGREGATE,
+    add_rating,
+    rated_user_pages,
+    recalculate,
+)
 from app.core.exceptions import (
     NotFoundError,
     InvalidInputError,
@@ -122,60 +127,52 @@ class RequesterRatingService:
         )
 
         self.db.add(rating)
+
+        # Fold the rating into the requester's stats in the same transaction
+        await add_rating(
+            self.db,
+            REQUESTER_AGGREGATE,
+            review_request.user_id,
+            ratings={
+                "clarity": clarity_rating,
+                "responsiveness": responsiveness_rating,
+                "fairness": fairness_rating,
+                "overall": overall_rating,
+            },
+            extra_values=self._request_count(),
+        )
         await self.db.commit()
         await self.db.refresh(rating)
 
-        # Update requester stats
-        await self._update_requester_stats(review_request.user_id)
-
         return rating
 
-    async def _update_requester_stats(self, requester_id: int) -> RequesterStats:
-        """Recalculate and update aggregated stats for a requester."""
-        # Get or create stats record
-        stmt = select(RequesterStats).where(RequesterStats.user_id == requester_id)
-        result = await self.db.execute(stmt)
-        stats = result.scalar_one_or_none()
-
-        if not stats:
-            stats = RequesterStats(user_id=requester_id)
-            self.db.add(stats)
-
-        # Calculate averages from all ratings
-        stmt = select(
-            func.avg(RequesterRating.clarity_rating),
-            func.avg(RequesterRating.responsiveness_rating),
-            func.avg(RequesterRating.fairness_rating),
-            func.avg(RequesterRating.overall_rating),
-            func.count(RequesterRating.id)
-        ).where(RequesterRating.requester_id == requester_id)
+    @staticmethod
+    def _request_count() -> Dict[str, Any]:
+        """Review request count for a stats row, as a subquery correlated to it"""
+        return {
+            "total_reviews_requested": (
+                select(func.count(ReviewRequest.id))
+                .where(ReviewRequest.user_id == RequesterStats.user_id)
+                .scalar_subquery()
+            ),
+        }
 
-        result = await self.db.execute(stmt)
-        row = result.first()
-
-        if row and row[4] > 0:  # Has ratings
-            stats.avg_clarity = Decimal(str(row[0])).quantize(Decimal("0.01")) if row[0] else None
-            stats.avg_responsiveness = Decimal(str(row[1])).quantize(Decimal("0.01")) if row[1] else None
-            stats.avg_fairness = Decimal(str(row[2])).quantize(Decimal("0.01")) if row[2] else None
-            stats.avg_overall = Decimal(str(row[3])).quantize(Decimal("0.01")) if row[3] else None
-            stats.total_ratings = row[4]
-
-            # Update flags
-            stats.is_responsive = float(stats.avg_responsiveness or 0) >= 4.0
-            stats.is_fair = float(stats.avg_fairness or 0) >= 4.0
-
-        # Count total reviews requested
-        stmt = select(func.count(ReviewRequest.id)).where(
-            ReviewRequest.user_id == requester_id
-        )
-        result = await self.db.execute(stmt)
-        stats.total_reviews_requested = result.scalar() or 0
+    async def recalculate_all_stats(self, page_size: int = 500) -> int:
+        """
+        Rebuild every requester's stats from their ratings and requests.
 
-        stats.updated_at = datetime.utcnow()
-        await self.db.commit()
-        await self.db.refresh(stats)
+        Ratings are applied incrementally as they arrive; this corrects
+        drift. Each page of requesters is committed on its own.
 
-        return stats
+        Returns:
+            Number of requesters recalculated
+        """
+        count = 0
+        async for requester_ids in rated_user_pages(self.db, REQUESTER_AGGREGATE, page_size):
+            await recalculate(self.db, REQUESTER_AGGREGATE, requester_ids, extra_values=self._request_count())
+            await self.db.commit()
+            count += len(requester_ids)
+        return count
 
     async def get_requester_stats(self, requester_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -11,15 +11,102 @@ based on their review history across 6 dimensions:
 - Encouragement: Supportive language score
 """
 
+import asyncio
+from dataclasses import dataclass, fields
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
-from sqlalchemy import func, select, case
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select, case, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.models.reviewer_dna import ReviewerDNA
 from app.models.user import User
 from app.models.review_slot import ReviewSlot, ReviewSlotStatus
 from app.models.review_request import ReviewRequest
+from app.services.ratings.feedback_analysis import FeedbackSignals, analyze_feedback, analyze_feedback_batch
+
+
+# Slot statuses that count as a completed review for DNA purposes
+REVIEWED_STATUSES = [
+    ReviewSlotStatus.SUBMITTED.value,
+    ReviewSlotStatus.ACCEPTED.value,
+    ReviewSlotStatus.REJECTED.value,
+]
+
+# Response times are capped at one week so a single stale claim can't dominate
+MAX_RESPONSE_HOURS = 168
+
+
+@dataclass
+class DNAStats:
+    """
+    Running sufficient statistics for a reviewer's DNA.
+
+    Field names mirror the statistic columns on ReviewerDNA so the same
+    object can express either absolute values (backfill) or deltas
+    (incremental updates on slot events).
+    """
+    reviews_analyzed: int = 0
+    response_time_count: int = 0
+    response_time_sum: float = 0.0
+    response_time_sum_sq: float = 0.0
+    feedback_count: int = 0
+    word_count_sum: float = 0.0
+    word_count_sum_sq: float = 0.0
+    action_items_sum: float = 0.0
+    action_items_sum_sq: float = 0.0
+    specificity_hits_sum: float = 0.0
+    encouragement_hits_sum: float = 0.0
+    rating_count: int = 0
+    rating_sum: float = 0.0
+    rating_sum_sq: float = 0.0
+    accepted_count: int = 0
+    rejected_count: int = 0
+
+    def add_submission(
+        self,
+        claimed_at: Optional[datetime],
+        submitted_at: Optional[datetime],
+        signals: Optional[FeedbackSignals],
+    ) -> None:
+        """Fold one submitted review (signals is None without feedback text) into the statistics."""
+        self.reviews_analyzed += 1
+
+        if claimed_at and submitted_at:
+            hours = min((submitted_at - claimed_at).total_seconds() / 3600, MAX_RESPONSE_HOURS)
+            self.response_time_count += 1
+            self.response_time_sum += hours
+            self.response_time_sum_sq += hours * hours
+
+        if signals is not None:
+            self.feedback_count += 1
+            self.word_count_sum += signals.word_count
+            self.word_count_sum_sq += signals.word_count ** 2
+            self.action_items_sum += signals.action_items
+            self.action_items_sum_sq += signals.action_items ** 2
+            self.specificity_hits_sum += signals.specificity_hits
+            self.encouragement_hits_sum += signals.encouragement_hits
+
+    def add_rating(self, rating: Optional[int]) -> None:
+        """Fold a requester helpful rating into the statistics."""
+        if rating:
+            self.rating_count += 1
+            self.rating_sum += rating
+            self.rating_sum_sq += rating * rating
+
+    def add_outcome(self, status: str) -> None:
+        """Count an accepted or rejected outcome."""
+        if status == ReviewSlotStatus.ACCEPTED.value:
+            self.accepted_count += 1
+        elif status == ReviewSlotStatus.REJECTED.value:
+            self.rejected_count += 1
+
+    def non_zero(self) -> Dict[str, float]:
+        """Return only the fields that changed (used as increments)."""
+        return {f.name: getattr(self, f.name) for f in fields(self) if getattr(self, f.name)}
+
+    def as_dict(self) -> Dict[str, float]:
+        """Return all fields (used as absolute values)."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
 
 class ReviewerDNAService:
@@ -28,6 +115,12 @@ class ReviewerDNAService:
 
     DNA dimensions are calculated on a 0-100 scale based on
     actual review performance data.
+
+    Review history is summarised as running statistics on the
+    ReviewerDNA row (see DNAStats). Slot events update those
+    statistics incrementally, so refreshing DNA never rescans
+    review history; recalculate_all_dna rebuilds them from scratch
+    to correct any drift.
     """
 
     # Minimum reviews needed for reliable DNA calculation
@@ -48,8 +141,13 @@ class ReviewerDNAService:
         "response_time_hours": 24,  # Ideal response time
         "word_count": 200,  # Target feedback length
         "action_items": 3,  # Target actionable items
+        "specificity_hits": 2,  # Target specificity markers ("because", "for example", ...)
+        "encouragement_hits": 2,  # Target encouraging phrases ("great", "well done", ...)
     }
 
+    # Reviewers processed per page during a full backfill
+    BACKFILL_PAGE_SIZE = 200
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
@@ -63,11 +161,6 @@ class ReviewerDNAService:
         Returns:
             ReviewerDNA object or None if user doesn't exist
         """
-        # Check if user exists
-        user = await self.db.get(User, user_id)
-        if not user:
-            return None
-
         # Try to get existing DNA
         stmt = select(ReviewerDNA).where(ReviewerDNA.user_id == user_id)
         result = await self.db.execute(stmt)
@@ -76,8 +169,24 @@ class ReviewerDNAService:
         if dna:
             return dna
 
+        # Check if user exists
+        user_exists = await self.db.scalar(select(User.id).where(User.id == user_id))
+        if not user_exists:
+            return None
+
         # Create new DNA with defaults (all at 50 = baseline)
-        dna = ReviewerDNA(
+        dna = self._new_dna(user_id)
+
+        self.db.add(dna)
+        await self.db.commit()
+        await self.db.refresh(dna)
+
+        return dna
+
+    @staticmethod
+    def _new_dna(user_id: int) -> ReviewerDNA:
+        """Build a baseline DNA row (all dimensions at 50, empty statistics)."""
+        return ReviewerDNA(
             user_id=user_id,
             speed=50.0,
             depth=50.0,
@@ -88,17 +197,15 @@ class ReviewerDNAService:
             overall_score=50.0,
             reviews_analyzed=0,
             version=1,
+            **{name: 0 for name in DNAStats().as_dict() if name != "reviews_analyzed"},
         )
 
-        self.db.add(dna)
-        await self.db.commit()
-        await self.db.refresh(dna)
-
-        return dna
-
     async def calculate_dna(self, user_id: int) -> Optional[ReviewerDNA]:
         """
-        Calculate DNA dimensions based on review history.
+        Calculate DNA dimensions from the stored running statistics.
+
+        This is O(1): it reads the ReviewerDNA row only and never
+        touches review history.
 
         Args:
             user_id: The reviewer's user ID
@@ -110,12 +217,24 @@ class ReviewerDNAService:
         if not dna:
             return None
 
-        # Get completed reviews by this user
-        reviews_data = await self._get_review_metrics(user_id)
+        if self._apply_dimensions(dna):
+            await self.db.commit()
+            await self.db.refresh(dna)
+
+        return dna
+
+    def _apply_dimensions(self, dna: ReviewerDNA) -> bool:
+        """
+        Recompute dimension scores on a DNA row from its statistics.
+
+        Returns:
+            False if there is not enough data (row left untouched)
+        """
+        reviews_data = self._get_review_metrics(dna)
 
         if reviews_data["total_reviews"] < self.MIN_REVIEWS_FOR_DNA:
-            # Not enough data - return defaults
-            return dna
+            # Not enough data - keep defaults
+            return False
 
         # Calculate each dimension
         dna.speed = self._calculate_speed(reviews_data)
@@ -129,99 +248,122 @@ class ReviewerDNAService:
         dna.overall_score = dna.calculate_overall()
 
         # Update metadata
-        dna.reviews_analyzed = reviews_data["total_reviews"]
         dna.version += 1
         dna.calculated_at = datetime.utcnow()
 
-        await self.db.commit()
-        await self.db.refresh(dna)
-
-        return dna
+        return True
 
-    async def _get_review_metrics(self, user_id: int) -> Dict[str, Any]:
+    def _get_review_metrics(self, dna: ReviewerDNA) -> Dict[str, Any]:
         """
-        Gather raw metrics from review history for DNA calculation.
+        Derive the metrics used for DNA calculation from running statistics.
 
         Returns dict with aggregated review statistics.
         """
-        # Get review slots completed by this reviewer
-        stmt = select(ReviewSlot).where(
-            ReviewSlot.reviewer_id == user_id,
-            ReviewSlot.status.in_([
-                ReviewSlotStatus.SUBMITTED.value,
-                ReviewSlotStatus.ACCEPTED.value,
-                ReviewSlotStatus.REJECTED.value,
-                ReviewSlotStatus.AUTO_ACCEPTED.value,
-            ])
-        )
-        result = await self.db.execute(stmt)
-        slots = list(result.scalars().all())
-
-        if not slots:
+        total_reviews = dna.reviews_analyzed or 0
+        if not total_reviews:
             return {"total_reviews": 0}
 
-        # Calculate metrics
-        total_reviews = len(slots)
-        response_times = []
-        word_counts = []
-        action_items_counts = []
-        ratings = []
-        accepted_count = 0
-        rejected_count = 0
-
-        for slot in slots:
-            # Response time (hours from claim to submit)
-            if slot.claimed_at and slot.submitted_at:
-                delta = slot.submitted_at - slot.claimed_at
-                hours = delta.total_seconds() / 3600
-                response_times.append(min(hours, 168))  # Cap at 1 week
-
-            # Feedback analysis
-            if slot.feedback_text:
-                word_counts.append(len(slot.feedback_text.split()))
-                # Count actionable items (sentences with "should", "try", "consider", etc.)
-                action_items_counts.append(self._count_action_items(slot.feedback_text))
-
-            # Ratings and acceptance
-            if slot.helpful_rating:
-                ratings.append(slot.helpful_rating)
-
-            if slot.status == ReviewSlotStatus.ACCEPTED.value:
-                accepted_count += 1
-            elif slot.status == ReviewSlotStatus.REJECTED.value:
-                rejected_count += 1
+        def mean(total: float, count: int, default: float) -> float:
+            return total / count if count else default
+
+        accepted_count = dna.accepted_count or 0
+        rejected_count = dna.rejected_count or 0
+        decided = accepted_count + rejected_count
 
         return {
             "total_reviews": total_reviews,
-            "response_times": response_times,
-            "avg_response_time": sum(response_times) / len(response_times) if response_times else 48,
-            "word_counts": word_counts,
-            "avg_word_count": sum(word_counts) / len(word_counts) if word_counts else 100,
-            "action_items_counts": action_items_counts,
-            "avg_action_items": sum(action_items_counts) / len(action_items_counts) if action_items_counts else 2,
-            "ratings": ratings,
-            "avg_rating": sum(ratings) / len(ratings) if ratings else 3.5,
+            "avg_response_time": mean(dna.response_time_sum, dna.response_time_count, 48),
+            "avg_word_count": mean(dna.word_count_sum, dna.feedback_count, 100),
+            "avg_action_items": mean(dna.action_items_sum, dna.feedback_count, 2),
+            "avg_specificity_hits": mean(dna.specificity_hits_sum, dna.feedback_count, 1),
+            "avg_encouragement_hits": mean(dna.encouragement_hits_sum, dna.feedback_count, 1),
+            "avg_rating": mean(dna.rating_sum, dna.rating_count, 3.5),
             "accepted_count": accepted_count,
             "rejected_count": rejected_count,
-            "acceptance_rate": accepted_count / (accepted_count + rejected_count) if (accepted_count + rejected_count) > 0 else 0.8,
+            "acceptance_rate": accepted_count / decided if decided > 0 else 0.8,
         }
 
-    def _count_action_items(self, feedback_text: str) -> int:
-        """Count actionable suggestions in feedback text."""
-        action_keywords = [
-            "should", "could", "try", "consider", "recommend",
-            "suggest", "would", "improve", "add", "remove",
-            "change", "update", "fix", "refactor", "optimize"
-        ]
+    # ==================== Incremental Updates ====================
 
-        text_lower = feedback_text.lower()
-        count = 0
+    def _submission_stats(
+        self,
+        claimed_at: Optional[datetime],
+        submitted_at: Optional[datetime],
+        review_text: Optional[str],
+    ) -> DNAStats:
+        """Build the statistics contributed by a single submitted review."""
+        stats = DNAStats()
+        stats.add_submission(claimed_at, submitted_at, analyze_feedback(review_text) if review_text else None)
+        return stats
 
-        for keyword in action_keywords:
-            count += text_lower.count(keyword)
+    async def _apply_increments(self, user_id: int, increments: Dict[str, float]) -> Optional[ReviewerDNA]:
+        """
+        Add deltas to a reviewer's statistics in one atomic UPDATE and
+        refresh the derived dimensions.
+        """
+        dna = await self.get_or_create_dna(user_id)
+        if not dna or not increments:
+            return dna
+
+        stmt = (
+            update(ReviewerDNA)
+            .where(ReviewerDNA.id == dna.id)
+            .values({
+                getattr(ReviewerDNA, name): getattr(ReviewerDNA, name) + delta
+                for name, delta in increments.items()
+            })
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.execute(stmt)
+        await self.db.refresh(dna)
+
+        self._apply_dimensions(dna)
+        await self.db.commit()
+
+        return dna
+
+    async def record_submission(self, slot: ReviewSlot) -> Optional[ReviewerDNA]:
+        """
+        Update DNA statistics when a review slot is first submitted.
+
+        Args:
+            slot: The submitted review slot
+
+        Returns:
+            Updated ReviewerDNA object or None
+        """
+        if not slot.reviewer_id:
+            return None
+
+        stats = self._submission_stats(slot.claimed_at, slot.submitted_at, slot.review_text)
+        return await self._apply_increments(slot.reviewer_id, stats.non_zero())
+
+    async def record_acceptance(self, slot: ReviewSlot, overturned_rejection: bool = False) -> Optional[ReviewerDNA]:
+        """
+        Update DNA statistics when a review is accepted (manually, automatically
+        or by an admin overturning a rejection).
+
+        Args:
+            slot: The accepted review slot
+            overturned_rejection: True if the slot was previously counted as rejected
+        """
+        if not slot.reviewer_id:
+            return None
+
+        stats = DNAStats(accepted_count=1)
+        stats.add_rating(slot.requester_helpful_rating)
+        increments = stats.non_zero()
+        if overturned_rejection:
+            increments["rejected_count"] = -1
+
+        return await self._apply_increments(slot.reviewer_id, increments)
+
+    async def record_rejection(self, slot: ReviewSlot) -> Optional[ReviewerDNA]:
+        """Update DNA statistics when a review is rejected."""
+        if not slot.reviewer_id:
+            return None
 
-        # Rough estimate: 1 action item per 2-3 keywords
-        return max(1, count // 2)
+        return await self._apply_increments(slot.reviewer_id, {"rejected_count": 1})
 
     def _calculate_speed(self, data: Dict[str, Any]) -> float:
         """
@@ -263,16 +405,17 @@ class ReviewerDNAService:
         """
         Calculate specificity score (0-100).
 
-        Based on actionable items per review.
-        3+ items = 100, scales down below that.
+        Based on actionable items per review (70%) and concrete
+        references such as "because", "for example" or "line 4" (30%).
+        Each part reaches full marks at its target and scales down below it.
         """
         avg_items = data.get("avg_action_items", 2)
-        target = self.TARGETS["action_items"]
+        avg_markers = data.get("avg_specificity_hits", 1)
 
-        if avg_items >= target:
-            return min(100.0, 50 + (avg_items / target) * 50)
-        else:
-            return max(20.0, (avg_items / target) * 50)
+        items_component = min(1.0, avg_items / self.TARGETS["action_items"]) * 70  # 0-70
+        markers_component = min(1.0, avg_markers / self.TARGETS["specificity_hits"]) * 30  # 0-30
+
+        return min(100.0, max(20.0, items_component + markers_component))
 
     def _calculate_constructiveness(self, data: Dict[str, Any]) -> float:
         """
@@ -307,18 +450,18 @@ class ReviewerDNAService:
         Calculate encouragement score (0-100).
 
         Based on a combination of acceptance rate (proxy for tone)
-        and depth (thorough feedback tends to be more supportive).
+        and encouraging phrases per review ("great", "well done", ...).
         """
         acceptance_rate = data.get("acceptance_rate", 0.8)
-        avg_words = data.get("avg_word_count", 100)
+        avg_encouragement = data.get("avg_encouragement_hits", 1)
 
         # Accepted reviews indicate positive, helpful tone
         acceptance_component = acceptance_rate * 60  # 0-60
 
-        # Longer feedback often has more encouraging language
-        depth_component = min(40.0, (avg_words / 200) * 40)  # 0-40
+        # Supportive language found in the feedback text
+        language_component = min(1.0, avg_encouragement / self.TARGETS["encouragement_hits"]) * 40  # 0-40
 
-        return min(100.0, max(20.0, acceptance_component + depth_component))
+        return min(100.0, max(20.0, acceptance_component + language_component))
 
     async def get_dna_summary(self, user_id: int) -> Dict[str, Any]:
         """
@@ -363,36 +506,120 @@ class ReviewerDNAService:
             "has_sufficient_data": dna.reviews_analyzed >= self.MIN_REVIEWS_FOR_DNA,
         }
 
-    async def recalculate_all_dna(self) -> int:
+    async def recalculate_all_dna(self, concurrency: int = 4) -> int:
         """
-        Recalculate DNA for all reviewers.
+        Rebuild DNA statistics for all reviewers from review history.
+
+        Incremental updates keep DNA current; this backfill exists to seed
+        the statistics and correct drift. Reviewers are split into
+        ``concurrency`` shards by user id, each processed on its own session.
+        Within a shard, reviewers are paged by keyset and their slots are
+        streamed, so memory use is bounded by the page size rather than by
+        review history.
 
-        Called periodically or after system updates.
+        Args:
+            concurrency: Number of shards processed in parallel (forced to 1 on SQLite)
 
         Returns:
             Number of profiles updated
         """
-        # Get all users who have given reviews
-        stmt = select(ReviewSlot.reviewer_id).where(
-            ReviewSlot.reviewer_id.isnot(None),
-            ReviewSlot.status.in_([
-                ReviewSlotStatus.SUBMITTED.value,
-                ReviewSlotStatus.ACCEPTED.value,
-                ReviewSlotStatus.AUTO_ACCEPTED.value,
-            ])
-        ).distinct()
+        bind = self.db.bind
+        if concurrency <= 1 or bind is None or bind.dialect.name == "sqlite":
+            return await self._backfill_shard(shard=0, shard_count=1)
 
-        result = await self.db.execute(stmt)
-        reviewer_ids = [row[0] for row in result.all()]
+        session_factory = async_sessionmaker(bind, class_=AsyncSession, expire_on_commit=False)
+
+        async def run_shard(shard: int) -> int:
+            async with session_factory() as db:
+                return await ReviewerDNAService(db)._backfill_shard(shard, concurrency)
+
+        results = await asyncio.gather(*(run_shard(shard) for shard in range(concurrency)))
+        return sum(results)
 
+    async def _backfill_shard(self, shard: int, shard_count: int) -> int:
+        """Backfill every reviewer whose id falls into the given shard."""
         updated = 0
-        for user_id in reviewer_ids:
-            dna = await self.calculate_dna(user_id)
-            if dna:
-                updated += 1
+        last_user_id = 0
+
+        while True:
+            # Next page of reviewer ids (keyset pagination)
+            ids_stmt = (
+                select(ReviewSlot.reviewer_id)
+                .where(
+                    ReviewSlot.reviewer_id > last_user_id,
+                    ReviewSlot.status.in_(REVIEWED_STATUSES),
+                )
+                .distinct()
+                .order_by(ReviewSlot.reviewer_id)
+                .limit(self.BACKFILL_PAGE_SIZE)
+            )
+            if shard_count > 1:
+                ids_stmt = ids_stmt.where(ReviewSlot.reviewer_id % shard_count == shard)
+
+            reviewer_ids = list((await self.db.execute(ids_stmt)).scalars().all())
+            if not reviewer_ids:
+                break
+
+            stats_by_user = await self._stream_page_stats(reviewer_ids)
+            updated += await self._write_page_stats(stats_by_user)
+            last_user_id = reviewer_ids[-1]
 
         return updated
 
+    async def _stream_page_stats(self, reviewer_ids: List[int]) -> Dict[int, DNAStats]:
+        """Stream the slots of a page of reviewers and fold them into statistics."""
+        stats_by_user: Dict[int, DNAStats] = {user_id: DNAStats() for user_id in reviewer_ids}
+
+        stmt = (
+            select(
+                ReviewSlot.reviewer_id,
+                ReviewSlot.status,
+                ReviewSlot.claimed_at,
+                ReviewSlot.submitted_at,
+                ReviewSlot.review_text,
+                ReviewSlot.requester_helpful_rating,
+            )
+            .where(
+                ReviewSlot.reviewer_id.in_(reviewer_ids),
+                ReviewSlot.status.in_(REVIEWED_STATUSES),
+            )
+            .execution_options(yield_per=500)
+        )
+
+        result = await self.db.stream(stmt)
+        async for rows in result.partitions(500):
+            # Analyze the partition's feedback texts in one batched scan
+            signals = analyze_feedback_batch(row.review_text for row in rows)
+            for row, row_signals in zip(rows, signals):
+                stats = stats_by_user[row.reviewer_id]
+                stats.add_submission(row.claimed_at, row.submitted_at, row_signals if row.review_text else None)
+                stats.add_rating(row.requester_helpful_rating)
+                stats.add_outcome(row.status)
+
+        return stats_by_user
+
+    async def _write_page_stats(self, stats_by_user: Dict[int, DNAStats]) -> int:
+        """Store absolute statistics for a page of reviewers and refresh their dimensions."""
+        result = await self.db.execute(
+            select(ReviewerDNA).where(ReviewerDNA.user_id.in_(list(stats_by_user)))
+        )
+        dna_by_user = {dna.user_id: dna for dna in result.scalars().all()}
+
+        for user_id, stats in stats_by_user.items():
+            dna = dna_by_user.get(user_id)
+            if dna is None:
+                dna = self._new_dna(user_id)
+                self.db.add(dna)
+            for name, value in stats.as_dict().items():
+                setattr(dna, name, value)
+            self._apply_dimensions(dna)
+
+        await self.db.commit()
+        # Release the page's rows so memory stays bounded across pages
+        self.db.expunge_all()
+
+        return len(stats_by_user)
+
     async def compare_to_average(self, user_id: int) -> Dict[str, Any]:
         """
         Compare user's DNA to platform average.
@@ -1,15 +1,21 @@
 """Reviewer Rating Service for two-sided reputation"""
 
 from datetime import datetime
-from decimal import Decimal
 from typing import Optional, List, Dict, Any
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.reviewer_rating import ReviewerRating, ReviewerStats
 from app.models.user import User
 from app.models.review_slot import ReviewSlot, ReviewSlotStatus
 from app.models.review_request import ReviewRequest
+from app.services.ratings.rating_aggregates import (
+    REVIEWER_AGGREGATE,
+    add_rating,
+    rated_user_pages,
+    recalculate,
+)
+from app.services.ratings.reviewer_stats import invalidate_reviewer_stats
 from app.core.exceptions import (
     NotFoundError,
     InvalidInputError,
@@ -123,87 +129,76 @@ class ReviewerRatingService:
         )
 
         self.db.add(rating)
+
+        # Fold the rating into the reviewer's stats in the same transaction
+        await add_rating(
+            self.db,
+            REVIEWER_AGGREGATE,
+            slot.reviewer_id,
+            ratings={
+                "quality": quality_rating,
+                "professionalism": professionalism_rating,
+                "helpfulness": helpfulness_rating,
+                "overall": overall_rating,
+            },
+            extra_values=self._slot_counts(),
+        )
+        await self._sync_user_ratings([slot.reviewer_id])
         await self.db.commit()
         await self.db.refresh(rating)
-
-        # Update reviewer stats
-        await self._update_reviewer_stats(slot.reviewer_id)
+        invalidate_reviewer_stats(slot.reviewer_id)
 
         return rating
 
-    async def _update_reviewer_stats(self, reviewer_id: int) -> ReviewerStats:
-        """Recalculate and update aggregated stats for a reviewer."""
-        # Get or create stats record
-        stmt = select(ReviewerStats).where(ReviewerStats.user_id == reviewer_id)
-        result = await self.db.execute(stmt)
-        stats = result.scalar_one_or_none()
-
-        if not stats:
-            stats = ReviewerStats(user_id=reviewer_id)
-            self.db.add(stats)
-
-        # Calculate averages from all ratings
-        stmt = select(
-            func.avg(ReviewerRating.quality_rating),
-            func.avg(ReviewerRating.professionalism_rating),
-            func.avg(ReviewerRating.helpfulness_rating),
-            func.avg(ReviewerRating.overall_rating),
-            func.count(ReviewerRating.id)
-        ).where(ReviewerRating.reviewer_id == reviewer_id)
-
-        result = await self.db.execute(stmt)
-        row = result.first()
-
-        if row and row[4] > 0:  # Has ratings
-            stats.avg_quality = Decimal(str(row[0])).quantize(Decimal("0.01")) if row[0] else None
-            stats.avg_professionalism = Decimal(str(row[1])).quantize(Decimal("0.01")) if row[1] else None
-            stats.avg_helpfulness = Decimal(str(row[2])).quantize(Decimal("0.01")) if row[2] else None
-            stats.avg_overall = Decimal(str(row[3])).quantize(Decimal("0.01")) if row[3] else None
-            stats.total_ratings = row[4]
-
-            # Update flags
-            stats.is_high_quality = float(stats.avg_quality or 0) >= 4.0
-            stats.is_professional = float(stats.avg_professionalism or 0) >= 4.0
-
-        # Count total completed reviews
-        stmt = select(func.count(ReviewSlot.id)).where(
-            ReviewSlot.reviewer_id == reviewer_id,
-            ReviewSlot.status.in_([ReviewSlotStatus.ACCEPTED.value, ReviewSlotStatus.SUBMITTED.value])
-        )
-        result = await self.db.execute(stmt)
-        stats.total_reviews_completed = result.scalar() or 0
+    @staticmethod
+    def _slot_counts() -> Dict[str, Any]:
+        """Review counts for a stats row, as subqueries correlated to it"""
+        def count(*statuses: str):
+            return (
+                select(func.count(ReviewSlot.id))
+                .where(ReviewSlot.reviewer_id == ReviewerStats.user_id, ReviewSlot.status.in_(statuses))
+                .scalar_subquery()
+            )
 
-        # Count accepted/rejected reviews
-        stmt = select(func.count(ReviewSlot.id)).where(
-            ReviewSlot.reviewer_id == reviewer_id,
-            ReviewSlot.status == ReviewSlotStatus.ACCEPTED.value
-        )
-        result = await self.db.execute(stmt)
-        stats.reviews_accepted = result.scalar() or 0
+        return {
+            "total_reviews_completed": count(ReviewSlotStatus.ACCEPTED.value, ReviewSlotStatus.SUBMITTED.value),
+            "reviews_accepted": count(ReviewSlotStatus.ACCEPTED.value),
+            "reviews_rejected": count(ReviewSlotStatus.REJECTED.value),
+        }
 
-        stmt = select(func.count(ReviewSlot.id)).where(
-            ReviewSlot.reviewer_id == reviewer_id,
-            ReviewSlot.status == ReviewSlotStatus.REJECTED.value
+    async def _sync_user_ratings(self, reviewer_ids: List[int]) -> None:
+        """Copy the average rating and accepted count onto the users rows (directory sort)"""
+        def stats_column(column):
+            return select(column).where(ReviewerStats.user_id == User.id).scalar_subquery()
+
+        await self.db.execute(
+            update(User)
+            .where(User.id.in_(reviewer_ids))
+            .values(
+                avg_rating=stats_column(ReviewerStats.avg_overall),
+                total_reviews_given=stats_column(ReviewerStats.reviews_accepted),
+            )
+            .execution_options(synchronize_session=False)
         )
-        result = await self.db.execute(stmt)
-        stats.reviews_rejected = result.scalar() or 0
-
-        stats.updated_at = datetime.utcnow()
 
-        # Also update the User table to keep profile in sync
-        user_stmt = select(User).where(User.id == reviewer_id)
-        user_result = await self.db.execute(user_stmt)
-        user = user_result.scalar_one_or_none()
-        if user:
-            if stats.avg_overall is not None:
-                user.avg_rating = stats.avg_overall
-            # Sync review counts
-            user.total_reviews_given = stats.reviews_accepted
+    async def recalculate_all_stats(self, page_size: int = 500) -> int:
+        """
+        Rebuild every reviewer's stats from their ratings and review slots.
 
-        await self.db.commit()
-        await self.db.refresh(stats)
+        Ratings are applied incrementally as they arrive; this corrects
+        drift. Each page of reviewers is committed on its own.
 
-        return stats
+        Returns:
+            Number of reviewers recalculated
+        """
+        count = 0
+        async for reviewer_ids in rated_user_pages(self.db, REVIEWER_AGGREGATE, page_size):
+            await recalculate(self.db, REVIEWER_AGGREGATE, reviewer_ids, extra_values=self._slot_counts())
+            await self._sync_user_ratings(reviewer_ids)
+            await self.db.commit()
+            invalidate_reviewer_stats(*reviewer_ids)
+            count += len(reviewer_ids)
+        return count
 
     async def get_reviewer_stats(self, reviewer_id: int) -> Optional[Dict[str, Any]]:
         """
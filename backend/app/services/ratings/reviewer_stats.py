@@ -0,0 +1,228 @@
+"""
+Reviewer statistics aggregation
+
+One query computes everything the profile, directory and tier services
+need to know about a reviewer's track record:
+
+- Accepted reviews given and received
+- Average overall rating received (kept incrementally in reviewer_stats)
+- Average response time (claim to submission) in hours
+- Average helpful rating on accepted reviews
+
+The batch variant runs the same statement for many users at once (one
+GROUP BY per source table, joined on user id). Response time uses
+days_between, so the aggregate runs on SQLite and PostgreSQL alike.
+
+Snapshots are cached per user for REVIEWER_STATS_CACHE_TTL_SECONDS.
+Changing a slot's status or helpful rating invalidates its reviewer (and
+the requester, when the slot's request is loaded); new ratings and the
+weekly rating recompute invalidate their reviewers. As with other TTL
+caches, other workers see the change once the entry expires.
+
+Usage:
+    from app.services.ratings.reviewer_stats import get_reviewer_stats
+
+    stats = await get_reviewer_stats(db, user_id)
+    stats.avg_response_time_hours
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import event, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from app.core.config import settings
+from app.models.review_request import ReviewRequest
+from app.models.review_slot import ReviewSlot, ReviewSlotStatus
+from app.models.reviewer_rating import ReviewerStats
+from app.models.user import User
+from app.services.infrastructure.ttl_cache import TTLCache
+from app.utils.query_helpers import count_where, days_between
+
+ACCEPTED = ReviewSlotStatus.ACCEPTED.value
+RESPONDED = (ReviewSlotStatus.SUBMITTED.value, ReviewSlotStatus.ACCEPTED.value)
+
+reviewer_stats_cache = TTLCache(
+    "reviewer_stats",
+    ttl_seconds=settings.REVIEWER_STATS_CACHE_TTL_SECONDS,
+    max_entries=10_000,
+)
+
+
+@dataclass(frozen=True)
+class ReviewerStatsSnapshot:
+    """A reviewer's aggregated track record"""
+
+    user_id: int
+    total_reviews_given: int
+    total_reviews_received: int
+    avg_rating: Optional[float]
+    avg_response_time_hours: Optional[int]
+    avg_helpful_rating: Optional[float]
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def _stats_query(user_ids: Sequence[int]) -> Select:
+    """Stats for the given users, one row per existing user"""
+    given = (
+        select(
+            ReviewSlot.reviewer_id.label("user_id"),
+            count_where(ReviewSlot.status == ACCEPTED).label("given"),
+            func.avg(days_between(ReviewSlot.submitted_at, ReviewSlot.claimed_at) * 24)
+            .filter(
+                ReviewSlot.status.in_(RESPONDED),
+                ReviewSlot.claimed_at.isnot(None),
+                ReviewSlot.submitted_at.isnot(None),
+            )
+            .label("response_hours"),
+            func.avg(ReviewSlot.requester_helpful_rating)
+            .filter(ReviewSlot.status == ACCEPTED)
+            .label("helpful"),
+        )
+        .where(ReviewSlot.reviewer_id.in_(user_ids))
+        .group_by(ReviewSlot.reviewer_id)
+        .subquery()
+    )
+    received = (
+        select(
+            ReviewRequest.user_id.label("user_id"),
+            func.count(ReviewSlot.id).label("received"),
+        )
+        .join(ReviewSlot, ReviewSlot.review_request_id == ReviewRequest.id)
+        .where(ReviewRequest.user_id.in_(user_ids), ReviewSlot.status == ACCEPTED)
+        .group_by(ReviewRequest.user_id)
+        .subquery()
+    )
+
+    return (
+        select(
+            User.id,
+            func.coalesce(given.c.given, 0),
+            func.coalesce(received.c.received, 0),
+            ReviewerStats.avg_overall,
+            given.c.response_hours,
+            given.c.helpful,
+        )
+        .outerjoin(given, given.c.user_id == User.id)
+        .outerjoin(received, received.c.user_id == User.id)
+        .outerjoin(ReviewerStats, ReviewerStats.user_id == User.id)
+        .where(User.id.in_(user_ids))
+    )
+
+
+def _snapshot(row) -> ReviewerStatsSnapshot:
+    user_id, given, received, rating, response_hours, helpful = row
+    return ReviewerStatsSnapshot(
+        user_id=user_id,
+        total_reviews_given=given,
+        total_reviews_received=received,
+        avg_rating=round(float(rating), 2) if rating else None,
+        avg_response_time_hours=int(round(response_hours)) if response_hours is not None else None,
+        avg_helpful_rating=float(helpful) if helpful else None,
+    )
+
+
+async def compute_reviewer_stats_batch(
+    db: AsyncSession, user_ids: Iterable[int]
+) -> Dict[int, ReviewerStatsSnapshot]:
+    """
+    Compute fresh stats for many users in one query.
+
+    Returns:
+        Snapshots keyed by user id (users that don't exist are omitted)
+    """
+    user_ids = list(set(user_ids))
+    if not user_ids:
+        return {}
+
+    result = await db.execute(_stats_query(user_ids))
+    snapshots = {}
+    for row in result.all():
+        snapshot = _snapshot(row)
+        snapshots[snapshot.user_id] = snapshot
+        reviewer_stats_cache.set(snapshot.user_id, snapshot)
+    return snapshots
+
+
+async def compute_reviewer_stats(db: AsyncSession, user_id: int) -> Optional[ReviewerStatsSnapshot]:
+    """Compute fresh stats for one user, or None if the user doesn't exist"""
+    return (await compute_reviewer_stats_batch(db, [user_id])).get(user_id)
+
+
+async def get_reviewer_stats(db: AsyncSession, user_id: int) -> Optional[ReviewerStatsSnapshot]:
+    """Cached stats for one user, or None if the user doesn't exist"""
+    return await reviewer_stats_cache.get_or_load(
+        user_id, lambda: compute_reviewer_stats(db, user_id)
+    )
+
+
+async def get_reviewer_stats_batch(
+    db: AsyncSession, user_ids: Iterable[int]
+) -> Dict[int, ReviewerStatsSnapshot]:
+    """Cached stats for many users; the misses are computed in one query"""
+    snapshots = {}
+    missing: List[int] = []
+    for user_id in set(user_ids):
+        snapshot = reviewer_stats_cache.get(user_id)
+        if snapshot is None:
+            missing.append(user_id)
+        else:
+            snapshots[user_id] = snapshot
+    reviewer_stats_cache.hits += len(snapshots)
+    reviewer_stats_cache.misses += len(missing)
+
+    if missing:
+        snapshots.update(await compute_reviewer_stats_batch(db, missing))
+    return snapshots
+
+
+async def refresh_user_stats(db: AsyncSession, user_ids: Iterable[int]) -> int:
+    """
+    Recompute stats and write them to the denormalized User columns the
+    directory filters and sorts on. The caller commits.
+
+    Returns:
+        Number of users updated
+    """
+    snapshots = await compute_reviewer_stats_batch(db, user_ids)
+    if not snapshots:
+        return 0
+
+    await db.execute(
+        update(User),
+        [
+            {
+                "id": s.user_id,
+                "total_reviews_given": s.total_reviews_given,
+                "total_reviews_received": s.total_reviews_received,
+                "avg_rating": s.avg_rating,
+                "avg_response_time_hours": s.avg_response_time_hours,
+            }
+            for s in snapshots.values()
+        ],
+    )
+    return len(snapshots)
+
+
+def invalidate_reviewer_stats(*user_ids: Optional[int]) -> None:
+    """Drop cached stats for these users (None ids are ignored)"""
+    for user_id in user_ids:
+        if user_id is not None:
+            reviewer_stats_cache.invalidate(user_id)
+
+
+@event.listens_for(ReviewSlot.status, "set")
+@event.listens_for(ReviewSlot.requester_helpful_rating, "set")
+def _invalidate_on_slot_change(slot, value, oldvalue, initiator):
+    if value == oldvalue:
+        return
+    # Only look at the request if it's already loaded; never lazy-load here
+    review_request = slot.__dict__.get("review_request")
+    invalidate_reviewer_stats(
+        slot.reviewer_id,
+        review_request.user_id if review_request is not None else None,
+    )
@@ -0,0 +1,229 @@
+"""
+Reviewer Directory Service
+
+Queries behind the public reviewer directory (/reviewers).
+
+- Specialty filters and tag counts use the normalized user_specialties
+  table instead of scanning the JSON specialty_tags text
+- Name/username search is a lower(...) LIKE, which Postgres serves from
+  the pg_trgm indexes on users (see the user_specialties migration)
+- The page query returns the total via a window count, so a page is one
+  round trip plus one for its tags
+- The endpoints cache built pages per filter set in the "reviewers"
+  response cache namespace, which profile and listing changes invalidate
+- Review counts, rating and response time are denormalized on users;
+  refresh_listed_reviewer_stats recomputes them in batches (daily job)
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User, UserTier
+from app.models.user_specialty import UserSpecialty
+
+# Columns needed to render a directory card
+DIRECTORY_COLUMNS = (
+    User.id,
+    User.username,
+    User.full_name,
+    User.avatar_url,
+    User.title,
+    User.bio,
+    User.reviewer_tagline,
+    User.user_tier,
+    User.reviewer_availability,
+    User.total_reviews_given,
+    User.accepted_reviews_count,
+    User.acceptance_rate,
+    User.avg_rating,
+    User.avg_response_time_hours,
+    User.sparks_points,
+    User.current_streak,
+)
+
+SORT_COLUMNS = {
+    "karma": User.sparks_points,
+    "rating": User.avg_rating,
+    "reviews": User.total_reviews_given,
+    "response_time": User.avg_response_time_hours,
+    "acceptance_rate": User.acceptance_rate,
+}
+
+
+def normalize_specialty_tags(tags: Sequence[str]) -> List[Tuple[str, str]]:
+    """
+    Return (tag, label) pairs for a user's specialty list.
+
+    tag is the stripped, lowercased filter key; label is the stripped
+    original. Later duplicates of a tag (case-insensitively) are dropped.
+    """
+    pairs = []
+    seen = set()
+    for raw in tags:
+        if not isinstance(raw, str):
+            continue
+        label = raw.strip()[:50]
+        tag = label.lower()
+        if not tag or tag in seen:
+            continue
+        seen.add(tag)
+        pairs.append((tag, label))
+    return pairs
+
+
+def _listed_reviewers_filter():
+    return and_(
+        User.is_active == True,
+        User.is_listed_as_reviewer == True,
+    )
+
+
+class ReviewerDirectoryService:
+    """Read queries for the reviewer directory"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def list_reviewers(
+        self,
+        search: Optional[str] = None,
+        tier: Optional[UserTier] = None,
+        specialty: Optional[str] = None,
+        min_reviews: int = 0,
+        min_rating: Optional[float] = None,
+        sort_by: str = "karma",
+        sort_order: str = "desc",
+        limit: int = 24,
+        offset: int = 0,
+    ) -> Tuple[list, int]:
+        """
+        Get one page of listed reviewers.
+
+        Returns:
+            (rows with DIRECTORY_COLUMNS, total matching reviewers)
+        """
+        conditions = [
+            _listed_reviewers_filter(),
+            User.total_reviews_given >= min_reviews,
+        ]
+
+        if search:
+            search_term = f"%{search.lower()}%"
+            conditions.append(
+                or_(
+                    func.lower(User.full_name).like(search_term),
+                    func.lower(User.username).like(search_term),
+                )
+            )
+
+        if tier is not None:
+            conditions.append(User.user_tier == tier)
+
+        if specialty:
+            conditions.append(
+                User.id.in_(
+                    select(UserSpecialty.user_id).where(UserSpecialty.tag == specialty.strip().lower())
+                )
+            )
+
+        if min_rating is not None:
+            conditions.append(User.avg_rating >= min_rating)
+
+        sort_column = SORT_COLUMNS.get(sort_by, User.sparks_points)
+        if sort_order == "desc":
+            # For response_time, nulls should be last (slower is worse)
+            if sort_by == "response_time":
+                order = sort_column.asc().nulls_last()
+            else:
+                order = sort_column.desc().nulls_last()
+        else:
+            if sort_by == "response_time":
+                order = sort_column.desc().nulls_last()
+            else:
+                order = sort_column.asc().nulls_first()
+
+        query = (
+            select(*DIRECTORY_COLUMNS, func.count().over().label("total_entries"))
+            .where(and_(*conditions))
+            .order_by(order, User.id)
+            .limit(limit)
+            .offset(offset)
+        )
+        rows = (await self.db.execute(query)).all()
+
+        if rows:
+            total = rows[0].total_entries
+        elif offset == 0:
+            total = 0
+        else:
+            # Past the last page: the window count has no row to ride on
+            total = (
+                await self.db.execute(select(func.count(User.id)).where(and_(*conditions)))
+            ).scalar_one()
+
+        return rows, total
+
+    async def get_specialty_labels(self, user_ids: Sequence[int], per_user: int = 5) -> Dict[int, List[str]]:
+        """Get the first per_user specialty labels of each user, in their order"""
+        if not user_ids:
+            return {}
+
+        result = await self.db.execute(
+            select(UserSpecialty.user_id, UserSpecialty.label)
+            .where(
+                UserSpecialty.user_id.in_(user_ids),
+                UserSpecialty.position < per_user,
+            )
+            .order_by(UserSpecialty.user_id, UserSpecialty.position)
+        )
+        labels: Dict[int, List[str]] = {user_id: [] for user_id in user_ids}
+        for user_id, label in result.all():
+            labels[user_id].append(label)
+        return labels
+
+    async def count_listed_reviewers(self) -> int:
+        result = await self.db.execute(select(func.count(User.id)).where(_listed_reviewers_filter()))
+        return result.scalar_one()
+
+    async def get_top_specialties(self, limit: int = 20) -> List[Tuple[str, int]]:
+        """Most common specialty tags among listed reviewers, with counts"""
+        count = func.count(UserSpecialty.user_id)
+        result = await self.db.execute(
+            select(UserSpecialty.tag, count)
+            .join(User, User.id == UserSpecialty.user_id)
+            .where(_listed_reviewers_filter())
+            .group_by(UserSpecialty.tag)
+            .order_by(count.desc(), UserSpecialty.tag)
+            .limit(limit)
+        )
+        return [(tag, tag_count) for tag, tag_count in result.all()]
+
+    async def refresh_listed_reviewer_stats(self, page_size: int = 500) -> int:
+        """
+        Recompute the denormalized stats of every listed reviewer.
+
+        Reviewers are paged by id; each page is one aggregate query, one
+        batched UPDATE and a commit.
+
+        Returns:
+            Number of reviewers updated
+        """
+        from app.services.ratings.reviewer_stats import refresh_user_stats
+
+        updated = 0
+        last_id = 0
+        while True:
+            result = await self.db.execute(
+                select(User.id)
+                .where(_listed_reviewers_filter(), User.id > last_id)
+                .order_by(User.id)
+                .limit(page_size)
+            )
+            user_ids = result.scalars().all()
+            if not user_ids:
+                return updated
+            updated += await refresh_user_stats(self.db, user_ids)
+            await self.db.commit()
+            last_id = user_ids[-1]
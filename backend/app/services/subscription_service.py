@@ -15,12 +15,10 @@ from app.core.exceptions import (
     InternalError,
 )
 from app.services.notifications.email_service import send_payment_failed_email
+from app.services.payments.stripe_client import get_stripe_client, idempotency_key_for
 
 logger = logging.getLogger(__name__)
 
-# Initialize Stripe
-stripe.api_key = settings.STRIPE_API_KEY
-
 
 class SubscriptionService:
     """Service for handling subscription operations"""
@@ -209,10 +207,14 @@ class SubscriptionService:
         try:
             # Create or retrieve Stripe customer
             if not user.stripe_customer_id:
-                customer = stripe.Customer.create(
-                    email=user.email,
-                    name=user.full_name,
-                    metadata={"user_id": str(user.id)}
+                customer_params = {
+                    "email": user.email,
+                    "name": user.full_name,
+                    "metadata": {"user_id": str(user.id)},
+                }
+                customer = await get_stripe_client().create_customer(
+                    idempotency_key=idempotency_key_for(f"customer-subscription-user-{user.id}", customer_params),
+                    **customer_params
                 )
                 user.stripe_customer_id = customer.id
                 await db.commit()
@@ -221,7 +223,7 @@ class SubscriptionService:
                 customer_id = user.stripe_customer_id
 
             # Create Checkout Session
-            session = stripe.checkout.Session.create(
+            session = await get_stripe_client().create_checkout_session(
                 customer=user.stripe_customer_id,
                 payment_method_types=["card"],
                 line_items=[
@@ -274,7 +276,7 @@ class SubscriptionService:
             raise InvalidStateError(message="User does not have a Stripe customer account")
 
         try:
-            session = stripe.billing_portal.Session.create(
+            session = await get_stripe_client().create_portal_session(
                 customer=user.stripe_customer_id,
                 return_url=return_url,
             )
@@ -449,7 +451,7 @@ class SubscriptionService:
 
         try:
             # List all subscriptions for this customer
-            subscriptions = stripe.Subscription.list(
+            subscriptions = await get_stripe_client().list_subscriptions(
                 customer=user.stripe_customer_id,
                 limit=1,
                 status="all"
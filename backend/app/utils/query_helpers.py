@@ -21,8 +21,10 @@ from typing import Any, Dict, List, Optional, Type, Union, Callable
 from datetime import datetime
 
 from fastapi import Query, HTTPException
-from sqlalchemy import select, and_, or_, func, desc, asc
+from sqlalchemy import Float, select, and_, or_, func, desc, asc
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql import Select
+from sqlalchemy.sql.functions import FunctionElement
 from sqlalchemy.orm import InstrumentedAttribute
 
 
@@ -506,3 +508,53 @@ def status_filter(
     if exclude:
         return ~column.in_(statuses)
     return column.in_(statuses)
+
+
+# =============================================================================
+# Aggregate Helpers
+# =============================================================================
+
+def count_where(*conditions: Any):
+    """
+    Conditional count: ``COUNT(*) FILTER (WHERE ...)``.
+
+    Lets several counts over one table share a single pass, e.g.
+    ``select(func.count(), count_where(User.is_banned == True))``.
+    """
+    return func.count().filter(and_(*conditions))
+
+
+# =============================================================================
+# Date Arithmetic Helper
+# =============================================================================
+
+class days_between(FunctionElement):
+    """
+    Fractional days from ``start`` to ``end``, portable across databases.
+
+    Renders as ``julianday(end) - julianday(start)`` on SQLite and as an
+    epoch difference elsewhere (PostgreSQL), so aggregates like
+    ``func.avg(days_between(Model.decided_at, Model.submitted_at))`` run
+    unchanged in development and production.
+    """
+    type = Float()
+    name = "days_between"
+    inherit_cache = True
+
+
+@compiles(days_between)
+def _days_between_default(element, compiler, **kw):
+    end, start = list(element.clauses)
+    return "(EXTRACT(EPOCH FROM (%s - %s)) / 86400.0)" % (
+        compiler.process(end, **kw),
+        compiler.process(start, **kw),
+    )
+
+
+@compiles(days_between, "sqlite")
+def _days_between_sqlite(element, compiler, **kw):
+    end, start = list(element.clauses)
+    return "(julianday(%s) - julianday(%s))" % (
+        compiler.process(end, **kw),
+        compiler.process(start, **kw),
+    )
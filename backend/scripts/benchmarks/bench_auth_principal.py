@@ -0,0 +1,95 @@
+"""
+Microbenchmark: auth principal projection vs full User load.
+
+Simulates the per-request work of GET /notifications/unread-count against
+an in-memory SQLite database (one fresh session per "request"):
+- full:       get_current_user (select(User), ~100 columns) + unread count
+- principal:  get_current_principal (9 columns) + unread count
+
+It also times the auth dependency on its own.
+
+The user row is seeded with realistic profile data (bio, badges and
+specialty tag JSON) so the full load pays for its wide columns.
+
+Usage:
+    python scripts/benchmarks/bench_auth_principal.py [requests] [repeat]
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+import app.models  # noqa: E402,F401 - register all models
+from app.api.deps import get_current_principal, get_current_user  # noqa: E402
+from app.core.security import create_access_token  # noqa: E402
+from app.models.user import Base, User  # noqa: E402
+from app.services.notifications.core import NotificationService  # noqa: E402
+
+
+async def seed(session_maker) -> str:
+    async with session_maker() as db:
+        user = User(
+            email="bench@example.com",
+            full_name="Bench Reviewer",
+            bio="Designer and illustrator. " * 40,
+            title="Senior Product Designer",
+            specialty_tags=json.dumps(["ui", "ux", "branding", "illustration", "motion"] * 4),
+            badges=json.dumps([{"id": f"badge-{i}", "earned_at": "2026-01-01"} for i in range(20)]),
+            reviewer_tagline="Fast, honest, actionable feedback",
+        )
+        db.add(user)
+        await db.commit()
+        return create_access_token(data={"user_id": user.id, "email": user.email})
+
+
+async def run(session_maker, token: str, dependency, requests: int, with_route: bool = True) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        async with session_maker() as db:
+            current_user = await dependency(access_token=token, db=db)
+            if with_route:
+                await NotificationService(db).get_unread_count(current_user.id)
+    return time.perf_counter() - started
+
+
+async def main(requests: int, repeat: int) -> None:
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    token = await seed(session_maker)
+
+    # Warm up statement caches for both paths
+    await run(session_maker, token, get_current_user, 50)
+    await run(session_maker, token, get_current_principal, 50)
+
+    print(f"{requests} requests x {repeat} repeats (best of)")
+    for label, with_route in (("auth dependency only", False), ("/notifications/unread-count", True)):
+        print(label)
+        results = {}
+        for name, dependency in (("full", get_current_user), ("principal", get_current_principal)):
+            best = min([await run(session_maker, token, dependency, requests, with_route) for _ in range(repeat)])
+            results[name] = best
+            print(f"  {name:<10} {best * 1000:8.1f} ms  {best / requests * 1e6:7.1f} us/request")
+
+        saved = results["full"] - results["principal"]
+        print(f"  saving     {saved / requests * 1e6:7.1f} us/request ({saved / results['full']:.0%})")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    num_requests = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    asyncio.run(main(num_requests, repeat))
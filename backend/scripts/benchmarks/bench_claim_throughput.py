@@ -0,0 +1,110 @@
+"""
+Benchmark: concurrent slot claims on one hot review request.
+
+Seeds a free review request with many slots and lets every reviewer claim
+one concurrently (one session per claim, as the API does), then reports
+claims per second and checks that the claimed counter matches the claimed
+slots.
+
+Runs against a temporary file-backed SQLite database by default. Set
+BENCH_DATABASE_URL to an async PostgreSQL URL (an empty database) to
+measure the SKIP LOCKED path, where claims on different slots don't wait
+for each other.
+
+Usage:
+    python scripts/benchmarks/bench_claim_throughput.py [reviewers] [concurrency]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from sqlalchemy import func, select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+import app.models  # noqa: E402,F401 - register all models
+from app.models.review_request import ContentType, ReviewRequest, ReviewStatus, ReviewType  # noqa: E402
+from app.models.review_slot import ReviewSlot, ReviewSlotStatus  # noqa: E402
+from app.models.user import Base, User  # noqa: E402
+from app.services.claim_service import ClaimService, ClaimValidationError  # noqa: E402
+
+
+async def seed(session_maker, reviewers: int) -> tuple:
+    async with session_maker() as db:
+        users = [User(email=f"bench{i}@example.com", username=f"bench{i}") for i in range(reviewers + 1)]
+        db.add_all(users)
+        await db.flush()
+
+        review = ReviewRequest(
+            user_id=users[0].id,
+            title="Hot request",
+            description="Everyone wants to review this one",
+            content_type=ContentType.DESIGN,
+            review_type=ReviewType.FREE,
+            status=ReviewStatus.PENDING,
+            reviews_requested=reviewers,
+        )
+        db.add(review)
+        await db.flush()
+        db.add_all([ReviewSlot(review_request_id=review.id) for _ in range(reviewers)])
+        await db.commit()
+        return review.id, [user.id for user in users[1:]]
+
+
+async def claim(session_maker, semaphore, review_id: int, reviewer_id: int) -> bool:
+    async with semaphore, session_maker() as db:
+        try:
+            await ClaimService.claim_review_by_request_id(db, review_id, reviewer_id)
+            return True
+        except ClaimValidationError:
+            return False
+
+
+async def main(reviewers: int, concurrency: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        url = os.environ.get("BENCH_DATABASE_URL", f"sqlite+aiosqlite:///{tmp}/claims.db")
+        if url.startswith("sqlite"):
+            engine = create_async_engine(url, connect_args={"timeout": 30})
+        else:
+            engine = create_async_engine(url, pool_size=concurrency)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+        review_id, reviewer_ids = await seed(session_maker, reviewers)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*[
+            claim(session_maker, semaphore, review_id, reviewer_id) for reviewer_id in reviewer_ids
+        ])
+        elapsed = time.perf_counter() - started
+
+        async with session_maker() as db:
+            review = await db.get(ReviewRequest, review_id)
+            claimed_slots = (await db.execute(
+                select(func.count()).where(
+                    ReviewSlot.review_request_id == review_id,
+                    ReviewSlot.status == ReviewSlotStatus.CLAIMED.value,
+                )
+            )).scalar_one()
+
+        print(f"{engine.dialect.name}: {reviewers} reviewers, {concurrency} concurrent sessions")
+        print(f"  claimed    {sum(results)}/{reviewers} slots in {elapsed * 1000:.1f} ms")
+        print(f"  throughput {sum(results) / elapsed:8.1f} claims/s")
+        print(f"  counter    {review.reviews_claimed} (claimed slots: {claimed_slots})")
+
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    num_reviewers = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    num_concurrent = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    asyncio.run(main(num_reviewers, num_concurrent))
@@ -0,0 +1,98 @@
+"""
+Microbenchmark: single-pass feedback analysis vs per-keyword loops.
+
+Compares, over a synthetic corpus of review texts:
+- legacy:  lowercase once, then one str.count scan per keyword (the
+           pattern ReviewerDNAService used for action items), repeated
+           for each signal vocabulary. str.count also matches inside
+           other words ("address" -> "add"), so its counts are higher
+           than the whole-word counts of the new matcher.
+- single:  analyze_feedback() per text (one compiled matcher pass)
+- batch:   analyze_feedback_batch() over the whole corpus
+
+Usage:
+    python scripts/benchmarks/bench_feedback_analysis.py [num_texts] [repeat]
+"""
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.services.ratings.feedback_analysis import (  # noqa: E402
+    ACTION_KEYWORDS,
+    ENCOURAGEMENT_KEYWORDS,
+    SPECIFICITY_MARKERS,
+    analyze_feedback,
+    analyze_feedback_batch,
+)
+
+
+VOCABULARY = (
+    "the layout is clean but you should consider stronger contrast and try to improve "
+    "the spacing around the hero section because it feels cramped great work overall "
+    "love the colour palette for example the buttons maybe fix the header alignment "
+    "and update the copy it would help readers nice job keep it up on line twelve"
+).split()
+
+# Neutral prose so keyword density resembles real reviews (~1 keyword in 8 words)
+FILLER = (
+    "this design page text image colour font menu footer card grid photo video "
+    "audio track mix story chapter scene brand logo icon user flow feels reads "
+    "looks works seems pretty quite really very a an of to in on with at it is was"
+).split()
+
+
+def build_corpus(num_texts: int, seed: int = 42) -> list[str]:
+    rng = random.Random(seed)
+    words = VOCABULARY + FILLER * 3
+    return [
+        " ".join(rng.choice(words) for _ in range(rng.randint(50, 400)))
+        for _ in range(num_texts)
+    ]
+
+
+def legacy_analyze(text: str) -> tuple[int, int, int, int]:
+    text_lower = text.lower()
+    action = sum(text_lower.count(keyword) for keyword in ACTION_KEYWORDS)
+    specificity = sum(text_lower.count(keyword) for keyword in SPECIFICITY_MARKERS)
+    encouragement = sum(text_lower.count(keyword) for keyword in ENCOURAGEMENT_KEYWORDS)
+    return len(text.split()), action, specificity, encouragement
+
+
+def legacy_action_only(text: str) -> int:
+    text_lower = text.lower()
+    return sum(text_lower.count(keyword) for keyword in ACTION_KEYWORDS)
+
+
+def main() -> None:
+    num_texts = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    corpus = build_corpus(num_texts)
+    total_words = sum(len(text.split()) for text in corpus)
+
+    cases = {
+        "legacy (action keywords only)": lambda: [legacy_action_only(t) for t in corpus],
+        "legacy (all vocabularies)": lambda: [legacy_analyze(t) for t in corpus],
+        "analyze_feedback (all signals)": lambda: [analyze_feedback(t) for t in corpus],
+        "analyze_feedback_batch (all signals)": lambda: analyze_feedback_batch(corpus),
+    }
+
+    print(f"Corpus: {num_texts} texts, {total_words} words, best of {repeat}\n")
+    baseline = None
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        if name == "legacy (all vocabularies)":
+            baseline = best
+        per_text_us = best / num_texts * 1e6
+        print(f"{name:<40} {best * 1000:8.1f} ms  {per_text_us:6.1f} us/text")
+
+    if baseline:
+        batch_best = min(timeit.repeat(cases["analyze_feedback_batch (all signals)"], number=1, repeat=repeat))
+        print(f"\nBatch speedup vs legacy (all vocabularies): {baseline / batch_best:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark: per-request overhead of HTTPMetricsMiddleware.
+
+Calls a trivial ASGI app directly (no server, no client) with and without
+the metrics middleware in front and reports the added time per request.
+The target is under 50 µs.
+
+Usage:
+    python scripts/benchmarks/bench_metrics_overhead.py [requests] [repeat]
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from app.core.metrics import HTTPMetricsMiddleware  # noqa: E402
+
+
+class Route:
+    path_format = "/api/v1/reviews/{review_id}"
+
+
+ROUTES = [Route()]
+
+
+async def trivial_app(scope, receive, send):
+    scope["route"] = ROUTES[0]
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/plain")]})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+
+async def run(app, requests: int) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app({"type": "http", "method": "GET", "path": "/api/v1/reviews/1"}, receive, send)
+    return time.perf_counter() - started
+
+
+async def main(requests: int, repeat: int) -> None:
+    instrumented = HTTPMetricsMiddleware(trivial_app)
+    await run(instrumented, 1000)  # Warm up
+
+    bare = min([await run(trivial_app, requests) for _ in range(repeat)])
+    timed = min([await run(instrumented, requests) for _ in range(repeat)])
+
+    print(f"{requests} requests, best of {repeat}")
+    print(f"  bare app        {bare / requests * 1e6:7.2f} µs/request")
+    print(f"  with metrics    {timed / requests * 1e6:7.2f} µs/request")
+    print(f"  overhead        {(timed - bare) / requests * 1e6:7.2f} µs/request")
+
+
+if __name__ == "__main__":
+    num_requests = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    num_repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    asyncio.run(main(num_requests, num_repeat))
@@ -0,0 +1,155 @@
+"""
+Benchmark: security headers + CSRF middleware, BaseHTTPMiddleware vs pure ASGI.
+
+Serves a trivial route through both middleware layers and reports requests
+per second for the previous BaseHTTPMiddleware implementations (reproduced
+below) and the current pure-ASGI ones. Requests are GETs and CSRF-checked
+POSTs sent straight to the ASGI app (no server, no HTTP client), so the
+numbers are the middleware cost plus Starlette routing.
+
+Usage:
+    python scripts/benchmarks/bench_middleware_stack.py [requests] [repeat]
+"""
+
+import asyncio
+import os
+import secrets
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from starlette.applications import Starlette  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+from starlette.responses import JSONResponse, PlainTextResponse  # noqa: E402
+from starlette.routing import Route  # noqa: E402
+
+from app.core.csrf import (  # noqa: E402
+    CSRF_COOKIE_NAME,
+    CSRF_HEADER_NAME,
+    EXEMPT_PATH_PREFIXES,
+    EXEMPT_PATHS,
+    PROTECTED_METHODS,
+    CSRFMiddleware,
+    is_path_exempt,
+)
+from app.core.security_headers import SecurityHeadersMiddleware  # noqa: E402
+
+
+# ===== Previous implementations =====
+
+def legacy_is_path_exempt(path: str) -> bool:
+    if path in EXEMPT_PATHS:
+        return True
+    for prefix in EXEMPT_PATH_PREFIXES:
+        if path.startswith(prefix):
+            return True
+    return False
+
+
+class LegacySecurityHeadersMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        response = await call_next(request)
+        response.headers["X-Content-Type-Options"] = "nosniff"
+        response.headers["X-Frame-Options"] = "DENY"
+        response.headers["X-XSS-Protection"] = "1; mode=block"
+        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
+        return response
+
+
+class LegacyCSRFMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        csrf_cookie = request.cookies.get(CSRF_COOKIE_NAME)
+        if request.method.upper() in PROTECTED_METHODS and not legacy_is_path_exempt(request.url.path):
+            csrf_header = request.headers.get(CSRF_HEADER_NAME)
+            if not csrf_cookie or not csrf_header or not secrets.compare_digest(csrf_cookie, csrf_header):
+                return JSONResponse(status_code=403, content={"error": {"code": "CSRF_VALIDATION_FAILED"}})
+        response = await call_next(request)
+        if not csrf_cookie:
+            response.set_cookie(key=CSRF_COOKIE_NAME, value=secrets.token_urlsafe(32), samesite="lax")
+        return response
+
+
+# ===== Harness =====
+
+async def ok(request):
+    return PlainTextResponse("ok")
+
+
+def build_app(security_middleware, csrf_middleware) -> Starlette:
+    app = Starlette(routes=[Route("/api/v1/reviews/{review_id}", ok, methods=["GET", "POST"])])
+    app.add_middleware(security_middleware)
+    app.add_middleware(csrf_middleware)
+    return app
+
+
+def scope(method: str) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": "/api/v1/reviews/42",
+        "raw_path": b"/api/v1/reviews/42",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"host", b"test"),
+            (b"cookie", f"session=abc; {CSRF_COOKIE_NAME}=token".encode()),
+            (CSRF_HEADER_NAME.lower().encode(), b"token"),
+        ],
+        "client": ("127.0.0.1", 1234),
+        "server": ("test", 80),
+    }
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def run(app, requests: int) -> float:
+    statuses = []
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    started = time.perf_counter()
+    for i in range(requests):
+        await app(scope("POST" if i % 2 else "GET"), receive, send)
+    elapsed = time.perf_counter() - started
+    assert set(statuses) == {200}, set(statuses)
+    return elapsed
+
+
+async def main(requests: int, repeat: int) -> None:
+    apps = {
+        "BaseHTTPMiddleware": build_app(LegacySecurityHeadersMiddleware, LegacyCSRFMiddleware),
+        "pure ASGI": build_app(SecurityHeadersMiddleware, CSRFMiddleware),
+    }
+    for app in apps.values():
+        await run(app, 500)  # Warm up
+
+    print(f"{requests} requests (GET/POST alternating), best of {repeat}")
+    results = {}
+    for name, app in apps.items():
+        results[name] = min([await run(app, requests) for _ in range(repeat)])
+        print(f"  {name:<20} {requests / results[name]:9.0f} req/s  {results[name] / requests * 1e6:7.1f} µs/request")
+    print(f"  speedup              {results['BaseHTTPMiddleware'] / results['pure ASGI']:.2f}x")
+
+    paths = ["/api/v1/reviews/42", "/api/v1/webhooks/stripe", "/api/v1/auth/login", "/health"] * 25_000
+    print("CSRF exempt-path check")
+    for name, check in [("set + prefix loop", legacy_is_path_exempt), ("compiled trie", is_path_exempt)]:
+        started = time.perf_counter()
+        for path in paths:
+            check(path)
+        print(f"  {name:<20} {(time.perf_counter() - started) / len(paths) * 1e9:9.0f} ns/path")
+
+
+if __name__ == "__main__":
+    num_requests = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    num_repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    asyncio.run(main(num_requests, num_repeat))
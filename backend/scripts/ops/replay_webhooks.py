@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Inspect and replay stored Stripe webhook events.
+
+Replayed events are reset to pending (attempt count cleared) and picked
+up by the webhook worker pool of a running backend, or processed here
+with --process.
+
+Usage:
+    python scripts/ops/replay_webhooks.py stats
+    python scripts/ops/replay_webhooks.py replay --status failed
+    python scripts/ops/replay_webhooks.py replay --event-id evt_123 --event-id evt_456
+    python scripts/ops/replay_webhooks.py replay --type payment_intent.succeeded --since 2026-10-01 --process
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add the backend root to the path (go up 2 levels from scripts/ops/)
+backend_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(backend_root))
+
+import app.models  # noqa: E402,F401 - register all models
+from app.services.payments.webhook_inbox import webhook_inbox, webhook_worker_pool  # noqa: E402
+
+
+async def main(args: argparse.Namespace) -> int:
+    if args.command == "stats":
+        print(json.dumps(await webhook_inbox.stats(), indent=2))
+        return 0
+
+    since = datetime.fromisoformat(args.since) if args.since else None
+    try:
+        count = await webhook_inbox.replay(
+            event_ids=args.event_id,
+            status=args.status,
+            event_type=args.type,
+            since=since,
+        )
+    except ValueError as e:
+        print(f"✗ {e}")
+        return 1
+    print(f"✓ Re-queued {count} webhook events")
+
+    if args.process:
+        processed = await webhook_worker_pool.drain()
+        print(f"✓ Processed {processed} webhook events")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    subcommands.add_parser("stats", help="Show inbox depth and lag")
+
+    replay = subcommands.add_parser("replay", help="Re-queue stored events")
+    replay.add_argument("--event-id", action="append", help="Stripe event ID (repeatable)")
+    replay.add_argument("--status", choices=["pending", "processed", "failed"], help="Only events with this status")
+    replay.add_argument("--type", help="Only events of this type")
+    replay.add_argument("--since", help="Only events received at or after this ISO date/time (UTC)")
+    replay.add_argument("--process", action="store_true", help="Process the re-queued events now")
+
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -9,19 +9,22 @@ import pytest
 import asyncio
 from typing import AsyncGenerator
 from httpx import AsyncClient, ASGITransport
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import NullPool, StaticPool
 
 # IMPORTANT: Import models BEFORE importing app to ensure they're registered with Base.metadata
 from app.models.user import Base, User, UserRole
 from app.models.review_request import ReviewRequest, ReviewStatus, ContentType, ReviewType
 from app.models.review_file import ReviewFile
 from app.models.review_slot import ReviewSlot
+import app.models  # noqa: F401 - register all models with Base.metadata
 
 # Now import app (which won't re-initialize Base since models are already loaded)
 from app.main import app
 from app.db.session import get_db
 from app.core.security import get_password_hash, create_access_token
+from app.services.payments.stripe_client import set_stripe_client
+from fake_stripe import FakeStripeServer
 
 
 # Test database configuration
@@ -89,6 +92,44 @@ async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
         await session.rollback()
 
 
+@pytest.fixture
+async def engine() -> AsyncGenerator[AsyncEngine, None]:
+    """
+    In-memory SQLite database with all tables, shared across a single
+    connection (StaticPool) so every session sees the same data.
+    """
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest.fixture
+def session_maker(engine: AsyncEngine) -> async_sessionmaker:
+    """Session factory on the shared in-memory database."""
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+async def db(engine: AsyncEngine, session_maker: async_sessionmaker) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Session on the shared in-memory database.
+
+    session.info["engine"] holds the engine, for tests that listen to the
+    statements it runs.
+    """
+    async with session_maker() as session:
+        session.info["engine"] = engine
+        yield session
+
+
 # ============================================================================
 # HTTP Client Fixtures
 # ============================================================================
@@ -114,6 +155,28 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     app.dependency_overrides.clear()
 
 
+# ============================================================================
+# Stripe Fixtures
+# ============================================================================
+
+@pytest.fixture
+async def fake_stripe() -> AsyncGenerator[FakeStripeServer, None]:
+    """
+    Route all Stripe API calls to an in-process fake Stripe server.
+
+    Payment and subscription services use the process-wide Stripe client,
+    which is swapped for one wired to the fake for the duration of the test.
+    """
+    server = FakeStripeServer()
+    stripe_client = server.client()
+    set_stripe_client(stripe_client)
+
+    yield server
+
+    await stripe_client.aclose()
+    set_stripe_client(None)
+
+
 # ============================================================================
 # User Fixtures
 # ============================================================================
@@ -287,6 +350,9 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "security: mark test as security-focused"
     )
+    config.addinivalue_line(
+        "markers", "postgres: mark test as needing PostgreSQL (set TEST_POSTGRES_URL)"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -0,0 +1,237 @@
+"""
+Fake in-process Stripe server for tests
+
+Implements the subset of the Stripe REST API used by the payment and
+subscription services as an httpx transport, so a StripeClient pointed at
+it never touches the network.
+
+Features:
+- Stores created objects and serves them back on retrieve/list
+- Honours Idempotency-Key (replays the original response)
+- Records every request for assertions
+- Failure injection (fail_next) and artificial latency for retry/timeout tests
+
+Usage:
+    fake = FakeStripeServer()
+    client = fake.client()
+    transfer = await client.create_transfer(amount=500, currency="usd", destination="acct_1")
+    assert fake.objects["transfer"][transfer.id]["amount"] == 500
+"""
+
+import asyncio
+import itertools
+import json
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+import httpx
+
+from app.services.payments.stripe_client import StripeClient
+
+
+def decode_form(pairs: List[Tuple[str, str]]) -> Dict[str, Any]:
+    """Rebuild nested params from Stripe's bracketed form encoding."""
+    root: Dict[str, Any] = {}
+    for key, value in pairs:
+        parts = key.replace("]", "").split("[")
+        node = root
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+        node[parts[-1]] = value
+
+    def listify(node: Any) -> Any:
+        if not isinstance(node, dict):
+            return node
+        if node and all(k.isdigit() for k in node):
+            return [listify(node[k]) for k in sorted(node, key=int)]
+        return {k: listify(v) for k, v in node.items()}
+
+    return listify(root)
+
+
+class FakeStripeServer:
+    """In-memory Stripe API served through httpx.MockTransport"""
+
+    PREFIXES = {
+        "customer": "cus",
+        "payment_intent": "pi",
+        "transfer": "tr",
+        "refund": "re",
+        "account": "acct",
+        "payout": "po",
+        "checkout.session": "cs",
+        "billing_portal.session": "bps",
+        "subscription": "sub",
+    }
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.objects: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+        self.balances: Dict[str, Dict[str, Any]] = {}
+        self.requests: List[httpx.Request] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._idempotent: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._failures: List[Tuple[int, Dict[str, str]]] = []
+        self._ids = itertools.count(1)
+
+    # ===== Test helpers =====
+
+    def client(self, **kwargs) -> StripeClient:
+        """Build a StripeClient wired to this server."""
+        kwargs.setdefault("api_key", "sk_test_fake")
+        kwargs.setdefault("base_url", "https://stripe.test")
+        return StripeClient(transport=httpx.MockTransport(self.handle), **kwargs)
+
+    def fail_next(self, status_code: int = 500, times: int = 1, headers: Optional[Dict[str, str]] = None) -> None:
+        """Make the next `times` requests fail with `status_code`."""
+        self._failures.extend([(status_code, headers or {})] * times)
+
+    def add(self, object_type: str, **fields) -> Dict[str, Any]:
+        """Seed an object (e.g. a payout or subscription) into the store."""
+        return self._new_object(object_type, fields)
+
+    def set_balance(self, account_id: str, available_cents: int, pending_cents: int = 0) -> None:
+        self.balances[account_id] = {
+            "object": "balance",
+            "available": [{"amount": available_cents, "currency": "usd"}],
+            "pending": [{"amount": pending_cents, "currency": "usd"}],
+        }
+
+    def requests_to(self, method: str, path: str) -> List[httpx.Request]:
+        return [r for r in self.requests if r.method == method and r.url.path == path]
+
+    # ===== Transport =====
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            return self._dispatch(request)
+        finally:
+            self.in_flight -= 1
+
+    def _dispatch(self, request: httpx.Request) -> httpx.Response:
+        if self._failures:
+            status_code, headers = self._failures.pop(0)
+            return self._error(status_code, "api_error", "Injected failure", headers)
+
+        if not request.headers.get("Authorization", "").startswith("Bearer sk_"):
+            return self._error(401, "invalid_request_error", "Invalid API Key provided")
+
+        idempotency_key = request.headers.get("Idempotency-Key")
+        if request.method == "POST" and idempotency_key in self._idempotent:
+            status_code, body = self._idempotent[idempotency_key]
+            return httpx.Response(status_code, json=body, headers={"Idempotent-Replayed": "true"})
+
+        if request.method == "POST":
+            params = decode_form(parse_qsl(request.content.decode(), keep_blank_values=True))
+        else:
+            params = decode_form(list(request.url.params.multi_items()))
+        account = request.headers.get("Stripe-Account")
+
+        status_code, body = self._route(request.method, request.url.path, params, account)
+        if request.method == "POST" and idempotency_key and status_code < 500:
+            self._idempotent[idempotency_key] = (status_code, body)
+        return httpx.Response(status_code, json=body)
+
+    def _route(self, method: str, path: str, params: Dict[str, Any], account: Optional[str]) -> Tuple[int, Dict[str, Any]]:
+        parts = path.strip("/").split("/")[1:]  # drop "v1"
+
+        creatable = {
+            ("customers",): "customer",
+            ("payment_intents",): "payment_intent",
+            ("transfers",): "transfer",
+            ("refunds",): "refund",
+            ("accounts",): "account",
+            ("checkout", "sessions"): "checkout.session",
+            ("billing_portal", "sessions"): "billing_portal.session",
+        }
+
+        if method == "POST" and tuple(parts) in creatable:
+            return 200, self._create(creatable[tuple(parts)], params)
+
+        if method == "POST" and parts == ["account_links"]:
+            return 200, {"object": "account_link", "url": f"https://connect.stripe.test/setup/{params['account']}"}
+
+        if method == "POST" and len(parts) == 3 and parts[0] == "accounts" and parts[2] == "login_links":
+            if parts[1] not in self.objects["account"]:
+                return self._missing("account", parts[1])
+            return 200, {"object": "login_link", "url": f"https://connect.stripe.test/express/{parts[1]}"}
+
+        if method == "GET" and len(parts) == 2 and parts[0] in ("payment_intents", "accounts"):
+            object_type = "payment_intent" if parts[0] == "payment_intents" else "account"
+            obj = self.objects[object_type].get(parts[1])
+            if obj is None:
+                return self._missing(object_type, parts[1])
+            return 200, obj
+
+        if method == "GET" and parts == ["balance"]:
+            return 200, self.balances.get(account or "platform", {
+                "object": "balance",
+                "available": [{"amount": 0, "currency": "usd"}],
+                "pending": [{"amount": 0, "currency": "usd"}],
+            })
+
+        if method == "GET" and parts == ["payouts"]:
+            payouts = [p for p in self.objects["payout"].values() if p.get("account") == account]
+            return 200, self._list(payouts, params)
+
+        if method == "GET" and parts == ["subscriptions"]:
+            subscriptions = [
+                s for s in self.objects["subscription"].values()
+                if s.get("customer") == params.get("customer")
+            ]
+            return 200, self._list(subscriptions, params)
+
+        return 404, self._error_body("invalid_request_error", f"Unrecognized request URL ({method}: {path})")
+
+    def _create(self, object_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        fields = dict(params)
+        for key in ("amount",):
+            if key in fields:
+                fields[key] = int(fields[key])
+        if object_type == "payment_intent":
+            fields.setdefault("status", "requires_payment_method")
+        if object_type == "account":
+            fields.setdefault("details_submitted", False)
+            fields.setdefault("payouts_enabled", False)
+        obj = self._new_object(object_type, fields)
+        if object_type == "payment_intent":
+            obj["client_secret"] = f"{obj['id']}_secret_fake"
+        if object_type in ("checkout.session", "billing_portal.session"):
+            obj["url"] = f"https://checkout.stripe.test/{obj['id']}"
+        return obj
+
+    def _new_object(self, object_type: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        object_id = fields.pop("id", None) or f"{self.PREFIXES[object_type]}_fake{next(self._ids)}"
+        obj = {"id": object_id, "object": object_type, "created": int(time.time()), **fields}
+        self.objects[object_type][object_id] = obj
+        return obj
+
+    @staticmethod
+    def _list(items: List[Dict[str, Any]], params: Dict[str, Any]) -> Dict[str, Any]:
+        items = sorted(items, key=lambda item: item["created"], reverse=True)
+        limit = int(params.get("limit", 10))
+        return {"object": "list", "data": items[:limit], "has_more": len(items) > limit}
+
+    def _missing(self, object_type: str, object_id: str) -> Tuple[int, Dict[str, Any]]:
+        return 404, self._error_body(
+            "invalid_request_error", f"No such {object_type}: '{object_id}'", code="resource_missing"
+        )
+
+    @staticmethod
+    def _error_body(error_type: str, message: str, code: Optional[str] = None) -> Dict[str, Any]:
+        return {"error": {"type": error_type, "message": message, "code": code}}
+
+    def _error(self, status_code: int, error_type: str, message: str, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        return httpx.Response(
+            status_code,
+            content=json.dumps(self._error_body(error_type, message)),
+            headers={"Content-Type": "application/json", **(headers or {})},
+        )
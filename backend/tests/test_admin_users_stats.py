@@ -0,0 +1,107 @@
+"""
+Tests for admin user stats and search
+
+These tests verify that:
+- Dashboard stats come from one query and are served from a shared
+  snapshot until it expires or a moderation action clears it
+- User search matches email and full name substrings through the FTS
+  index, including renamed and deleted users, and short queries
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.models.expert_application import ApplicationStatus, ExpertApplication
+from app.models.user import User, UserRole
+from app.services import admin_users_service
+from app.services.admin_users_service import AdminUsersService
+
+
+@pytest.fixture(autouse=True)
+def clear_stats_cache():
+    admin_users_service.admin_stats_cache.clear()
+    yield
+    admin_users_service.admin_stats_cache.clear()
+
+
+def _count_queries(engine) -> list:
+    statements = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+@pytest.mark.asyncio
+async def test_stats_single_query_snapshot(db):
+    now = datetime.utcnow()
+    admin = User(email="admin@example.com", username="admin", role=UserRole.ADMIN, last_login=now)
+    db.add_all([
+        admin,
+        User(email="old@example.com", username="old", created_at=now - timedelta(days=30)),
+        User(email="reviewer@example.com", username="reviewer", role=UserRole.REVIEWER, is_banned=True),
+        User(email="quiet@example.com", username="quiet", is_suspended=True),
+    ])
+    await db.flush()
+    db.add(ExpertApplication(
+        user_id=admin.id, email=admin.email, full_name="Admin",
+        status=ApplicationStatus.SUBMITTED.value,
+    ))
+    await db.commit()
+
+    service = AdminUsersService(db)
+    statements = _count_queries(db.info["engine"])
+    stats = await service.get_admin_stats()
+
+    assert len(statements) == 1
+    assert {key: stats[key] for key in (
+        "total_users", "new_users_this_week", "active_users_today", "total_reviewers",
+        "total_admins", "banned_users", "suspended_users", "pending_applications",
+        "approved_this_month", "active_challenges", "total_reviews",
+    )} == {
+        "total_users": 4, "new_users_this_week": 3, "active_users_today": 1, "total_reviewers": 1,
+        "total_admins": 1, "banned_users": 1, "suspended_users": 1, "pending_applications": 1,
+        "approved_this_month": 0, "active_challenges": 0, "total_reviews": 0,
+    }
+
+    # Served from the snapshot until a moderation action clears it
+    db.add(User(email="new@example.com", username="new"))
+    await db.commit()
+    statements.clear()
+    assert (await service.get_admin_stats())["total_users"] == 4
+    assert statements == []
+
+    await service.suspend_user(2, reason="Spam", duration_hours=24, admin=admin)
+    assert (await service.get_admin_stats())["total_users"] == 5
+
+
+@pytest.mark.asyncio
+async def test_user_search(db):
+    db.add_all([
+        User(email="ada@lovelace.dev", username="ada", full_name="Ada Lovelace"),
+        User(email="grace@navy.mil", username="grace", full_name="Grace Hopper"),
+        User(email="alan@bletchley.uk", username="alan", full_name="Alan Turing"),
+    ])
+    await db.commit()
+    service = AdminUsersService(db)
+
+    async def search(query: str) -> set:
+        users, total = await service.get_users(query=query)
+        assert total == len(users)
+        return {user.username for user in users}
+
+    assert await search("LOVE") == {"ada"}
+    assert await search("hop") == {"grace"}
+    assert await search("a") == {"ada", "grace", "alan"}
+    assert await search("al") == {"alan"}
+    assert await search('"quoted') == set()
+
+    grace = (await service.get_users(query="navy"))[0][0]
+    grace.full_name = "Grace Brewster"
+    await db.commit()
+    assert await search("hopper") == set()
+    assert await search("brewster") == {"grace"}
+
+    await db.delete(grace)
+    await db.commit()
+    assert await search("navy") == set()
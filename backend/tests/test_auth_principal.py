@@ -0,0 +1,102 @@
+"""
+Tests for the lightweight auth principal
+
+These tests verify that:
+- get_current_principal selects only the principal columns
+- The full User is loaded lazily, once, when a handler asks for it
+- Account status checks match get_current_user
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.deps import (
+    AuthPrincipal,
+    get_current_principal,
+    get_current_principal_optional,
+    get_current_user_optional,
+)
+from app.core.exceptions import BannedUserError, SuspendedUserError, TokenInvalidError
+from app.core.security import create_access_token
+from app.models.user import User, UserRole
+
+
+@pytest.fixture
+async def db(engine):
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+
+
+@pytest.fixture
+def statements(engine):
+    """Record the SQL statements executed on the engine."""
+    seen = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        seen.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    yield seen
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+async def _create_user(db: AsyncSession, **fields) -> tuple[User, str]:
+    user = User(email=f"user{datetime.utcnow().timestamp()}@example.com", bio="long bio", **fields)
+    db.add(user)
+    await db.commit()
+    db.expunge(user)
+    return user, create_access_token(data={"user_id": user.id, "email": user.email})
+
+
+@pytest.mark.asyncio
+async def test_principal_uses_column_limited_query(db, statements):
+    """Only the principal columns are selected; the full row loads on demand"""
+    user, token = await _create_user(db, role=UserRole.ADMIN)
+    statements.clear()
+
+    principal = await get_current_principal(access_token=token, db=db)
+
+    assert isinstance(principal, AuthPrincipal)
+    assert principal.id == user.id
+    assert principal.is_admin
+    assert len(statements) == 1
+    assert "users.bio" not in statements[0]
+    assert "users.stripe_customer_id" not in statements[0]
+
+    full_user = await principal.get_user()
+    assert full_user.bio == "long bio"
+    assert await principal.get_user() is full_user
+    assert len(statements) == 2
+
+
+@pytest.mark.asyncio
+async def test_principal_rejects_blocked_accounts(db):
+    """Banned and actively suspended accounts are rejected like get_current_user"""
+    _, banned_token = await _create_user(db, is_banned=True)
+    _, suspended_token = await _create_user(
+        db, is_suspended=True, suspended_until=datetime.utcnow() + timedelta(days=1)
+    )
+    _, expired_token = await _create_user(
+        db, is_suspended=True, suspended_until=datetime.utcnow() - timedelta(days=1)
+    )
+
+    with pytest.raises(BannedUserError):
+        await get_current_principal(access_token=banned_token, db=db)
+    with pytest.raises(SuspendedUserError):
+        await get_current_principal(access_token=suspended_token, db=db)
+    assert (await get_current_principal(access_token=expired_token, db=db)).is_suspended
+
+    assert await get_current_principal_optional(access_token=banned_token, db=db) is None
+    assert await get_current_user_optional(access_token=suspended_token, db=db) is None
+    assert await get_current_principal_optional(access_token=None, db=db) is None
+
+
+@pytest.mark.asyncio
+async def test_unknown_user_is_invalid(db):
+    token = create_access_token(data={"user_id": 9999, "email": "ghost@example.com"})
+
+    with pytest.raises(TokenInvalidError):
+        await get_current_principal(access_token=token, db=db)
@@ -0,0 +1,140 @@
+"""
+Tests for the Connect balance cache
+
+These tests verify that:
+- Repeat balance reads are served from cache within the TTL
+- Balance/payout/transfer webhooks invalidate the affected account
+- Stale values are served when Stripe fails or is slow
+- Hit ratio and upstream latency are tracked and exported as metrics
+"""
+
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.payments.balance_cache import CACHE_LOOKUPS, UPSTREAM_DURATION, ConnectBalanceCache, balance_cache
+from app.services.payments.balance_service import BalanceService
+from app.services.payments.webhook_handlers import PaymentWebhookHandlers
+from fake_stripe import FakeStripeServer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def reviewer():
+    return SimpleNamespace(id=1, stripe_connect_account_id="acct_reviewer")
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    balance_cache.clear()
+    yield
+    balance_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_balance_cached_until_webhook(fake_stripe: FakeStripeServer, reviewer):
+    """Balance is fetched once, then refetched after a payout webhook"""
+    fake_stripe.set_balance("acct_reviewer", available_cents=1000)
+
+    first = await BalanceService.get_available_balance(reviewer)
+    second = await BalanceService.get_available_balance(reviewer)
+    assert first == second == {"available_balance": Decimal("10"), "pending_balance": Decimal("0")}
+    assert len(fake_stripe.requests_to("GET", "/v1/balance")) == 1
+
+    fake_stripe.set_balance("acct_reviewer", available_cents=0)
+    await PaymentWebhookHandlers.handle_connect_balance_event(
+        "payout.paid", {"id": "po_1", "object": "payout"}, "acct_reviewer"
+    )
+
+    third = await BalanceService.get_available_balance(reviewer)
+    assert third["available_balance"] == Decimal("0")
+    assert len(fake_stripe.requests_to("GET", "/v1/balance")) == 2
+
+
+@pytest.mark.asyncio
+async def test_transfer_webhook_invalidates_destination(fake_stripe: FakeStripeServer, reviewer):
+    """transfer.* events invalidate the transfer's destination account"""
+    await BalanceService.get_payout_history(reviewer)
+
+    await PaymentWebhookHandlers.handle_connect_balance_event(
+        "transfer.created", {"id": "tr_1", "destination": "acct_reviewer"}
+    )
+    await BalanceService.get_payout_history(reviewer)
+
+    assert len(fake_stripe.requests_to("GET", "/v1/payouts")) == 2
+    assert balance_cache.stats()["invalidations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_value_served_when_stripe_fails(fake_stripe: FakeStripeServer, reviewer):
+    """An expired entry is served if the refresh fails"""
+    fake_stripe.set_balance("acct_reviewer", available_cents=2500)
+    await BalanceService.get_available_balance(reviewer)
+
+    balance_cache.invalidate("acct_reviewer")
+    fake_stripe.fail_next(status_code=500, times=10)
+    stale_before = CACHE_LOOKUPS.value(result="stale_hit")
+    errors_before = UPSTREAM_DURATION.count(outcome="error")
+
+    balance = await BalanceService.get_available_balance(reviewer)
+
+    assert balance["available_balance"] == Decimal("25")
+    stats = balance_cache.stats()
+    assert stats["stale_hits"] == 1
+    assert stats["upstream_errors"] == 1
+    assert CACHE_LOOKUPS.value(result="stale_hit") == stale_before + 1
+    assert UPSTREAM_DURATION.count(outcome="error") == errors_before + 1
+
+
+@pytest.mark.asyncio
+async def test_slow_refresh_serves_stale_and_fills_cache():
+    """A refresh slower than the timeout serves stale data, then completes in the background"""
+    clock = FakeClock()
+    cache = ConnectBalanceCache(ttl_seconds=60, stale_seconds=600, refresh_timeout_seconds=0.01, clock=clock)
+    values = iter(["old", "new"])
+
+    async def fetch():
+        value = next(values)
+        if value == "new":
+            await asyncio.sleep(0.05)
+        return value
+
+    assert await cache.get("acct_1", "balance", fetch) == "old"
+    clock.now += 61
+
+    assert await cache.get("acct_1", "balance", fetch) == "old"
+    await asyncio.sleep(0.1)
+    assert await cache.get("acct_1", "balance", fetch) == "new"
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["stale_hits"], stats["misses"]) == (1, 1, 1)
+    assert stats["hit_ratio"] == pytest.approx(2 / 3, abs=1e-3)
+    assert stats["upstream_calls"] == 2
+    assert stats["upstream_latency_max_ms"] >= 50
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_request():
+    """Concurrent cold reads for one account make a single upstream call"""
+    cache = ConnectBalanceCache(ttl_seconds=60, stale_seconds=600, refresh_timeout_seconds=1)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*[cache.get("acct_1", "balance", fetch) for _ in range(5)])
+
+    assert results == [1] * 5
+    assert calls == 1
@@ -0,0 +1,174 @@
+"""
+Tests for challenge completion
+
+These tests verify that:
+- Category placements, participant records, user stats and sparks are
+  written in bulk from one ranked query
+- A 1v1 win applies margin karma, stats and streak bonuses
+- Completion is all-or-nothing and a repeated run awards nothing twice
+- Stats and the leaderboard read the rollups completion maintains
+"""
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import InvalidStateError
+from app.models.challenge import Challenge, ChallengeStatus, ChallengeType
+from app.models.challenge_entry import ChallengeEntry
+from app.models.challenge_participant import ChallengeParticipant
+from app.models.review_request import ContentType
+from app.models.sparks_transaction import SparksAction, SparksTransaction
+from app.models.user import User
+from app.services.challenges.lifecycle_service import ChallengeLifecycleService
+from app.services.challenges.query_service import ChallengeQueryService
+from app.services.gamification.sparks_service import SparksService
+
+
+async def _users(db: AsyncSession, count: int) -> list:
+    users = [User(email=f"user{i}@example.com", username=f"user{i}") for i in range(count)]
+    db.add_all(users)
+    await db.flush()
+    return users
+
+
+async def _category_challenge(db: AsyncSession, votes: list, max_winners: int = 3) -> tuple:
+    users = await _users(db, len(votes))
+    challenge = Challenge(
+        title="Poster week",
+        challenge_type=ChallengeType.CATEGORY,
+        content_type=ContentType.DESIGN,
+        status=ChallengeStatus.VOTING,
+        max_winners=max_winners,
+        created_by=users[0].id,
+    )
+    db.add(challenge)
+    await db.flush()
+
+    for user, vote_count in zip(users, votes):
+        db.add(ChallengeParticipant(challenge_id=challenge.id, user_id=user.id))
+        db.add(ChallengeEntry(challenge_id=challenge.id, user_id=user.id, title="Entry", vote_count=vote_count))
+    await db.commit()
+    return challenge, users
+
+
+async def _sparks(db: AsyncSession) -> dict:
+    return dict((await db.execute(select(User.username, User.sparks_points))).all())
+
+
+@pytest.mark.asyncio
+async def test_category_completion(db):
+    # user3 and user1 tie on votes; the earlier entry places first
+    challenge, users = await _category_challenge(db, votes=[1, 9, 4, 9, 0, 2])
+
+    completed = await ChallengeLifecycleService(db).complete_challenge(challenge.id)
+
+    assert completed.status == ChallengeStatus.COMPLETED
+    assert completed.completed_at is not None
+    assert completed.winner_id == users[1].id
+    assert completed.winner_karma_reward == 100
+
+    placements = dict((await db.execute(
+        select(ChallengeParticipant.user_id, ChallengeParticipant.placement)
+    )).all())
+    assert placements == {
+        users[0].id: None, users[1].id: 1, users[2].id: 3,
+        users[3].id: 2, users[4].id: None, users[5].id: None,
+    }
+
+    assert await _sparks(db) == {
+        "user0": 5, "user1": 100, "user2": 25, "user3": 50, "user4": 5, "user5": 5,
+    }
+    actions = (await db.execute(
+        select(SparksTransaction.action, func.count()).group_by(SparksTransaction.action)
+    )).all()
+    assert dict(actions) == {SparksAction.CHALLENGE_WIN: 3, SparksAction.CHALLENGE_LOSS: 3}
+
+    await db.refresh(users[1])
+    assert (users[1].challenges_won, users[1].challenge_win_streak) == (1, 1)
+    assert users[1].xp_points == 100
+
+
+@pytest.mark.asyncio
+async def test_1v1_win_with_streak_bonus(db):
+    winner, loser = await _users(db, 2)
+    winner.challenge_win_streak = 2
+    loser.challenge_win_streak = 4
+    challenge = Challenge(
+        title="Logo duel",
+        challenge_type=ChallengeType.ONE_ON_ONE,
+        content_type=ContentType.DESIGN,
+        status=ChallengeStatus.VOTING,
+        participant1_id=loser.id,
+        participant2_id=winner.id,
+        participant1_votes=2,
+        participant2_votes=8,
+        total_votes=10,
+        created_by=winner.id,
+    )
+    db.add(challenge)
+    await db.commit()
+
+    completed = await ChallengeLifecycleService(db).complete_challenge(challenge.id)
+
+    # 60% margin: 50 base + 30 bonus, plus the 3-win streak bonus
+    assert completed.winner_id == winner.id
+    assert completed.winner_karma_reward == 80
+    assert await _sparks(db) == {"user0": 80 + 50, "user1": 5}
+
+    await db.refresh(winner)
+    await db.refresh(loser)
+    assert (winner.challenges_won, winner.challenge_win_streak, winner.best_challenge_streak) == (1, 3, 3)
+    assert (loser.challenges_lost, loser.challenge_win_streak) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_completion_is_atomic_and_not_repeated(db, monkeypatch):
+    challenge, _ = await _category_challenge(db, votes=[3, 2, 1, 0])
+    challenge_id = challenge.id
+
+    # Fail after the placements and winner awards, before participation karma
+    original = SparksService.award_sparks_bulk
+
+    async def failing(self, user_ids, action, reason, points):
+        if action == SparksAction.CHALLENGE_LOSS:
+            raise RuntimeError("database went away")
+        return await original(self, user_ids, action, reason, points)
+
+    monkeypatch.setattr(SparksService, "award_sparks_bulk", failing)
+    with pytest.raises(RuntimeError):
+        await ChallengeLifecycleService(db).complete_challenge(challenge_id)
+
+    db.expire_all()
+    assert (await db.get(Challenge, challenge_id)).status == ChallengeStatus.VOTING
+    assert (await db.execute(select(SparksTransaction))).first() is None
+    assert set((await _sparks(db)).values()) == {0}
+
+    # Retry succeeds; another run changes nothing
+    monkeypatch.setattr(SparksService, "award_sparks_bulk", original)
+    await ChallengeLifecycleService(db).complete_challenge(challenge_id)
+    with pytest.raises(InvalidStateError):
+        await ChallengeLifecycleService(db).complete_challenge(challenge_id)
+
+    assert (await db.execute(select(func.count(SparksTransaction.id)))).scalar_one() == 4
+    assert await _sparks(db) == {"user0": 100, "user1": 50, "user2": 25, "user3": 5}
+
+
+@pytest.mark.asyncio
+async def test_stats_and_leaderboard_from_rollups(db):
+    challenge, users = await _category_challenge(db, votes=[1, 9, 4])
+    users[2].challenges_won = 1
+    users[2].best_challenge_streak = 4
+    users[2].category_challenges_joined = 1
+    await db.commit()
+    await ChallengeLifecycleService(db).complete_challenge(challenge.id)
+
+    queries = ChallengeQueryService(db)
+    stats = await queries.get_user_challenge_stats(users[1].id)
+    assert stats["challenges_won"] == 1
+    assert stats["total_votes_received"] == 9
+    assert stats["win_rate"] == 100.0
+    assert await queries.get_user_challenge_stats(999) == {}
+
+    leaderboard = await queries.get_leaderboard()
+    assert [(entry["username"], entry["best_streak"]) for entry in leaderboard] == [("user2", 4), ("user1", 1)]
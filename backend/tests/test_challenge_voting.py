@@ -0,0 +1,120 @@
+"""
+Tests for challenge voting
+
+These tests verify that:
+- Concurrent votes are all counted, with no lost counter updates
+- Concurrent duplicate votes by one user are recorded and counted once
+- Voting karma is awarded outside the vote transaction
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+
+from app.core.exceptions import AlreadyExistsError
+from app.models.challenge import Challenge, ChallengeStatus, ChallengeType
+from app.models.challenge_entry import ChallengeEntry
+from app.models.challenge_vote import ChallengeVote
+from app.models.review_request import ContentType
+from app.models.sparks_transaction import SparksAction, SparksTransaction
+from app.models.user import Base, User
+from app.services.challenges import entry_service
+from app.services.challenges.entry_service import ChallengeEntryService, award_vote_karma
+
+
+@pytest.fixture
+async def sessions(tmp_path, monkeypatch):
+    """Session factory for a file-backed SQLite database, so sessions run concurrently."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'votes.db'}",
+        connect_args={"timeout": 30},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(entry_service, "async_session_maker", factory)
+    yield factory
+
+    await engine.dispose()
+
+
+async def _one_on_one(sessions, voters: int):
+    async with sessions() as db:
+        users = [User(email=f"user{i}@example.com", username=f"user{i}") for i in range(voters + 2)]
+        db.add_all(users)
+        await db.flush()
+
+        challenge = Challenge(
+            title="Logo duel",
+            challenge_type=ChallengeType.ONE_ON_ONE,
+            content_type=ContentType.DESIGN,
+            status=ChallengeStatus.VOTING,
+            participant1_id=users[0].id,
+            participant2_id=users[1].id,
+            created_by=users[0].id,
+        )
+        db.add(challenge)
+        await db.flush()
+
+        entries = [
+            ChallengeEntry(challenge_id=challenge.id, user_id=users[i].id, title=f"Entry {i}")
+            for i in range(2)
+        ]
+        db.add_all(entries)
+        await db.commit()
+        return challenge.id, [entry.id for entry in entries], [user.id for user in users[2:]]
+
+
+async def _vote(sessions, challenge_id: int, voter_id: int, entry_id: int):
+    async with sessions() as db:
+        return await ChallengeEntryService(db).cast_vote(challenge_id, voter_id, entry_id)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_votes_are_all_counted(sessions):
+    challenge_id, entry_ids, voter_ids = await _one_on_one(sessions, voters=40)
+
+    await asyncio.gather(*[
+        _vote(sessions, challenge_id, voter_id, entry_ids[0] if i % 3 else entry_ids[1])
+        for i, voter_id in enumerate(voter_ids)
+    ])
+
+    async with sessions() as db:
+        challenge = await db.get(Challenge, challenge_id)
+        entries = [await db.get(ChallengeEntry, entry_id) for entry_id in entry_ids]
+        votes = (await db.execute(select(func.count(ChallengeVote.id)))).scalar_one()
+
+    assert votes == challenge.total_votes == 40
+    async with sessions() as db:
+        votes_cast = (await db.execute(select(func.sum(User.challenge_votes_cast)))).scalar_one()
+    assert votes_cast == 40
+    assert [entry.vote_count for entry in entries] == [26, 14]
+    assert (challenge.participant1_votes, challenge.participant2_votes) == (26, 14)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicate_votes_count_once(sessions):
+    challenge_id, entry_ids, voter_ids = await _one_on_one(sessions, voters=1)
+
+    results = await asyncio.gather(
+        *[_vote(sessions, challenge_id, voter_ids[0], entry_ids[0]) for _ in range(10)],
+        return_exceptions=True,
+    )
+
+    assert sum(isinstance(result, ChallengeVote) for result in results) == 1
+    assert all(isinstance(result, (ChallengeVote, AlreadyExistsError)) for result in results)
+    async with sessions() as db:
+        challenge = await db.get(Challenge, challenge_id)
+        assert challenge.total_votes == challenge.participant1_votes == 1
+
+        # No karma on the vote path; the endpoint schedules it afterwards
+        assert (await db.execute(select(SparksTransaction))).first() is None
+
+    await award_vote_karma(voter_ids[0])
+    async with sessions() as db:
+        transaction = (await db.execute(select(SparksTransaction))).scalar_one()
+        assert transaction.action == SparksAction.CHALLENGE_VOTE_CAST
+        assert transaction.user_id == voter_ids[0]
@@ -0,0 +1,193 @@
+"""
+Tests for concurrent slot claiming
+
+These tests verify that:
+- Reviewers racing for a hot request fill exactly its slots, each on a
+  different slot, and the claimed counter matches the claimed slots
+- Concurrent claims by one reviewer take a single slot, including on
+  PostgreSQL where the claims lock different slots (set TEST_POSTGRES_URL)
+- The database refuses a second active slot for a reviewer on a request
+- Claiming a specific slot refuses a slot taken in the meantime
+"""
+
+import asyncio
+import os
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+
+from app.models.review_request import ContentType, ReviewRequest, ReviewStatus, ReviewType
+from app.models.review_slot import ReviewSlot, ReviewSlotStatus
+from app.models.user import Base, User
+from app.services.claim_service import ClaimService, ClaimValidationError
+
+
+@pytest.fixture
+async def sessions(tmp_path):
+    """Session factory for a file-backed SQLite database, so sessions run concurrently."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'claims.db'}",
+        connect_args={"timeout": 30},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def pg_sessions():
+    """Session factory for a fresh schema on the TEST_POSTGRES_URL database."""
+    url = os.environ.get("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL not set")
+
+    engine = create_async_engine(url, pool_size=20)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+async def _hot_request(sessions, slots: int, reviewers: int):
+    async with sessions() as db:
+        users = [User(email=f"user{i}@example.com", username=f"user{i}") for i in range(reviewers + 1)]
+        db.add_all(users)
+        await db.flush()
+
+        review = ReviewRequest(
+            user_id=users[0].id,
+            title="Portfolio site",
+            description="Feedback on the case studies",
+            content_type=ContentType.DESIGN,
+            review_type=ReviewType.FREE,
+            status=ReviewStatus.PENDING,
+            reviews_requested=slots,
+        )
+        db.add(review)
+        await db.flush()
+        db.add_all([ReviewSlot(review_request_id=review.id) for _ in range(slots)])
+        await db.commit()
+        return review.id, [user.id for user in users[1:]]
+
+
+async def _claim(sessions, review_id: int, reviewer_id: int):
+    async with sessions() as db:
+        return await ClaimService.claim_review_by_request_id(db, review_id, reviewer_id)
+
+
+async def _claimed_slots(sessions, review_id: int) -> list:
+    async with sessions() as db:
+        return (await db.execute(
+            select(ReviewSlot.reviewer_id).where(
+                ReviewSlot.review_request_id == review_id,
+                ReviewSlot.status == ReviewSlotStatus.CLAIMED.value,
+            )
+        )).scalars().all()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_claims_fill_each_slot_once(sessions):
+    review_id, reviewer_ids = await _hot_request(sessions, slots=5, reviewers=30)
+
+    results = await asyncio.gather(
+        *[_claim(sessions, review_id, reviewer_id) for reviewer_id in reviewer_ids],
+        return_exceptions=True,
+    )
+
+    claimed = [result for result in results if isinstance(result, ReviewSlot)]
+    assert len(claimed) == 5
+    assert all(isinstance(result, (ReviewSlot, ClaimValidationError)) for result in results)
+    assert len({slot.id for slot in claimed}) == 5
+    assert all(slot.status == ReviewSlotStatus.CLAIMED.value for slot in claimed)
+
+    reviewers = await _claimed_slots(sessions, review_id)
+    assert sorted(reviewers) == sorted(slot.reviewer_id for slot in claimed)
+    async with sessions() as db:
+        review = await db.get(ReviewRequest, review_id)
+    assert (review.reviews_claimed, review.status) == (5, ReviewStatus.IN_REVIEW)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_claims_by_one_reviewer_take_one_slot(sessions):
+    review_id, (reviewer_id,) = await _hot_request(sessions, slots=3, reviewers=1)
+
+    results = await asyncio.gather(
+        *[_claim(sessions, review_id, reviewer_id) for _ in range(10)],
+        return_exceptions=True,
+    )
+
+    assert sum(isinstance(result, ReviewSlot) for result in results) == 1
+    assert all(isinstance(result, (ReviewSlot, ClaimValidationError)) for result in results)
+    assert await _claimed_slots(sessions, review_id) == [reviewer_id]
+    async with sessions() as db:
+        assert (await db.get(ReviewRequest, review_id)).reviews_claimed == 1
+
+
+@pytest.mark.postgres
+@pytest.mark.asyncio
+async def test_concurrent_claims_by_one_reviewer_take_one_slot_postgres(pg_sessions):
+    review_id, (reviewer_id,) = await _hot_request(pg_sessions, slots=5, reviewers=1)
+
+    results = await asyncio.gather(
+        *[_claim(pg_sessions, review_id, reviewer_id) for _ in range(20)],
+        return_exceptions=True,
+    )
+
+    assert sum(isinstance(result, ReviewSlot) for result in results) == 1
+    assert all(isinstance(result, (ReviewSlot, ClaimValidationError)) for result in results)
+    assert await _claimed_slots(pg_sessions, review_id) == [reviewer_id]
+    async with pg_sessions() as db:
+        assert (await db.get(ReviewRequest, review_id)).reviews_claimed == 1
+
+
+@pytest.mark.asyncio
+async def test_second_active_slot_for_reviewer_is_refused(sessions):
+    review_id, (reviewer_id,) = await _hot_request(sessions, slots=3, reviewers=1)
+    await _claim(sessions, review_id, reviewer_id)
+
+    async with sessions() as db:
+        db.add(ReviewSlot(
+            review_request_id=review_id,
+            reviewer_id=reviewer_id,
+            status=ReviewSlotStatus.SUBMITTED.value,
+        ))
+        with pytest.raises(IntegrityError):
+            await db.commit()
+
+    # Finished slots don't count as active claims
+    async with sessions() as db:
+        db.add(ReviewSlot(
+            review_request_id=review_id,
+            reviewer_id=reviewer_id,
+            status=ReviewSlotStatus.ACCEPTED.value,
+        ))
+        await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_claim_by_slot_id_refuses_taken_slot(sessions):
+    review_id, (first, second) = await _hot_request(sessions, slots=2, reviewers=2)
+    async with sessions() as db:
+        slot_id = (await db.execute(
+            select(func.min(ReviewSlot.id)).where(ReviewSlot.review_request_id == review_id)
+        )).scalar_one()
+
+    async with sessions() as db:
+        slot = await ClaimService.claim_review_by_slot_id(db, slot_id, first)
+        assert (slot.status, slot.reviewer_id) == (ReviewSlotStatus.CLAIMED.value, first)
+
+    async with sessions() as db:
+        with pytest.raises(ClaimValidationError):
+            await ClaimService.claim_review_by_slot_id(db, slot_id, second)
+        review = await db.get(ReviewRequest, review_id)
+        assert review.reviews_claimed == 1
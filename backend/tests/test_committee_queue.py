@@ -0,0 +1,116 @@
+"""
+Tests for the committee review queue and dashboard stats
+
+These tests verify that:
+- Claims bump claim_count and take the active-claim flag, hiding the
+  application from the queue; release, vote and auto-release clear it
+- A second claim on an application is refused
+- Dashboard counts and the average review time come from one query
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import AlreadyExistsError
+from app.models.application_review import ApplicationReview, ReviewStatus, Vote
+from app.models.committee_member import CommitteeMember
+from app.models.expert_application import ApplicationStatus, ExpertApplication
+from app.models.user import User
+from app.schemas.committee import VoteRequest
+from app.services.committee_service import CommitteeService
+
+
+async def _members(db: AsyncSession, count: int) -> list:
+    users = [User(email=f"member{i}@example.com", username=f"member{i}") for i in range(count)]
+    db.add_all(users)
+    await db.flush()
+    members = [CommitteeMember(user_id=user.id) for user in users]
+    db.add_all(members)
+    await db.commit()
+    return members
+
+
+async def _application(db: AsyncSession, name: str, days_ago: int, status=ApplicationStatus.SUBMITTED, **values):
+    user = User(email=f"{name}@example.com", username=name)
+    db.add(user)
+    await db.flush()
+    application = ExpertApplication(
+        user_id=user.id,
+        email=user.email,
+        full_name=name.title(),
+        status=status.value,
+        submitted_at=datetime.utcnow() - timedelta(days=days_ago),
+        **values,
+    )
+    db.add(application)
+    await db.commit()
+    return application
+
+
+async def _queue(service: CommitteeService) -> list:
+    items, total = await service.get_application_queue()
+    assert total == len(items)
+    return [(item.id, item.claim_count) for item in items]
+
+
+@pytest.mark.asyncio
+async def test_queue_tracks_claims(db):
+    alice, bob, carol = await _members(db, 3)
+    older = await _application(db, "older", days_ago=9)
+    newer = await _application(db, "newer", days_ago=2)
+    older_id, newer_id = older.id, newer.id
+    service = CommitteeService(db)
+
+    assert await _queue(service) == [(older_id, 0), (newer_id, 0)]
+
+    await service.claim_application(older_id, alice)
+    assert await _queue(service) == [(newer_id, 0)]
+
+    # Reset the status so only the claim flag stands in the way
+    older.status = ApplicationStatus.SUBMITTED.value
+    await db.commit()
+    with pytest.raises(AlreadyExistsError):
+        await service.claim_application(older_id, bob)
+
+    await service.release_application(older_id, alice)
+    assert await _queue(service) == [(older_id, 1), (newer_id, 0)]
+
+    await service.claim_application(older_id, bob)
+    await service.submit_vote(older_id, bob, VoteRequest(vote=Vote.APPROVE))
+    await db.refresh(older)
+    assert (older.claim_count, older.has_active_claim) == (2, False)
+
+    # A claim left for over a week is auto-released
+    await service.claim_application(newer_id, carol)
+    review = (await db.execute(
+        select(ApplicationReview).where(ApplicationReview.status == ReviewStatus.CLAIMED.value)
+    )).scalar_one()
+    review.claimed_at = datetime.utcnow() - timedelta(days=8)
+    await db.commit()
+    assert await service.auto_release_stale_claims() == 1
+    assert await _queue(service) == [(newer_id, 1)]
+
+
+@pytest.mark.asyncio
+async def test_committee_stats(db):
+    member, = await _members(db, 1)
+    now = datetime.utcnow()
+    await _application(db, "waiting", days_ago=1)
+    await _application(db, "again", days_ago=3, status=ApplicationStatus.RESUBMITTED)
+    await _application(db, "reviewing", days_ago=2, status=ApplicationStatus.UNDER_REVIEW)
+    await _application(db, "approved", days_ago=4, status=ApplicationStatus.APPROVED, decided_at=now)
+    await _application(db, "rejected", days_ago=2, status=ApplicationStatus.REJECTED, decided_at=now)
+    await _application(
+        db, "last_year", days_ago=400, status=ApplicationStatus.APPROVED,
+        decided_at=now - timedelta(days=380),
+    )
+
+    stats = await CommitteeService(db).get_committee_stats(member)
+
+    assert (stats.pending_applications, stats.under_review) == (2, 1)
+    assert (stats.approved_this_month, stats.rejected_this_month) == (1, 1)
+    assert stats.avg_review_time_days == 3.0
+    assert (stats.my_claimed_count, stats.my_votes_this_month) == (0, 0)
@@ -0,0 +1,221 @@
+"""
+Tests for buffered draft autosaves
+
+These tests verify that:
+- Autosaves are buffered and coalesced: saves only read the slot, and a
+  flush writes the latest draft in one statement
+- Draft reads see buffered saves before they're written back
+- Partial saves replace only the sent sections
+- Flushes skip slots no longer claimed by the draft's reviewer, and saves
+  are refused once the claim is lost even with a draft buffered
+- An older buffered draft never overwrites a newer stored one, and partial
+  saves merge into whichever of the two is newer
+- With the buffer disabled, saves write straight through
+- Saves, writes and the dirty count are exported as metrics
+"""
+
+import json
+from datetime import timedelta
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user
+from app.core.config import settings
+from app.core.csrf import CSRF_COOKIE_NAME, CSRF_HEADER_NAME
+from app.db.session import get_db
+from app.main import app
+from app.models.review_request import ContentType, ReviewRequest, ReviewStatus, ReviewType
+from app.models.review_slot import ReviewSlot, ReviewSlotStatus
+from app.models.user import User
+from app.services.infrastructure.draft_buffer import DRAFT_EVENTS, BufferedDraft, draft_buffer
+
+
+@pytest.fixture
+async def slot(db):
+    """A slot claimed by the reviewer."""
+    owner = User(email="owner@example.com", username="owner")
+    reviewer = User(email="reviewer@example.com", username="reviewer")
+    db.add_all([owner, reviewer])
+    await db.flush()
+    review = ReviewRequest(
+        user_id=owner.id,
+        title="Onboarding flow",
+        description="Is the signup clear?",
+        content_type=ContentType.DESIGN,
+        review_type=ReviewType.FREE,
+        status=ReviewStatus.IN_REVIEW,
+    )
+    db.add(review)
+    await db.flush()
+    slot = ReviewSlot(review_request_id=review.id)
+    db.add(slot)
+    await db.flush()
+    slot.claim(reviewer.id)
+    await db.commit()
+    return slot
+
+
+@pytest.fixture
+async def api(db, slot):
+    """HTTP client signed in as the slot's reviewer, with an empty draft buffer."""
+    async def override_get_db():
+        yield db
+
+    async def override_current_user():
+        return await db.get(User, slot.reviewer_id)
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = override_current_user
+    draft_buffer.clear()
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+        cookies={CSRF_COOKIE_NAME: "token"},
+        headers={CSRF_HEADER_NAME: "token"},
+    ) as client:
+        yield client
+
+    app.dependency_overrides.clear()
+    draft_buffer.clear()
+
+
+def _count_statements(db: AsyncSession) -> list:
+    statements = []
+    event.listen(db.info["engine"].sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def _section(section_id: str, content: str) -> dict:
+    return {"section_id": section_id, "section_label": section_id.title(), "content": content}
+
+
+async def _stored_draft(db: AsyncSession, slot_id: int):
+    slot = await db.get(ReviewSlot, slot_id, populate_existing=True)
+    return json.loads(slot.draft_sections) if slot.draft_sections else None, slot.rating
+
+
+@pytest.mark.asyncio
+async def test_autosaves_are_coalesced(api, db, slot):
+    url = f"/api/v1/review-slots/{slot.id}/save-draft"
+    statements = _count_statements(db)
+    saved_before = DRAFT_EVENTS.value(event="saved")
+    written_before = DRAFT_EVENTS.value(event="written")
+
+    for i in range(5):
+        response = await api.post(url, json={"sections": [_section("overview", f"Draft {i} <script>x</script>")]})
+        assert response.status_code == 200
+
+    # Every save checked the slot; nothing was written yet
+    assert sum("FROM review_slots" in statement for statement in statements) == 5
+    assert not any(statement.lstrip().upper().startswith("UPDATE") for statement in statements)
+    assert (await _stored_draft(db, slot.id))[0] is None
+    await draft_buffer.refresh_metrics()
+    assert draft_buffer.last_dirty == 1
+
+    response = await api.get(f"/api/v1/review-slots/{slot.id}/draft")
+    assert [section["content"] for section in response.json()["sections"]] == ["Draft 4 x"]
+
+    statements.clear()
+    assert await draft_buffer.flush(db) == 1
+    assert DRAFT_EVENTS.value(event="saved") == saved_before + 5
+    assert DRAFT_EVENTS.value(event="written") == written_before + 1
+    assert sum(statement.lstrip().upper().startswith("UPDATE") for statement in statements) == 1
+    draft, _ = await _stored_draft(db, slot.id)
+    assert [section["content"] for section in draft] == ["Draft 4 x"]
+    assert await draft_buffer.flush(db) == 0
+
+
+@pytest.mark.asyncio
+async def test_partial_saves_merge_sections(api, db, slot):
+    url = f"/api/v1/review-slots/{slot.id}/save-draft"
+    await api.post(url, json={
+        "sections": [_section("overview", "First pass"), _section("issues", "Contrast")],
+        "rating": 3,
+    })
+    await api.post(f"{url}?partial=true", json={"sections": [_section("issues", "Contrast and spacing")]})
+    await api.post(f"{url}?partial=true", json={"sections": [_section("next", "Ship it")]})
+
+    await draft_buffer.flush(db)
+    draft, rating = await _stored_draft(db, slot.id)
+    assert [(section["section_id"], section["content"]) for section in draft] == [
+        ("overview", "First pass"), ("issues", "Contrast and spacing"), ("next", "Ship it"),
+    ]
+    assert rating == 3
+
+    # Studio drafts merge top-level keys
+    studio_url = f"/api/v1/review-slots/{slot.id}/studio/save-draft"
+    await api.post(studio_url, json={"issueCards": [{"issue": "Tiny buttons"}], "verdictCard": {"rating": 4}})
+    await api.post(f"{studio_url}?partial=true", json={"strengthCards": [{"what": "Clear copy"}]})
+    response = await api.get(f"/api/v1/review-slots/{slot.id}/studio/draft")
+    assert response.json() == {
+        "issueCards": [{"issue": "Tiny buttons"}],
+        "verdictCard": {"rating": 4},
+        "strengthCards": [{"what": "Clear copy"}],
+        "_format": "studio",
+        "_version": "2.0",
+    }
+
+
+@pytest.mark.asyncio
+async def test_flush_skips_slots_no_longer_claimed(api, db, slot):
+    await api.post(f"/api/v1/review-slots/{slot.id}/save-draft", json={"sections": [_section("overview", "Late")]})
+
+    slot.status = ReviewSlotStatus.ABANDONED.value
+    await db.commit()
+
+    assert await draft_buffer.flush(db) == 0
+    assert (await _stored_draft(db, slot.id))[0] is None
+    assert draft_buffer.get(slot.id) is None
+
+
+@pytest.mark.asyncio
+async def test_save_refused_after_claim_lost(api, db, slot):
+    url = f"/api/v1/review-slots/{slot.id}/save-draft"
+    await api.post(url, json={"sections": [_section("overview", "First")]})
+
+    slot.status = ReviewSlotStatus.ABANDONED.value
+    await db.commit()
+
+    response = await api.post(url, json={"sections": [_section("overview", "Second")]})
+    assert response.status_code != 200
+    assert draft_buffer.get(slot.id).draft[0]["content"] == "First"
+
+
+@pytest.mark.asyncio
+async def test_older_draft_never_overwrites_newer(api, db, slot):
+    url = f"/api/v1/review-slots/{slot.id}/save-draft"
+    await api.post(url, json={"sections": [_section("overview", "Old"), _section("tone", "Old tone")]})
+    old_entry = draft_buffer.get(slot.id)
+
+    # Another worker saves and flushes a newer draft
+    newer = BufferedDraft(slot.reviewer_id, [_section("overview", "New")], None,
+                          saved_at=old_entry.saved_at + timedelta(seconds=5))
+    assert await draft_buffer.write(db, slot.id, newer)
+
+    # This worker's stale entry is dropped rather than written back
+    assert await draft_buffer.flush(db) == 0
+    assert (await _stored_draft(db, slot.id))[0] == newer.draft
+
+    # A partial save merges into the newer stored draft, not the stale entry
+    draft_buffer.save(slot.id, old_entry)
+    await api.post(f"{url}?partial=true", json={"sections": [_section("summary", "Added")]})
+    assert [section["content"] for section in draft_buffer.get(slot.id).draft] == ["New", "Added"]
+
+
+@pytest.mark.asyncio
+async def test_write_through_when_disabled(api, db, slot, monkeypatch):
+    monkeypatch.setattr(settings, "DRAFT_BUFFER_ENABLED", False)
+
+    response = await api.post(
+        f"/api/v1/review-slots/{slot.id}/smart-review/save-draft",
+        json={"phase1_quick_assessment": {"overall_rating": 5, "quick_summary": "<b>Great</b>"}},
+    )
+
+    assert response.status_code == 200
+    draft, rating = await _stored_draft(db, slot.id)
+    assert draft["phase1_quick_assessment"]["quick_summary"] == "<b>Great</b>"
+    assert rating == 5
@@ -0,0 +1,67 @@
+"""
+Tests for single-pass feedback text analysis
+"""
+
+from app.services.ratings.feedback_analysis import (
+    FeedbackSignals,
+    analyze_feedback,
+    analyze_feedback_batch,
+)
+
+
+def test_counts_all_signal_types():
+    """One pass returns word count, action, specificity and encouragement hits"""
+    signals = analyze_feedback(
+        "Great work! You should consider a bolder headline, for example in the hero section. "
+        "Try to improve the contrast because the text is hard to read."
+    )
+
+    assert signals.word_count == 26
+    assert signals.action_hits == 4  # should, consider, try, improve
+    assert signals.specificity_hits == 3  # for example, section, because
+    assert signals.encouragement_hits == 1  # great
+    assert signals.action_items == 2
+
+
+def test_matches_only_whole_words():
+    """Keywords inside other words are not counted"""
+    signals = analyze_feedback("The padding in this country layout is fine, improvements aside.")
+
+    # "padding" (add), "country" (try) and "improvements" (improve) are ignored
+    assert signals.action_hits == 0
+
+
+def test_prefix_words_do_not_match():
+    """Words that merely start with a keyword are not counted"""
+    signals = analyze_feedback("The address has improvements and is strongly worded. Add a fix.")
+
+    # Only "add" and "fix": "address" and "improvements" are other words
+    assert signals.action_hits == 2
+
+
+def test_phrases_and_punctuated_markers():
+    """Multi-word phrases and markers ending in punctuation match as whole tokens"""
+    signals = analyze_feedback("Well done, e.g. line 4. The wellness online lines are fine.")
+
+    # "well done", "e.g.", "line"; not "wellness", "online" or "lines"
+    assert signals.encouragement_hits == 1
+    assert signals.specificity_hits == 2
+
+
+def test_empty_text():
+    assert analyze_feedback(None) == FeedbackSignals()
+    assert analyze_feedback("").action_items == 0
+
+
+def test_batch_matches_single():
+    """Batch API returns the same signals as analyzing each text"""
+    texts = [
+        "You should fix the header.",
+        None,
+        "Nice colours, well done. Consider adding more whitespace.",
+        "",
+        "Should should should, e.g. line 4",
+    ]
+
+    assert analyze_feedback_batch(texts) == [analyze_feedback(text) for text in texts]
+    assert analyze_feedback_batch([]) == []
@@ -0,0 +1,116 @@
+"""
+Tests for the queued, structured logging pipeline
+
+These tests verify that:
+- Records go through the queue to the writer thread as JSON lines, with
+  request id, extra fields and exception text
+- INFO records beyond the per-logger rate are dropped and the next one
+  through reports how many; warnings are never dropped
+- Requests get an X-Request-ID (incoming or generated) bound to their logs
+"""
+
+import io
+import json
+import logging
+import queue
+from logging.handlers import QueueListener
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.core.logging_config import (
+    AsyncQueueHandler,
+    JSONFormatter,
+    RateLimitFilter,
+    RequestIdFilter,
+    RequestIdMiddleware,
+    request_id_var,
+)
+
+
+@pytest.fixture
+def json_logger():
+    """Logger writing JSON lines through a queue to a buffer."""
+    output = io.StringIO()
+    stream_handler = logging.StreamHandler(output)
+    stream_handler.setFormatter(JSONFormatter())
+    queue_handler = AsyncQueueHandler(queue.Queue(maxsize=100))
+    queue_handler.addFilter(RequestIdFilter())
+    listener = QueueListener(queue_handler.queue, stream_handler)
+    listener.start()
+
+    logger = logging.getLogger("tests.logging_config")
+    logger.addHandler(queue_handler)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+
+    def lines():
+        listener.stop()
+        return [json.loads(line) for line in output.getvalue().splitlines()]
+
+    yield logger, lines
+
+    logger.removeHandler(queue_handler)
+    logger.propagate = True
+
+
+def test_records_written_as_json_lines(json_logger):
+    logger, lines = json_logger
+    token = request_id_var.set("req-1")
+    try:
+        logger.info("Saved draft for slot %s", 42, extra={"slot_id": 42})
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("Flush failed")
+    finally:
+        request_id_var.reset(token)
+
+    saved, failed = lines()
+    assert saved["message"] == "Saved draft for slot 42"
+    assert saved["level"] == "INFO"
+    assert saved["request_id"] == "req-1"
+    assert saved["slot_id"] == 42
+    assert failed["level"] == "ERROR"
+    assert "ValueError: boom" in failed["exception"]
+
+
+def test_rate_limit_drops_info_and_reports_suppressed(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("app.core.logging_config.time.monotonic", lambda: clock[0])
+    rate_limit = RateLimitFilter(rate=2)
+
+    def record(level=logging.INFO, name="hot"):
+        return logging.LogRecord(name, level, __file__, 1, "event", None, None)
+
+    assert [rate_limit.filter(record()) for _ in range(5)] == [True, True, False, False, False]
+    assert rate_limit.filter(record(logging.WARNING))
+    assert rate_limit.filter(record(name="other"))
+
+    clock[0] += 1.0
+    next_record = record()
+    assert rate_limit.filter(next_record)
+    assert next_record.suppressed == 3
+
+
+@pytest.mark.asyncio
+async def test_request_id_middleware():
+    async def endpoint(request):
+        return PlainTextResponse(request_id_var.get())
+
+    app = Starlette(routes=[Route("/", endpoint)])
+    app.add_middleware(RequestIdMiddleware)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/", headers={"X-Request-ID": "from-proxy"})
+        assert response.text == "from-proxy"
+        assert response.headers["x-request-id"] == "from-proxy"
+
+        response = await client.get("/")
+        assert len(response.text) == 32
+        assert response.headers["x-request-id"] == response.text
+
+    assert request_id_var.get() == "-"
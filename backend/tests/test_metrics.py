@@ -0,0 +1,150 @@
+"""
+Tests for Prometheus metrics
+
+These tests verify that:
+- Counters, gauges and histograms render in the text exposition format
+- Request latency is labelled by route template, method and status
+- Outbound Stripe calls and scheduler jobs record their durations
+- /metrics needs METRICS_TOKEN when one is set, and is closed outside
+  development without one
+- Collect hooks refresh gauges on scrape; /health publishes no internals
+"""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.core.config import settings
+from app.core.metrics import EXTERNAL_CALL_DURATION, HTTP_REQUEST_DURATION, MetricsRegistry
+from app.main import app
+from app.services.payments.webhook_inbox import webhook_inbox
+from app.services.infrastructure.scheduler import JOB_DURATION, timed_job
+
+
+def test_registry_renders_exposition_format():
+    registry = MetricsRegistry()
+    registry.counter("jobs_total", "Jobs run", labelnames=("kind",)).inc(kind='say "hi"')
+    registry.gauge("queue_depth", "Queued items", callback=lambda: 7)
+    registry.gauge("pool_size", "Pool size", callback=lambda: None)
+    latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(5)
+
+    assert registry.render().splitlines() == [
+        "# HELP jobs_total Jobs run",
+        "# TYPE jobs_total counter",
+        'jobs_total{kind="say \\"hi\\""} 1',
+        "# HELP queue_depth Queued items",
+        "# TYPE queue_depth gauge",
+        "queue_depth 7",
+        "# HELP pool_size Pool size",
+        "# TYPE pool_size gauge",
+        "# HELP latency_seconds Latency",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{le="0.1"} 1',
+        'latency_seconds_bucket{le="1"} 2',
+        'latency_seconds_bucket{le="+Inf"} 3',
+        "latency_seconds_sum 5.55",
+        "latency_seconds_count 3",
+    ]
+
+    # Re-registering returns the same metric; a conflicting definition fails
+    assert registry.histogram("latency_seconds", "Latency") is latency
+    with pytest.raises(ValueError):
+        registry.counter("latency_seconds", "Latency")
+
+
+@pytest.mark.asyncio
+async def test_collect_runs_hooks_before_rendering():
+    registry = MetricsRegistry()
+    depth = {}
+
+    async def refresh():
+        depth["value"] = 3
+
+    async def broken():
+        raise RuntimeError("database unavailable")
+
+    registry.on_collect(broken)
+    registry.on_collect(refresh)
+    registry.gauge("queue_depth", "Queued items", callback=lambda: depth.get("value"))
+
+    assert "queue_depth 3" not in registry.render()
+    assert (await registry.collect()).splitlines()[-1] == "queue_depth 3"
+
+
+@pytest.mark.asyncio
+async def test_health_is_a_liveness_check(monkeypatch):
+    async def no_stats():
+        raise AssertionError("/health must not count the webhook inbox")
+
+    monkeypatch.setattr(webhook_inbox, "stats", no_stats)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/health")
+
+    assert response.status_code == 200
+    assert set(response.json()) == {"status", "service", "database", "version", "timestamp"}
+
+
+@pytest.mark.asyncio
+async def test_request_latency_by_route_template():
+    route = "/api/v1/review-slots/rubrics/{content_type}"
+    before = HTTP_REQUEST_DURATION.count(method="GET", route=route, status="200")
+    unmatched_before = HTTP_REQUEST_DURATION.count(method="GET", route="<other>", status="404")
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.get("/api/v1/review-slots/rubrics/design")
+        await client.get("/api/v1/review-slots/rubrics/code")
+        await client.get("/no-such-page")
+        response = await client.get("/metrics")
+
+    assert HTTP_REQUEST_DURATION.count(method="GET", route=route, status="200") == before + 2
+    assert HTTP_REQUEST_DURATION.count(method="GET", route="<other>", status="404") == unmatched_before + 1
+    assert f'http_request_duration_seconds_count{{method="GET",route="{route}",status="200"}}' in response.text
+    assert "http_requests_in_progress 1" in response.text  # The /metrics request itself
+    assert "redis_available " in response.text
+    assert "password_hash_pending " in response.text
+    assert "stripe_balance_cache_entries " in response.text
+    assert "http_response_cache_entries " in response.text
+    assert "draft_buffer_dirty " in response.text
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_access(monkeypatch):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        monkeypatch.setattr(settings, "ENVIRONMENT", "staging")
+        assert (await client.get("/metrics")).status_code == 404
+        monkeypatch.setattr(settings, "ENVIRONMENT", "production")
+        assert (await client.get("/metrics")).status_code == 404
+
+        monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+        assert (await client.get("/metrics")).status_code == 404
+        wrong = await client.get("/metrics", headers={"Authorization": "Bearer nope"})
+        assert wrong.status_code == 404
+        allowed = await client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+        assert allowed.status_code == 200
+        assert "http_request_duration_seconds" in allowed.text
+
+
+@pytest.mark.asyncio
+async def test_outbound_and_job_durations(fake_stripe):
+    account = fake_stripe.add("account", type="express")
+    operation = "GET /v1/accounts/{id}"
+    before = EXTERNAL_CALL_DURATION.count(service="stripe", operation=operation, outcome="2xx")
+
+    client = fake_stripe.client(max_retries=0)
+    await client.retrieve_account(account["id"])
+    fake_stripe.fail_next(500)
+    with pytest.raises(Exception):
+        await client.retrieve_account(account["id"])
+    await client.aclose()
+
+    assert EXTERNAL_CALL_DURATION.count(service="stripe", operation=operation, outcome="2xx") == before + 1
+    assert EXTERNAL_CALL_DURATION.count(service="stripe", operation=operation, outcome="5xx") >= 1
+
+    @timed_job
+    async def sample_job():
+        return "done"
+
+    assert await sample_job() == "done"
+    assert JOB_DURATION.count(job="sample") == 1
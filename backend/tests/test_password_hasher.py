@@ -0,0 +1,106 @@
+"""
+Tests for off-loop password hashing
+
+These tests verify that:
+- bcrypt runs on the hashing pool without blocking the event loop
+- Jobs beyond the pending limit are shed with a 503 error
+- Outdated hashes are upgraded on successful verification
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from passlib.context import CryptContext
+
+from app.core.exceptions import ServiceOverloadedError
+from app.core.security import (
+    PASSWORD_HASH_SHED,
+    PasswordHasher,
+    get_password_hash_async,
+    pwd_context,
+    verify_and_update_password,
+    verify_dummy_password,
+    verify_password_async,
+)
+
+
+@pytest.mark.asyncio
+async def test_hashing_does_not_block_event_loop():
+    """The loop keeps ticking while bcrypt runs"""
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    hashed = await get_password_hash_async("ValidPassword123!")
+    assert await verify_password_async("ValidPassword123!", hashed)
+    assert not await verify_password_async("wrong-password", hashed)
+    task.cancel()
+
+    assert ticks > 5
+
+
+@pytest.mark.asyncio
+async def test_saturated_pool_sheds_load():
+    """Jobs over max_pending raise ServiceOverloadedError instead of queueing"""
+    hasher = PasswordHasher(workers=1, max_pending=2)
+    release = threading.Event()
+    shed_before = PASSWORD_HASH_SHED.value()
+
+    def slow_job():
+        release.wait(timeout=5)
+        return "done"
+
+    first = asyncio.create_task(hasher.run(slow_job))
+    second = asyncio.create_task(hasher.run(slow_job))
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(ServiceOverloadedError) as exc_info:
+        await hasher.run(slow_job)
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers == {"Retry-After": "1"}
+
+    release.set()
+    assert await asyncio.gather(first, second) == ["done", "done"]
+
+    stats = hasher.stats()
+    assert stats["shed"] == 1
+    assert stats["completed"] == 2
+    assert stats["max_pending_seen"] == 2
+    assert stats["pending"] == 0
+    assert PASSWORD_HASH_SHED.value() == shed_before + 1
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_outdated_hash_is_upgraded():
+    """A hash made with fewer rounds is replaced on login; a current one isn't"""
+    weak_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("ValidPassword123!")
+
+    valid, new_hash = await verify_and_update_password("ValidPassword123!", weak_hash)
+    assert valid
+    assert new_hash is not None
+    assert not pwd_context.needs_update(new_hash)
+
+    valid, newer_hash = await verify_and_update_password("ValidPassword123!", new_hash)
+    assert valid
+    assert newer_hash is None
+
+    valid, _ = await verify_and_update_password("wrong-password", weak_hash)
+    assert not valid
+
+
+@pytest.mark.asyncio
+async def test_dummy_verification_takes_real_time():
+    """Unknown-account logins still spend a bcrypt verification"""
+    await verify_dummy_password("warm-up")  # builds the dummy hash once
+
+    started = time.perf_counter()
+    assert await verify_dummy_password("anything") is False
+    assert time.perf_counter() - started > 0.01
@@ -0,0 +1,86 @@
+"""
+Tests for SQL query instrumentation
+
+These tests verify that:
+- Tracked blocks count and time their queries and report statements
+  repeated with different literals as one N+1 fingerprint
+- Slow statements are logged
+- Requests get X-DB-* headers and feed the /metrics endpoint
+"""
+
+import logging
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.instrumentation import fingerprint, instrument_engine, track_queries
+from app.db.session import get_db
+from app.main import app
+
+
+@pytest.fixture
+def engine(engine):
+    """The shared in-memory database, instrumented."""
+    instrument_engine(engine)
+    return engine
+
+
+def test_fingerprint_normalizes_literals():
+    assert fingerprint("SELECT * FROM users WHERE id = 1") == fingerprint("SELECT *  FROM users\nWHERE id = 42")
+    assert fingerprint("SELECT name FROM t WHERE name = 'a'") == fingerprint("SELECT name FROM t WHERE name = 'b''c'")
+    assert fingerprint("SELECT * FROM t WHERE id IN (?, ?, ?)") == fingerprint("SELECT * FROM t WHERE id IN (?)")
+    assert fingerprint("SELECT * FROM users") != fingerprint("SELECT * FROM slots")
+
+
+@pytest.mark.asyncio
+async def test_tracks_queries_and_repeated_statements(db):
+    with track_queries() as stats:
+        await db.execute(text("SELECT 1"))
+        for i in range(settings.DB_REPEATED_QUERY_THRESHOLD):
+            await db.execute(text(f"SELECT {i} + 1"))
+
+    assert stats.count == settings.DB_REPEATED_QUERY_THRESHOLD + 1
+    assert stats.total_seconds >= stats.slowest_seconds > 0
+    assert stats.slowest_statement is not None
+    assert stats.repeated() == {"SELECT ? + ?": settings.DB_REPEATED_QUERY_THRESHOLD}
+
+    # Queries outside a tracked block aren't recorded on it
+    await db.execute(text("SELECT 1"))
+    assert stats.count == settings.DB_REPEATED_QUERY_THRESHOLD + 1
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_are_logged(db, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "DB_SLOW_QUERY_MS", 0)
+
+    with caplog.at_level(logging.WARNING, logger="app.db.instrumentation"):
+        await db.execute(text("SELECT 2"))
+
+    record = next(record for record in caplog.records if record.getMessage().startswith("Slow query"))
+    assert record.db_statement == "SELECT 2"
+
+
+@pytest.mark.asyncio
+async def test_request_headers_and_metrics(db):
+    async def override_get_db():
+        yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/health")
+            assert response.headers["x-db-query-count"] == "1"
+            assert float(response.headers["x-db-time-ms"]) >= 0
+            assert response.headers["x-db-repeated-queries"] == "0"
+
+            response = await client.get("/metrics")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE db_query_duration_seconds histogram" in response.text
+    assert 'db_queries_per_request_bucket{le="1"}' in response.text
+    assert "db_queries_per_request_count " in response.text
@@ -0,0 +1,140 @@
+"""
+Tests for incremental rating aggregates
+
+These tests verify that:
+- Each rating updates the stored sums, averages and flags in place, and
+  the reviewer's avg_rating on the users row
+- The incremental path matches a full recompute from the rating tables,
+  and the recompute corrects a drifted row
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+from app.models.review_request import ReviewRequest, ContentType, ReviewType
+from app.models.review_slot import ReviewSlot, ReviewSlotStatus
+from app.models.requester_rating import RequesterStats
+from app.models.reviewer_rating import ReviewerStats
+from app.services.ratings import RequesterRatingService, ReviewerRatingService
+from app.services.ratings.reviewer_stats import reviewer_stats_cache
+
+REVIEWER_COLUMNS = [
+    "quality_sum", "professionalism_sum", "helpfulness_sum", "overall_sum", "total_ratings",
+    "avg_quality", "avg_professionalism", "avg_helpfulness", "avg_overall",
+    "is_high_quality", "is_professional",
+    "total_reviews_completed", "reviews_accepted", "reviews_rejected",
+]
+
+REQUESTER_COLUMNS = [
+    "clarity_sum", "responsiveness_sum", "fairness_sum", "overall_sum", "total_ratings",
+    "avg_clarity", "avg_responsiveness", "avg_fairness", "avg_overall",
+    "is_responsive", "is_fair", "total_reviews_requested",
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_stats_cache():
+    yield
+    reviewer_stats_cache.clear()
+
+
+@pytest.fixture
+async def reviewed_slots(db: AsyncSession):
+    """A requester, a reviewer and four completed slots."""
+    requester = User(email="creator@example.com", hashed_password="x", full_name="Creator")
+    reviewer = User(email="reviewer@example.com", hashed_password="x", full_name="Reviewer")
+    db.add_all([requester, reviewer])
+    await db.commit()
+
+    request = ReviewRequest(
+        user_id=requester.id,
+        title="Landing page",
+        description="Please review my landing page",
+        content_type=ContentType.DESIGN,
+        review_type=ReviewType.FREE,
+        reviews_requested=4,
+    )
+    db.add(request)
+    await db.commit()
+
+    now = datetime.utcnow()
+    slots = [
+        ReviewSlot(
+            review_request_id=request.id,
+            reviewer_id=reviewer.id,
+            status=status.value,
+            claimed_at=now - timedelta(hours=5),
+            submitted_at=now,
+        )
+        for status in [ReviewSlotStatus.ACCEPTED] * 3 + [ReviewSlotStatus.REJECTED]
+    ]
+    db.add_all(slots)
+    await db.commit()
+    return requester, reviewer, slots
+
+
+async def _row(db: AsyncSession, model, user_id: int, columns) -> dict:
+    stats = (await db.execute(
+        select(model).where(model.user_id == user_id).execution_options(populate_existing=True)
+    )).scalar_one()
+    return {column: getattr(stats, column) for column in columns}
+
+
+@pytest.mark.asyncio
+async def test_reviewer_ratings_incremental(db, reviewed_slots):
+    requester, reviewer, slots = reviewed_slots
+    service = ReviewerRatingService(db)
+
+    await service.submit_rating(slots[0].id, requester.id, 5, 4, 5)
+    await service.submit_rating(slots[1].id, requester.id, 4, 3, 3)
+    await service.submit_rating(slots[2].id, requester.id, 3, 3, 4)
+
+    incremental = await _row(db, ReviewerStats, reviewer.id, REVIEWER_COLUMNS)
+    assert incremental["quality_sum"] == 12
+    assert incremental["total_ratings"] == 3
+    assert incremental["avg_quality"] == Decimal("4.00")
+    assert incremental["avg_professionalism"] == Decimal("3.33")
+    assert incremental["avg_overall"] == Decimal("3.67")
+    assert incremental["is_high_quality"] is True
+    assert incremental["is_professional"] is False
+    assert (incremental["reviews_accepted"], incremental["reviews_rejected"]) == (3, 1)
+
+    await db.refresh(reviewer)
+    assert reviewer.avg_rating == Decimal("3.67")
+    assert reviewer.total_reviews_given == 3
+
+    # A full recompute agrees with the incremental path...
+    assert await service.recalculate_all_stats() == 1
+    assert await _row(db, ReviewerStats, reviewer.id, REVIEWER_COLUMNS) == incremental
+
+    # ...and repairs a drifted row
+    stats = (await db.execute(select(ReviewerStats))).scalar_one()
+    stats.quality_sum = 99
+    stats.avg_overall = Decimal("1.00")
+    await db.commit()
+    await service.recalculate_all_stats(page_size=1)
+    assert await _row(db, ReviewerStats, reviewer.id, REVIEWER_COLUMNS) == incremental
+
+
+@pytest.mark.asyncio
+async def test_requester_ratings_incremental(db, reviewed_slots):
+    requester, reviewer, slots = reviewed_slots
+    service = RequesterRatingService(db)
+
+    await service.submit_rating(slots[0].id, reviewer.id, 5, 5, 4)
+    await service.submit_rating(slots[1].id, reviewer.id, 4, 3, 4)
+
+    incremental = await _row(db, RequesterStats, requester.id, REQUESTER_COLUMNS)
+    assert incremental["clarity_sum"] == 9
+    assert incremental["avg_responsiveness"] == Decimal("4.00")
+    assert incremental["avg_fairness"] == Decimal("4.00")
+    assert incremental["is_responsive"] is True
+    assert incremental["total_reviews_requested"] == 1
+
+    assert await service.recalculate_all_stats() == 1
+    assert await _row(db, RequesterStats, requester.id, REQUESTER_COLUMNS) == incremental
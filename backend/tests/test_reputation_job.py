@@ -0,0 +1,88 @@
+"""
+Tests for the daily reputation job
+
+These tests verify that:
+- Decay applies one weekly step to users past the inactivity threshold,
+  never below the floor and at most once a week
+- Each decay is recorded as a REPUTATION_DECAY transaction
+- Percentiles match the per-user calculation
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.sparks_transaction import SparksAction, SparksTransaction
+from app.models.user import User
+from app.services.gamification.sparks_service import SparksService
+
+
+async def _user(db: AsyncSession, name: str, days_inactive=None, reputation=100, sparks=0, active=True) -> User:
+    user = User(
+        email=f"{name}@example.com",
+        username=name,
+        sparks_points=sparks,
+        reputation_score=reputation,
+        is_active=active,
+        last_active_date=(
+            datetime.utcnow() - timedelta(days=days_inactive) if days_inactive is not None else None
+        ),
+    )
+    db.add(user)
+    await db.commit()
+    return user
+
+
+@pytest.mark.asyncio
+async def test_decay_batch(db):
+    away = await _user(db, "away", days_inactive=30)
+    near_floor = await _user(db, "near_floor", days_inactive=60, reputation=52)
+    await _user(db, "recent", days_inactive=15)
+    at_floor = await _user(db, "at_floor", days_inactive=60, reputation=50)
+    never = await _user(db, "never")
+
+    service = SparksService(db)
+    assert await service.apply_reputation_decay_batch() == 2
+
+    reputations = dict((await db.execute(select(User.username, User.reputation_score))).all())
+    assert reputations == {"away": 95, "near_floor": 50, "recent": 100, "at_floor": 50, "never": 100}
+
+    transactions = (await db.execute(select(SparksTransaction))).scalars().all()
+    assert {t.user_id for t in transactions} == {away.id, near_floor.id}
+    assert all(t.action == SparksAction.REPUTATION_DECAY and t.points == 0 for t in transactions)
+    assert {t.reason for t in transactions} == {
+        "Reputation adjusted by 5 while you were away",
+        "Reputation adjusted by 2 while you were away",
+    }
+
+    # Running again the next day doesn't decay again; a week later "away"
+    # takes its next step and "recent" has crossed the threshold
+    assert await service.apply_reputation_decay_batch(now=datetime.utcnow() + timedelta(days=1)) == 0
+    assert await service.apply_reputation_decay_batch(now=datetime.utcnow() + timedelta(days=7)) == 2
+    reputations = dict((await db.execute(select(User.username, User.reputation_score))).all())
+    assert reputations == {"away": 90, "near_floor": 50, "recent": 95, "at_floor": 50, "never": 100}
+    assert {at_floor.id, never.id}.isdisjoint(
+        (await db.execute(select(SparksTransaction.user_id))).scalars().all()
+    )
+
+
+@pytest.mark.asyncio
+async def test_percentiles_match_per_user_calculation(db):
+    users = [
+        await _user(db, f"user{i}", sparks=sparks)
+        for i, sparks in enumerate([0, 10, 10, 40, 100])
+    ]
+    inactive = await _user(db, "inactive", sparks=1000, active=False)
+
+    service = SparksService(db)
+    assert await service.recalculate_percentiles() == 5
+
+    for user in users:
+        await db.refresh(user)
+        assert user.reputation_percentile == await service._calculate_sparks_percentile(user.sparks_points)
+    assert [user.reputation_percentile for user in users] == [0, 20, 20, 60, 80]
+
+    await db.refresh(inactive)
+    assert inactive.reputation_percentile is None
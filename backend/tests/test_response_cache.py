@@ -0,0 +1,201 @@
+"""
+Tests for the HTTP response cache
+
+These tests verify that:
+- Cached endpoints answer If-None-Match with 304
+- Keys vary by query string and, for per_user endpoints, by signed-in user
+- invalidate() stops serving old entries
+- Bodies go through the route's response_model, and private endpoints
+  are never marked public
+- The Redis level shares entries and invalidations between workers,
+  calling Redis off the event loop thread
+- Lookups and 304s are counted for /metrics, and sparks awards drop
+  cached leaderboards
+"""
+
+import importlib
+import threading
+
+import pytest
+from fastapi import FastAPI, Request
+from pydantic import BaseModel
+from httpx import ASGITransport, AsyncClient
+
+from app.core.security import create_access_token
+from app.models.sparks_transaction import SparksAction
+from app.models.user import User
+from app.services.gamification.sparks_service import SparksService
+from app.services.infrastructure.response_cache import (
+    CACHE_INVALIDATIONS,
+    CACHE_LOOKUPS,
+    CACHE_NOT_MODIFIED,
+    ResponseCache,
+    cached_response,
+    etag_matches,
+)
+
+# The package re-exports the response_cache instance under the module's name
+cache_module = importlib.import_module("app.services.infrastructure.response_cache")
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+        self.threads = set()
+
+    def get(self, key):
+        self.threads.add(threading.get_ident())
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.threads.add(threading.get_ident())
+        self.data[key] = value
+
+    def incr(self, key):
+        self.threads.add(threading.get_ident())
+        self.data[key] = str(int(self.data.get(key, "0")) + 1)
+
+
+class PublicUser(BaseModel):
+    id: int
+    name: str
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def make_app(calls, monkeypatch):
+    """Build a tiny app whose endpoints count their executions, using the given cache."""
+    def build(cache: ResponseCache) -> AsyncClient:
+        monkeypatch.setattr(cache_module, "response_cache", cache)
+        app = FastAPI()
+
+        @app.get("/items")
+        @cached_response("items", ttl_seconds=60)
+        async def list_items(request: Request, page: int = 1):
+            calls.append(("items", page))
+            return {"page": page, "items": [1, 2, 3]}
+
+        @app.get("/mine")
+        @cached_response("items", ttl_seconds=60, per_user=True)
+        async def my_items(request: Request):
+            user = request.cookies.get("access_token")
+            calls.append(("mine", user is not None))
+            return {"signed_in": user is not None}
+
+        @app.get("/users/{user_id}", response_model=PublicUser)
+        @cached_response("users", ttl_seconds=60, private=True)
+        async def get_user(request: Request, user_id: int):
+            calls.append(("user", user_id))
+            return {"id": user_id, "name": "Ada", "password_hash": "secret"}
+
+        return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+    return build
+
+
+@pytest.mark.asyncio
+async def test_etag_and_not_modified(make_app, calls):
+    hits_before = CACHE_LOOKUPS.value(namespace="items", result="hit")
+    not_modified_before = CACHE_NOT_MODIFIED.value()
+
+    async with make_app(ResponseCache()) as client:
+        first = await client.get("/items", params={"page": 2})
+        assert first.status_code == 200
+        assert first.json() == {"page": 2, "items": [1, 2, 3]}
+        assert first.headers["cache-control"] == "public, max-age=60"
+        etag = first.headers["etag"]
+
+        cached = await client.get("/items", params={"page": 2})
+        assert cached.headers["etag"] == etag
+        assert cached.json() == first.json()
+
+        conditional = await client.get("/items", params={"page": 2}, headers={"If-None-Match": etag})
+        assert conditional.status_code == 304
+        assert conditional.content == b""
+
+        await client.get("/items", params={"page": 3})
+
+    assert calls == [("items", 2), ("items", 3)]
+    assert CACHE_LOOKUPS.value(namespace="items", result="hit") == hits_before + 2
+    assert CACHE_NOT_MODIFIED.value() == not_modified_before + 1
+
+
+@pytest.mark.asyncio
+async def test_per_user_variation_and_invalidation(make_app, calls):
+    cache = ResponseCache()
+    token = create_access_token(data={"user_id": 7, "email": "u@example.com"})
+
+    async with make_app(cache) as client:
+        anonymous = await client.get("/mine")
+        assert anonymous.json() == {"signed_in": False}
+        assert anonymous.headers["cache-control"] == "private, max-age=60"
+        assert anonymous.headers["vary"] == "Cookie"
+
+        signed_in = await client.get("/mine", cookies={"access_token": token})
+        assert signed_in.json() == {"signed_in": True}
+        await client.get("/mine", cookies={"access_token": token})
+        assert len(calls) == 2
+
+        await cache.invalidate("items")
+        await client.get("/mine", cookies={"access_token": token})
+        assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_redis_level_shared_between_workers(make_app, calls):
+    redis = FakeRedis()
+    worker_a, worker_b = ResponseCache(redis=redis), ResponseCache(redis=redis)
+
+    async with make_app(worker_a) as client:
+        await client.get("/items")
+    async with make_app(worker_b) as client:
+        await client.get("/items")
+    assert calls == [("items", 1)]
+    assert worker_b.stats()["redis_hits"] == 1
+
+    # An invalidation on worker B hides worker A's local copy too
+    await worker_b.invalidate("items")
+    async with make_app(worker_a) as client:
+        await client.get("/items")
+    assert calls == [("items", 1), ("items", 1)]
+    assert threading.get_ident() not in redis.threads
+
+
+@pytest.mark.asyncio
+async def test_response_model_and_private(make_app, calls):
+    async with make_app(ResponseCache()) as client:
+        first = await client.get("/users/3")
+        cached = await client.get("/users/3")
+
+    assert first.json() == cached.json() == {"id": 3, "name": "Ada"}
+    assert first.headers["cache-control"] == "private, max-age=60"
+    assert "vary" not in first.headers
+    assert calls == [("user", 3)]
+
+
+@pytest.mark.asyncio
+async def test_awarding_sparks_invalidates_leaderboards(db):
+    user = User(email="sparks@example.com", hashed_password="x", full_name="Sparky")
+    db.add(user)
+    await db.commit()
+    before = CACHE_INVALIDATIONS.value(namespace="leaderboards")
+
+    await SparksService(db).award_sparks(user.id, SparksAction.REVIEW_SUBMITTED, "Submitted a review")
+
+    assert CACHE_INVALIDATIONS.value(namespace="leaderboards") == before + 1
+
+
+def test_decorator_requires_request_and_etag_matching():
+    with pytest.raises(TypeError):
+        @cached_response("items", ttl_seconds=60)
+        async def no_request(page: int = 1):
+            return {}
+
+    assert etag_matches('W/"abc", "def"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"abd"', '"abc"')
+    assert not etag_matches(None, '"abc"')
@@ -0,0 +1,190 @@
+"""
+Tests for review request loading profiles
+
+These tests verify that:
+- Each profile loads only its relationships, in a fixed number of queries
+- Unloaded collections, the slot summary's unloaded columns and
+  deferred slot content raise instead of issuing hidden queries
+- Detail and owner-list slots serialize without their content until
+  load_slot_content fetches it
+- Claim and background reads load the review request columns they use
+- Created requests come back with the collections the response includes
+"""
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.crud import review_loading
+from app.crud.browse import browse_crud
+from app.crud.review import review_crud
+from app.models.review_file import ReviewFile
+from app.models.review_request import ContentType, ReviewRequest, ReviewStatus, ReviewType
+from app.models.review_slot import ReviewSlot
+from app.models.user import User
+from app.schemas.review import ReviewRequestCreate, ReviewRequestResponse
+
+
+@pytest.fixture
+async def review_id(engine):
+    """A pending review request with two files and three slots."""
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as db:
+        owner = User(email="owner@example.com", username="owner")
+        db.add(owner)
+        await db.flush()
+        review = ReviewRequest(
+            user_id=owner.id,
+            title="Landing page",
+            description="Feedback on the hero section",
+            content_type=ContentType.DESIGN,
+            review_type=ReviewType.FREE,
+            status=ReviewStatus.PENDING,
+            reviews_requested=3,
+        )
+        db.add(review)
+        await db.flush()
+        db.add_all([
+            ReviewFile(
+                review_request_id=review.id, filename=f"f{i}.png", original_filename=f"f{i}.png",
+                file_size=10, file_type="image/png", file_path=f"f{i}.png",
+            )
+            for i in range(2)
+        ])
+        db.add_all([
+            ReviewSlot(review_request_id=review.id, review_text="A long review " * 100)
+            for _ in range(3)
+        ])
+        await db.commit()
+        return review.id
+
+
+@pytest.fixture
+async def db(engine):
+    """A fresh session plus the list of SQL statements it runs."""
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        session.info["statements"] = statements
+        yield session
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+@pytest.mark.asyncio
+async def test_detail_profile(review_id, db):
+    review = await review_crud.get_review_request(db, review_id)
+
+    assert len(db.info["statements"]) == 4  # request, requester, files, slots
+    assert review.user.username == "owner"
+    assert (len(review.files), len(review.slots)) == (2, 3)
+    with pytest.raises(InvalidRequestError):
+        review.nda_signatures
+    with pytest.raises(InvalidRequestError):
+        review.slot_applications
+    assert "review_text" not in db.info["statements"][3]
+    with pytest.raises(InvalidRequestError):
+        review.slots[0].review_text
+
+
+@pytest.mark.asyncio
+async def test_load_slot_content(review_id, db):
+    review = await review_crud.get_review_request(db, review_id)
+    first, *rest = review.slots
+
+    await review_loading.load_slot_content(db, [first])
+    await review_loading.load_slot_content(db, [first])
+
+    assert len(db.info["statements"]) == 5  # detail reads, then one content read
+    assert first.review_text.startswith("A long review")
+    slots = ReviewRequestResponse.model_validate(review).slots
+    assert slots[0].review_text == first.review_text
+    assert [slot.review_text for slot in slots[1:]] == [None, None]
+
+
+@pytest.mark.asyncio
+async def test_owner_list_profile(review_id, db):
+    reviews, total = await review_crud.get_user_review_requests(db, user_id=1)
+
+    assert total == 1
+    assert len(db.info["statements"]) == 4  # count, requests, files, slots
+    response = ReviewRequestResponse.model_validate(reviews[0])
+    assert (len(response.files), len(response.slots)) == (2, 3)
+    assert "review_text" not in db.info["statements"][3]
+    assert [slot.review_text for slot in response.slots] == [None] * 3
+
+
+@pytest.mark.asyncio
+async def test_list_card_profile(review_id, db):
+    items, total = await browse_crud.get_public_reviews(db)
+
+    assert total == 1
+    assert items[0].preview_image == "/files/f0.png"
+    assert len(db.info["statements"]) == 3  # count, requests with requester, files
+
+
+@pytest.mark.asyncio
+async def test_slot_summary_profile(review_id, db):
+    review = (await db.execute(
+        select(ReviewRequest).options(*review_loading.SLOT_SUMMARY)
+    )).scalar_one()
+
+    assert len(db.info["statements"]) == 2
+    assert [slot.status for slot in review.slots] == ["available"] * 3
+    assert "review_text" not in db.info["statements"][1]
+    with pytest.raises(InvalidRequestError):
+        review.slots[0].review_text
+    with pytest.raises(InvalidRequestError):
+        review.files
+
+
+@pytest.mark.asyncio
+async def test_claim_profile(review_id, db):
+    review = await db.get(ReviewRequest, review_id, options=review_loading.CLAIM)
+
+    assert len(db.info["statements"]) == 1
+    assert "description" not in db.info["statements"][0]
+    assert review.user_id == 1
+    assert review.available_slots == 3
+    with pytest.raises(InvalidRequestError):
+        review.description
+    with pytest.raises(InvalidRequestError):
+        review.slots
+
+
+@pytest.mark.asyncio
+async def test_job_profiles(review_id, db):
+    review = await db.get(ReviewRequest, review_id, options=review_loading.JOB)
+    assert (review.reviews_completed, review.completed_at) == (0, None)
+    with pytest.raises(InvalidRequestError):
+        review.description
+    db.expunge(review)
+
+    slots = (await db.execute(
+        select(ReviewSlot).options(*review_loading.JOB_SLOT_REQUEST)
+    )).scalars().all()
+
+    assert len(db.info["statements"]) == 3
+    assert "description" not in db.info["statements"][2]
+    assert {slot.review_request.reviews_requested for slot in slots} == {3}
+    with pytest.raises(InvalidRequestError):
+        slots[0].review_request.title
+
+
+@pytest.mark.asyncio
+async def test_created_request_includes_files_and_slots(review_id, db):
+    data = ReviewRequestCreate(
+        title="Logo ideas",
+        description="Which direction is strongest?",
+        content_type=ContentType.DESIGN,
+        review_type=ReviewType.FREE,
+        status=ReviewStatus.PENDING,
+        reviews_requested=2,
+    )
+    review = await review_crud.create_review_request(db, user_id=1, data=data)
+
+    response = ReviewRequestResponse.model_validate(review)
+    assert (response.files, len(response.slots)) == ([], 2)
@@ -0,0 +1,110 @@
+"""
+Tests for the reviewer directory
+
+These tests verify that:
+- Specialty filters and counts use the normalized user_specialties table
+- Totals are right on every page, including past the last one
+- Directory pages are cached per filter set and invalidated on profile changes
+"""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.profile import update_profile
+from app.db.session import get_db
+from app.main import app
+from app.models.user import User
+from app.schemas.profile import ProfileUpdate
+from app.services.infrastructure.response_cache import response_cache
+
+
+@pytest.fixture
+async def api(db):
+    """HTTP client for the app, using the test database and an empty response cache."""
+    async def override_get_db():
+        yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    response_cache.clear()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+    app.dependency_overrides.clear()
+    response_cache.clear()
+
+
+async def _reviewer(db: AsyncSession, name: str, sparks: int, tags: list) -> User:
+    user = User(
+        email=f"{name}@example.com",
+        full_name=name.title(),
+        username=name,
+        is_listed_as_reviewer=True,
+        total_reviews_given=1,
+        sparks_points=sparks,
+    )
+    db.add(user)
+    await db.commit()
+    await update_profile(db, user.id, ProfileUpdate(specialty_tags=tags))
+    return user
+
+
+async def _directory(api: AsyncClient, **params) -> dict:
+    response = await api.get("/api/v1/reviewers", params=params)
+    assert response.status_code == 200
+    return response.json()
+
+
+def _usernames(page: dict) -> list:
+    return [reviewer["username"] for reviewer in page["reviewers"]]
+
+
+@pytest.mark.asyncio
+async def test_specialty_filter_uses_normalized_tags(api, db):
+    """Tag filters are case-insensitive and cards keep the user's labels"""
+    await _reviewer(db, "ada", 30, ["UI Design", "Branding"])
+    await _reviewer(db, "bob", 20, ["branding", "Motion"])
+    await _reviewer(db, "cy", 10, ["Illustration"])
+
+    page = await _directory(api, specialty="BRANDING")
+    assert _usernames(page) == ["ada", "bob"]
+    assert page["reviewers"][0]["specialty_tags"] == ["UI Design", "Branding"]
+    assert page["metadata"]["total_entries"] == 2
+
+    filters = (await api.get("/api/v1/reviewers/filters")).json()
+    assert filters["total_reviewers"] == 3
+    assert filters["specialties"][0] == {"tag": "branding", "count": 2}
+
+
+@pytest.mark.asyncio
+async def test_total_on_every_page(api, db):
+    for i in range(5):
+        await _reviewer(db, f"user{i}", i, ["ux"])
+
+    page = await _directory(api, limit=2, offset=2)
+    assert _usernames(page) == ["user2", "user1"]
+    assert page["metadata"]["total_entries"] == 5
+
+    past_end = await _directory(api, limit=2, offset=10)
+    assert past_end["reviewers"] == []
+    assert past_end["metadata"]["total_entries"] == 5
+
+    searched = await _directory(api, search="USER3")
+    assert _usernames(searched) == ["user3"]
+
+
+@pytest.mark.asyncio
+async def test_pages_cached_until_profile_change(api, db):
+    ada = await _reviewer(db, "ada", 30, ["ui"])
+
+    assert _usernames(await _directory(api, specialty="ui")) == ["ada"]
+
+    # Changed behind the cache's back: the cached page is still served
+    await update_profile(db, ada.id, ProfileUpdate(specialty_tags=["motion"]))
+    assert _usernames(await _directory(api, specialty="ui")) == ["ada"]
+
+    # The profile endpoints invalidate the directory namespace
+    await response_cache.invalidate("reviewers")
+    assert _usernames(await _directory(api, specialty="ui")) == []
+    assert _usernames(await _directory(api, specialty="motion")) == ["ada"]
@@ -0,0 +1,153 @@
+"""
+Tests for incremental Reviewer DNA statistics
+
+These tests verify that:
+- Slot events update the running statistics without rescanning history
+- The streaming backfill produces the same statistics as the incremental path
+- Dimensions stay at baseline until enough reviews are recorded
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+from app.models.review_request import ReviewRequest, ContentType, ReviewType
+from app.models.review_slot import ReviewSlot, ReviewSlotStatus, RejectionReason
+from app.services.ratings.reviewer_dna_service import ReviewerDNAService
+
+
+STAT_FIELDS = [
+    "reviews_analyzed",
+    "response_time_count",
+    "response_time_sum",
+    "feedback_count",
+    "word_count_sum",
+    "action_items_sum",
+    "specificity_hits_sum",
+    "encouragement_hits_sum",
+    "rating_count",
+    "rating_sum",
+    "accepted_count",
+    "rejected_count",
+]
+
+
+async def _create_reviewed_slots(db: AsyncSession, reviewer: User, count: int) -> list[ReviewSlot]:
+    requester = User(email="creator@example.com", hashed_password="x", full_name="Creator")
+    db.add(requester)
+    await db.commit()
+
+    # One request per slot: a reviewer holds one active slot per request
+    requests = [
+        ReviewRequest(
+            user_id=requester.id,
+            title=f"Landing page {i}",
+            description="Please review my landing page",
+            content_type=ContentType.DESIGN,
+            review_type=ReviewType.FREE,
+            reviews_requested=1,
+        )
+        for i in range(count)
+    ]
+    db.add_all(requests)
+    await db.commit()
+
+    now = datetime.utcnow()
+    slots = []
+    for i, request in enumerate(requests):
+        slot = ReviewSlot(
+            review_request_id=request.id,
+            reviewer_id=reviewer.id,
+            status=ReviewSlotStatus.SUBMITTED.value,
+            claimed_at=now - timedelta(hours=10 + i),
+            submitted_at=now,
+            review_text="Great start. You should consider stronger contrast because the headline fades. " * (i + 1),
+        )
+        db.add(slot)
+        slots.append(slot)
+    await db.commit()
+    return slots
+
+
+@pytest.mark.asyncio
+async def test_incremental_matches_backfill(db: AsyncSession):
+    """Stats built from slot events equal stats rebuilt from history"""
+    reviewer = User(email="reviewer@example.com", hashed_password="x", full_name="Reviewer")
+    db.add(reviewer)
+    await db.commit()
+
+    slots = await _create_reviewed_slots(db, reviewer, 4)
+    service = ReviewerDNAService(db)
+
+    for slot in slots:
+        await service.record_submission(slot)
+
+    slots[0].accept(helpful_rating=5)
+    await db.commit()
+    await service.record_acceptance(slots[0])
+
+    slots[1].accept(is_auto=True)
+    await db.commit()
+    await service.record_acceptance(slots[1])
+
+    slots[2].reject(RejectionReason.LOW_QUALITY)
+    await db.commit()
+    await service.record_rejection(slots[2])
+
+    dna = await service.get_or_create_dna(reviewer.id)
+    incremental = {name: getattr(dna, name) for name in STAT_FIELDS}
+    incremental_depth = dna.depth
+    incremental_encouragement = dna.encouragement
+
+    assert incremental["reviews_analyzed"] == 4
+    assert incremental["accepted_count"] == 2
+    assert incremental["rejected_count"] == 1
+    assert incremental["rating_count"] == 1
+    assert incremental["specificity_hits_sum"] == 10  # "because" once per repetition
+    assert incremental["encouragement_hits_sum"] == 10  # "great" once per repetition
+    assert dna.reviews_analyzed >= ReviewerDNAService.MIN_REVIEWS_FOR_DNA
+
+    updated = await service.recalculate_all_dna()
+    assert updated == 1
+
+    dna = await service.get_or_create_dna(reviewer.id)
+    for name in STAT_FIELDS:
+        assert getattr(dna, name) == pytest.approx(incremental[name]), name
+    assert dna.depth == pytest.approx(incremental_depth)
+    assert dna.encouragement == pytest.approx(incremental_encouragement)
+
+
+@pytest.mark.asyncio
+async def test_dimensions_stay_at_baseline_below_minimum(db: AsyncSession):
+    """A single review is recorded but doesn't move the dimensions"""
+    reviewer = User(email="new@example.com", hashed_password="x", full_name="New Reviewer")
+    db.add(reviewer)
+    await db.commit()
+
+    slots = await _create_reviewed_slots(db, reviewer, 1)
+    service = ReviewerDNAService(db)
+    await service.record_submission(slots[0])
+
+    dna = await service.calculate_dna(reviewer.id)
+    assert dna.reviews_analyzed == 1
+    assert dna.feedback_count == 1
+    assert dna.speed == 50.0
+    assert dna.overall_score == 50.0
+
+
+@pytest.mark.asyncio
+async def test_overturned_rejection_moves_outcome(db: AsyncSession):
+    """Admin-accepted disputes move a rejection to the accepted column"""
+    reviewer = User(email="disputer@example.com", hashed_password="x", full_name="Disputer")
+    db.add(reviewer)
+    await db.commit()
+
+    slots = await _create_reviewed_slots(db, reviewer, 1)
+    service = ReviewerDNAService(db)
+    await service.record_submission(slots[0])
+    await service.record_rejection(slots[0])
+    dna = await service.record_acceptance(slots[0], overturned_rejection=True)
+
+    assert dna.accepted_count == 1
+    assert dna.rejected_count == 0
@@ -0,0 +1,157 @@
+"""
+Tests for reviewer stats aggregation
+
+These tests verify that:
+- One query computes a reviewer's counts, ratings and response time
+- The batch variant returns the same stats as the single-user one
+- Cached stats are dropped when one of the reviewer's slots changes state
+- The directory refresh writes stats to listed reviewers' user rows
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+from app.models.review_request import ReviewRequest, ContentType, ReviewType
+from app.models.review_slot import ReviewSlot, ReviewSlotStatus
+from app.models.reviewer_rating import ReviewerRating
+from app.services.ratings import ReviewerRatingService
+from app.services.ratings.reviewer_stats import (
+    compute_reviewer_stats,
+    compute_reviewer_stats_batch,
+    get_reviewer_stats,
+    reviewer_stats_cache,
+)
+from app.services.reviewer_directory_service import ReviewerDirectoryService
+
+
+@pytest.fixture(autouse=True)
+def clear_stats_cache():
+    reviewer_stats_cache.clear()
+    yield
+    reviewer_stats_cache.clear()
+
+
+@pytest.fixture
+async def history(db: AsyncSession):
+    """A requester and two reviewers with accepted, submitted and claimed slots."""
+    requester = User(email="creator@example.com", hashed_password="x", full_name="Creator")
+    alice = User(email="alice@example.com", hashed_password="x", full_name="Alice", is_listed_as_reviewer=True)
+    bob = User(email="bob@example.com", hashed_password="x", full_name="Bob")
+    db.add_all([requester, alice, bob])
+    await db.commit()
+
+    request = ReviewRequest(
+        user_id=requester.id,
+        title="Landing page",
+        description="Please review my landing page",
+        content_type=ContentType.DESIGN,
+        review_type=ReviewType.FREE,
+        reviews_requested=4,
+    )
+    db.add(request)
+    await db.commit()
+
+    now = datetime.utcnow()
+
+    def slot(reviewer, status, hours, helpful=None):
+        return ReviewSlot(
+            review_request_id=request.id,
+            reviewer_id=reviewer.id,
+            status=status.value,
+            claimed_at=now - timedelta(hours=hours),
+            claim_deadline=now + timedelta(hours=72 - hours),
+            submitted_at=now if status != ReviewSlotStatus.CLAIMED else None,
+            requester_helpful_rating=helpful,
+        )
+
+    slots = [
+        slot(alice, ReviewSlotStatus.ACCEPTED, 10, helpful=5),
+        slot(alice, ReviewSlotStatus.ACCEPTED, 20, helpful=4),
+        slot(alice, ReviewSlotStatus.SUBMITTED, 30),
+        slot(bob, ReviewSlotStatus.CLAIMED, 5),
+    ]
+    db.add_all(slots)
+    await db.commit()
+
+    db.add_all([
+        ReviewerRating(
+            review_slot_id=slots[i].id, requester_id=requester.id, reviewer_id=alice.id,
+            quality_rating=rating, professionalism_rating=rating, helpfulness_rating=rating,
+            overall_rating=rating,
+        )
+        for i, rating in [(0, 5), (1, 4)]
+    ])
+    await db.commit()
+    await ReviewerRatingService(db).recalculate_all_stats()
+    reviewer_stats_cache.clear()
+    return requester, alice, bob, slots
+
+
+@pytest.mark.asyncio
+async def test_single_query_stats(db, history):
+    requester, alice, bob, _ = history
+    statements = []
+    event.listen(
+        db.info["engine"].sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+    )
+
+    stats = await compute_reviewer_stats(db, alice.id)
+
+    assert len(statements) == 1
+    assert stats.total_reviews_given == 2
+    assert stats.total_reviews_received == 0
+    assert stats.avg_rating == 4.5
+    assert stats.avg_response_time_hours == 20
+    assert stats.avg_helpful_rating == 4.5
+
+    received = await compute_reviewer_stats(db, requester.id)
+    assert received.total_reviews_received == 2
+    assert received.avg_rating is None
+    assert received.avg_response_time_hours is None
+
+    assert await compute_reviewer_stats(db, 9999) is None
+
+
+@pytest.mark.asyncio
+async def test_batch_matches_single(db, history):
+    users = history[:3]
+    batch = await compute_reviewer_stats_batch(db, [user.id for user in users] + [9999])
+
+    assert set(batch) == {user.id for user in users}
+    for user in users:
+        assert batch[user.id] == await compute_reviewer_stats(db, user.id)
+
+
+@pytest.mark.asyncio
+async def test_cache_invalidated_on_slot_change(db, history):
+    _, alice, bob, slots = history
+    assert (await get_reviewer_stats(db, bob.id)).total_reviews_given == 0
+    assert (await get_reviewer_stats(db, alice.id)).total_reviews_given == 2
+
+    slots[3].submit_review(review_text="Looks good overall, consider tightening the copy. " * 3, rating=4)
+    slots[3].accept(helpful_rating=3)
+    await db.commit()
+
+    bob_stats = await get_reviewer_stats(db, bob.id)
+    assert bob_stats.total_reviews_given == 1
+    assert bob_stats.avg_helpful_rating == 3.0
+    # Alice's slots didn't change, so hers is still served from the cache
+    assert reviewer_stats_cache.get(alice.id) is not None
+
+
+@pytest.mark.asyncio
+async def test_refresh_listed_reviewer_stats(db, history):
+    _, alice, bob, _ = history
+
+    assert await ReviewerDirectoryService(db).refresh_listed_reviewer_stats(page_size=1) == 1
+
+    await db.refresh(alice)
+    await db.refresh(bob)
+    assert alice.total_reviews_given == 2
+    assert float(alice.avg_rating) == 4.5
+    assert alice.avg_response_time_hours == 20
+    assert bob.avg_rating is None
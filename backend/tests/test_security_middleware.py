@@ -0,0 +1,100 @@
+"""
+Tests for the security headers and CSRF middleware
+
+These tests verify that:
+- Every response carries the security headers (HSTS/CSP only in production)
+- State-changing requests need a CSRF header matching the cookie, except
+  on exempt paths
+- Responses set a CSRF cookie when the request has none
+- Exempt paths match exactly, or by one of the exempt prefixes
+"""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.core.csrf import CSRF_COOKIE_NAME, CSRF_HEADER_NAME, CSRFMiddleware, is_path_exempt
+from app.core.security_headers import SecurityHeadersMiddleware
+
+
+async def ok(request):
+    return PlainTextResponse("ok")
+
+
+def _client(app) -> AsyncClient:
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.fixture
+def csrf_app():
+    app = Starlette(routes=[
+        Route("/api/v1/reviews", ok, methods=["GET", "POST"]),
+        Route("/api/v1/webhooks/stripe", ok, methods=["POST"]),
+    ])
+    app.add_middleware(CSRFMiddleware)
+    return app
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("production", [False, True])
+async def test_security_headers(production):
+    app = Starlette(routes=[Route("/", ok)])
+    app.add_middleware(SecurityHeadersMiddleware, production=production)
+
+    async with _client(app) as client:
+        response = await client.get("/")
+
+    assert response.text == "ok"
+    assert response.headers["x-content-type-options"] == "nosniff"
+    assert response.headers["x-frame-options"] == "DENY"
+    assert response.headers["referrer-policy"] == "strict-origin-when-cross-origin"
+    assert ("strict-transport-security" in response.headers) is production
+    assert ("content-security-policy" in response.headers) is production
+
+
+@pytest.mark.asyncio
+async def test_csrf_validation(csrf_app):
+    async with _client(csrf_app) as client:
+        response = await client.post("/api/v1/reviews")
+        assert response.status_code == 403
+        assert response.json()["error"]["code"] == "CSRF_VALIDATION_FAILED"
+
+        response = await client.post(
+            "/api/v1/reviews", cookies={CSRF_COOKIE_NAME: "token"}, headers={CSRF_HEADER_NAME: "other"}
+        )
+        assert response.status_code == 403
+
+        response = await client.post(
+            "/api/v1/reviews", cookies={CSRF_COOKIE_NAME: "token"}, headers={CSRF_HEADER_NAME: "token"}
+        )
+        assert response.status_code == 200
+        assert CSRF_COOKIE_NAME not in response.headers.get("set-cookie", "")
+
+        # Exempt paths skip validation
+        response = await client.post("/api/v1/webhooks/stripe")
+        assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_csrf_cookie_set_when_missing(csrf_app):
+    async with _client(csrf_app) as client:
+        response = await client.get("/api/v1/reviews")
+
+    assert response.status_code == 200
+    cookie = response.headers["set-cookie"]
+    assert cookie.startswith(f"{CSRF_COOKIE_NAME}=")
+    assert "SameSite=lax" in cookie and "HttpOnly" not in cookie
+
+
+def test_exempt_paths():
+    assert is_path_exempt("/health")
+    assert is_path_exempt("/api/v1/auth/google/callback")
+    assert is_path_exempt("/api/v1/webhooks")
+    assert is_path_exempt("/api/v1/webhooks/stripe/events")
+    assert not is_path_exempt("/health/db")
+    assert not is_path_exempt("/api/v1/auth/log")
+    assert not is_path_exempt("/api/v1/auth/me")
+    assert not is_path_exempt("/api/v1/auth/login\n")
+    assert not is_path_exempt("/api/v1/webhooksx")
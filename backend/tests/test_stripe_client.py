@@ -0,0 +1,133 @@
+"""
+Tests for the async Stripe client
+
+These tests verify that:
+- Params are form-encoded the way Stripe expects
+- POSTs carry idempotency keys and retries replay rather than duplicate;
+  derived keys change with the call site and params
+- Transient failures are retried and permanent ones raise stripe errors
+- The concurrency limit caps in-flight requests
+- Payment services go through the client (using the fake Stripe server)
+"""
+
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+import stripe
+
+from app.services.payments.balance_service import BalanceService
+from app.services.payments.stripe_client import encode_params, idempotency_key_for
+from fake_stripe import FakeStripeServer
+
+
+def test_encode_params_nested():
+    """Nested dicts, lists and booleans use Stripe's bracket encoding"""
+    pairs = encode_params({
+        "amount": 500,
+        "metadata": {"slot_id": "7"},
+        "line_items": [{"price": "price_1", "quantity": 1}],
+        "automatic_payment_methods": {"enabled": True},
+        "description": None,
+    })
+
+    assert pairs == [
+        ("amount", "500"),
+        ("metadata[slot_id]", "7"),
+        ("line_items[0][price]", "price_1"),
+        ("line_items[0][quantity]", "1"),
+        ("automatic_payment_methods[enabled]", "true"),
+    ]
+
+
+def test_idempotency_key_for_params():
+    """Keys are stable for the same params and differ per call site and params"""
+    params = {"email": "a@example.com", "metadata": {"user_id": "1"}}
+
+    key = idempotency_key_for("customer-payment-user-1", params)
+    assert key == idempotency_key_for("customer-payment-user-1", dict(params))
+    assert key.startswith("customer-payment-user-1-")
+    assert key != idempotency_key_for("customer-subscription-user-1", params)
+    assert key != idempotency_key_for("customer-payment-user-1", {**params, "email": "b@example.com"})
+
+
+@pytest.mark.asyncio
+async def test_idempotency_key_replays_transfer():
+    """The same idempotency key never creates a second transfer"""
+    fake = FakeStripeServer()
+    client = fake.client()
+
+    first = await client.create_transfer(
+        amount=750, currency="usd", destination="acct_1",
+        metadata={"slot_id": "1"}, idempotency_key="transfer-slot-1",
+    )
+    second = await client.create_transfer(
+        amount=750, currency="usd", destination="acct_1",
+        metadata={"slot_id": "1"}, idempotency_key="transfer-slot-1",
+    )
+
+    assert first.id == second.id
+    assert first.metadata.slot_id == "1"
+    assert len(fake.objects["transfer"]) == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried():
+    """5xx responses are retried with the same idempotency key"""
+    fake = FakeStripeServer()
+    client = fake.client(max_retries=2)
+    fake.fail_next(status_code=503, times=2)
+
+    refund = await client.create_refund(payment_intent="pi_1", amount=100, idempotency_key="refund-slot-3")
+
+    assert refund.amount == 100
+    posts = fake.requests_to("POST", "/v1/refunds")
+    assert len(posts) == 3
+    assert {r.headers["Idempotency-Key"] for r in posts} == {"refund-slot-3"}
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_client_errors_raise_stripe_errors():
+    """4xx responses surface as stripe.StripeError subclasses without retrying"""
+    fake = FakeStripeServer()
+    client = fake.client(max_retries=2)
+
+    with pytest.raises(stripe.InvalidRequestError) as exc_info:
+        await client.retrieve_payment_intent("pi_missing")
+
+    assert exc_info.value.http_status == 404
+    assert exc_info.value.code == "resource_missing"
+    assert len(fake.requests) == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit():
+    """No more than max_concurrency requests are in flight at once"""
+    fake = FakeStripeServer(latency=0.01)
+    client = fake.client(max_concurrency=3)
+
+    await asyncio.gather(*[client.retrieve_balance() for _ in range(12)])
+
+    assert len(fake.requests) == 12
+    assert fake.max_in_flight == 3
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_balance_service_uses_client(fake_stripe: FakeStripeServer):
+    """BalanceService reads the Connect balance and payouts through the client"""
+    fake_stripe.set_balance("acct_reviewer", available_cents=12345, pending_cents=500)
+    fake_stripe.add("payout", account="acct_reviewer", amount=2000, status="paid", arrival_date=None)
+    reviewer = SimpleNamespace(id=1, stripe_connect_account_id="acct_reviewer")
+
+    balance = await BalanceService.get_available_balance(reviewer)
+    payouts = await BalanceService.get_payout_history(reviewer)
+
+    assert balance == {"available_balance": Decimal("123.45"), "pending_balance": Decimal("5")}
+    assert [p["amount"] for p in payouts] == [Decimal("20")]
+    request = fake_stripe.requests_to("GET", "/v1/balance")[0]
+    assert request.headers["Stripe-Account"] == "acct_reviewer"
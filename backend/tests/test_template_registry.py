@@ -0,0 +1,93 @@
+"""
+Tests for the precompiled rubric and section template registry
+
+These tests verify that:
+- Every rubric and section set matches what get_rubric / get_sections
+  build, including their fallbacks for unknown keys
+- Registry data is read-only
+- The rubric endpoint sends the precompiled body with its ETag and
+  answers If-None-Match with 304
+- The sections endpoint sends the precompiled body for slots without a
+  draft and merges buffered drafts into a copy otherwise
+"""
+
+import json
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.config.review_sections import calculate_min_total_words, get_sections
+from app.config.template_registry import (
+    RUBRIC_RESPONSES,
+    SECTION_SETS,
+    get_section_set,
+    rubric_response,
+)
+from app.constants.rubrics import get_rubric
+from app.main import app
+from app.services.infrastructure.draft_buffer import BufferedDraft, draft_buffer
+from tests.test_draft_buffer import api, slot  # noqa: F401 - fixtures
+
+
+def test_registry_matches_builders():
+    for (content_type, subcategory), entry in RUBRIC_RESPONSES.items():
+        assert json.loads(entry.body) == get_rubric(content_type, subcategory)
+
+    for key, section_set in SECTION_SETS.items():
+        sections = get_sections(*key)
+        assert [dict(section) for section in section_set.sections] == sections
+        assert section_set.min_total_words == calculate_min_total_words(sections)
+        assert json.loads(section_set.response.body)["sections"] == sections
+
+    # Fallbacks resolve like the builders
+    for content_type, subcategory in [("design", "unknown"), ("code", "ui_ux"), ("photography", "")]:
+        assert json.loads(rubric_response(content_type, subcategory).body) == get_rubric(content_type, subcategory)
+    assert [dict(s) for s in get_section_set("design", "other", "huge").sections] == get_sections("design", "other", "huge")
+
+
+def test_registry_is_read_only():
+    section_set = get_section_set("design", "specific_fixes", "standard")
+
+    with pytest.raises(TypeError):
+        section_set.sections[0]["min_words"] = 0
+    with pytest.raises(TypeError):
+        section_set.context["has_draft"] = True
+
+
+@pytest.mark.asyncio
+async def test_rubric_endpoint_serves_precompiled_body():
+    entry = rubric_response("design", "ui_ux")
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/api/v1/review-slots/rubrics/design", params={"subcategory": "ui_ux"})
+        assert response.status_code == 200
+        assert response.content == entry.body
+        assert response.headers["etag"] == entry.etag
+
+        response = await client.get(
+            "/api/v1/review-slots/rubrics/design",
+            params={"subcategory": "ui_ux"},
+            headers={"If-None-Match": entry.etag},
+        )
+        assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_sections_endpoint_merges_drafts_into_copy(api, slot):
+    section_set = get_section_set("design", "specific_fixes", "standard")
+    url = f"/api/v1/review-slots/{slot.id}/sections"
+
+    response = await api.get(url)
+    assert response.status_code == 200
+    assert response.content == section_set.response.body
+    assert response.headers["etag"] == section_set.response.etag
+
+    section_id = section_set.sections[0]["id"]
+    draft_buffer.save(slot.id, BufferedDraft(slot.reviewer_id, [{"id": section_id, "content": "Looks clean"}]))
+    data = (await api.get(url)).json()
+    assert data["context"]["has_draft"] is True
+    assert data["sections"][0]["content"] == "Looks clean"
+
+    # The registry entry is untouched
+    assert "content" not in section_set.sections[0]
+    assert json.loads(section_set.response.body)["context"]["has_draft"] is False
@@ -0,0 +1,41 @@
+"""
+Tests for the in-process TTL cache
+
+These tests verify that:
+- Concurrent misses for a key share one load
+- Entries expire after their TTL
+- A load that started before clear() isn't cached
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.infrastructure.ttl_cache import TTLCache
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_single_flight_and_expiry():
+    now = [0.0]
+    cache = TTLCache("test", ttl_seconds=10, clock=lambda: now[0])
+    loads = 0
+
+    async def loader():
+        nonlocal loads
+        loads += 1
+        await asyncio.sleep(0.01)
+        return {"page": loads}
+
+    results = await asyncio.gather(*[cache.get_or_load("key", loader) for _ in range(5)])
+    assert loads == 1
+    assert all(result == {"page": 1} for result in results)
+
+    now[0] = 11
+    assert await cache.get_or_load("key", loader) == {"page": 2}
+
+    # A load that started before a clear() isn't cached
+    pending = asyncio.create_task(cache.get_or_load("other", loader))
+    await asyncio.sleep(0)
+    cache.clear()
+    await pending
+    assert cache.get("other") is None
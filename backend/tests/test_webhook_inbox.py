@@ -0,0 +1,174 @@
+"""
+Tests for the Stripe webhook inbox
+
+These tests verify that:
+- Duplicate deliveries are stored once
+- Events for the same object are processed in order
+- Failing events are retried with backoff and marked failed at the attempt limit
+- Failed events can be replayed
+- Stopping the pool ends a drain after the current batch
+"""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select, update
+
+from app.core.config import settings
+from app.models.webhook_event import WebhookEvent
+from app.services.payments import webhook_inbox as inbox_module
+from app.services.payments.webhook_inbox import WEBHOOK_EVENTS, WebhookInbox, WebhookWorkerPool
+
+
+@pytest.fixture
+def handled(monkeypatch):
+    """Replace the Stripe dispatcher with a recorder; events of type 'fail.*' raise."""
+    calls = []
+
+    async def fake_dispatch(event, db):
+        calls.append(event["id"])
+        if event["type"].startswith("fail."):
+            raise RuntimeError("handler exploded")
+
+    monkeypatch.setattr(inbox_module, "dispatch_stripe_event", fake_dispatch)
+    return calls
+
+
+def _event(event_id: str, event_type: str, object_id: str, created: int) -> dict:
+    return {
+        "id": event_id,
+        "type": event_type,
+        "created": created,
+        "data": {"object": {"id": object_id}},
+    }
+
+
+async def _enqueue(inbox: WebhookInbox, session_maker, event: dict) -> bool:
+    async with session_maker() as db:
+        return await inbox.enqueue(db, json.dumps(event).encode(), event)
+
+
+async def _statuses(session_maker) -> dict:
+    async with session_maker() as db:
+        rows = (await db.execute(select(WebhookEvent.event_id, WebhookEvent.status))).all()
+    return dict(rows)
+
+
+@pytest.mark.asyncio
+async def test_duplicate_delivery_stored_once(session_maker, handled):
+    """A redelivered event is acknowledged but processed only once"""
+    inbox = WebhookInbox(session_maker)
+    event = _event("evt_1", "payment_intent.succeeded", "pi_1", 1000)
+
+    assert await _enqueue(inbox, session_maker, event) is True
+    assert await _enqueue(inbox, session_maker, event) is False
+
+    processed = await WebhookWorkerPool(inbox, concurrency=4).drain()
+
+    assert processed == 1
+    assert handled == ["evt_1"]
+    assert (await _statuses(session_maker)) == {"evt_1": "processed"}
+
+
+@pytest.mark.asyncio
+async def test_same_object_events_processed_in_order(session_maker, handled, monkeypatch):
+    """A later event waits while an earlier event for its object is retrying"""
+    monkeypatch.setattr(settings, "WEBHOOK_MAX_ATTEMPTS", 3)
+    inbox = WebhookInbox(session_maker)
+    await _enqueue(inbox, session_maker, _event("evt_later", "payment_intent.succeeded", "pi_1", 2000))
+    await _enqueue(inbox, session_maker, _event("evt_first", "fail.created", "pi_1", 1000))
+    await _enqueue(inbox, session_maker, _event("evt_other", "payment_intent.succeeded", "pi_2", 1500))
+
+    await WebhookWorkerPool(inbox, concurrency=4).drain()
+
+    # Only the first event of pi_1 ran (and failed); pi_2 was unaffected
+    assert sorted(handled) == ["evt_first", "evt_other"]
+    statuses = await _statuses(session_maker)
+    assert statuses["evt_first"] == "pending"
+    assert statuses["evt_later"] == "pending"
+    assert statuses["evt_other"] == "processed"
+
+    async with session_maker() as db:
+        first = (await db.execute(select(WebhookEvent).where(WebhookEvent.event_id == "evt_first"))).scalar_one()
+        assert first.attempts == 1
+        assert first.next_attempt_at > datetime.utcnow()
+        assert "handler exploded" in first.last_error
+
+
+@pytest.mark.asyncio
+async def test_failed_after_max_attempts_then_replayed(session_maker, handled, monkeypatch):
+    """Events give up after the attempt limit and can be replayed"""
+    monkeypatch.setattr(settings, "WEBHOOK_MAX_ATTEMPTS", 2)
+    inbox = WebhookInbox(session_maker)
+    pool = WebhookWorkerPool(inbox, concurrency=2)
+    failed_before = WEBHOOK_EVENTS.value(outcome="failed")
+    await _enqueue(inbox, session_maker, _event("evt_bad", "fail.updated", "sub_1", 1000))
+
+    for _ in range(2):
+        await pool.drain()
+        # Make the retry due immediately
+        async with session_maker() as db:
+            await db.execute(update(WebhookEvent).values(next_attempt_at=datetime.utcnow() - timedelta(seconds=1)))
+            await db.commit()
+
+    assert (await _statuses(session_maker)) == {"evt_bad": "failed"}
+    assert handled == ["evt_bad", "evt_bad"]
+
+    stats = await inbox.stats()
+    assert stats["failed"] == 1
+    assert stats["retried_since_start"] == 1
+    assert stats["failed_since_start"] == 1
+    assert WEBHOOK_EVENTS.value(outcome="failed") == failed_before + 1
+    assert inbox.last_stats == stats
+
+    with pytest.raises(ValueError):
+        await inbox.replay()
+
+    assert await inbox.replay(status="failed") == 1
+    assert (await _statuses(session_maker)) == {"evt_bad": "pending"}
+    assert (await inbox.stats())["pending"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stuck_processing_events_are_recovered(session_maker, handled):
+    """Events left in processing by a crashed worker go back to the queue"""
+    inbox = WebhookInbox(session_maker)
+    await _enqueue(inbox, session_maker, _event("evt_stuck", "payment_intent.succeeded", "pi_9", 1000))
+    claimed = await inbox.claim_batch(1)
+    assert [e.event_id for e in claimed] == ["evt_stuck"]
+
+    async with session_maker() as db:
+        await db.execute(update(WebhookEvent).values(locked_at=datetime.utcnow() - timedelta(hours=1)))
+        await db.commit()
+
+    assert await inbox.recover_stuck() == 1
+    assert await WebhookWorkerPool(inbox).drain() == 1
+    assert handled == ["evt_stuck"]
+
+
+@pytest.mark.asyncio
+async def test_stop_ends_drain_after_current_batch(session_maker, monkeypatch):
+    """A stop requested mid-drain finishes the batch and leaves the rest queued"""
+    inbox = WebhookInbox(session_maker)
+    pool = WebhookWorkerPool(inbox, concurrency=1, poll_interval=60)
+    for i in range(3):
+        await _enqueue(inbox, session_maker, _event(f"evt_{i}", "payment_intent.succeeded", f"pi_{i}", 1000 + i))
+
+    calls = []
+    stopped = []
+
+    async def dispatch_then_stop(event, db):
+        calls.append(event["id"])
+        stopped.append(asyncio.create_task(pool.stop()))
+
+    monkeypatch.setattr(inbox_module, "dispatch_stripe_event", dispatch_then_stop)
+    pool.start()
+    while not stopped:
+        await asyncio.sleep(0.01)
+    await asyncio.wait_for(stopped[0], timeout=5)
+
+    assert not pool.running
+    assert calls == ["evt_0"]
+    assert (await _statuses(session_maker))["evt_2"] == "pending"